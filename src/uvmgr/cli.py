@@ -8,12 +8,14 @@ This module serves as the main entry point for the uvmgr CLI application. It pro
 
 • **Logging Setup**: Configures logging once (plain `logging` + optional OpenTelemetry)
 • **Global Flags**: Adds a global `--json / -j` flag for machine-readable output
-• **Dynamic Command Loading**: Automatically mounts every sub-command package found in **uvmgr.commands**
+• **Lazy Command Loading**: Lists every verb from the prebuilt manifest in
+  **uvmgr.commands._manifest** and imports a sub-command only when it is invoked
+• **Startup Profiling**: ``--startup-profile`` reports per-module import cost
 • **Error Handling**: Provides centralized exception handling for CLI operations
 • **Telemetry Integration**: Instruments the main CLI with OpenTelemetry for observability
 
 The application follows a modular design where each command group (deps, tests, build, etc.)
-is implemented as a separate Typer sub-application that gets dynamically mounted.
+is implemented as a separate Typer sub-application that gets mounted on first use.
 
 Example
 -------
@@ -21,24 +23,30 @@ Example
     $ uvmgr deps add requests         # Add dependency
     $ uvmgr tests run                 # Run test suite
     $ uvmgr --json deps list          # JSON output
+    $ uvmgr --startup-profile deps list  # Import cost of a cold start
 
 See Also
 --------
 - :mod:`uvmgr.commands` : Command implementations
+- :mod:`uvmgr.commands._manifest` : Prebuilt command manifest
 - :mod:`uvmgr.core.instrumentation` : Telemetry instrumentation
 - :mod:`uvmgr.logging_config` : Logging configuration
 """
 
 from __future__ import annotations
 
-import importlib
 import importlib.metadata
 import os
 import sys
 
 import typer
 
-from uvmgr.cli_utils import handle_cli_exception
+from uvmgr.cli_utils import (
+    LazyTyperGroup,
+    handle_cli_exception,
+    profile_startup,
+    render_startup_profile,
+)
 from uvmgr.core.instrumentation import instrument_command
 from uvmgr.logging_config import setup_logging
 
@@ -53,6 +61,7 @@ setup_logging()
 #  Root Typer application
 # ──────────────────────────────────────────────────────────────────────────────
 app = typer.Typer(
+    cls=LazyTyperGroup,
     add_completion=False,
     rich_markup_mode="rich",
     help="**uvmgr** – unified Python workflow engine (powered by *uv*).",
@@ -77,6 +86,20 @@ def _version_callback(value: bool):
         raise typer.Exit()
 
 
+def _startup_profile_callback(value: bool):
+    """Re-run the command under ``-X importtime`` and report import cost."""
+    if not value:
+        return
+    if getattr(sys, "frozen", False):
+        raise typer.BadParameter("--startup-profile is not available in frozen executables")
+    args = [arg for arg in sys.argv[1:] if arg != "--startup-profile"]
+    exit_code, costs, stderr = profile_startup(args)
+    for line in stderr:
+        typer.echo(line, err=True)
+    render_startup_profile(costs)
+    raise typer.Exit(exit_code)
+
+
 @app.callback()
 @instrument_command("uvmgr_main", track_args=True)
 def _root(
@@ -96,32 +119,22 @@ def _root(
         is_eager=True,
         help="Show version and exit",
     ),
+    startup_profile: bool = typer.Option(
+        False,
+        "--startup-profile",
+        callback=_startup_profile_callback,
+        is_eager=True,
+        help="Run the command and report per-module import cost",
+    ),
 ):
     """Callback only sets the JSON flag – no other side-effects."""
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-#  Mount every sub-command defined in *uvmgr.commands*
+#  Sub-commands are mounted lazily by LazyTyperGroup from the manifest in
+#  *uvmgr.commands._manifest* – regenerate it after adding a verb to
+#  uvmgr.commands.__all__ (python -m uvmgr.commands._manifest).
 # ──────────────────────────────────────────────────────────────────────────────
-commands_pkg = importlib.import_module("uvmgr.commands")
-
-for verb in commands_pkg.__all__:
-    try:
-        mod = importlib.import_module(f"uvmgr.commands.{verb}")
-    except ImportError:
-        # Skip commands that have missing dependencies (e.g., AI modules in frozen executables)
-        continue
-
-    # Expect exactly one typer.Typer object in the module's globals ------------
-    sub_app = next(
-        (obj for obj in mod.__dict__.values() if isinstance(obj, typer.Typer)),
-        None,
-    )
-    if sub_app is None:  # Fail fast during development
-        raise ImportError(f"`{verb}` has no Typer sub-app")
-
-    # Mount under the same name (convert _ to - for nicer CLI UX) --------------
-    app.add_typer(sub_app, name=verb.replace("_", "-"))
 
 
 if __name__ == "__main__":
@@ -6,16 +6,24 @@ Utility functions for the command-line interface, providing common functionality
 for error handling, JSON output, and CLI operations.
 
 This module contains helper functions that are used across multiple CLI commands
-to ensure consistent behavior and reduce code duplication.
+to ensure consistent behavior and reduce code duplication. It also hosts the
+lazy command group used by the root application and the ``--startup-profile``
+import-cost reporter.
 """
 
+import importlib
 import logging
+import subprocess
 import sys
 import traceback
+from dataclasses import dataclass
 from typing import Any
 
+import click
 import typer
+from typer.core import TyperCommand, TyperGroup
 
+from uvmgr.commands._manifest import COMMANDS, CommandSpec
 from uvmgr.core.shell import dump_json
 
 
@@ -71,3 +79,166 @@ def maybe_json(ctx: typer.Context, payload: Any, exit_code: int = 0) -> None:
     if ctx.meta.get("json"):
         dump_json(payload)
         raise typer.Exit(exit_code)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  Lazy, manifest-driven command mounting
+# ──────────────────────────────────────────────────────────────────────────────
+class _ManifestCommand(TyperCommand):
+    """Placeholder carrying only the manifest help text (used for ``--help``)."""
+
+    def __init__(self, spec: CommandSpec):
+        super().__init__(name=spec.name, help=spec.help)
+        self.spec = spec
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Root group that mounts sub-apps from :data:`uvmgr.commands._manifest.COMMANDS`
+    on first use.
+
+    Listing and help rendering only need the manifest, so ``uvmgr --help`` and
+    ``uvmgr --version`` import no command module at all. When a verb is
+    resolved for execution its module is imported, converted to a Click group
+    and cached on the group, exactly as ``app.add_typer`` would have mounted it.
+
+    Notes
+    -----
+    Commands registered eagerly on the Typer app (``app.add_typer``) still take
+    precedence over manifest entries with the same name.
+    """
+
+    manifest: dict[str, CommandSpec] = {spec.name: spec for spec in COMMANDS}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in self.manifest if name not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is None and cmd_name in self.manifest:
+            cmd = _ManifestCommand(self.manifest[cmd_name])
+        return cmd
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, cmd, rest = super().resolve_command(ctx, args)
+        if isinstance(cmd, _ManifestCommand):
+            cmd = self.load_command(cmd.spec)
+        return cmd_name, cmd, rest
+
+    def load_command(self, spec: CommandSpec) -> click.Command:
+        """
+        Import the sub-app described by *spec* and mount it on this group.
+
+        Raises
+        ------
+        click.ClickException
+            If the module cannot be imported (e.g. an optional extra is missing
+            from a frozen executable) or does not expose the expected Typer.
+        """
+        try:
+            module = importlib.import_module(spec.module)
+        except ImportError as e:
+            raise click.ClickException(f"`{spec.name}` is unavailable: {e}") from e
+
+        sub_app = getattr(module, spec.attr, None)
+        if not isinstance(sub_app, typer.Typer):
+            raise click.ClickException(
+                f"`{spec.module}.{spec.attr}` is not a Typer sub-app; "
+                "regenerate the manifest with `python -m uvmgr.commands._manifest`"
+            )
+
+        cmd = typer.main.get_group(sub_app)
+        cmd.name = spec.name
+        self.add_command(cmd, spec.name)
+        return cmd
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  Startup profiling
+# ──────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class ImportCost:
+    """One line of ``python -X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(lines: list[str]) -> list[ImportCost]:
+    """
+    Parse ``-X importtime`` lines into :class:`ImportCost` records.
+
+    Lines that are not import-time records (the header, regular stderr output)
+    are ignored.
+    """
+    costs = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        if not self_us.strip().isdigit():  # header line
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        costs.append(
+            ImportCost(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=depth,
+            )
+        )
+    return costs
+
+
+def profile_startup(args: list[str]) -> tuple[int, list[ImportCost], list[str]]:
+    """
+    Run ``uvmgr *args`` in a fresh interpreter with ``-X importtime``.
+
+    The child's stdout is passed through untouched so the command behaves as
+    usual; stderr is captured and split into import records and other output.
+
+    Parameters
+    ----------
+    args : list[str]
+        Arguments for the profiled uvmgr invocation (without the profile flag).
+
+    Returns
+    -------
+    tuple[int, list[ImportCost], list[str]]
+        Exit code of the child, import costs and the remaining stderr lines.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "uvmgr", *args],
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    lines = proc.stderr.splitlines()
+    costs = parse_importtime(lines)
+    other = [line for line in lines if not line.startswith("import time:")]
+    return proc.returncode, costs, other
+
+
+def render_startup_profile(costs: list[ImportCost], limit: int = 25) -> None:
+    """Print the *limit* most expensive imports (by cumulative time) to stderr."""
+    from rich.console import Console
+    from rich.table import Table
+
+    total_us = sum(c.self_us for c in costs)
+    table = Table(title=f"Startup import cost ({len(costs)} modules, {total_us / 1000:.1f} ms)")
+    table.add_column("Module", style="cyan", overflow="fold")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right", style="yellow")
+
+    for c in sorted(costs, key=lambda c: c.cumulative_us, reverse=True)[:limit]:
+        table.add_row(c.module, f"{c.self_us / 1000:.1f}", f"{c.cumulative_us / 1000:.1f}")
+
+    Console(stderr=True).print(table)
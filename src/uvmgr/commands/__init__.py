@@ -48,17 +48,20 @@ Usage
 Notes
 -----
 Nothing here is imported by end-users directly; the root CLI (`uvmgr.cli`)
-resolves sub-modules via `importlib.import_module` on demand. This file:
+lists verbs from the prebuilt manifest in `uvmgr.commands._manifest` and
+resolves sub-modules via `importlib.import_module` only when invoked. This file:
 
 1. Documents which command modules exist
 2. Provides auto-completion / IDE discovery through `__all__`
 3. Implements a `__getattr__` lazy loader for Just-Works™ imports
 
-Add new verb modules to **__all__** when you create them.
+Add new verb modules to **__all__** when you create them, then regenerate the
+manifest with ``python -m uvmgr.commands._manifest``.
 
 See Also
 --------
 - :mod:`uvmgr.cli` : Main CLI application
+- :mod:`uvmgr.commands._manifest` : Prebuilt command manifest
 """
 
 from __future__ import annotations
@@ -82,20 +85,22 @@ __all__: Final[list[str]] = [
     "mermaid", # Full Mermaid support with Weaver Forge + DSPy (8020 priority)
     "dod", # Definition of Done automation with Weaver Forge exoskeleton
     "docs", # 8020 Documentation automation with multi-layered approach
+    "aggregate", # Command aggregation with a parallel DAG executor
+    "performance", # Profiling and benchmark suite with baseline regression gates
+    "release", # Version management and releases
+    "weaver", # OpenTelemetry Weaver semantic convention tools
+    "forge", # 8020 Weaver Forge automation and development workflows
     # "mcp", # FastMCP server with DSPy integration for AI-powered analysis - DISABLED: DSPy init issues
     # "exponential", # Exponential technology capabilities - "The Future Is Faster Than You Think" - DISABLED: testing
     # "democratize", # Democratization platform - Make AI development accessible to everyone - DISABLED: testing
     
     # Other commands disabled temporarily due to Callable type issues
     # "project",  # Project creation and management
-    # "release",  # Version management and releases
     # "tool",    # Tool management and installation
     # "index",   # Package index operations
     # "exec",    # Command execution utilities
     # "shell",   # Shell integration commands
     # "serve",   # MCP server for AI integration
-    # "weaver",  # OpenTelemetry Weaver semantic convention tools
-    # "forge",   # 8020 Weaver Forge automation and development workflows
     # "history", # Command history tracking
     # "workspace", # Workspace and environment management
     # "search",    # Advanced search capabilities (code, deps, files, semantic)
@@ -0,0 +1,157 @@
+"""
+uvmgr.commands._manifest - Prebuilt Command Manifest
+====================================================
+
+Static description of every command group mounted by the root CLI.
+
+The root application (:mod:`uvmgr.cli`) reads :data:`COMMANDS` to list verbs
+and render ``uvmgr --help`` without importing a single command module. A
+sub-application is imported only when its verb is actually invoked, so
+``uvmgr --version`` or ``uvmgr deps list`` never pay for DSPy, ChromaDB,
+SpiffWorkflow or torch.
+
+The manifest is generated from the sources with :func:`build_manifest`, which
+parses each module listed in :data:`uvmgr.commands.__all__` (no imports) and
+records the module-level ``typer.Typer(...)`` assignment. Regenerate it after
+adding a verb or changing a group's help text::
+
+    $ python -m uvmgr.commands._manifest
+
+``tests/test_cli.py`` fails if the committed manifest drifts from the sources.
+
+See Also
+--------
+- :mod:`uvmgr.cli` : Root Typer application
+- :class:`uvmgr.cli_utils.LazyTyperGroup` : Group that consumes the manifest
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from typing import NamedTuple
+
+
+class CommandSpec(NamedTuple):
+    """One mountable command group."""
+
+    name: str
+    """CLI verb (``_`` converted to ``-``)."""
+    module: str
+    """Dotted path of the module defining the sub-application."""
+    attr: str
+    """Module attribute holding the ``typer.Typer`` instance."""
+    help: str
+    """Help text shown in ``uvmgr --help``."""
+
+
+# --------------------------------------------------------------------------- #
+# GENERATED by ``python -m uvmgr.commands._manifest`` – do not edit by hand.
+# --------------------------------------------------------------------------- #
+COMMANDS: tuple[CommandSpec, ...] = (
+    CommandSpec(name='deps', module='uvmgr.commands.deps', attr='app', help='Dependency management (uv add/remove/upgrade)'),
+    CommandSpec(name='build', module='uvmgr.commands.build', attr='app', help='Build wheel + sdist'),
+    CommandSpec(name='tests', module='uvmgr.commands.tests', attr='app', help='Run the test suite (and coverage) using pytest and coverage.'),
+    CommandSpec(name='cache', module='uvmgr.commands.cache', attr='app', help='Manage uv cache'),
+    CommandSpec(name='lint', module='uvmgr.commands.lint', attr='app', help='Run code quality checks and formatting using Ruff.'),
+    CommandSpec(name='otel', module='uvmgr.commands.otel', attr='app', help='OpenTelemetry validation and management'),
+    CommandSpec(name='guides', module='uvmgr.commands.guides', attr='app', help='Agent guide catalog management and versioning'),
+    CommandSpec(name='worktree', module='uvmgr.commands.worktree', attr='app', help='Git worktree isolation and management for multi-project development'),
+    CommandSpec(name='infodesign', module='uvmgr.commands.infodesign', attr='app', help='Intelligent information design with DSPy'),
+    CommandSpec(name='mermaid', module='uvmgr.commands.mermaid', attr='app', help='Full Mermaid support with Weaver Forge + DSPy'),
+    CommandSpec(name='dod', module='uvmgr.commands.dod', attr='app', help='🎯 Definition of Done automation with Weaver Forge exoskeleton'),
+    CommandSpec(name='docs', module='uvmgr.commands.docs', attr='app', help='📚 8020 Documentation automation with multi-layered approach'),
+    CommandSpec(name='aggregate', module='uvmgr.commands.aggregate', attr='app', help='Command aggregation with 8020 implementation using Spiff and Weaver'),
+    CommandSpec(name='performance', module='uvmgr.commands.performance', attr='app', help='⚡ Performance profiling and optimization'),
+    CommandSpec(name='release', module='uvmgr.commands.release', attr='app', help='Release helpers (Commitizen)'),
+    CommandSpec(name='weaver', module='uvmgr.commands.weaver', attr='app', help='OpenTelemetry Weaver semantic convention tools'),
+    CommandSpec(name='forge', module='uvmgr.commands.forge', attr='app', help='Forge workflow management for semantic convention development'),
+    CommandSpec(name='terraform', module='uvmgr.commands.terraform', attr='app', help='Enterprise Terraform support with 8020 Weaver Forge integration'),
+)
+# --------------------------------------------------------------------------- #
+
+
+def _typer_assignment(tree: ast.Module) -> tuple[str, str] | None:
+    """Return ``(attr, help)`` of the first module-level ``typer.Typer(...)``."""
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Call):
+            continue
+        func = node.value.func
+        if not (isinstance(func, ast.Attribute) and func.attr == "Typer"):
+            continue
+        target = node.targets[0]
+        if not isinstance(target, ast.Name):
+            continue
+        help_text = ""
+        for kw in node.value.keywords:
+            if kw.arg == "help" and isinstance(kw.value, ast.Constant):
+                help_text = str(kw.value.value)
+        return target.id, help_text
+    return None
+
+
+def build_manifest(verbs: list[str] | None = None) -> tuple[CommandSpec, ...]:
+    """
+    Build the manifest by statically parsing the command modules.
+
+    Parameters
+    ----------
+    verbs : list[str], optional
+        Module names under :mod:`uvmgr.commands`. Defaults to ``__all__``.
+
+    Returns
+    -------
+    tuple[CommandSpec, ...]
+        One entry per verb, in declaration order.
+
+    Raises
+    ------
+    ImportError
+        If a listed module has no module-level ``typer.Typer`` assignment.
+    """
+    if verbs is None:
+        from uvmgr.commands import __all__ as verbs
+
+    pkg_dir = Path(__file__).parent
+    specs = []
+    for verb in verbs:
+        source = (pkg_dir / f"{verb}.py").read_text(encoding="utf-8")
+        found = _typer_assignment(ast.parse(source))
+        if found is None:  # Fail fast during development
+            raise ImportError(f"`{verb}` has no Typer sub-app")
+        attr, help_text = found
+        specs.append(
+            CommandSpec(
+                name=verb.replace("_", "-"),
+                module=f"uvmgr.commands.{verb}",
+                attr=attr,
+                help=help_text,
+            )
+        )
+    return tuple(specs)
+
+
+def render_manifest(specs: tuple[CommandSpec, ...]) -> str:
+    """Render *specs* as the body of the :data:`COMMANDS` tuple."""
+    lines = [
+        f"    CommandSpec(name={s.name!r}, module={s.module!r}, attr={s.attr!r}, help={s.help!r}),"
+        for s in specs
+    ]
+    return "\n".join(lines)
+
+
+def write_manifest() -> Path:
+    """Regenerate :data:`COMMANDS` in this file from the current sources."""
+    path = Path(__file__)
+    text = path.read_text(encoding="utf-8")
+    head, rest = text.split("COMMANDS: tuple[CommandSpec, ...] = (\n", 1)
+    _, tail = rest.split("\n)\n", 1)
+    body = render_manifest(build_manifest())
+    path.write_text(
+        f"{head}COMMANDS: tuple[CommandSpec, ...] = (\n{body}\n)\n{tail}", encoding="utf-8"
+    )
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_manifest()}")
@@ -68,6 +68,7 @@ from enum import Enum
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.table import Table
@@ -77,6 +78,8 @@ from uvmgr.core.instrumentation import instrument_command, add_span_attributes,
 from uvmgr.core.semconv import WorkflowAttributes, WorkflowOperations, CliAttributes
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram, record_exception
 from uvmgr.ops.aggregate import (
+    MODE_COMMANDS,
+    CommandStatus,
     create_8020_workflow,
     execute_aggregation_workflow,
     analyze_command_dependencies,
@@ -234,7 +237,8 @@ def execute_8020_workflow(
                 result = execute_aggregation_workflow(
                     workflow_path=workflow_path,
                     parallel=parallel,
-                    validate_weaver=validate_weaver
+                    validate_weaver=validate_weaver,
+                    on_status=_print_command_status,
                 )
                 progress.advance(task4)
                 
@@ -538,7 +542,8 @@ def execute_workflow(
                 workflow_path=workflow_file,
                 parallel=parallel,
                 validate_weaver=validate_weaver,
-                timeout=timeout
+                timeout=timeout,
+                on_status=_print_command_status,
             )
             progress.advance(task)
         
@@ -692,17 +697,37 @@ def show_status(
 
 def _generate_execution_plan(workflow_path: Path, mode: AggregationMode, parallel: bool) -> Dict[str, Any]:
     """Generate execution plan for dry run mode."""
+    analysis = analyze_command_dependencies(MODE_COMMANDS.get(mode.value) or MODE_COMMANDS["development"])
+    groups = analysis["parallel_groups"]
     return {
         "workflow_file": str(workflow_path),
         "mode": mode.value,
         "parallel": parallel,
-        "estimated_commands": ["deps", "test", "build", "release"],
-        "estimated_duration": 120.0,
-        "critical_path": ["deps", "test", "build"],
-        "parallel_groups": [["deps"], ["test", "lint"], ["build"]],
+        "estimated_commands": analysis["commands"],
+        # With parallel execution each group costs its slowest command
+        "estimated_duration": sum(
+            max(analysis["metrics"][cmd]["execution_time"] for cmd in group) if parallel
+            else sum(analysis["metrics"][cmd]["execution_time"] for cmd in group)
+            for group in groups
+        ),
+        "critical_path": analysis["critical_path"],
+        "parallel_groups": groups,
     }
 
 
+_STATUS_ICONS = {"started": "▶️", "succeeded": "✅", "failed": "❌", "skipped": "⏭️"}
+
+
+def _print_command_status(status: CommandStatus):
+    """Stream one command's state change while the DAG executor runs."""
+    line = f"  {_STATUS_ICONS.get(status.state, '•')} {status.command} {status.state}"
+    if status.state != "started":
+        line += f" ({status.duration:.1f}s)"
+    if status.detail:
+        line += f" [dim]{escape(status.detail)}[/dim]"
+    console.print(line)
+
+
 def _display_execution_plan(plan: Dict[str, Any]):
     """Display execution plan for dry run mode."""
     console.print("\n📋 [bold]Execution Plan[/bold]")
@@ -73,6 +73,7 @@ from typing import List, Optional, Dict, Any
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -642,8 +643,8 @@ def quick_search(
             table.add_row(
                 result["session_id"][:8] + "...",
                 result["date"],
-                result.get("project", "N/A"),
-                result["preview"][:50] + "...",
+                result.get("project") or "N/A",
+                escape(result.get("snippet") or result["preview"][:50] + "..."),
                 str(result.get("message_count", "?"))
             )
         
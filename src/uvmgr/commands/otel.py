@@ -85,6 +85,7 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from uvmgr.core.code_index import ProjectIndex, Symbol, get_project_index
 from uvmgr.core.instrumentation import add_span_attributes, add_span_event, instrument_command
 from uvmgr.core.semconv import CliAttributes, PackageAttributes
 from uvmgr.core.shell import colour
@@ -154,33 +155,63 @@ def check_function_telemetry(node: ast.FunctionDef, source_lines: list[str]) ->
     return FunctionInfo(node.name, node.lineno, False, None)
 
 
-def analyze_file(file_path: Path) -> FileStats:
-    """Analyze a Python file for telemetry coverage."""
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-            source_lines = content.splitlines()
-    except Exception as e:
-        console.print(f"[red]Error reading {file_path}: {e}[/red]")
-        return FileStats(0, 0, [])
+def symbol_telemetry(symbol: Symbol) -> FunctionInfo:
+    """Check an indexed function symbol for telemetry instrumentation."""
+    # Skip private functions and test functions
+    if symbol.name.startswith("_") or symbol.name.startswith("test_"):
+        return FunctionInfo(symbol.name, symbol.line, True, "skipped")
 
-    try:
-        tree = ast.parse(content)
-    except SyntaxError as e:
-        console.print(f"[red]Syntax error in {file_path}: {e}[/red]")
+    # Check decorators for instrumentation
+    for decorator in symbol.detail.get("decorators", []):
+        if "instrument_command" in decorator or "instrument_subcommand" in decorator:
+            return FunctionInfo(symbol.name, symbol.line, True, "decorator")
+        if "timed" in decorator:
+            return FunctionInfo(symbol.name, symbol.line, True, "timed")
+
+    # Check function body for 'with span' usage
+    for context in symbol.detail.get("contexts", []):
+        if context.endswith("span"):
+            return FunctionInfo(symbol.name, symbol.line, True, "span")
+        if context.endswith("timer"):
+            return FunctionInfo(symbol.name, symbol.line, True, "timer")
+
+    return FunctionInfo(symbol.name, symbol.line, False, None)
+
+
+def analyze_file(file_path: Path, index: ProjectIndex | None = None) -> FileStats:
+    """
+    Analyze a Python file for telemetry coverage.
+
+    Functions are read from the project symbol index; pass *index* when
+    analysing many files so it is refreshed once by the caller.
+    """
+    if index is None:
+        index = get_project_index(file_path)
+        try:
+            index.refresh(file_path)
+        except OSError as e:
+            console.print(f"[red]Error reading {file_path}: {e}[/red]")
+            return FileStats(0, 0, [])
+
+    record = index.file(file_path)
+    if record is None:
+        console.print(f"[red]Error reading {file_path}: not indexed[/red]")
+        return FileStats(0, 0, [])
+    if record.error:
+        console.print(f"[red]Syntax error in {file_path}: {record.error}[/red]")
         return FileStats(0, 0, [])
 
     functions = []
 
     # Find all functions in the file
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            # Skip test methods in test files
-            if "test_" in str(file_path) and node.name.startswith("test_"):
-                continue
+    for symbol in index.symbols(kind="function", path=file_path):
+        if symbol.is_async:
+            continue
+        # Skip test methods in test files
+        if "test_" in str(file_path) and symbol.name.startswith("test_"):
+            continue
 
-            func_info = check_function_telemetry(node, source_lines)
-            functions.append(func_info)
+        functions.append(symbol_telemetry(symbol))
 
     instrumented = sum(1 for f in functions if f.has_telemetry)
     return FileStats(len(functions), instrumented, functions)
@@ -222,7 +253,10 @@ def coverage(
         console.print(f"[red]Error: {path} directory not found[/red]")
         raise typer.Exit(1)
 
-    py_files = list(path.rglob("*.py"))
+    index = get_project_index(path)
+    index.refresh(path)
+    # Keep paths in the form given on the command line for reporting
+    py_files = [path / record.path.relative_to(path.resolve()) for record in index.files(path)]
 
     # Exclude certain files
     excluded_patterns = ["__pycache__", "__init__.py", "__main__.py", "test_"]
@@ -250,7 +284,7 @@ def coverage(
         task = progress.add_task(f"[cyan]Analyzing {len(py_files)} files...", total=len(py_files))
 
         for py_file in py_files:
-            stats = analyze_file(py_file)
+            stats = analyze_file(py_file, index)
             if stats.total_functions > 0:
                 all_stats[py_file] = stats
 
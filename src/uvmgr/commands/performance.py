@@ -6,7 +6,9 @@ This module provides performance analysis capabilities following the 80/20 princ
 """
 
 import time
+import tomllib
 import typer
+from dataclasses import asdict
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
@@ -17,13 +19,27 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from uvmgr.core.instrumentation import instrument_command, add_span_event
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram
 from uvmgr.core.semconv import CliAttributes
+from uvmgr.runtime.benchmark import (
+    DEFAULT_BENCHMARKS,
+    BenchmarkResult,
+    BenchmarkSpec,
+    Comparison,
+    baseline_path,
+    compare_results,
+    default_suite,
+    host_key,
+    load_baseline,
+    run_benchmark,
+    run_suite,
+    save_baseline,
+)
 
 app = typer.Typer(help="⚡ Performance profiling and optimization")
 console = Console()
 
 
 @app.command("profile")
-@instrument_command
+@instrument_command("performance_profile", track_args=True)
 def profile_project(
     path: Optional[Path] = typer.Option(None, "--path", "-p", help="Project path to profile"),
     target: str = typer.Option("all", "--target", "-t", help="Profile target (all, deps, tests, build, startup)"),
@@ -43,9 +59,9 @@ def profile_project(
     profile_path = path or Path.cwd()
     
     console.print(Panel(
-        f"⚡ [bold]Performance Profiling[/bold]\\n"
-        f"Path: {profile_path}\\n"
-        f"Target: {target}\\n"
+        f"⚡ [bold]Performance Profiling[/bold]\n"
+        f"Path: {profile_path}\n"
+        f"Target: {target}\n"
         f"Format: {output_format}",
         title="Performance Analysis"
     ))
@@ -67,7 +83,7 @@ def profile_project(
             # Apply optimizations if requested
             if optimize:
                 optimizations = _apply_performance_optimizations(profile_path, results)
-                console.print(f"\\n✨ Applied {len(optimizations)} performance optimizations")
+                console.print(f"\n✨ Applied {len(optimizations)} performance optimizations")
                 for opt in optimizations:
                     console.print(f"  • {opt}")
             
@@ -80,76 +96,104 @@ def profile_project(
 
 
 @app.command("benchmark")
-@instrument_command
+@instrument_command("performance_benchmark", track_args=True)
 def benchmark_commands(
-    commands: str = typer.Option("deps,tests,build", "--commands", help="Commands to benchmark (comma-separated)"),
-    iterations: int = typer.Option(3, "--iterations", "-i", help="Number of benchmark iterations"),
+    commands: str = typer.Option(",".join(DEFAULT_BENCHMARKS), "--commands", help="Benchmarks to run (comma-separated)"),
+    iterations: int = typer.Option(10, "--iterations", "-i", help="Measured repetitions per benchmark"),
+    warmup: int = typer.Option(1, "--warmup", help="Unmeasured warmup runs per benchmark"),
     baseline: bool = typer.Option(False, "--baseline", help="Record as baseline for comparison"),
+    compare: bool = typer.Option(False, "--compare", help="Compare against this host's baseline"),
+    fail_on_regression: Optional[float] = typer.Option(
+        None, "--fail-on-regression", help="Exit 1 if a median regresses by more than this percentage (implies --compare)"
+    ),
+    path: Optional[Path] = typer.Option(None, "--path", "-p", help="Project path (baselines live in .uvmgr/bench)"),
+    output_format: str = typer.Option("table", "--format", "-f", help="Output format (table, json)"),
 ) -> None:
     """
     🏃 Benchmark uvmgr command performance.
     
-    Measures execution time for common commands to identify performance regressions.
+    Runs each benchmark with warmup and repeated measurement, reports
+    median/IQR/p95, CPU time and peak RSS, and optionally stores or compares
+    against a per-host baseline so CI can gate on regressions.
     """
-    console.print(Panel(
-        f"🏃 [bold]Performance Benchmarking[/bold]\\n"
-        f"Commands: {commands}\\n"
-        f"Iterations: {iterations}",
-        title="Benchmark Suite"
-    ))
+    project_path = (path or Path.cwd()).resolve()
+    command_list = [cmd.strip() for cmd in commands.split(",") if cmd.strip()]
+    compare = compare or fail_on_regression is not None
+    threshold = fail_on_regression if fail_on_regression is not None else 10.0
+    
+    if fail_on_regression is not None and not baseline and load_baseline(project_path) is None:
+        # Gating without a baseline would pass every run
+        console.print(
+            f"[red]❌ --fail-on-regression needs a baseline, but there is none at "
+            f"{baseline_path(project_path)}; record one with --baseline first[/red]"
+        )
+        raise typer.Exit(1)
     
-    command_list = [cmd.strip() for cmd in commands.split(",")]
+    if output_format == "table":
+        console.print(Panel(
+            f"🏃 [bold]Performance Benchmarking[/bold]\n"
+            f"Commands: {', '.join(command_list)}\n"
+            f"Iterations: {iterations} (+{warmup} warmup)",
+            title="Benchmark Suite"
+        ))
     
     try:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=output_format != "table",
         ) as progress:
+            task = progress.add_task("Benchmarking...", total=len(command_list))
             
-            results = {}
+            def on_result(result: BenchmarkResult) -> None:
+                progress.update(task, advance=1, description=f"Benchmarked {result.name}")
             
-            for command in command_list:
-                task = progress.add_task(f"Benchmarking {command}...", total=iterations)
-                
-                times = []
-                for i in range(iterations):
-                    start_time = time.time()
-                    success = _run_benchmark_command(command)
-                    duration = time.time() - start_time
-                    times.append(duration)
-                    
-                    progress.update(task, advance=1)
-                
-                results[command] = {
-                    "avg_time": sum(times) / len(times),
-                    "min_time": min(times),
-                    "max_time": max(times),
-                    "success": all(times),  # Simplified success check
-                    "iterations": iterations
-                }
-        
-        # Display benchmark results
+            results = run_suite(command_list, project_path, warmup=warmup, repetitions=iterations,
+                                on_result=on_result)
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise typer.Exit(2)
+    
+    comparisons = []
+    if compare:
+        stored = load_baseline(project_path)
+        if stored is None:
+            console.print(f"[yellow]⚠️  No baseline at {baseline_path(project_path)}; run with --baseline first[/yellow]")
+        else:
+            comparisons = compare_results(results, stored, threshold)
+            compared = {c.name for c in comparisons}
+            missing = [name for name, r in results.items() if r.ok and name not in compared]
+            if missing:
+                console.print(f"[yellow]⚠️  Not in the baseline, so not compared: {', '.join(missing)}[/yellow]")
+    
+    if output_format == "table":
         _display_benchmark_table(results)
-        
-        # Record metrics
-        for command, data in results.items():
-            metric_histogram("performance.benchmark.duration")(
-                data["avg_time"], 
-                {"command": command}
-            )
-        
-        if baseline:
-            _save_baseline(results)
-            console.print("\\n📊 Baseline saved for future comparison")
+        if comparisons:
+            _display_comparison_table(comparisons, threshold)
+    else:
+        console.print_json(data={
+            "host": host_key(),
+            "results": {name: r.to_dict() for name, r in results.items()},
+            "comparisons": [asdict(c) for c in comparisons],
+        })
     
-    except Exception as e:
-        console.print(f"[red]❌ Benchmarking failed: {e}[/red]")
+    if baseline:
+        saved = save_baseline(results, project_path)
+        console.print(f"\n📊 Baseline saved to {saved}")
+    
+    failed = [name for name, r in results.items() if not r.ok]
+    regressions = [c.name for c in comparisons if c.regression]
+    if failed:
+        console.print(f"[red]❌ Benchmarks failed: {', '.join(failed)}[/red]")
+    if fail_on_regression is not None and regressions:
+        console.print(f"[red]❌ Regressions over {threshold:g}%: {', '.join(regressions)}[/red]")
+    if failed or (fail_on_regression is not None and regressions):
         raise typer.Exit(1)
 
 
 @app.command("optimize")
-@instrument_command
+@instrument_command("performance_optimize", track_args=True)
 def optimize_project(
     path: Optional[Path] = typer.Option(None, "--path", "-p", help="Project path"),
     target: str = typer.Option("cache", "--target", "-t", help="Optimization target (cache, deps, config)"),
@@ -163,9 +207,9 @@ def optimize_project(
     opt_path = path or Path.cwd()
     
     console.print(Panel(
-        f"🚀 [bold]Performance Optimization[/bold]\\n"
-        f"Path: {opt_path}\\n"
-        f"Target: {target}\\n"
+        f"🚀 [bold]Performance Optimization[/bold]\n"
+        f"Path: {opt_path}\n"
+        f"Target: {target}\n"
         f"Dry Run: {'Yes' if dry_run else 'No'}",
         title="Optimization"
     ))
@@ -177,14 +221,14 @@ def optimize_project(
             console.print("[green]✅ Project is already optimized![/green]")
             return
         
-        console.print(f"\\n🔍 Found {len(optimizations)} optimization opportunities:")
+        console.print(f"\n🔍 Found {len(optimizations)} optimization opportunities:")
         for i, opt in enumerate(optimizations, 1):
             status = "[dim](will apply)[/dim]" if not dry_run else "[yellow](dry run)[/yellow]"
             console.print(f"  {i}. {opt['description']} {status}")
         
         if not dry_run:
             applied = _apply_optimizations(opt_path, optimizations)
-            console.print(f"\\n✨ Applied {len(applied)} optimizations successfully!")
+            console.print(f"\n✨ Applied {len(applied)} optimizations successfully!")
             
             # Measure improvement
             improvement = _measure_optimization_impact(opt_path, applied)
@@ -197,7 +241,7 @@ def optimize_project(
 
 
 @app.command("monitor")
-@instrument_command
+@instrument_command("performance_monitor", track_args=True)
 def monitor_performance(
     duration: int = typer.Option(60, "--duration", "-d", help="Monitoring duration in seconds"),
     interval: int = typer.Option(5, "--interval", "-i", help="Monitoring interval in seconds"),
@@ -209,9 +253,9 @@ def monitor_performance(
     Tracks command execution times and alerts on performance degradation.
     """
     console.print(Panel(
-        f"📊 [bold]Performance Monitoring[/bold]\\n"
-        f"Duration: {duration}s\\n"
-        f"Interval: {interval}s\\n"
+        f"📊 [bold]Performance Monitoring[/bold]\n"
+        f"Duration: {duration}s\n"
+        f"Interval: {interval}s\n"
         f"Threshold: {threshold}s",
         title="Real-time Monitoring"
     ))
@@ -244,7 +288,7 @@ def monitor_performance(
         _display_monitoring_summary(measurements)
     
     except KeyboardInterrupt:
-        console.print("\\n[yellow]Monitoring stopped by user[/yellow]")
+        console.print("\n[yellow]Monitoring stopped by user[/yellow]")
     except Exception as e:
         console.print(f"[red]❌ Monitoring failed: {e}[/red]")
         raise typer.Exit(1)
@@ -265,13 +309,13 @@ def _run_performance_analysis(project_path: Path, target: str, benchmark: bool)
         results["metrics"]["startup"] = _analyze_startup_performance()
     
     if target in ["all", "deps"]:
-        results["metrics"]["dependencies"] = _analyze_dependency_performance(project_path)
+        results["metrics"]["dependencies"] = _analyze_dependency_performance(project_path, benchmark)
     
     if target in ["all", "tests"]:
         results["metrics"]["tests"] = _analyze_test_performance(project_path)
     
     if target in ["all", "build"]:
-        results["metrics"]["build"] = _analyze_build_performance(project_path)
+        results["metrics"]["build"] = _analyze_build_performance(project_path, benchmark)
     
     return results
 
@@ -317,26 +361,42 @@ def _analyze_startup_performance() -> dict:
     }
 
 
-def _analyze_dependency_performance(project_path: Path) -> dict:
+def _read_pyproject(project_path: Path) -> Optional[dict]:
+    """Parsed pyproject.toml, ``{}`` if it is invalid, ``None`` if missing."""
+    try:
+        return tomllib.loads((project_path / "pyproject.toml").read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def _analyze_dependency_performance(project_path: Path, benchmark: bool = False) -> dict:
     """Analyze dependency resolution performance."""
-    # Check pyproject.toml complexity, number of dependencies
-    deps_file = project_path / "pyproject.toml"
+    pyproject = _read_pyproject(project_path)
     
-    if not deps_file.exists():
+    if pyproject is None:
         return {"status": "no_deps_file", "recommendations": ["Add pyproject.toml for faster dependency management"]}
-    
-    try:
-        content = deps_file.read_text()
-        deps_count = content.count('=')  # Rough dependency count
-        
-        return {
-            "dependencies_count": deps_count,
-            "resolution_time": min(deps_count * 0.01, 2.0),  # Estimated
-            "status": "good" if deps_count < 50 else "optimization_needed",
-            "recommendations": ["Consider dependency groups"] if deps_count > 20 else []
-        }
-    except Exception:
+    if not pyproject:
         return {"status": "error", "recommendations": ["Fix pyproject.toml syntax"]}
+    
+    project = pyproject.get("project", {})
+    optional = project.get("optional-dependencies", {})
+    groups = pyproject.get("dependency-groups", {})
+    deps_count = len(project.get("dependencies", []))
+    extra_count = sum(len(v) for v in optional.values()) + sum(len(v) for v in groups.values())
+    
+    results = {
+        "dependencies_count": deps_count,
+        "optional_dependencies_count": extra_count,
+        "status": "good" if deps_count < 50 else "optimization_needed",
+        "recommendations": ["Consider dependency groups"] if deps_count > 20 and not groups else []
+    }
+    if benchmark:
+        measured = run_benchmark(default_suite(project_path)["deps"], project_path, warmup=1, repetitions=3)
+        if measured.ok:
+            results["resolution_time"] = measured.median
+    return results
 
 
 def _analyze_test_performance(project_path: Path) -> dict:
@@ -357,61 +417,30 @@ def _analyze_test_performance(project_path: Path) -> dict:
     }
 
 
-def _analyze_build_performance(project_path: Path) -> dict:
+def _analyze_build_performance(project_path: Path, benchmark: bool = False) -> dict:
     """Analyze build performance."""
-    pyproject_file = project_path / "pyproject.toml"
+    pyproject = _read_pyproject(project_path)
     
-    if not pyproject_file.exists():
+    if pyproject is None:
         return {"status": "no_build_config", "recommendations": ["Add build configuration"]}
     
-    return {
-        "build_backend": "hatchling",  # Would detect actual backend
-        "estimated_build_time": 5.0,
-        "status": "good",
-        "recommendations": ["Consider wheel caching for faster builds"]
-    }
-
-
-def _run_benchmark_command(command: str) -> bool:
-    """Run a benchmark for a specific command."""
-    import subprocess
-    import time
-    
-    # Map commands to actual uvmgr commands
-    command_map = {
-        "deps": ["uvmgr", "deps", "list"],
-        "tests": ["uvmgr", "tests", "--help"],  # Use help to avoid actually running tests
-        "build": ["uvmgr", "build", "--help"],
-        "lint": ["uvmgr", "lint", "--help"],
+    backend = pyproject.get("build-system", {}).get("build-backend")
+    results = {
+        "build_backend": backend or "setuptools.build_meta:__legacy__",
+        "status": "good" if backend else "optimization_needed",
+        "recommendations": [] if backend else ["Declare [build-system] build-backend explicitly"]
     }
-    
-    cmd = command_map.get(command)
-    if not cmd:
-        return False
-    
-    try:
-        # Run the actual command and measure time
-        start_time = time.time()
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        execution_time = time.time() - start_time
+    if benchmark:
+        import tempfile
         
-        # Store in telemetry
-        add_span_event("benchmark.command_executed", {
-            "command": command,
-            "execution_time": execution_time,
-            "exit_code": result.returncode
-        })
-        
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        return False
-    except Exception:
-        return False
+        with tempfile.TemporaryDirectory() as out_dir:
+            spec = BenchmarkSpec("build", "uv build --wheel", argv=["uv", "build", "--wheel", "--out-dir", out_dir], timeout=600)
+            measured = run_benchmark(spec, project_path, warmup=0, repetitions=1)
+        if measured.ok:
+            results["build_time"] = measured.median
+        else:
+            results["status"] = "build_failed"
+    return results
 
 
 def _identify_optimizations(project_path: Path, target: str) -> list:
@@ -564,7 +593,8 @@ def _display_performance_table(results: dict) -> None:
     
     for component, data in results.get("metrics", {}).items():
         status = data.get("status", "unknown")
-        duration = f"{data.get('resolution_time', data.get('estimated_runtime', data.get('total_startup', 0))):.2f}s"
+        seconds = next((data[k] for k in ("resolution_time", "build_time", "estimated_runtime", "total_startup") if k in data), None)
+        duration = f"{seconds:.2f}s" if seconds is not None else "-"
         recommendations = "; ".join(data.get("recommendations", ["None"]))[:50]
         
         table.add_row(component.title(), status, duration, recommendations)
@@ -576,23 +606,46 @@ def _display_benchmark_table(results: dict) -> None:
     """Display benchmark results in table format."""
     table = Table(title="Benchmark Results")
     table.add_column("Command", style="cyan")
-    table.add_column("Avg Time", style="green")
-    table.add_column("Min Time", style="blue")
-    table.add_column("Max Time", style="yellow")
-    table.add_column("Iterations", style="white")
+    table.add_column("Median", style="green")
+    table.add_column("IQR", style="blue")
+    table.add_column("p95", style="yellow")
+    table.add_column("CPU", style="magenta")
+    table.add_column("Max RSS", style="magenta")
+    table.add_column("Runs", style="white")
     
     for command, data in results.items():
+        if not data.ok:
+            table.add_row(command, "[red]failed[/red]", "-", "-", "-", "-", f"0/{data.runs}")
+            continue
         table.add_row(
             command,
-            f"{data['avg_time']:.3f}s",
-            f"{data['min_time']:.3f}s",
-            f"{data['max_time']:.3f}s",
-            str(data['iterations'])
+            f"{data.median:.3f}s",
+            f"{data.iqr:.3f}s",
+            f"{data.p95:.3f}s",
+            f"{data.cpu_seconds:.3f}s" if data.cpu_seconds is not None else "-",
+            f"{data.max_rss / 2**20:.1f} MB" if data.max_rss is not None else "-",
+            f"{data.runs - data.failures}/{data.runs}"
         )
     
     console.print(table)
 
 
+def _display_comparison_table(comparisons: list[Comparison], threshold: float) -> None:
+    """Display benchmark medians against the stored baseline."""
+    table = Table(title=f"Baseline Comparison ({host_key()}, threshold {threshold:g}%)")
+    table.add_column("Command", style="cyan")
+    table.add_column("Baseline", style="blue")
+    table.add_column("Current", style="green")
+    table.add_column("Change", style="yellow")
+    table.add_column("Status", style="white")
+    
+    for c in comparisons:
+        status = "🔴 Regression" if c.regression else ("🟢 Faster" if c.change_pct < 0 else "⚪ Within noise")
+        table.add_row(c.name, f"{c.baseline_median:.3f}s", f"{c.current_median:.3f}s", f"{c.change_pct:+.1f}%", status)
+    
+    console.print(table)
+
+
 def _display_monitoring_summary(measurements: list) -> None:
     """Display monitoring summary."""
     if not measurements:
@@ -615,7 +668,7 @@ def _display_monitoring_summary(measurements: list) -> None:
 
 def _show_performance_summary(results: dict) -> None:
     """Show performance analysis summary and recommendations."""
-    console.print("\\n📊 [bold]Performance Summary:[/bold]")
+    console.print("\n📊 [bold]Performance Summary:[/bold]")
     
     all_recommendations = []
     for component, data in results.get("metrics", {}).items():
@@ -623,19 +676,13 @@ def _show_performance_summary(results: dict) -> None:
         all_recommendations.extend(recommendations)
     
     if all_recommendations:
-        console.print("\\n💡 [bold]Optimization Recommendations:[/bold]")
+        console.print("\n💡 [bold]Optimization Recommendations:[/bold]")
         for i, rec in enumerate(all_recommendations[:5], 1):  # Show top 5
             console.print(f"  {i}. {rec}")
         
-        console.print("\\n[dim]Run 'uvmgr performance optimize' to apply optimizations[/dim]")
+        console.print("\n[dim]Run 'uvmgr performance optimize' to apply optimizations[/dim]")
     else:
-        console.print("\\n[green]✅ No performance issues detected![/green]")
-
-
-def _save_baseline(results: dict) -> None:
-    """Save benchmark results as baseline."""
-    # Would save to a file for future comparison
-    pass
+        console.print("\n[green]✅ No performance issues detected![/green]")
 
 
 if __name__ == "__main__":
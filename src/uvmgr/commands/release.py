@@ -45,9 +45,12 @@ app = typer.Typer(help="Release helpers (Commitizen)")
 
 @app.command("bump")
 @instrument_command("release_bump", track_args=True)
-def _bump():
-    rel_ops.bump()
-    colour("✔ version bumped", "green")
+def _bump(
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show the next version without committing or tagging"),
+):
+    rel_ops.bump(dry_run=dry_run)
+    if not dry_run:
+        colour("✔ version bumped", "green")
 
 
 @app.command("changelog")
@@ -79,7 +79,21 @@ def run_tests(
     test_type: List[str] = typer.Option([], "--type", "-t", help="Test types to run (unit, integration, e2e)"),
     markers: List[str] = typer.Option([], "--marker", "-m", help="Test markers to run"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output results as JSON"),
-    generate_report: bool = typer.Option(True, "--report/--no-report", help="Generate comprehensive test report")
+    generate_report: bool = typer.Option(True, "--report/--no-report", help="Generate comprehensive test report"),
+    impact: bool = typer.Option(
+        False, "--impact", "-i",
+        help="Run only tests affected by changes since their last run, plus previous failures",
+    ),
+    shards: int = typer.Option(1, "--shards", min=1, help="Split the suite into N shards of equal expected duration"),
+    shard_index: int = typer.Option(0, "--shard-index", min=0, help="0-based shard to run (with --shards)"),
+    dist: str = typer.Option(
+        "load", "--dist",
+        help="Test ordering for parallel runs: 'load' (collection order) or 'timing' (slowest first)",
+    ),
+    durations_file: Path = typer.Option(
+        None, "--durations-file",
+        help="JSON {nodeid: seconds} timings to schedule with (and update); share it across CI shards",
+    ),
 ):
     """
     🧪 Run comprehensive test suite with intelligent optimization.
@@ -93,8 +107,28 @@ def run_tests(
     
     The command automatically discovers and categorizes tests by type (unit, integration, e2e)
     and provides detailed analytics and recommendations for improving test quality.
+    
+    With --impact, tests are mapped to the project modules they import and only
+    the tests whose dependencies changed (or that failed last time) run, slowest
+    first. Intended for pre-commit hooks; keep full runs in CI.
+    
+    With --shards N --shard-index i, the suite is split into N shards of about
+    equal expected duration (from recorded per-test timings) and shard i runs;
+    use one matrix job per index. --dist timing orders tests slowest-first for
+    xdist workers.
     """
+    if dist not in ("load", "timing"):
+        console.print(f"[red]❌ Unknown --dist mode: {dist} (expected 'load' or 'timing')[/red]")
+        raise typer.Exit(2)
+    if shard_index >= shards:
+        console.print(f"[red]❌ --shard-index must be below --shards ({shards})[/red]")
+        raise typer.Exit(2)
+
+    if impact:
+        _run_impacted_tests(verbose, parallel, coverage, fail_fast, markers, json_output)
+        return
     
+
     # Parse test types
     test_types = []
     if test_type:
@@ -118,7 +152,10 @@ def run_tests(
         "test.parallel": parallel,
         "test.coverage": coverage,
         "test.types": [t.value for t in test_types],
-        "test.markers": markers
+        "test.markers": markers,
+        "test.shards": shards,
+        "test.shard_index": shard_index,
+        "test.dist": dist
     })
     add_span_event("tests.comprehensive.started", {
         "test_types": [t.value for t in test_types],
@@ -131,21 +168,28 @@ def run_tests(
         f"Types: {', '.join(t.value for t in test_types)}\n"
         f"Parallel: {'✅' if parallel else '❌'}\n"
         f"Coverage: {'✅' if coverage else '❌'}\n"
-        f"Markers: {', '.join(markers) if markers else 'None'}",
+        f"Markers: {', '.join(markers) if markers else 'None'}"
+        + (f"\nShard: {shard_index + 1}/{shards}" if shards > 1 else "")
+        + ("\nOrdering: slowest first" if dist == "timing" else ""),
         title="Test Configuration"
     ))
     
     try:
         # Use the comprehensive testing infrastructure
+        infrastructure = get_test_infrastructure()
+        
         async def _run_tests():
-            infrastructure = get_test_infrastructure()
             return await infrastructure.run_tests(
                 test_types=test_types,
                 parallel=parallel,
                 coverage=coverage,
                 fail_fast=fail_fast,
                 verbose=verbose,
-                markers=markers
+                markers=markers,
+                shards=shards,
+                shard_index=shard_index,
+                dist=dist,
+                durations_file=durations_file
             )
         
         # Run tests asynchronously
@@ -158,6 +202,14 @@ def run_tests(
             test_suite = asyncio.run(_run_tests())
             progress.update(task, description="Test execution completed")
         
+        if infrastructure.shard_plan is not None:
+            plan = infrastructure.shard_plan
+            console.print(
+                f"🧩 Shard {plan.index + 1}/{plan.shards}: {len(plan.node_ids)} test(s), "
+                f"expected {plan.expected_duration:.1f}s "
+                f"(shards range {min(plan.loads):.1f}s-{max(plan.loads):.1f}s)"
+            )
+        
         # Generate comprehensive report
         if generate_report:
             reporter = TestReporter(Path.cwd())
@@ -191,6 +243,39 @@ def run_tests(
         raise typer.Exit(1)
 
 
+def _run_impacted_tests(verbose, parallel, coverage, fail_fast, markers, json_output):
+    """Run only the tests affected since their last run."""
+    from uvmgr.ops.tests import run_test_suite
+
+    add_span_event("tests.impact.started", {"parallel": parallel})
+    result = run_test_suite(
+        verbose=verbose,
+        parallel=parallel,
+        coverage=coverage,
+        fail_fast=fail_fast,
+        markers=markers,
+        on_line=None if json_output else (lambda line: console.print(line, markup=False, highlight=False)),
+        impact=True,
+    )
+    summary = result.get("impact", {})
+    add_span_event("tests.impact.completed", {"success": result.get("success", False), **summary})
+
+    if json_output:
+        dump_json(result)
+    else:
+        console.print(
+            f"\n🎯 Impact: {summary.get('affected_files', 0)} affected file(s), "
+            f"{summary.get('rerun_tests', 0)} previously failing test(s), "
+            f"{summary.get('skipped_files', 0)} file(s) skipped"
+        )
+    if not result.get("success", False):
+        if not json_output:
+            console.print(f"[red]❌ {result.get('error') or str(result.get('failed', 0)) + ' test(s) failed'}[/red]")
+        raise typer.Exit(1)
+    if not json_output:
+        console.print(f"[green]✅ {result.get('passed', 0)} test(s) passed[/green]")
+
+
 def _display_test_results(test_suite, report):
     """Display comprehensive test results."""
     
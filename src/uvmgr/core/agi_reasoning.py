@@ -10,18 +10,60 @@ This module fills the critical gaps between basic observability and AGI-level un
 4. **Autonomous Improvement**: Self-modifies based on observations
 
 The 80/20 approach: 20% of AGI capabilities that provide 80% of intelligent behavior.
+
+Observation cost is constant: observations live in a ring buffer of
+:data:`MAX_OBSERVATIONS`, causal predecessors come from a per-command index of
+recent observations, and learned patterns are keyed by hashable pattern keys.
+Set ``UVMGR_AGI_BACKGROUND=1`` to move reasoning onto a background thread so
+:func:`observe_with_agi_reasoning` returns without waiting for it.
 """
 
 from __future__ import annotations
 
+import itertools
+import os
+import queue
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Set, Tuple
-from collections import defaultdict
-from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Hashable, List, Optional, Set, Tuple
 
 from uvmgr.core.semconv import CliAttributes, ProcessAttributes, TestAttributes
 
+MAX_OBSERVATIONS: int = int(os.getenv("UVMGR_AGI_MAX_OBSERVATIONS", 10_000))
+"""Observations (and learning events) kept in memory; older ones are dropped."""
+MAX_PREDECESSORS = 8
+"""Most recent observations per command considered as causal predecessors."""
+MAX_PATTERN_INSTANCES = 100
+"""Concrete instances kept per cross-domain pattern."""
+CAUSAL_WINDOW = 30.0
+"""Seconds within which an observation may cause another."""
+RECENT_WINDOW = 300.0
+"""Seconds of observations that make up the understanding confidence."""
+BACKGROUND: bool = os.getenv("UVMGR_AGI_BACKGROUND") == "1"
+
+# (cause command, effect command)
+CAUSAL_CHAINS = frozenset({
+    # Code changes lead to tests
+    ("deps", "tests"),
+    ("lint", "tests"),
+    ("build", "tests"),
+    # Development workflow chains
+    ("weaver", "forge"),
+    ("forge", "otel"),
+    ("otel", "tests"),
+    # External validation chains
+    ("install", "validate"),
+    ("validate", "test"),
+})
+_CAUSES: Dict[str, Tuple[str, ...]] = {}
+for _cause, _effect in CAUSAL_CHAINS:
+    _CAUSES[_effect] = _CAUSES.get(_effect, ()) + (_cause,)
+_CAUSE_COMMANDS = frozenset(cause for cause, _ in CAUSAL_CHAINS)
+
+_PATTERN_KEY_ATTRS = (CliAttributes.COMMAND, ProcessAttributes.COMMAND, TestAttributes.OPERATION)
+
 
 @dataclass 
 class SemanticObservation:
@@ -51,7 +93,7 @@ class CrossDomainPattern:
     """A pattern that generalizes across different domains/operations."""
     
     abstract_pattern: Dict[str, Any]
-    concrete_instances: List[Dict[str, Any]]
+    concrete_instances: Deque[Dict[str, Any]]
     domains: Set[str]
     generalization_confidence: float
     
@@ -65,19 +107,44 @@ class AGIReasoningEngine:
     - Causal inference from temporal patterns
     - Cross-domain pattern recognition
     - Autonomous learning and improvement
+    
+    Every per-observation structure is bounded or indexed, so the cost of
+    :meth:`observe` does not grow with the number of observations.
+    
+    Parameters
+    ----------
+    max_observations : int, optional
+        Ring-buffer size for observations and learning history.
+    background : bool, optional
+        Run causal reasoning and learning on a worker thread. :meth:`observe`
+        then returns before ``causal_predecessors`` is filled in; call
+        :meth:`flush` to wait for pending observations.
     """
     
-    def __init__(self):
-        self.observations: List[SemanticObservation] = []
+    def __init__(self, max_observations: int = MAX_OBSERVATIONS, background: bool = False):
+        self.observations: Deque[SemanticObservation] = deque(maxlen=max_observations)
         self.causal_patterns: List[CausalPattern] = []
         self.cross_domain_patterns: List[CrossDomainPattern] = []
-        self.learning_history: List[Dict[str, Any]] = []
+        self.learning_history: Deque[Dict[str, Any]] = deque(maxlen=max_observations)
         
         # AGI state tracking
         self.understanding_confidence = 0.0
         self.improvement_suggestions: List[str] = []
         self.meta_learning_insights: List[str] = []
         
+        # Indexes over the ring buffer
+        self._by_timestamp: Dict[float, SemanticObservation] = {}
+        self._latest_by_command: Dict[Any, Deque[SemanticObservation]] = {}
+        self._causal_index: Dict[Tuple[Hashable, Hashable], CausalPattern] = {}
+        self._cross_domain_index: Dict[Hashable, CrossDomainPattern] = {}
+        self._recent: Deque[SemanticObservation] = deque()
+        self._recent_confidence = 0.0
+        
+        self._lock = threading.RLock()
+        self._background = background
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        
     def observe(self, attributes: Dict[str, Any], context: Dict[str, Any] = None) -> SemanticObservation:
         """
         Create a semantic observation with AGI-level reasoning.
@@ -85,32 +152,81 @@ class AGIReasoningEngine:
         Goes beyond simple attribute tracking to infer intent, context, and meaning.
         """
         context = context or {}
-        timestamp = time.time()
-        
-        # AGI Capability 1: Intent Inference
-        inferred_intent = self._infer_intent(attributes, context)
-        
-        # AGI Capability 2: Causal Predecessor Detection
-        causal_predecessors = self._identify_causal_predecessors(attributes, timestamp)
-        
-        # AGI Capability 3: Confidence Assessment
-        confidence = self._assess_observation_confidence(attributes, context)
         
         observation = SemanticObservation(
-            timestamp=timestamp,
+            timestamp=time.time(),
             attributes=attributes,
             context=context,
-            inferred_intent=inferred_intent,
-            causal_predecessors=causal_predecessors,
-            confidence=confidence
+            # AGI Capability 1: Intent Inference
+            inferred_intent=self._infer_intent(attributes, context),
+            # AGI Capability 3: Confidence Assessment
+            confidence=self._assess_observation_confidence(attributes, context),
         )
         
-        self.observations.append(observation)
+        if self._background:
+            self._submit(observation)
+        else:
+            with self._lock:
+                self._process(observation)
+        
+        return observation
+    
+    def _process(self, observation: SemanticObservation):
+        """Reason about *observation* against the engine state (lock held)."""
+        # AGI Capability 2: Causal Predecessor Detection
+        observation.causal_predecessors = self._identify_causal_predecessors(
+            observation.attributes, observation.timestamp
+        )
+        
+        self._remember(observation)
         
         # AGI Capability 4: Real-time Learning
         self._learn_from_observation(observation)
+    
+    def _remember(self, observation: SemanticObservation):
+        """Append to the ring buffer and its indexes, dropping the oldest observation."""
+        if len(self.observations) == self.observations.maxlen:
+            evicted = self.observations[0]
+            if self._by_timestamp.get(evicted.timestamp) is evicted:
+                del self._by_timestamp[evicted.timestamp]
+        self.observations.append(observation)
+        self._by_timestamp.setdefault(observation.timestamp, observation)
         
-        return observation
+        command = observation.attributes.get(CliAttributes.COMMAND)
+        if command in _CAUSE_COMMANDS:
+            latest = self._latest_by_command.get(command)
+            if latest is None:
+                latest = self._latest_by_command[command] = deque(maxlen=MAX_PREDECESSORS)
+            latest.append(observation)
+        
+        self._recent.append(observation)
+        self._recent_confidence += observation.confidence
+    
+    def _submit(self, observation: SemanticObservation):
+        """Hand *observation* to the background worker, starting it on first use."""
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._queue = queue.Queue(maxsize=self.observations.maxlen)
+                    self._worker = threading.Thread(target=self._drain, name="agi-reasoning", daemon=True)
+                    self._worker.start()
+        self._queue.put(observation)
+    
+    def _drain(self):
+        while True:
+            observation = self._queue.get()
+            try:
+                with self._lock:
+                    self._process(observation)
+            except Exception:
+                pass  # reasoning is best-effort and must never kill the worker
+            finally:
+                self._queue.task_done()
+    
+    def flush(self):
+        """Wait until every submitted observation has been reasoned about."""
+        if self._queue is not None:
+            self._queue.join()
     
     def _infer_intent(self, attributes: Dict[str, Any], context: Dict[str, Any]) -> str:
         """
@@ -162,44 +278,23 @@ class AGIReasoningEngine:
         
         Analyzes temporal patterns to infer causality.
         """
-        predecessors = []
-        window = 30.0  # 30 second causal window
-        
-        # Look for recent observations that could be causal
-        for obs in reversed(self.observations):
-            if timestamp - obs.timestamp > window:
-                break
-                
-            # Causal inference patterns
-            if self._could_be_causal(obs.attributes, attributes):
-                predecessors.append(f"{obs.inferred_intent}@{obs.timestamp}")
-                
-        return predecessors
+        # Only commands with a known causal chain into this one can be causes,
+        # and only their latest MAX_PREDECESSORS observations are considered
+        candidates = [
+            obs
+            for cause in _CAUSES.get(attributes.get(CliAttributes.COMMAND, ""), ())
+            for obs in self._latest_by_command.get(cause, ())
+            if timestamp - obs.timestamp <= CAUSAL_WINDOW
+        ]
+        candidates.sort(key=lambda obs: obs.timestamp, reverse=True)
+        return [f"{obs.inferred_intent}@{obs.timestamp}" for obs in candidates[:MAX_PREDECESSORS]]
     
     def _could_be_causal(self, predecessor_attrs: Dict[str, Any], current_attrs: Dict[str, Any]) -> bool:
         """Determine if one observation could have caused another."""
-        
-        # Known causal patterns
-        causal_chains = [
-            # Code changes lead to tests
-            ("deps", "tests"),
-            ("lint", "tests"), 
-            ("build", "tests"),
-            
-            # Development workflow chains
-            ("weaver", "forge"),
-            ("forge", "otel"),
-            ("otel", "tests"),
-            
-            # External validation chains
-            ("install", "validate"),
-            ("validate", "test")
-        ]
-        
         pred_cmd = predecessor_attrs.get(CliAttributes.COMMAND, "")
         curr_cmd = current_attrs.get(CliAttributes.COMMAND, "")
         
-        return (pred_cmd, curr_cmd) in causal_chains
+        return (pred_cmd, curr_cmd) in CAUSAL_CHAINS
     
     def _assess_observation_confidence(self, attributes: Dict[str, Any], context: Dict[str, Any]) -> float:
         """
@@ -246,37 +341,30 @@ class AGIReasoningEngine:
     
     def _update_causal_patterns(self, observation: SemanticObservation):
         """Learn and update causal relationships."""
+        effect_key = self._pattern_key(observation.attributes)
         for predecessor_id in observation.causal_predecessors:
             # Find the predecessor observation
-            pred_timestamp = float(predecessor_id.split('@')[1])
-            predecessor = next(
-                (obs for obs in self.observations if obs.timestamp == pred_timestamp),
-                None
-            )
+            pred_timestamp = float(predecessor_id.rsplit('@', 1)[1])
+            predecessor = self._by_timestamp.get(pred_timestamp)
             
             if predecessor:
-                # Create or update causal pattern
-                pattern = CausalPattern(
-                    cause_pattern=predecessor.attributes.copy(),
-                    effect_pattern=observation.attributes.copy(),
-                    confidence=min(predecessor.confidence, observation.confidence),
-                    frequency=1,
-                    last_seen=observation.timestamp
-                )
-                
-                # Check if this pattern already exists
-                existing = next(
-                    (p for p in self.causal_patterns 
-                     if self._patterns_match(p.cause_pattern, pattern.cause_pattern) and
-                        self._patterns_match(p.effect_pattern, pattern.effect_pattern)),
-                    None
-                )
+                key = (self._pattern_key(predecessor.attributes), effect_key)
+                existing = self._causal_index.get(key)
                 
                 if existing:
                     existing.frequency += 1
                     existing.confidence = min(1.0, existing.confidence + 0.1)
                     existing.last_seen = observation.timestamp
                 else:
+                    # Create causal pattern
+                    pattern = CausalPattern(
+                        cause_pattern=predecessor.attributes.copy(),
+                        effect_pattern=observation.attributes.copy(),
+                        confidence=min(predecessor.confidence, observation.confidence),
+                        frequency=1,
+                        last_seen=observation.timestamp
+                    )
+                    self._causal_index[key] = pattern
                     self.causal_patterns.append(pattern)
     
     def _discover_cross_domain_patterns(self, observation: SemanticObservation):
@@ -286,11 +374,8 @@ class AGIReasoningEngine:
         
         if abstract_pattern:
             # Check if this fits an existing cross-domain pattern
-            existing = next(
-                (p for p in self.cross_domain_patterns 
-                 if self._abstract_patterns_match(p.abstract_pattern, abstract_pattern)),
-                None
-            )
+            key = abstract_pattern.get("operation_type")
+            existing = self._cross_domain_index.get(key)
             
             if existing:
                 existing.concrete_instances.append(observation.attributes)
@@ -300,10 +385,11 @@ class AGIReasoningEngine:
                 # Create new cross-domain pattern
                 pattern = CrossDomainPattern(
                     abstract_pattern=abstract_pattern,
-                    concrete_instances=[observation.attributes],
+                    concrete_instances=deque([observation.attributes], maxlen=MAX_PATTERN_INSTANCES),
                     domains={observation.context.get("domain", "unknown")},
                     generalization_confidence=0.5
                 )
+                self._cross_domain_index[key] = pattern
                 self.cross_domain_patterns.append(pattern)
     
     def _meta_learn(self, observation: SemanticObservation):
@@ -323,7 +409,8 @@ class AGIReasoningEngine:
         
         # Generate meta-learning insights
         if len(self.learning_history) >= 10:
-            avg_confidence = sum(e["observation_confidence"] for e in self.learning_history[-10:]) / 10
+            last_ten = itertools.islice(reversed(self.learning_history), 10)
+            avg_confidence = sum(e["observation_confidence"] for e in last_ten) / 10
             
             if avg_confidence > 0.8:
                 insight = "High-confidence observation pattern detected - learning acceleration possible"
@@ -340,16 +427,30 @@ class AGIReasoningEngine:
             self.understanding_confidence = 0.0
             return
             
-        # Base confidence on recent observations
-        recent_obs = [obs for obs in self.observations if time.time() - obs.timestamp < 300]  # 5 minutes
-        if recent_obs:
-            avg_confidence = sum(obs.confidence for obs in recent_obs) / len(recent_obs)
-            self.understanding_confidence = avg_confidence
+        # Base confidence on recent observations (running sum over a sliding window)
+        self._expire_recent(time.time())
+        if self._recent:
+            self.understanding_confidence = self._recent_confidence / len(self._recent)
         
         # Boost confidence with learned patterns
         pattern_boost = min(0.3, len(self.causal_patterns) * 0.05 + len(self.cross_domain_patterns) * 0.1)
         self.understanding_confidence = min(1.0, self.understanding_confidence + pattern_boost)
     
+    def _expire_recent(self, now: float):
+        """Drop observations older than :data:`RECENT_WINDOW` (or evicted) from the window."""
+        recent = self._recent
+        limit = self.observations.maxlen
+        while recent and (now - recent[0].timestamp >= RECENT_WINDOW or len(recent) > limit):
+            self._recent_confidence -= recent.popleft().confidence
+        if not recent:
+            self._recent_confidence = 0.0  # reset float drift
+    
+    def _rescale_confidence(self, observation: SemanticObservation, factor: float):
+        """Scale the confidence of a remembered observation, keeping the window sum in step."""
+        if self._recent and self._recent[-1] is observation:
+            self._recent_confidence += observation.confidence * (factor - 1)
+        observation.confidence *= factor
+    
     def generate_improvement_suggestions(self) -> List[str]:
         """
         AGI-level autonomous improvement suggestions.
@@ -388,28 +489,36 @@ class AGIReasoningEngine:
     
     def get_reasoning_summary(self) -> Dict[str, Any]:
         """Get a comprehensive summary of AGI reasoning state."""
-        return {
-            "total_observations": len(self.observations),
-            "causal_patterns_discovered": len(self.causal_patterns),
-            "cross_domain_patterns": len(self.cross_domain_patterns),
-            "understanding_confidence": self.understanding_confidence,
-            "recent_observations": len([obs for obs in self.observations if time.time() - obs.timestamp < 300]),
-            "improvement_suggestions": self.improvement_suggestions[-5:],  # Last 5 suggestions
-            "meta_learning_insights": self.meta_learning_insights[-3:],  # Last 3 insights
-            "strongest_causal_patterns": [
-                {"cause": p.cause_pattern, "effect": p.effect_pattern, "confidence": p.confidence}
-                for p in sorted(self.causal_patterns, key=lambda x: x.confidence, reverse=True)[:3]
-            ]
-        }
+        self.flush()
+        with self._lock:
+            self._expire_recent(time.time())
+            return {
+                "total_observations": len(self.observations),
+                "causal_patterns_discovered": len(self.causal_patterns),
+                "cross_domain_patterns": len(self.cross_domain_patterns),
+                "understanding_confidence": self.understanding_confidence,
+                "recent_observations": len(self._recent),
+                "improvement_suggestions": self.improvement_suggestions[-5:],  # Last 5 suggestions
+                "meta_learning_insights": self.meta_learning_insights[-3:],  # Last 3 insights
+                "strongest_causal_patterns": [
+                    {"cause": p.cause_pattern, "effect": p.effect_pattern, "confidence": p.confidence}
+                    for p in sorted(self.causal_patterns, key=lambda x: x.confidence, reverse=True)[:3]
+                ]
+            }
     
     # Helper methods
+    @staticmethod
+    def _pattern_key(attributes: Dict[str, Any]) -> Tuple[Hashable, ...]:
+        """Hashable key of the attributes that identify a causal pattern."""
+        key = []
+        for attr in _PATTERN_KEY_ATTRS:
+            value = attributes.get(attr)
+            key.append(value if isinstance(value, Hashable) else repr(value))
+        return tuple(key)
+    
     def _patterns_match(self, pattern1: Dict[str, Any], pattern2: Dict[str, Any]) -> bool:
         """Check if two patterns match (basic implementation)."""
-        key_attrs = [CliAttributes.COMMAND, ProcessAttributes.COMMAND, TestAttributes.OPERATION]
-        for attr in key_attrs:
-            if pattern1.get(attr) != pattern2.get(attr):
-                return False
-        return True
+        return self._pattern_key(pattern1) == self._pattern_key(pattern2)
     
     def _extract_abstract_pattern(self, observation: SemanticObservation) -> Dict[str, Any]:
         """Extract abstract pattern from observation."""
@@ -436,7 +545,7 @@ class AGIReasoningEngine:
 
 
 # Global AGI reasoning engine instance
-_agi_engine = AGIReasoningEngine()
+_agi_engine = AGIReasoningEngine(background=BACKGROUND)
 
 def get_agi_engine() -> AGIReasoningEngine:
     """Get the global AGI reasoning engine."""
@@ -458,26 +567,31 @@ def get_agi_insights() -> Dict[str, Any]:
 # Exponential Learning Enhancements
 # ================================
 
+def _bounded() -> deque:
+    """History that can grow once per observation, capped like the observations."""
+    return deque(maxlen=MAX_OBSERVATIONS)
+
+
 @dataclass
 class ExponentialLearningState:
     """Tracks exponential learning acceleration state."""
     
     learning_acceleration: float = 1.0  # Current learning speed multiplier
-    convergence_insights: List[Dict[str, Any]] = field(default_factory=list)
-    meta_meta_learning: List[str] = field(default_factory=list)  # Learning about learning about learning
+    convergence_insights: Deque[Dict[str, Any]] = field(default_factory=lambda: _bounded())
+    meta_meta_learning: Deque[str] = field(default_factory=lambda: _bounded())  # Learning about learning about learning
     
     # Exponential improvement tracking
     improvement_velocity: float = 0.0
     improvement_acceleration: float = 0.0
-    breakthrough_moments: List[float] = field(default_factory=list)
+    breakthrough_moments: Deque[float] = field(default_factory=lambda: _bounded())
     
     # Technology convergence integration
     convergence_amplification: float = 1.0
     cross_domain_insights: List[Dict[str, Any]] = field(default_factory=list)
     
     # Self-improvement capabilities
-    algorithm_modifications: List[Dict[str, Any]] = field(default_factory=list)
-    reasoning_optimizations: List[str] = field(default_factory=list)
+    algorithm_modifications: Deque[Dict[str, Any]] = field(default_factory=lambda: _bounded())
+    reasoning_optimizations: Deque[str] = field(default_factory=lambda: _bounded())
 
 
 class ExponentialAGIReasoningEngine(AGIReasoningEngine):
@@ -491,20 +605,20 @@ class ExponentialAGIReasoningEngine(AGIReasoningEngine):
     - Breakthrough acceleration patterns
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, max_observations: int = MAX_OBSERVATIONS, background: bool = False):
+        super().__init__(max_observations, background)
         self.exponential_state = ExponentialLearningState()
         
         # Convergence integration (lazy import to avoid circular imports)
         self._convergence_engine = None
         
         # Exponential learning history
-        self.learning_breakthroughs: List[Dict[str, Any]] = []
-        self.convergence_learning_events: List[Dict[str, Any]] = []
+        self.learning_breakthroughs: Deque[Dict[str, Any]] = _bounded()
+        self.convergence_learning_events: Deque[Dict[str, Any]] = _bounded()
         
         # Self-improvement tracking
-        self.algorithm_versions: List[Dict[str, Any]] = []
-        self.performance_metrics_history: List[Dict[str, Any]] = []
+        self.algorithm_versions: Deque[Dict[str, Any]] = _bounded()
+        self.performance_metrics_history: Deque[Dict[str, Any]] = _bounded()
     
     @property
     def convergence_engine(self):
@@ -518,22 +632,20 @@ class ExponentialAGIReasoningEngine(AGIReasoningEngine):
                 self._convergence_engine = None
         return self._convergence_engine
     
-    def observe(self, attributes: Dict[str, Any], context: Dict[str, Any] = None) -> SemanticObservation:
+    def _process(self, observation: SemanticObservation):
         """
         Enhanced observation with exponential learning capabilities.
         
         Integrates convergence insights for accelerated learning.
         """
         # Standard observation
-        observation = super().observe(attributes, context)
+        super()._process(observation)
         
         # Exponential enhancements
         self._apply_exponential_learning(observation)
         self._detect_breakthrough_moments(observation)
         self._integrate_convergence_insights(observation)
         self._accelerate_learning_velocity()
-        
-        return observation
     
     def _apply_exponential_learning(self, observation: SemanticObservation):
         """Apply exponential learning acceleration to new observations."""
@@ -554,7 +666,7 @@ class ExponentialAGIReasoningEngine(AGIReasoningEngine):
         self.exponential_state.learning_acceleration = base_acceleration * convergence_boost
         
         # Apply acceleration to confidence and learning
-        observation.confidence *= min(2.0, self.exponential_state.learning_acceleration)
+        self._rescale_confidence(observation, min(2.0, self.exponential_state.learning_acceleration))
         
         # Log acceleration event
         if self.exponential_state.learning_acceleration > 2.0:
@@ -602,8 +714,8 @@ class ExponentialAGIReasoningEngine(AGIReasoningEngine):
             
             # Calculate improvement velocity and acceleration
             if len(self.exponential_state.breakthrough_moments) >= 2:
-                recent_breakthroughs = self.exponential_state.breakthrough_moments[-2:]
-                time_between = recent_breakthroughs[1] - recent_breakthroughs[0]
+                moments = self.exponential_state.breakthrough_moments
+                time_between = moments[-1] - moments[-2]
                 self.exponential_state.improvement_velocity = 1.0 / max(0.1, time_between)
                 
                 if len(self.exponential_state.breakthrough_moments) >= 3:
@@ -791,7 +903,11 @@ class ExponentialAGIReasoningEngine(AGIReasoningEngine):
     
     def get_exponential_insights(self) -> Dict[str, Any]:
         """Get insights specific to exponential learning capabilities."""
-        
+        self.flush()
+        with self._lock:
+            return self._exponential_insights()
+    
+    def _exponential_insights(self) -> Dict[str, Any]:
         return {
             "exponential_learning_state": {
                 "learning_acceleration": self.exponential_state.learning_acceleration,
@@ -925,7 +1041,7 @@ class ExponentialAGIReasoningEngine(AGIReasoningEngine):
 
 
 # Replace the global engine with exponential version
-_agi_engine = ExponentialAGIReasoningEngine()
+_agi_engine = ExponentialAGIReasoningEngine(background=BACKGROUND)
 
 def get_exponential_agi_insights() -> Dict[str, Any]:
     """Get exponential learning insights from the AGI engine."""
@@ -4,41 +4,47 @@ uvmgr.core.cache - Command Result Caching
 
 SHA1 command-result cache with comprehensive telemetry instrumentation.
 
-This module provides a simple but effective caching system for command results
-using SHA1 hashing of command strings. Cache entries are stored in JSONL format
-for efficient appending and lookup operations.
+This module provides an indexed cache for command results keyed by the SHA1
+hash of the command string. Entries live in a SQLite database (WAL mode) with
+a primary-key index on the hash, so a lookup costs one B-tree probe no matter
+how many commands have been recorded.
 
 Key Features
 -----------
 • **SHA1 Hashing**: Fast and reliable command string hashing
-• **JSONL Storage**: Efficient append-only storage format
+• **Indexed Storage**: SQLite/WAL store keyed by command hash
+• **Stored Results**: Captured output and exit code, not just presence
+• **Bounded Size**: TTL expiry plus LRU eviction by entry count and bytes
 • **Telemetry Integration**: Full OpenTelemetry instrumentation
-• **Performance Monitoring**: Duration tracking for all cache operations
 • **Hit/Miss Tracking**: Comprehensive cache performance metrics
 
 Available Functions
 ------------------
 - **hash_cmd()**: Generate SHA1 hash for command string
-- **cache_hit()**: Check if command result exists in cache
+- **cache_hit()**: Check if a fresh result exists in cache
+- **get_result()**: Fetch the cached output and exit code
 - **store_result()**: Store command result in cache
+- **purge()**: Apply TTL expiry and LRU eviction
+- **cache_stats()**: Entry count and stored bytes
+- **clear_cache()**: Drop every entry
 
 Cache Storage
 ------------
-- **Location**: ~/.uvmgr_cache/runs.jsonl
-- **Format**: JSONL (JSON Lines) with hash and timestamp
-- **Structure**: {"k": "sha1_hash", "ts": timestamp}
+- **Location**: ~/.uvmgr_cache/runs.db
+- **Format**: SQLite, journal_mode=WAL
+- **Structure**: runs(k, output, exit_code, created_at, accessed_at, size)
+- **Limits**: ``UVMGR_CACHE_TTL`` (seconds), ``UVMGR_CACHE_MAX_ENTRIES`` and
+  ``UVMGR_CACHE_MAX_BYTES`` override the defaults below
 
 Examples
 --------
-    >>> from uvmgr.core.cache import hash_cmd, cache_hit, store_result
-    >>> 
-    >>> # Check if command was previously executed
-    >>> cmd = "python --version"
-    >>> if cache_hit(cmd):
-    ...     print("Command was cached")
+    >>> from uvmgr.core.cache import cache_hit, get_result, store_result
+    >>>
+    >>> cmd = "uv --version"
+    >>> if (cached := get_result(cmd)) is not None:
+    ...     print(cached.output)
     ... else:
-    ...     print("Command not cached")
-    ...     # store_result(cmd, "Python 3.12.0")
+    ...     store_result(cmd, "uv 0.7.0", exit_code=0)
 
 See Also
 --------
@@ -48,22 +54,98 @@ See Also
 
 from __future__ import annotations
 
-import json
+import os
+import sqlite3
+import threading
 import time
+from dataclasses import dataclass
+from pathlib import Path
 
 from .fs import hash_str
 from .instrumentation import add_span_attributes, add_span_event
 from .paths import CACHE_DIR
-from .telemetry import metric_counter, metric_histogram, span
+from .telemetry import OTEL_ENABLED, metric_counter, metric_histogram, span
+
+_DB = CACHE_DIR / "runs.db"
+
+DEFAULT_TTL: float = float(os.getenv("UVMGR_CACHE_TTL", 7 * 24 * 3600))
+MAX_ENTRIES: int = int(os.getenv("UVMGR_CACHE_MAX_ENTRIES", 10_000))
+MAX_BYTES: int = int(os.getenv("UVMGR_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+__all__ = [
+    "CachedResult",
+    "cache_hit",
+    "cache_stats",
+    "clear_cache",
+    "get_result",
+    "hash_cmd",
+    "purge",
+    "store_result",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    k           TEXT PRIMARY KEY,
+    output      TEXT,
+    exit_code   INTEGER,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size        INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_created ON runs(created_at);
+CREATE INDEX IF NOT EXISTS runs_accessed ON runs(accessed_at);
+
+-- Running totals so size checks never scan the table
+CREATE TABLE IF NOT EXISTS stats (
+    id      INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes   INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS runs_ins AFTER INSERT ON runs BEGIN
+    UPDATE stats SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS runs_del AFTER DELETE ON runs BEGIN
+    UPDATE stats SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS runs_upd AFTER UPDATE OF size ON runs BEGIN
+    UPDATE stats SET bytes = bytes - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A stored command result."""
+
+    output: str | None
+    exit_code: int | None
+    created_at: float
 
-_RUNS = CACHE_DIR / "runs.jsonl"
-_RUNS.touch(exist_ok=True)
 
-__all__ = ["cache_hit", "hash_cmd", "store_result"]
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+
+
+def _db() -> sqlite3.Connection:
+    """Return the process-wide connection, opening it (and the schema) once."""
+    global _conn, _conn_path
+    if _conn is None or _conn_path != _DB:
+        _DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_DB, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _conn, _conn_path = conn, _DB
+    return _conn
 
 
 def hash_cmd(cmd: str) -> str:
     """Hash command string for cache key with telemetry."""
+    if not OTEL_ENABLED:  # hot path: skip building span attributes entirely
+        return hash_str(cmd)
+
     with span("cache.hash_cmd", command_length=len(cmd)):
         add_span_event("cache.hash.starting", {"command_preview": cmd[:50] + "..." if len(cmd) > 50 else cmd})
 
@@ -85,18 +167,35 @@ def hash_cmd(cmd: str) -> str:
         return hash_value
 
 
-def cache_hit(cmd: str) -> bool:
-    """Check if command result exists in cache with comprehensive telemetry."""
+def get_result(cmd: str, *, ttl: float | None = None) -> CachedResult | None:
+    """
+    Return the cached result for *cmd*, or ``None`` on a miss.
+
+    Parameters
+    ----------
+    cmd : str
+        Command string used as the cache key.
+    ttl : float, optional
+        Maximum age in seconds; defaults to :data:`DEFAULT_TTL`. Older entries
+        are treated as misses (and removed by the next :func:`purge`).
+    """
     with span("cache.lookup", command=cmd):
         add_span_event("cache.lookup.starting", {"command": cmd[:50] + "..." if len(cmd) > 50 else cmd})
 
         start_time = time.time()
         h = hash_cmd(cmd)
-
-        # Check cache
-        cache_lines = _RUNS.read_text().splitlines() if _RUNS.exists() else []
-        hit = any(h in line for line in cache_lines)
+        max_age = DEFAULT_TTL if ttl is None else ttl
+
+        with _lock:
+            conn = _db()
+            row = conn.execute(
+                "SELECT output, exit_code, created_at FROM runs WHERE k = ? AND created_at >= ?",
+                (h, start_time - max_age),
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE runs SET accessed_at = ? WHERE k = ?", (start_time, h))
         duration = time.time() - start_time
+        hit = row is not None
 
         # Record metrics
         if hit:
@@ -111,24 +210,48 @@ def cache_hit(cmd: str) -> bool:
         add_span_attributes(**{
             "cache.hit": hit,
             "cache.hash": h,
-            "cache.entries_checked": len(cache_lines),
             "cache.lookup_duration": duration,
         })
 
-        return hit
+        return CachedResult(*row) if hit else None
+
+
+def cache_hit(cmd: str, *, ttl: float | None = None) -> bool:
+    """Check if a fresh command result exists in cache with comprehensive telemetry."""
+    return get_result(cmd, ttl=ttl) is not None
 
 
-def store_result(cmd: str) -> None:
-    """Store command result in cache with telemetry tracking."""
+def store_result(cmd: str, output: str | None = None, exit_code: int | None = 0) -> None:
+    """
+    Store command result in cache with telemetry tracking.
+
+    Re-storing a command replaces its previous result. The cache is trimmed to
+    :data:`MAX_ENTRIES` / :data:`MAX_BYTES` afterwards.
+    """
     with span("cache.store", command=cmd):
         add_span_event("cache.store.starting", {"command": cmd[:50] + "..." if len(cmd) > 50 else cmd})
 
         start_time = time.time()
         h = hash_cmd(cmd)
-        entry = {"k": h, "ts": time.time()}
+        size = len(output.encode()) if output else 0
 
         try:
-            _RUNS.write_text(json.dumps(entry) + "\n", mode="a")
+            with _lock:
+                conn = _db()
+                conn.execute(
+                    """
+                    INSERT INTO runs (k, output, exit_code, created_at, accessed_at, size)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(k) DO UPDATE SET
+                        output = excluded.output,
+                        exit_code = excluded.exit_code,
+                        created_at = excluded.created_at,
+                        accessed_at = excluded.accessed_at,
+                        size = excluded.size
+                    """,
+                    (h, output, exit_code, start_time, start_time, size),
+                )
+            evicted = purge(ttl=None)
             duration = time.time() - start_time
 
             # Record success metrics
@@ -138,12 +261,13 @@ def store_result(cmd: str) -> None:
             add_span_attributes(**{
                 "cache.hash": h,
                 "cache.store_duration": duration,
-                "cache.entry_size": len(json.dumps(entry)),
+                "cache.entry_size": size,
+                "cache.evicted": evicted,
             })
             add_span_event("cache.store.completed", {
                 "hash": h,
                 "duration": duration,
-                "timestamp": entry["ts"],
+                "timestamp": start_time,
             })
 
         except Exception as e:
@@ -158,3 +282,56 @@ def store_result(cmd: str) -> None:
                 "duration": duration,
             })
             raise
+
+
+def purge(
+    *,
+    ttl: float | None = None,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+) -> int:
+    """
+    Expire entries older than *ttl* and evict least-recently-used entries until
+    the cache fits within *max_entries* and *max_bytes*.
+
+    Returns
+    -------
+    int
+        Number of entries removed.
+    """
+    max_age = DEFAULT_TTL if ttl is None else ttl
+    entry_cap = MAX_ENTRIES if max_entries is None else max_entries
+    byte_cap = MAX_BYTES if max_bytes is None else max_bytes
+
+    with _lock:
+        conn = _db()
+        removed = conn.execute(
+            "DELETE FROM runs WHERE created_at < ?", (time.time() - max_age,)
+        ).rowcount
+
+        entries, total = conn.execute("SELECT entries, bytes FROM stats WHERE id = 0").fetchone()
+        while entries > entry_cap or total > byte_cap:
+            # Evict in batches: at least the entry overflow, at least one row
+            batch = max(entries - entry_cap, 1)
+            removed += conn.execute(
+                "DELETE FROM runs WHERE k IN (SELECT k FROM runs ORDER BY accessed_at LIMIT ?)",
+                (batch,),
+            ).rowcount
+            entries, total = conn.execute("SELECT entries, bytes FROM stats WHERE id = 0").fetchone()
+
+    if removed:
+        metric_counter("cache.evictions")(removed)
+    return removed
+
+
+def cache_stats() -> dict[str, int]:
+    """Return the number of cached entries and the bytes of stored output."""
+    with _lock:
+        entries, total = _db().execute("SELECT entries, bytes FROM stats WHERE id = 0").fetchone()
+    return {"entries": entries, "bytes": total}
+
+
+def clear_cache() -> None:
+    """Remove every cached result."""
+    with _lock:
+        _db().execute("DELETE FROM runs")
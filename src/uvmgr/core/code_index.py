@@ -0,0 +1,678 @@
+"""
+uvmgr.core.code_index - Persistent Python Symbol Index
+======================================================
+
+Incremental AST/symbol index shared by every feature that needs to know what
+is *in* the project's Python sources.
+
+Code search, dependency-usage search, the knowledge base, the OpenTelemetry
+coverage report and the code security scan all used to ``rglob`` the tree and
+``ast.parse`` every file from scratch on every call. This module parses each
+file once, stores the result under ``<project>/.uvmgr/index/symbols.db`` and
+afterwards only re-parses files whose ``(mtime, size)`` changed *and* whose
+content hash differs.
+
+Key Features
+-----------
+• **Incremental**: Unchanged files cost one ``stat``; touched-but-identical
+  files cost one read + hash; only edited files are re-parsed
+• **Parallel Cold Builds**: Large batches of changed files are parsed in a
+  process pool
+• **Rich Symbols**: Functions, classes, variables, imports and decorators with
+  qualified names, line spans, cyclomatic complexity, docstrings and
+  referenced names
+• **Line Offsets**: Byte offset of every line, so source segments and context
+  lines can be sliced without re-parsing
+• **Query API**: :meth:`ProjectIndex.files`, :meth:`ProjectIndex.symbols`,
+  :meth:`ProjectIndex.segments`
+
+Storage
+-------
+- **Location**: ``<project>/.uvmgr/index/symbols.db`` (SQLite, WAL)
+- **Tables**: ``files(path, mtime_ns, size, hash, lines, offsets, error)`` and
+  ``symbols(path, kind, name, qualname, line, end_line, ...)``
+- **Invalidation**: :data:`INDEX_VERSION` is stored in the database; bumping it
+  discards the index on next open
+
+Examples
+--------
+    >>> from uvmgr.core.code_index import get_project_index
+    >>>
+    >>> index = get_project_index(Path("src"))
+    >>> index.refresh(Path("src"))
+    >>> for sym in index.symbols(kind="function", name=r"^test_"):
+    ...     print(sym.path, sym.line, sym.qualname, sym.complexity)
+
+See Also
+--------
+- :mod:`uvmgr.ops.search` : Code and dependency search
+- :mod:`uvmgr.core.knowledge` : Project knowledge base
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+from .instrumentation import add_span_attributes, add_span_event
+from .telemetry import metric_counter, metric_histogram, span
+
+__all__ = [
+    "INDEX_VERSION",
+    "PRUNE_DIRS",
+    "IndexedFile",
+    "ProjectIndex",
+    "RefreshStats",
+    "Symbol",
+    "find_project_root",
+    "get_project_index",
+]
+
+INDEX_VERSION = 1
+"""Bump whenever symbol extraction changes; older indexes are rebuilt."""
+
+PRUNE_DIRS: frozenset[str] = frozenset({
+    ".git", ".hg", ".svn", ".uvmgr", ".venv", "venv", "__pycache__", "node_modules",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+})
+"""Directory names never descended into while indexing."""
+
+PARALLEL_THRESHOLD = 64
+"""Changed-file count above which parsing fans out to a process pool."""
+
+_ROOT_MARKERS = ("pyproject.toml", "setup.py", "setup.cfg", ".git")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    hash     TEXT NOT NULL,
+    lines    INTEGER NOT NULL,
+    offsets  BLOB NOT NULL,
+    error    TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS symbols (
+    path       TEXT NOT NULL,
+    kind       TEXT NOT NULL,
+    name       TEXT NOT NULL,
+    qualname   TEXT NOT NULL,
+    line       INTEGER NOT NULL,
+    end_line   INTEGER NOT NULL,
+    col        INTEGER NOT NULL,
+    complexity INTEGER NOT NULL,
+    is_async   INTEGER NOT NULL,
+    parent     TEXT,
+    detail     TEXT
+);
+CREATE INDEX IF NOT EXISTS symbols_path ON symbols(path);
+CREATE INDEX IF NOT EXISTS symbols_kind_name ON symbols(kind, name);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedFile:
+    """Index record for one Python source file."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    hash: str
+    lines: int
+    error: str | None = None
+    """Parse error (``SyntaxError: ...``) if the file could not be parsed."""
+
+
+@dataclass(frozen=True, slots=True)
+class Symbol:
+    """One indexed definition, import or decorator."""
+
+    path: Path
+    kind: str
+    """``function``, ``class``, ``variable``, ``import``, ``import_from`` or ``decorator``."""
+    name: str
+    qualname: str
+    line: int
+    end_line: int
+    col: int = 0
+    complexity: int = 0
+    is_async: bool = False
+    parent: str | None = None
+    detail: dict[str, Any] = field(default_factory=dict, compare=False)
+    """Kind-specific data: decorators, docstring, refs, bases, alias, names, ..."""
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshStats:
+    """Outcome of :meth:`ProjectIndex.refresh`."""
+
+    scanned: int = 0
+    parsed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    errors: int = 0
+    duration: float = 0.0
+
+
+# --------------------------------------------------------------------------- #
+# Extraction (runs in worker processes – module level and picklable)
+# --------------------------------------------------------------------------- #
+
+def _dotted(node: ast.AST | None) -> str | None:
+    """Best-effort dotted name for a Name/Attribute/Call/Subscript expression."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted(node.value)
+        return f"{base}.{node.attr}" if base else node.attr
+    if isinstance(node, ast.Call):
+        return _dotted(node.func)
+    if isinstance(node, ast.Subscript):
+        return _dotted(node.value)
+    if isinstance(node, ast.Constant):
+        return str(node.value)
+    return None
+
+
+_BRANCHES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler)
+_BLOCKS = ("body", "orelse", "finalbody")
+
+
+def _summarise(node: ast.AST) -> tuple[int, list[str], list[str]]:
+    """
+    One walk over *node* returning ``(complexity, refs, contexts)``.
+
+    *complexity* is cyclomatic: 1 + branches + handlers + extra boolean
+    operands. *refs* are the names and attribute names referenced inside the
+    node; *contexts* the callables used as ``with`` context managers.
+    """
+    complexity = 1
+    refs: set[str] = set()
+    contexts: list[str] = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            refs.add(child.id)
+        elif isinstance(child, ast.Attribute):
+            refs.add(child.attr)
+        elif isinstance(child, _BRANCHES):
+            complexity += 1
+        elif isinstance(child, ast.BoolOp):
+            complexity += len(child.values) - 1
+        elif isinstance(child, (ast.With, ast.AsyncWith)):
+            contexts.extend(name for item in child.items if (name := _dotted(item.context_expr)))
+    return complexity, sorted(refs), contexts
+
+
+class _SymbolExtractor:
+    """Flatten a module AST into ``symbols`` rows (minus the path column)."""
+
+    def __init__(self) -> None:
+        self.rows: list[tuple] = []
+        self._scope: list[str] = []
+
+    def _add(self, kind: str, name: str, node: ast.AST, *, complexity: int = 0,
+             is_async: bool = False, detail: dict[str, Any] | None = None) -> None:
+        parent = ".".join(self._scope) or None
+        self.rows.append((
+            kind,
+            name,
+            f"{parent}.{name}" if parent else name,
+            node.lineno,
+            getattr(node, "end_lineno", None) or node.lineno,
+            node.col_offset,
+            complexity,
+            int(is_async),
+            parent,
+            json.dumps(detail) if detail else None,
+        ))
+
+    def _decorators(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> list[str]:
+        names = []
+        for decorator in node.decorator_list:
+            name = _dotted(decorator)
+            if name:
+                names.append(name)
+                self._add("decorator", name, decorator, detail={"target": node.name})
+        return names
+
+    def visit(self, stmts: list[ast.stmt]) -> None:
+        """Walk statement blocks only; expressions never hold definitions."""
+        for node in stmts:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                complexity, refs, contexts = _summarise(node)
+                self._add(
+                    "function", node.name, node,
+                    complexity=complexity,
+                    is_async=isinstance(node, ast.AsyncFunctionDef),
+                    detail={
+                        "decorators": self._decorators(node),
+                        "docstring": ast.get_docstring(node),
+                        "refs": refs,
+                        "contexts": contexts,
+                    },
+                )
+            elif isinstance(node, ast.ClassDef):
+                complexity, refs, _ = _summarise(node)
+                self._add(
+                    "class", node.name, node,
+                    complexity=complexity,
+                    detail={
+                        "decorators": self._decorators(node),
+                        "docstring": ast.get_docstring(node),
+                        "refs": refs,
+                        "bases": [_dotted(base) for base in node.bases],
+                        "methods": sum(isinstance(n, ast.FunctionDef) for n in node.body),
+                    },
+                )
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        self._add("variable", target.id, node, detail={"value_type": type(node.value).__name__})
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    self._add("import", alias.name, node, detail={"alias": alias.asname})
+            elif isinstance(node, ast.ImportFrom):
+                self._add(
+                    "import_from", node.module or "", node,
+                    detail={"names": [alias.name for alias in node.names], "level": node.level},
+                )
+
+            scoped = isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+            if scoped:
+                self._scope.append(node.name)
+            for block in _BLOCKS:
+                if (body := getattr(node, block, None)) and isinstance(body, list):
+                    self.visit(body)
+            for handler in getattr(node, "handlers", ()):
+                self.visit(handler.body)
+            for case in getattr(node, "cases", ()):
+                self.visit(case.body)
+            if scoped:
+                self._scope.pop()
+
+
+def _line_offsets(data: bytes) -> array:
+    """Byte offset at which every line starts."""
+    offsets = array("I", [0])
+    find = data.find
+    pos = find(b"\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find(b"\n", pos + 1)
+    if offsets[-1] == len(data) and len(offsets) > 1:
+        offsets.pop()  # trailing newline does not start a new line
+    return offsets
+
+
+def _index_file(path: str, known_hash: str | None) -> tuple[str, tuple | None]:
+    """
+    Hash and, if the content changed, parse one file.
+
+    Returns ``(hash, None)`` when the content matches *known_hash*, otherwise
+    ``(hash, (line_count, offsets_blob, rows, error))``.
+    """
+    data = Path(path).read_bytes()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if digest == known_hash:
+        return digest, None
+
+    offsets = _line_offsets(data)
+    line_count = len(offsets) if data else 0
+    try:
+        tree = ast.parse(data.decode("utf-8", errors="replace"), filename=path)
+    except (SyntaxError, ValueError) as e:
+        return digest, (line_count, offsets.tobytes(), [], f"{type(e).__name__}: {e}")
+
+    extractor = _SymbolExtractor()
+    extractor.visit(tree.body)
+    return digest, (line_count, offsets.tobytes(), extractor.rows, None)
+
+
+# --------------------------------------------------------------------------- #
+# Index
+# --------------------------------------------------------------------------- #
+
+def find_project_root(path: Path) -> Path:
+    """Nearest ancestor of *path* holding a project marker, else *path* itself."""
+    start = path.resolve()
+    if start.is_file():
+        start = start.parent
+    for candidate in (start, *start.parents):
+        if any((candidate / marker).exists() for marker in _ROOT_MARKERS):
+            return candidate
+    return start
+
+
+class ProjectIndex:
+    """
+    Persistent symbol index for the Python sources below :attr:`root`.
+
+    Instances are safe to share between threads; use :func:`get_project_index`
+    to get the process-wide instance for a project.
+    """
+
+    def __init__(self, root: Path, *, index_dir: Path | None = None):
+        self.root = root.resolve()
+        self.index_dir = index_dir or self.root / ".uvmgr" / "index"
+        self.db_path = self.index_dir / "symbols.db"
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    # -- storage ----------------------------------------------------------- #
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or int(row[0]) != INDEX_VERSION:
+                conn.executescript("DELETE FROM symbols; DELETE FROM files;")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(INDEX_VERSION),)
+                )
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _rel(self, path: Path) -> str:
+        """Root-relative POSIX path ("" for the root itself)."""
+        rel = path.resolve().relative_to(self.root).as_posix()
+        return "" if rel == "." else rel
+
+    def _scope(self, path: Path | None, column: str = "path") -> tuple[str, tuple]:
+        """SQL predicate selecting *path* (a file or a directory subtree)."""
+        rel = self._rel(path) if path is not None else ""
+        if not rel:
+            return "1", ()
+        # '0' is the character after '/', so the range covers "rel/..." exactly
+        return (
+            f"({column} = ? OR ({column} >= ? AND {column} < ?))",
+            (rel, f"{rel}/", f"{rel}0"),
+        )
+
+    def _walk(self, base: Path) -> Iterator[tuple[str, int, int]]:
+        """Yield ``(relative_path, mtime_ns, size)`` for ``*.py`` files under *base*."""
+        if base.is_file():
+            if base.suffix == ".py":
+                st = base.stat()
+                yield self._rel(base), st.st_mtime_ns, st.st_size
+            return
+
+        root_len = len(str(self.root)) + 1
+        stack = [str(base.resolve())]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in PRUNE_DIRS:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            st = entry.stat()
+                            rel = entry.path[root_len:].replace(os.sep, "/")
+                            yield rel, st.st_mtime_ns, st.st_size
+                    except OSError:
+                        continue
+
+    # -- maintenance ------------------------------------------------------- #
+
+    def refresh(self, path: Path | None = None, *, workers: int | None = None) -> RefreshStats:
+        """
+        Bring the index up to date for *path* (a file or directory, default: root).
+
+        Parameters
+        ----------
+        path : Path, optional
+            Restrict the scan to this file or subtree. Deleted files inside the
+            subtree are dropped from the index.
+        workers : int, optional
+            Process-pool size for parsing; ``1`` forces in-process parsing.
+
+        Returns
+        -------
+        RefreshStats
+            Counts of scanned, parsed, unchanged and removed files.
+        """
+        base = (path or self.root).resolve()
+        with span("code_index.refresh", root=str(self.root), path=str(base)):
+            start_time = time.time()
+            on_disk = {rel: (mtime, size) for rel, mtime, size in self._walk(base)}
+
+            where, params = self._scope(base)
+            with self._lock:
+                known = {
+                    row[0]: row[1:]
+                    for row in self._db().execute(
+                        f"SELECT path, mtime_ns, size, hash FROM files WHERE {where}", params
+                    )
+                }
+
+            removed = [rel for rel in known if rel not in on_disk]
+            stale = [rel for rel, stat in on_disk.items() if known.get(rel, (None, None, None))[:2] != stat]
+            results = self._parse(stale, [known.get(rel, (None, None, None))[2] for rel in stale], workers)
+
+            parsed = errors = 0
+            with self._lock:
+                conn = self._db()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for rel in removed:
+                        conn.execute("DELETE FROM symbols WHERE path = ?", (rel,))
+                        conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                    for rel, (digest, payload) in results:
+                        mtime, size = on_disk[rel]
+                        if payload is None:
+                            conn.execute(
+                                "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?", (mtime, size, rel)
+                            )
+                            continue
+                        line_count, offsets, rows, error = payload
+                        parsed += 1
+                        errors += error is not None
+                        conn.execute("DELETE FROM symbols WHERE path = ?", (rel,))
+                        conn.execute(
+                            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (rel, mtime, size, digest, line_count, offsets, error),
+                        )
+                        conn.executemany(
+                            "INSERT INTO symbols VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            [(rel, *row) for row in rows],
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+
+            stats = RefreshStats(
+                scanned=len(on_disk),
+                parsed=parsed,
+                unchanged=len(on_disk) - parsed,
+                removed=len(removed),
+                errors=errors,
+                duration=time.time() - start_time,
+            )
+
+            metric_counter("code_index.files_parsed")(parsed)
+            metric_histogram("code_index.refresh_duration")(stats.duration)
+            add_span_attributes(**{
+                "code_index.scanned": stats.scanned,
+                "code_index.parsed": stats.parsed,
+                "code_index.removed": stats.removed,
+                "code_index.errors": stats.errors,
+                "code_index.duration": stats.duration,
+            })
+            return stats
+
+    def _parse(self, rels: list[str], hashes: list[str | None], workers: int | None) -> list[tuple[str, tuple]]:
+        """Run :func:`_index_file` over *rels*, in a process pool for large batches."""
+        paths = [str(self.root / rel) for rel in rels]
+        if len(paths) >= PARALLEL_THRESHOLD and workers != 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(zip(rels, pool.map(_index_file, paths, hashes, chunksize=32)))
+            except (OSError, RuntimeError) as e:  # no fork/semaphores: parse in-process
+                add_span_event("code_index.pool_unavailable", {"error": str(e)})
+
+        results = []
+        for rel, path, known_hash in zip(rels, paths, hashes):
+            try:
+                results.append((rel, _index_file(path, known_hash)))
+            except OSError:
+                continue  # vanished or unreadable since the walk
+        return results
+
+    def clear(self) -> None:
+        """Drop every indexed file and symbol."""
+        with self._lock:
+            self._db().executescript("DELETE FROM symbols; DELETE FROM files;")
+
+    # -- queries ----------------------------------------------------------- #
+
+    def files(self, path: Path | None = None, *, pattern: str | None = None) -> list[IndexedFile]:
+        """
+        Indexed files under *path*, sorted by path.
+
+        Parameters
+        ----------
+        path : Path, optional
+            File or directory to restrict to (default: whole index).
+        pattern : str, optional
+            ``fnmatch`` pattern applied to the file name.
+        """
+        where, params = self._scope(path)
+        with self._lock:
+            rows = self._db().execute(
+                f"SELECT path, mtime_ns, size, hash, lines, error FROM files WHERE {where} ORDER BY path",
+                params,
+            ).fetchall()
+        return [
+            IndexedFile(self.root / rel, mtime, size, digest, lines, error)
+            for rel, mtime, size, digest, lines, error in rows
+            if pattern is None or fnmatch(rel.rsplit("/", 1)[-1], pattern)
+        ]
+
+    def file(self, path: Path) -> IndexedFile | None:
+        """Index record for a single file, or ``None`` if it is not indexed."""
+        found = self.files(path)
+        return found[0] if found and found[0].path == path.resolve() else None
+
+    def symbols(
+        self,
+        *,
+        kind: str | Iterable[str] | None = None,
+        name: str | re.Pattern[str] | None = None,
+        path: Path | None = None,
+    ) -> Iterator[Symbol]:
+        """
+        Iterate indexed symbols ordered by file and line.
+
+        Parameters
+        ----------
+        kind : str or iterable of str, optional
+            Restrict to these symbol kinds.
+        name : str or re.Pattern, optional
+            Regular expression searched (not matched) against the symbol name.
+        path : Path, optional
+            File or directory to restrict to.
+        """
+        clauses, params = [], []
+        if kind is not None:
+            kinds = [kind] if isinstance(kind, str) else list(kind)
+            clauses.append(f"kind IN ({', '.join('?' * len(kinds))})")
+            params.extend(kinds)
+        scope, scope_params = self._scope(path)
+        clauses.append(scope)
+        params.extend(scope_params)
+
+        regex = re.compile(name) if isinstance(name, str) else name
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT path, kind, name, qualname, line, end_line, col, complexity, is_async, parent, detail "
+                f"FROM symbols WHERE {' AND '.join(clauses)} ORDER BY path, line, col",
+                params,
+            ).fetchall()
+
+        for rel, kind_, name_, qualname, line, end_line, col, complexity, is_async, parent, detail in rows:
+            if regex is not None and not regex.search(name_):
+                continue
+            yield Symbol(
+                self.root / rel, kind_, name_, qualname, line, end_line, col,
+                complexity, bool(is_async), parent, json.loads(detail) if detail else {},
+            )
+
+    def line_offsets(self, path: Path) -> array:
+        """Byte offset of the start of every line of *path* (empty if unindexed)."""
+        offsets = array("I")
+        with self._lock:
+            row = self._db().execute(
+                "SELECT offsets FROM files WHERE path = ?", (self._rel(path),)
+            ).fetchone()
+        if row is not None:
+            offsets.frombytes(row[0])
+        return offsets
+
+    def segments(self, path: Path, symbols: Iterable[Symbol]) -> list[str]:
+        """
+        Source text of each of *symbols* (all defined in *path*).
+
+        The file is read once and sliced with the stored line offsets, so no
+        re-parse is needed.
+        """
+        data = path.read_bytes()
+        offsets = self.line_offsets(path)
+        out = []
+        for sym in symbols:
+            start = offsets[sym.line - 1] if sym.line - 1 < len(offsets) else len(data)
+            end = offsets[sym.end_line] if sym.end_line < len(offsets) else len(data)
+            out.append(data[start:end].decode("utf-8", errors="replace").rstrip("\n"))
+        return out
+
+
+_INDEXES: dict[Path, ProjectIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_project_index(path: Path | None = None) -> ProjectIndex:
+    """
+    Process-wide :class:`ProjectIndex` for the project containing *path*.
+
+    The project root is the nearest ancestor with a ``pyproject.toml``,
+    ``setup.py``, ``setup.cfg`` or ``.git`` entry; *path* defaults to the
+    working directory.
+    """
+    root = find_project_root(path or Path.cwd())
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(root)
+        if index is None:
+            index = _INDEXES[root] = ProjectIndex(root)
+        return index
@@ -14,14 +14,22 @@ Key Features:
 - Secure secrets management integration
 
 This fills a critical gap: lack of centralized configuration management.
+
+The resolved configuration of every scope is kept as a snapshot (see
+:mod:`uvmgr.core.snapshot`) keyed by the stat of each contributing file and
+the ``UVMGR_*`` environment. A manager whose files and environment are
+unchanged loads that snapshot instead of creating directories, parsing TOML
+and merging scopes; lookups re-check the key at most every
+``SNAPSHOT_CHECK_INTERVAL`` seconds and reload when a file changed.
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, is_dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union, get_type_hints
@@ -32,10 +40,13 @@ from uvmgr.core.agi_memory import get_persistent_memory
 from uvmgr.core.semconv import CliAttributes
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram
 from uvmgr.core.paths import CONFIG_DIR
+from uvmgr.core.snapshot import load_snapshot, save_snapshot, snapshot_key, snapshot_name
 
 
 T = TypeVar('T')
 
+SNAPSHOT_CHECK_INTERVAL = 0.5  # seconds between stat checks of the config files
+
 
 class ConfigScope(Enum):
     """Configuration scope levels."""
@@ -237,13 +248,33 @@ class ConfigurationManager:
             ConfigScope.RUNTIME: None      # Runtime overrides
         }
         
+        # Resolved-config snapshot
+        self._snapshot_name = snapshot_name("config", self.project_root)
+        self._snapshot_key: Optional[tuple] = None
+        self._last_check = 0.0
+        
         # Initialize configuration
         self._initialize_configuration()
     
+    def _contributing_paths(self) -> List[Path]:
+        """Files the resolved configuration depends on (this module included)."""
+        return [Path(__file__), *(path for path in self.config_paths.values() if path)]
+    
     def _initialize_configuration(self):
         """Initialize configuration system."""
         
-        with span("config.initialize"):
+        with span("config.initialize") as current_span:
+            
+            # Unchanged files and environment: reuse the resolved configuration
+            key = snapshot_key(self._contributing_paths())
+            cached = load_snapshot(self._snapshot_name, key)
+            if cached is not None:
+                self.config_cache = cached
+                self._snapshot_key = key
+                self._last_check = time.monotonic()
+                current_span.set_attribute("config.snapshot_hit", True)
+                metric_counter("config.snapshot_hits")(1)
+                return
             
             # Ensure config directories exist
             for scope, path in self.config_paths.items():
@@ -254,7 +285,7 @@ class ConfigurationManager:
             self._create_default_configs()
             
             # Load configuration hierarchy
-            self._load_configuration_hierarchy()
+            self._reload()
             
             # Observe initialization
             observe_with_agi_reasoning(
@@ -289,6 +320,35 @@ class ConfigurationManager:
             )
             self._save_config(project_config, project_config_path)
     
+    def _reload(self):
+        """Load the hierarchy and snapshot it, unless a file changed meanwhile."""
+        key = snapshot_key(self._contributing_paths())
+        self._load_configuration_hierarchy()
+        self._last_check = time.monotonic()
+        if snapshot_key(self._contributing_paths()) == key:
+            self._snapshot_key = key
+            save_snapshot(self._snapshot_name, key, self.config_cache)
+        else:
+            self._snapshot_key = None  # Re-check on next lookup
+    
+    def _refresh_if_stale(self):
+        """Reload when a contributing file or ``UVMGR_*`` variable changed."""
+        now = time.monotonic()
+        if now - self._last_check < SNAPSHOT_CHECK_INTERVAL:
+            return
+        self._last_check = now
+        key = snapshot_key(self._contributing_paths())
+        if key == self._snapshot_key:
+            return
+        cached = load_snapshot(self._snapshot_name, key)
+        if cached is not None:
+            self.config_cache = cached
+            self._snapshot_key = key
+        else:
+            self.config_cache = {}
+            self._reload()
+        metric_counter("config.reloads")(1)
+    
     def _load_configuration_hierarchy(self):
         """Load configuration from all scopes in hierarchy order."""
         
@@ -454,6 +514,7 @@ class ConfigurationManager:
     def get_config(self, scope: ConfigScope = ConfigScope.RUNTIME) -> UvmgrConfig:
         """Get configuration for a specific scope."""
         
+        self._refresh_if_stale()
         return self.config_cache.get(scope, UvmgrConfig())
     
     def get_merged_config(self) -> UvmgrConfig:
@@ -500,7 +561,7 @@ class ConfigurationManager:
                     self._save_config(updated_config, config_path)
                 
                 # Reload hierarchy
-                self._load_configuration_hierarchy()
+                self._reload()
                 
                 # Observe change
                 observe_with_agi_reasoning(
@@ -526,19 +587,22 @@ class ConfigurationManager:
         """Get a configuration value."""
         
         try:
-            config = self.get_config(scope)
-            config_dict = asdict(config)
-            
-            # Parse key path
-            keys = key_path.split(".")
-            value = config_dict
+            value: Any = self.get_config(scope)
             
-            for key in keys:
+            # Walk the key path without converting the whole config to a dict
+            for key in key_path.split("."):
                 if isinstance(value, dict) and key in value:
                     value = value[key]
+                elif is_dataclass(value) and key in value.__dataclass_fields__:
+                    value = getattr(value, key)
                 else:
                     return default
             
+            # Callers get copies, never the cached objects
+            if is_dataclass(value):
+                return asdict(value)
+            if isinstance(value, (dict, list)):
+                return copy.deepcopy(value)
             return value
             
         except Exception:
@@ -579,7 +643,7 @@ class ConfigurationManager:
         if config_path:
             self._save_config(default_config, config_path)
         
-        self._load_configuration_hierarchy()
+        self._reload()
         
         observe_with_agi_reasoning(
             attributes={
@@ -0,0 +1,294 @@
+"""
+uvmgr.core.file_listing - Cached Project File Listing
+=====================================================
+
+In-memory listing of every file and directory below a project root, shared by
+callers that need to enumerate the tree repeatedly - chiefly the MCP server,
+whose tools and resources used to ``rglob`` the whole project on every
+request.
+
+The tree is walked once (pruning :data:`~uvmgr.core.code_index.PRUNE_DIRS`)
+and re-walked only when it changed:
+
+- With ``watchdog`` installed and :meth:`FileListing.watch` called, file
+  system events mark the listing stale; checking it is free.
+- Otherwise the modification time of every listed directory is compared
+  against the one recorded at the last walk. Creating, deleting or renaming an
+  entry changes its parent directory's mtime, so this costs one ``stat`` per
+  directory instead of a ``scandir`` per directory plus a ``stat`` per file.
+
+Consumers iterate the cached entries and stop as soon as they have enough,
+e.g. :func:`search_text` returns after *limit* matches.
+
+Examples
+--------
+    >>> from uvmgr.core.file_listing import get_file_listing, search_text
+    >>>
+    >>> listing = get_file_listing(Path.cwd(), watch=True)
+    >>> listing.tree(limit=100)
+    >>> matches, truncated = search_text(listing, "TODO", pattern="*.py", limit=20)
+
+See Also
+--------
+- :mod:`uvmgr.mcp.tools.files` : ``search_code`` MCP tool
+- :mod:`uvmgr.mcp.resources` : ``project://structure`` resource
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from .code_index import PRUNE_DIRS, find_project_root
+from .telemetry import metric_counter, span
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+__all__ = [
+    "WATCHDOG_AVAILABLE",
+    "FileListing",
+    "TextMatch",
+    "get_file_listing",
+    "search_text",
+]
+
+_SNIFF_BYTES = 8192
+
+
+@dataclass(frozen=True, slots=True)
+class TextMatch:
+    """One line containing the searched text."""
+
+    path: Path
+    line: int
+    text: str
+
+
+class _StaleOnChange(FileSystemEventHandler):
+    """Marks a listing stale when an entry is created, deleted or moved."""
+
+    def __init__(self, listing: FileListing):
+        super().__init__()
+        self.listing = listing
+
+    def on_any_event(self, event) -> None:
+        if event.event_type not in ("created", "deleted", "moved"):
+            return  # content changes do not alter the listing
+        rel = os.path.relpath(event.src_path, self.listing.root)
+        if not PRUNE_DIRS.intersection(rel.split(os.sep)):
+            self.listing.invalidate()
+
+
+class FileListing:
+    """
+    Cached listing of the files and directories below :attr:`root`.
+
+    Instances are safe to share between threads; use :func:`get_file_listing`
+    to get the process-wide instance for a project.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root.resolve()
+        self._lock = threading.Lock()
+        self._entries: tuple[tuple[str, bool], ...] | None = None
+        self._dir_mtimes: dict[str, int] = {}
+        self._stale = False
+        self._observer = None
+
+    # -- watching ---------------------------------------------------------- #
+
+    @property
+    def watching(self) -> bool:
+        return self._observer is not None
+
+    def watch(self) -> bool:
+        """
+        Invalidate on file system events instead of re-checking directories.
+
+        Returns ``False`` (and keeps mtime validation) when ``watchdog`` is not
+        installed or the observer cannot be started.
+        """
+        if self._observer is not None:
+            return True
+        if not WATCHDOG_AVAILABLE:
+            return False
+        observer = Observer()
+        observer.daemon = True
+        try:
+            observer.schedule(_StaleOnChange(self), str(self.root), recursive=True)
+            observer.start()
+        except OSError:
+            return False  # e.g. inotify watch limit reached
+        self._observer = observer
+        self.invalidate()  # events before the observer started were missed
+        return True
+
+    def close(self) -> None:
+        """Stop watching."""
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
+
+    def invalidate(self) -> None:
+        """Force a re-walk on next access."""
+        self._stale = True
+
+    # -- listing ----------------------------------------------------------- #
+
+    def _is_stale(self) -> bool:
+        if self._entries is None or self._stale:
+            return True
+        if self.watching:
+            return False
+        for rel, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(os.path.join(self.root, rel)).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _walk(self) -> None:
+        with span("file_listing.walk", root=str(self.root)) as current_span:
+            entries: list[tuple[str, bool]] = []
+            dir_mtimes: dict[str, int] = {}
+            root_len = len(str(self.root)) + 1
+            stack = [str(self.root)]
+            while stack:
+                directory = stack.pop()
+                try:
+                    dir_mtimes[directory[root_len:]] = os.stat(directory).st_mtime_ns
+                    entries_it = os.scandir(directory)
+                except OSError:
+                    continue
+                with entries_it:
+                    for entry in entries_it:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if is_dir and entry.name in PRUNE_DIRS:
+                            continue
+                        entries.append((entry.path[root_len:].replace(os.sep, "/"), is_dir))
+                        if is_dir:
+                            stack.append(entry.path)
+            entries.sort(key=lambda e: e[0].split("/"))
+            self._entries = tuple(entries)
+            self._dir_mtimes = dir_mtimes
+            current_span.set_attribute("file_listing.entries", len(entries))
+            metric_counter("file_listing.walks")(1)
+
+    def entries(self) -> tuple[tuple[str, bool], ...]:
+        """``(relative_posix_path, is_dir)`` of every entry, in tree order."""
+        with self._lock:
+            if self._is_stale():
+                self._stale = False
+                self._walk()
+            assert self._entries is not None
+            return self._entries
+
+    def files(self, pattern: str | None = None) -> Iterator[Path]:
+        """
+        Files matching *pattern*, in tree order.
+
+        *pattern* is matched like :meth:`pathlib.Path.rglob` patterns: against
+        the trailing components of the relative path (``"*.py"``,
+        ``"tests/*.py"``).
+        """
+        for rel, is_dir in self.entries():
+            if not is_dir and (pattern is None or PurePosixPath(rel).match(pattern)):
+                yield self.root / rel
+
+    def tree(self, *, limit: int | None = None, hidden: bool = False) -> list[str]:
+        """
+        Indented tree lines (``"  name"``, directories with a trailing ``/``).
+
+        Entries below dot-directories and dot-files are left out unless
+        *hidden* is set.
+        """
+        lines: list[str] = []
+        for rel, is_dir in self.entries():
+            if limit is not None and len(lines) >= limit:
+                break
+            parts = rel.split("/")
+            if not hidden and any(part.startswith(".") for part in parts):
+                continue
+            lines.append("  " * (len(parts) - 1) + parts[-1] + ("/" if is_dir else ""))
+        return lines
+
+
+def search_text(
+    listing: FileListing,
+    needle: str,
+    *,
+    pattern: str | None = None,
+    limit: int | None = None,
+) -> tuple[list[TextMatch], bool]:
+    """
+    Case-insensitive substring search over the files of *listing*.
+
+    Files are searched in tree order and the search stops after *limit*
+    matches. Binary and non-UTF-8 files are skipped; a file is only split
+    into lines when it contains *needle* at all.
+
+    Returns
+    -------
+    tuple[list[TextMatch], bool]
+        The matches and whether the search stopped at *limit*.
+    """
+    folded = needle.lower()
+    matches: list[TextMatch] = []
+    with span("file_listing.search_text", pattern=pattern or "*") as current_span:
+        for path in listing.files(pattern):
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            if b"\0" in data[:_SNIFF_BYTES]:
+                continue
+            try:
+                content = data.decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+            if folded not in content.lower():
+                continue
+            for i, line in enumerate(content.splitlines(), 1):
+                if folded in line.lower():
+                    matches.append(TextMatch(path, i, line.strip()))
+                    if limit is not None and len(matches) >= limit:
+                        current_span.set_attribute("file_listing.truncated", True)
+                        return matches, True
+        return matches, False
+
+
+_LISTINGS: dict[Path, FileListing] = {}
+_LISTINGS_LOCK = threading.Lock()
+
+
+def get_file_listing(path: Path | None = None, *, watch: bool = False) -> FileListing:
+    """
+    Process-wide :class:`FileListing` for the project containing *path*.
+
+    With *watch*, the listing is invalidated by file system events (when
+    ``watchdog`` is available); long-running processes should pass it.
+    """
+    root = find_project_root(path or Path.cwd())
+    with _LISTINGS_LOCK:
+        listing = _LISTINGS.get(root)
+        if listing is None:
+            listing = _LISTINGS[root] = FileListing(root)
+    if watch:
+        listing.watch()
+    return listing
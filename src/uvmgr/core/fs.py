@@ -144,7 +144,9 @@ def hash_bytes(data: bytes, *, algo: str = "sha1") -> str:
         start_time = time.time()
 
         try:
-            hash_value = _digest(algo)(data).hexdigest()
+            h = _digest(algo)
+            h.update(data)
+            hash_value = h.hexdigest()
             duration = time.time() - start_time
 
             # Record metrics
@@ -27,10 +27,17 @@ Available Functions
 - **history_menu()**: Interactive file history browser
 - **clear_history()**: Clear command or file history
 
-Storage Locations
-----------------
-- **Command History**: ~/.config/uvmgr/command_history.json
-- **File History**: ~/.config/uvmgr/history.json
+Storage
+-------
+- **Location**: ~/.config/uvmgr/history.db (SQLite, journal_mode=WAL)
+- **Tables**: ``commands`` (last :data:`MAX_COMMANDS` runs) and ``files``
+  (last :data:`MAX_FILES` artifacts); older rows are trimmed on insert
+- **Aggregates**: ``command_stats`` / ``command_counts`` are maintained by
+  triggers, so :func:`get_command_stats` never rereads the history
+
+Logging a command is one small transaction regardless of history size, and
+concurrent uvmgr processes append safely through SQLite's locking. Legacy
+``command_history.json`` / ``history.json`` files are imported once.
 
 Examples
 --------
@@ -53,6 +60,8 @@ from __future__ import annotations
 
 import json
 import os
+import sqlite3
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -63,9 +72,15 @@ from .paths import CONFIG_DIR
 from .shell import rich_table
 from .telemetry import metric_counter, metric_histogram, span
 
+_DB: Path = CONFIG_DIR / "history.db"
+
+# Pre-SQLite JSON stores, imported on first use
 HIST: Path = CONFIG_DIR / "history.json"
 CMD_HIST: Path = CONFIG_DIR / "command_history.json"
 
+MAX_COMMANDS = 500
+MAX_FILES = 100
+
 __all__ = [
     "log_output", 
     "last_files", 
@@ -76,58 +91,230 @@ __all__ = [
     "clear_history"
 ]
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commands (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          TEXT NOT NULL,
+    epoch       REAL NOT NULL,
+    command     TEXT NOT NULL,
+    args        TEXT NOT NULL,
+    exit_code   INTEGER NOT NULL,
+    duration    REAL,
+    error       TEXT,
+    metadata    TEXT NOT NULL,
+    working_dir TEXT,
+    user        TEXT
+);
+CREATE INDEX IF NOT EXISTS commands_epoch ON commands(epoch);
+CREATE INDEX IF NOT EXISTS commands_command ON commands(command, id);
+
+CREATE TABLE IF NOT EXISTS files (
+    id   INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts   TEXT NOT NULL,
+    file TEXT NOT NULL
+);
+
+-- Running aggregates over the retained commands
+CREATE TABLE IF NOT EXISTS command_stats (
+    id             INTEGER PRIMARY KEY CHECK (id = 0),
+    total          INTEGER NOT NULL,
+    succeeded      INTEGER NOT NULL,
+    duration_sum   REAL NOT NULL,
+    duration_count INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO command_stats VALUES (0, 0, 0, 0.0, 0);
+CREATE TABLE IF NOT EXISTS command_counts (
+    command TEXT PRIMARY KEY,
+    n       INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS command_counts_n ON command_counts(n);
+
+CREATE TRIGGER IF NOT EXISTS commands_ins AFTER INSERT ON commands BEGIN
+    UPDATE command_stats SET
+        total = total + 1,
+        succeeded = succeeded + (NEW.exit_code = 0),
+        duration_sum = duration_sum + COALESCE(NEW.duration, 0),
+        duration_count = duration_count + (COALESCE(NEW.duration, 0) != 0)
+    WHERE id = 0;
+    INSERT OR IGNORE INTO command_counts VALUES (NEW.command, 0);
+    UPDATE command_counts SET n = n + 1 WHERE command = NEW.command;
+END;
+CREATE TRIGGER IF NOT EXISTS commands_del AFTER DELETE ON commands BEGIN
+    UPDATE command_stats SET
+        total = total - 1,
+        succeeded = succeeded - (OLD.exit_code = 0),
+        duration_sum = duration_sum - COALESCE(OLD.duration, 0),
+        duration_count = duration_count - (COALESCE(OLD.duration, 0) != 0)
+    WHERE id = 0;
+    UPDATE command_counts SET n = n - 1 WHERE command = OLD.command;
+    DELETE FROM command_counts WHERE command = OLD.command AND n <= 0;
+END;
+"""
+
+_COMMAND_COLUMNS = "ts, command, args, exit_code, duration, error, metadata, working_dir, user"
+
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+
+
+def _db() -> sqlite3.Connection:
+    """Return the process-wide connection, opening it (and the schema) once."""
+    global _conn, _conn_path
+    if _conn is None or _conn_path != _DB:
+        _DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_DB, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _import_legacy(conn)
+        _conn, _conn_path = conn, _DB
+    return _conn
+
+
+def _import_legacy(conn: sqlite3.Connection) -> None:
+    """Move entries of the old JSON history files into the database, once."""
+    legacy_dir = _DB.parent  # the JSON files lived next to the database
+    for path, insert in ((legacy_dir / CMD_HIST.name, _insert_command), (legacy_dir / HIST.name, _insert_file)):
+        if not path.exists():
+            continue
+        try:
+            entries = json.loads(path.read_text())
+        except (OSError, ValueError):
+            entries = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for entry in entries:
+                insert(conn, entry)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        path.rename(path.with_name(path.name + ".migrated"))
+
+
+def _epoch(ts: str) -> float:
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _insert_command(conn: sqlite3.Connection, entry: Dict[str, Any]) -> int:
+    """Insert one command entry and trim to :data:`MAX_COMMANDS` (in a transaction)."""
+    ts = entry.get("ts", "")
+    row_id = conn.execute(
+        f"INSERT INTO commands (epoch, {_COMMAND_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            _epoch(ts),
+            ts,
+            entry.get("command", "unknown"),
+            json.dumps(entry.get("args") or []),
+            entry.get("exit_code", 0),
+            entry.get("duration"),
+            entry.get("error"),
+            json.dumps(entry.get("metadata") or {}, default=str),
+            entry.get("working_dir"),
+            entry.get("user"),
+        ),
+    ).lastrowid
+    # Ids only grow, so everything at or below this one is outside the window
+    conn.execute("DELETE FROM commands WHERE id <= ?", (row_id - MAX_COMMANDS,))
+    return row_id
+
+
+def _insert_file(conn: sqlite3.Connection, entry: Dict[str, Any]) -> int:
+    """Insert one file entry and trim to :data:`MAX_FILES` (in a transaction)."""
+    row_id = conn.execute(
+        "INSERT INTO files (ts, file) VALUES (?, ?)", (entry.get("ts", ""), entry["file"])
+    ).lastrowid
+    conn.execute("DELETE FROM files WHERE id <= ?", (row_id - MAX_FILES,))
+    return row_id
+
+
+def _append(insert, entry: Dict[str, Any]) -> None:
+    """Run *insert* for *entry* in its own write transaction."""
+    with _lock:
+        conn = _db()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            insert(conn, entry)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _command_record(row: tuple) -> Dict[str, Any]:
+    ts, command, args, exit_code, duration, error, metadata, working_dir, user = row
+    return {
+        "ts": ts,
+        "command": command,
+        "args": json.loads(args),
+        "exit_code": exit_code,
+        "duration": duration,
+        "error": error,
+        "metadata": json.loads(metadata),
+        "working_dir": working_dir,
+        "user": user,
+    }
+
 
-def _load() -> list[dict]:
-    """Load file history with telemetry tracking."""
+def _load(limit: Optional[int] = None) -> list[dict]:
+    """Load file history (oldest first), optionally only the last *limit* entries."""
     with span("history.load_files"):
-        start_time = time.time()
-        
-        if HIST.exists():
-            try:
-                data = json.loads(HIST.read_text())
-                metric_counter("history.file_loads.success")(1)
-                
-                add_span_event("history.file_load.success", {
-                    "entries_count": len(data),
-                    "file_path": str(HIST),
-                })
-                
-                return data
-            except Exception as e:
-                metric_counter("history.file_loads.failed")(1)
-                add_span_event("history.file_load.failed", {"error": str(e)})
-                return []
-        else:
-            metric_counter("history.file_loads.not_found")(1)
-            add_span_event("history.file_load.not_found", {"file_path": str(HIST)})
+        try:
+            with _lock:
+                rows = _db().execute(
+                    "SELECT ts, file FROM files ORDER BY id DESC LIMIT ?", (limit or -1,)
+                ).fetchall()
+            metric_counter("history.file_loads.success")(1)
+            add_span_event("history.file_load.success", {"entries_count": len(rows)})
+            return [{"ts": ts, "file": file} for ts, file in reversed(rows)]
+        except sqlite3.Error as e:
+            metric_counter("history.file_loads.failed")(1)
+            add_span_event("history.file_load.failed", {"error": str(e)})
             return []
 
 
-def _load_commands() -> list[dict]:
-    """Load command history with telemetry tracking."""
+def _load_commands(
+    command: Optional[str] = None,
+    limit: Optional[int] = None,
+    successful_only: bool = False,
+) -> list[dict]:
+    """Load command history (oldest first), filtered in SQL."""
     with span("history.load_commands"):
-        start_time = time.time()
-        
-        if CMD_HIST.exists():
-            try:
-                data = json.loads(CMD_HIST.read_text())
-                metric_counter("history.command_loads.success")(1)
-                
-                add_span_event("history.command_load.success", {
-                    "entries_count": len(data),
-                    "file_path": str(CMD_HIST),
-                })
-                
-                return data
-            except Exception as e:
-                metric_counter("history.command_loads.failed")(1)
-                add_span_event("history.command_load.failed", {"error": str(e)})
-                return []
-        else:
-            metric_counter("history.command_loads.not_found")(1)
+        clauses, params = [], []
+        if command:
+            clauses.append("command = ?")
+            params.append(command)
+        if successful_only:
+            clauses.append("exit_code = 0")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        try:
+            with _lock:
+                rows = _db().execute(
+                    f"SELECT {_COMMAND_COLUMNS} FROM commands {where} ORDER BY id DESC LIMIT ?",
+                    (*params, limit or -1),
+                ).fetchall()
+            metric_counter("history.command_loads.success")(1)
+            add_span_event("history.command_load.success", {"entries_count": len(rows)})
+            return [_command_record(row) for row in reversed(rows)]
+        except sqlite3.Error as e:
+            metric_counter("history.command_loads.failed")(1)
+            add_span_event("history.command_load.failed", {"error": str(e)})
             return []
 
 
+def _counts() -> tuple[int, int]:
+    """Number of retained ``(commands, files)``."""
+    with _lock:
+        conn = _db()
+        total = conn.execute("SELECT total FROM command_stats WHERE id = 0").fetchone()[0]
+        files = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+    return total, files
+
+
 def log_output(p: Path) -> None:
     """Log file output with comprehensive telemetry."""
     with span("history.log_output", file_path=str(p)):
@@ -136,13 +323,8 @@ def log_output(p: Path) -> None:
         add_span_event("history.log_output.starting", {"file_path": str(p)})
         
         try:
-            recs = _load()
             entry = {"ts": datetime.now().isoformat(), "file": str(p)}
-            recs.append(entry)
-            
-            # Keep only last 100 entries
-            trimmed_recs = recs[-100:]
-            HIST.write_text(json.dumps(trimmed_recs, indent=2))
+            _append(_insert_file, entry)  # keeps only the last MAX_FILES entries
             
             duration = time.time() - start_time
             
@@ -152,13 +334,11 @@ def log_output(p: Path) -> None:
             
             add_span_attributes(**{
                 "history.file_path": str(p),
-                "history.entries_count": len(trimmed_recs),
                 "history.duration": duration,
             })
             
             add_span_event("history.log_output.completed", {
                 "file_path": str(p),
-                "entries_count": len(trimmed_recs),
                 "duration": duration,
             })
             
@@ -181,8 +361,8 @@ def last_files(n: int = 5) -> list[Path]:
         start_time = time.time()
         
         try:
-            records = _load()
-            result = [Path(r["file"]) for r in records[-n:]]
+            records = _load(n) if n > 0 else []
+            result = [Path(r["file"]) for r in records]
             duration = time.time() - start_time
             
             # Record metrics
@@ -192,7 +372,6 @@ def last_files(n: int = 5) -> list[Path]:
             add_span_attributes(**{
                 "history.requested_count": n,
                 "history.returned_count": len(result),
-                "history.total_available": len(records),
                 "history.duration": duration,
             })
             
@@ -304,9 +483,6 @@ def log_command(
         })
         
         try:
-            # Load existing command history
-            commands = _load_commands()
-            
             # Create command entry
             entry = {
                 "ts": datetime.now().isoformat(),
@@ -320,11 +496,8 @@ def log_command(
                 "user": os.getenv("USER", "unknown"),
             }
             
-            commands.append(entry)
-            
-            # Keep only last 500 command entries
-            trimmed_commands = commands[-500:]
-            CMD_HIST.write_text(json.dumps(trimmed_commands, indent=2))
+            # One append (plus trim to MAX_COMMANDS), independent of history size
+            _append(_insert_command, entry)
             
             operation_duration = time.time() - start_time
             
@@ -348,14 +521,12 @@ def log_command(
                 "history.exit_code": exit_code,
                 "history.duration": duration,
                 "history.has_error": error is not None,
-                "history.entries_count": len(trimmed_commands),
                 "history.operation_duration": operation_duration,
             })
             
             add_span_event("history.log_command.completed", {
                 "command": command,
                 "exit_code": exit_code,
-                "entries_count": len(trimmed_commands),
                 "duration": operation_duration,
             })
             
@@ -389,19 +560,8 @@ def get_command_history(
         })
         
         try:
-            commands = _load_commands()
-            
-            # Apply filters
-            filtered_commands = commands
-            
-            if command:
-                filtered_commands = [c for c in filtered_commands if c.get("command") == command]
-            
-            if successful_only:
-                filtered_commands = [c for c in filtered_commands if c.get("exit_code", 0) == 0]
-            
-            # Apply limit
-            result = filtered_commands[-limit:] if limit else filtered_commands
+            # Filters and limit are applied by the query
+            result = _load_commands(command, limit, successful_only)
             
             duration = time.time() - start_time
             
@@ -413,15 +573,11 @@ def get_command_history(
                 "history.command_filter": command,
                 "history.limit": limit,
                 "history.successful_only": successful_only,
-                "history.total_commands": len(commands),
-                "history.filtered_commands": len(filtered_commands),
                 "history.returned_commands": len(result),
                 "history.duration": duration,
             })
             
             add_span_event("history.get_command_history.completed", {
-                "total": len(commands),
-                "filtered": len(filtered_commands),
                 "returned": len(result),
                 "duration": duration,
             })
@@ -448,53 +604,42 @@ def get_command_stats() -> Dict[str, Any]:
         add_span_event("history.get_command_stats.starting")
         
         try:
-            commands = _load_commands()
-            
-            if not commands:
-                return {
-                    "total_commands": 0,
-                    "unique_commands": 0,
-                    "success_rate": 0.0,
-                    "most_used": [],
-                    "recent_activity": {},
-                }
-            
-            # Calculate statistics
-            total_commands = len(commands)
-            unique_commands = len(set(c.get("command", "") for c in commands))
-            successful_commands = sum(1 for c in commands if c.get("exit_code", 0) == 0)
-            success_rate = (successful_commands / total_commands) * 100 if total_commands > 0 else 0
-            
-            # Command frequency analysis
-            command_counts = {}
-            for cmd in commands:
-                command_name = cmd.get("command", "unknown")
-                command_counts[command_name] = command_counts.get(command_name, 0) + 1
-            
-            most_used = sorted(command_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-            
-            # Recent activity (last 24 hours)
-            now = datetime.now()
-            recent_commands = []
-            for cmd in commands:
-                try:
-                    cmd_time = datetime.fromisoformat(cmd.get("ts", ""))
-                    if (now - cmd_time).total_seconds() < 86400:  # 24 hours
-                        recent_commands.append(cmd)
-                except ValueError:
-                    continue
-            
+            # Aggregates are maintained by triggers; only the 24h window is queried
+            with _lock:
+                conn = _db()
+                total_commands, successful_commands, duration_sum, duration_count = conn.execute(
+                    "SELECT total, succeeded, duration_sum, duration_count FROM command_stats WHERE id = 0"
+                ).fetchone()
+                
+                if not total_commands:
+                    return {
+                        "total_commands": 0,
+                        "unique_commands": 0,
+                        "success_rate": 0.0,
+                        "most_used": [],
+                        "recent_activity": {},
+                    }
+                
+                unique_commands = conn.execute("SELECT COUNT(*) FROM command_counts").fetchone()[0]
+                most_used = [
+                    tuple(row) for row in conn.execute(
+                        "SELECT command, n FROM command_counts ORDER BY n DESC, command LIMIT 10"
+                    )
+                ]
+                # Recent activity (last 24 hours)
+                recent_total, recent_succeeded = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(exit_code = 0), 0) FROM commands WHERE epoch > ?",
+                    (time.time() - 86400,),
+                ).fetchone()
+            
+            success_rate = (successful_commands / total_commands) * 100
             recent_activity = {
-                "last_24h": len(recent_commands),
-                "success_rate_24h": (
-                    sum(1 for c in recent_commands if c.get("exit_code", 0) == 0) / len(recent_commands) * 100
-                    if recent_commands else 0
-                ),
+                "last_24h": recent_total,
+                "success_rate_24h": recent_succeeded / recent_total * 100 if recent_total else 0,
             }
             
             # Average durations
-            durations = [c.get("duration", 0) for c in commands if c.get("duration")]
-            avg_duration = sum(durations) / len(durations) if durations else 0
+            avg_duration = duration_sum / duration_count if duration_count else 0
             
             stats = {
                 "total_commands": total_commands,
@@ -552,13 +697,11 @@ def clear_history(command_history: bool = True, file_history: bool = False) -> N
         
         try:
             cleared_files = []
+            cmd_count, file_count = _counts()
             
-            if command_history and CMD_HIST.exists():
-                # Get count before clearing
-                commands = _load_commands()
-                cmd_count = len(commands)
-                
-                CMD_HIST.unlink()
+            if command_history and cmd_count:
+                with _lock:
+                    _db().execute("DELETE FROM commands")
                 cleared_files.append("command_history")
                 
                 metric_counter("history.clear_history.commands")(cmd_count)
@@ -567,12 +710,9 @@ def clear_history(command_history: bool = True, file_history: bool = False) -> N
                     "count": cmd_count,
                 })
             
-            if file_history and HIST.exists():
-                # Get count before clearing
-                files = _load()
-                file_count = len(files)
-                
-                HIST.unlink()
+            if file_history and file_count:
+                with _lock:
+                    _db().execute("DELETE FROM files")
                 cleared_files.append("file_history")
                 
                 metric_counter("history.clear_history.files")(file_count)
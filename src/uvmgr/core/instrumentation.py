@@ -269,8 +269,8 @@ def add_span_attributes(**attributes):
     """
     if HAS_OTEL:
         current_span = trace.get_current_span()
-        for key, value in attributes.items():
-            current_span.set_attribute(key, value)
+        if current_span.is_recording():
+            current_span.set_attributes(attributes)
 
 
 def add_span_event(name: str, attributes: dict = None):
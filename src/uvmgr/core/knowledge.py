@@ -35,6 +35,7 @@ except ImportError:
     SentenceTransformer = None
     KNOWLEDGE_AVAILABLE = False
 
+from uvmgr.core.code_index import ProjectIndex, get_project_index
 from uvmgr.core.semconv import CliAttributes, AIAttributes, ProjectAttributes
 from uvmgr.core.agi_reasoning import observe_with_agi_reasoning, get_agi_insights
 from uvmgr.core.workspace import get_workspace_config
@@ -154,6 +155,43 @@ class CodeAnalyzer:
         
         return elements
     
+    @staticmethod
+    def elements_from_index(index: ProjectIndex, file_path: Path) -> List[CodeElement]:
+        """Build code elements for a file from the project symbol index (no re-parse)."""
+        
+        symbols = [
+            symbol for symbol in index.symbols(kind=("class", "function"), path=file_path)
+            if not symbol.is_async
+        ]
+        if not symbols:
+            return []
+        
+        try:
+            sources = index.segments(file_path, symbols)
+        except OSError:
+            return []
+        
+        builtins = {'print', 'len', 'str', 'int', 'float', 'list', 'dict', 'set', 'tuple'}
+        elements = []
+        
+        for symbol, source_code in zip(symbols, sources):
+            element = CodeElement(
+                id=f"{symbol.kind}:{file_path}:{symbol.name}",
+                type=symbol.kind,
+                name=symbol.name,
+                file_path=str(file_path),
+                line_number=symbol.line,
+                source_code=source_code,
+                docstring=symbol.detail.get("docstring"),
+                complexity_score=float(symbol.complexity),
+                dependencies=sorted(set(symbol.detail.get("refs", [])) - builtins),
+            )
+            element.hash = hashlib.md5(source_code.encode()).hexdigest()
+            element.tags = CodeAnalyzer._generate_tags(element)
+            elements.append(element)
+        
+        return elements
+    
     @staticmethod
     def _calculate_complexity(node: ast.AST) -> float:
         """Calculate cyclomatic complexity score."""
@@ -293,31 +331,27 @@ class KnowledgeBase:
             project_type=workspace_config.project_type
         )
         
-        # Find all Python files
-        python_files = list(self.workspace_root.rglob("*.py"))
+        # Find all Python files (incrementally re-parsed by the project index)
+        index = get_project_index(self.workspace_root)
+        index.refresh(self.workspace_root)
         # Filter out common ignore patterns
         ignore_patterns = {'.venv', '__pycache__', '.git', 'node_modules', '.pytest_cache'}
-        python_files = [f for f in python_files if not any(pattern in str(f) for pattern in ignore_patterns)]
+        records = [
+            record for record in index.files(self.workspace_root)
+            if not any(pattern in str(record.path) for pattern in ignore_patterns)
+        ]
+        python_files = [record.path for record in records]
         
         knowledge.total_files = len(python_files)
         knowledge.languages["python"] = len(python_files)
         
-        # Analyze each file
+        # Build code elements from indexed symbols
         all_elements = []
-        total_lines = 0
+        total_lines = sum(record.lines for record in records)
         
-        for file_path in python_files:
-            try:
-                # Count lines
-                content = file_path.read_text(encoding='utf-8')
-                total_lines += len(content.splitlines())
-                
-                # Analyze code elements
-                elements = CodeAnalyzer.analyze_file(file_path)
-                all_elements.extend(elements)
-                
-            except Exception as e:
-                continue  # Skip problematic files
+        for record in records:
+            if record.error is None:
+                all_elements.extend(CodeAnalyzer.elements_from_index(index, record.path))
         
         knowledge.total_lines = total_lines
         
@@ -444,12 +478,17 @@ class KnowledgeBase:
         if not changed_files:
             return
         
-        # Re-analyze changed files
+        # Re-index and re-analyze changed files
+        index = get_project_index(self.workspace_root)
         updated_elements = []
         for file_path_str in changed_files:
-            file_path = Path(file_path_str)
+            file_path = Path(file_path_str).resolve()
             if file_path.suffix == '.py' and file_path.exists():
-                elements = CodeAnalyzer.analyze_file(file_path)
+                if file_path.is_relative_to(index.root):
+                    index.refresh(file_path)
+                    elements = CodeAnalyzer.elements_from_index(index, file_path)
+                else:
+                    elements = CodeAnalyzer.analyze_file(file_path)
                 updated_elements.extend(elements)
         
         # Update knowledge base
@@ -486,21 +525,13 @@ class KnowledgeBase:
         """Extract most common imports across the project."""
         
         import_counts = {}
+        wanted = set(python_files)
+        index = get_project_index(self.workspace_root)
         
-        for file_path in python_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            import_counts[alias.name] = import_counts.get(alias.name, 0) + 1
-                    elif isinstance(node, ast.ImportFrom) and node.module:
-                        import_counts[node.module] = import_counts.get(node.module, 0) + 1
-                        
-            except Exception:
+        for symbol in index.symbols(kind=("import", "import_from"), path=self.workspace_root):
+            if symbol.path not in wanted or not symbol.name:
                 continue
+            import_counts[symbol.name] = import_counts.get(symbol.name, 0) + 1
         
         # Return top 20 most common imports
         return dict(sorted(import_counts.items(), key=lambda x: x[1], reverse=True)[:20])
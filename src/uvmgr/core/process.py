@@ -16,11 +16,14 @@ Key Features
 • **Telemetry Integration**: Full OpenTelemetry instrumentation
 • **Error Handling**: Comprehensive error tracking and metrics
 • **Path Resolution**: Executable location utilities
+• **Streaming**: Line-by-line output with a bounded tail buffer and timeouts
 
 Available Functions
 ------------------
 - **run()**: Execute command with optional output capture
 - **run_logged()**: Execute command with logging and display
+- **run_streaming()**: Execute command, handing each output line to a callback
+- **stream()**: Iterate over a command's output lines as they arrive
 - **which()**: Find executable in PATH with telemetry
 
 Environment Variables
@@ -42,6 +45,10 @@ Examples
     >>> 
     >>> # Logged execution with display
     >>> run_logged(["ls", "-la"])
+    >>>
+    >>> # Stream a long-running command, keeping only the last 200 lines
+    >>> result = run_streaming(["pytest", "-q"], on_line=print, timeout=600)
+    >>> result.exit_code, result.line_count
     >>> 
     >>> # Find executable
     >>> python_path = which("python")
@@ -58,8 +65,11 @@ import logging
 import os
 import shlex
 import subprocess
+import threading
 import time
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from .instrumentation import add_span_attributes, add_span_event
@@ -67,7 +77,9 @@ from .semconv import ProcessAttributes
 from .shell import colour
 from .telemetry import metric_counter, metric_histogram, span
 
-__all__ = ["run", "run_logged", "which"]
+__all__ = ["StreamResult", "StreamingProcess", "run", "run_logged", "run_streaming", "stream", "which"]
+
+DEFAULT_TAIL_LINES = 200
 
 _log = logging.getLogger("uvmgr.process")
 
@@ -76,8 +88,19 @@ def _to_str(cmd: str | Sequence[str]) -> str:
     return cmd if isinstance(cmd, str) else " ".join(cmd)
 
 
-def run(cmd: str | Sequence[str], *, capture: bool = False, cwd: Path | None = None) -> str | None:
-    """Execute a command with comprehensive OTEL instrumentation."""
+def run(
+    cmd: str | Sequence[str],
+    *,
+    capture: bool = False,
+    cwd: Path | None = None,
+    timeout: float | None = None,
+) -> str | None:
+    """
+    Execute a command with comprehensive OTEL instrumentation.
+
+    The whole output is buffered when *capture* is set; use
+    :func:`run_streaming` for commands with large or long-running output.
+    """
     cmd_str = _to_str(cmd)
     start_time = time.time()
 
@@ -107,7 +130,7 @@ def run(cmd: str | Sequence[str], *, capture: bool = False, cwd: Path | None = N
         })
 
         try:
-            res = subprocess.run(shlex.split(cmd_str), check=True, **kw)
+            res = subprocess.run(shlex.split(cmd_str), check=True, timeout=timeout, **kw)
 
             duration = time.time() - start_time
 
@@ -187,6 +210,214 @@ def run_logged(cmd: str | Sequence[str], **kw):
             raise
 
 
+@dataclass
+class StreamResult:
+    """Outcome of a streamed command; only the last lines are retained."""
+
+    command: str
+    exit_code: int
+    line_count: int = 0
+    duration: float = 0.0
+    timed_out: bool = False
+    tail: list[str] = field(default_factory=list)
+
+    @property
+    def output(self) -> str:
+        """The retained tail of the output as one string."""
+        return "\n".join(self.tail)
+
+
+class StreamingProcess:
+    """
+    Iterate over a command's merged stdout/stderr lines as they are produced.
+
+    Memory stays flat regardless of output size: each line is yielded once and
+    only the last *tail_lines* are kept (for error reporting). A watchdog kills
+    the process when *timeout* seconds elapse. After iteration finishes,
+    :attr:`result` holds the :class:`StreamResult`. Breaking out of the loop
+    early kills the process.
+
+    Example
+    -------
+    >>> proc = StreamingProcess(["pytest", "-q"], timeout=600)
+    >>> for line in proc:
+    ...     print(line)
+    >>> proc.result.exit_code
+    """
+
+    def __init__(
+        self,
+        cmd: str | Sequence[str],
+        *,
+        cwd: Path | None = None,
+        timeout: float | None = None,
+        tail_lines: int = DEFAULT_TAIL_LINES,
+        env: dict[str, str] | None = None,
+    ):
+        self.cmd_str = _to_str(cmd)
+        self.argv = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+        self.cwd = cwd
+        self.timeout = timeout
+        self.env = env
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self.line_count = 0
+        self.result: StreamResult | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        start_time = time.time()
+
+        if os.getenv("UVMGR_DRY") == "1":
+            colour(f"[dry] {self.cmd_str}", "yellow")
+            metric_counter("process.dry_runs")(1)
+            self.result = StreamResult(command=self.cmd_str, exit_code=0)
+            return
+
+        proc = subprocess.Popen(
+            self.argv,
+            cwd=str(self.cwd) if self.cwd else None,
+            env=self.env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        timed_out = threading.Event()
+
+        def _expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(self.timeout, _expire) if self.timeout else None
+        if watchdog:
+            watchdog.daemon = True
+            watchdog.start()
+
+        try:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                self.tail.append(line)
+                self.line_count += 1
+                yield line
+            exit_code = proc.wait()
+        finally:
+            if watchdog:
+                watchdog.cancel()
+            if proc.poll() is None:  # consumer stopped early
+                proc.kill()
+                proc.wait()
+            if proc.stdout:
+                proc.stdout.close()
+
+        duration = time.time() - start_time
+        metric_counter("process.streamed_executions")(1)
+        metric_histogram("process.execution.duration")(duration)
+
+        self.result = StreamResult(
+            command=self.cmd_str,
+            exit_code=exit_code,
+            line_count=self.line_count,
+            duration=duration,
+            timed_out=timed_out.is_set(),
+            tail=list(self.tail),
+        )
+
+
+def stream(
+    cmd: str | Sequence[str],
+    *,
+    cwd: Path | None = None,
+    timeout: float | None = None,
+    tail_lines: int = DEFAULT_TAIL_LINES,
+) -> StreamingProcess:
+    """Return a :class:`StreamingProcess` to iterate over *cmd*'s output lines."""
+    return StreamingProcess(cmd, cwd=cwd, timeout=timeout, tail_lines=tail_lines)
+
+
+def run_streaming(
+    cmd: str | Sequence[str],
+    *,
+    on_line: Callable[[str], None] | None = None,
+    cwd: Path | None = None,
+    timeout: float | None = None,
+    tail_lines: int = DEFAULT_TAIL_LINES,
+    check: bool = True,
+    env: dict[str, str] | None = None,
+) -> StreamResult:
+    """
+    Execute a command, passing each output line to *on_line* as it arrives.
+
+    Parameters
+    ----------
+    cmd : str | Sequence[str]
+        Command to run; stderr is merged into stdout.
+    on_line : Callable[[str], None], optional
+        Called once per output line (without the trailing newline).
+    cwd : Path, optional
+        Working directory.
+    timeout : float, optional
+        Seconds before the process is killed.
+    tail_lines : int
+        Number of trailing lines retained for the result and error messages.
+    check : bool
+        Raise :class:`subprocess.CalledProcessError` on a non-zero exit code.
+    env : dict[str, str], optional
+        Environment for the child process.
+
+    Returns
+    -------
+    StreamResult
+        Exit code, line count, duration and the retained tail.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If *timeout* elapsed; ``output`` holds the tail.
+    subprocess.CalledProcessError
+        If *check* and the command failed; ``output`` holds the tail.
+    """
+    proc = StreamingProcess(cmd, cwd=cwd, timeout=timeout, tail_lines=tail_lines, env=env)
+
+    with span(
+        "process.streaming",
+        **{
+            ProcessAttributes.COMMAND: proc.cmd_str,
+            ProcessAttributes.WORKING_DIRECTORY: str(cwd) if cwd else os.getcwd(),
+            "process.timeout": timeout or 0,
+        }
+    ):
+        add_span_event("process.starting", {"command": proc.cmd_str, "streaming": True})
+
+        for line in proc:
+            if on_line is not None:
+                on_line(line)
+        result = proc.result
+        assert result is not None
+
+        add_span_attributes(**{
+            ProcessAttributes.EXIT_CODE: result.exit_code,
+            ProcessAttributes.DURATION: result.duration,
+            "process.output_lines": result.line_count,
+            "process.timed_out": result.timed_out,
+        })
+
+        if result.timed_out:
+            metric_counter("process.executions.timeout")(1)
+            add_span_event("process.timeout", {"timeout": timeout, "duration": result.duration})
+            raise subprocess.TimeoutExpired(proc.argv, timeout, output=result.output)
+
+        if result.exit_code != 0:
+            metric_counter("process.executions.failed")(1)
+            add_span_event("process.failed", {"exit_code": result.exit_code, "duration": result.duration})
+            if check:
+                raise subprocess.CalledProcessError(result.exit_code, proc.argv, output=result.output)
+        else:
+            metric_counter("process.executions.success")(1)
+            add_span_event("process.completed", {"exit_code": 0, "duration": result.duration})
+
+        return result
+
+
 def which(binary: str) -> str | None:
     """Find executable in PATH with telemetry tracking."""
     import shutil
@@ -0,0 +1,330 @@
+"""
+uvmgr.core.scanner - Single-Pass Multi-Pattern File Scanner
+===========================================================
+
+Regex scanner shared by the secret and code-security scans.
+
+Every pattern of a :class:`PatternSet` is folded into one alternation that is
+run once over each file's raw bytes. Files without a hit - nearly all of
+them - are never decoded or split into lines. Only lines touched by a
+prefilter hit are decoded and matched against the individual patterns, so
+results equal those of running every pattern on every line. (The prefilter
+matches bytes, where ``\\w`` and ``(?i)`` are ASCII-only; patterns that rely
+on non-ASCII word characters should not be scanned with this module.)
+
+Key Features
+-----------
+• **One Pass**: A single compiled alternation prefilters each file
+• **Zero-Copy Reads**: Large files are memory-mapped instead of read
+• **Binary Sniffing**: Files with a NUL byte in their first 8 KiB are skipped
+• **Parallel**: Large batches fan out to a process pool
+• **Clean-File Cache**: Files that matched nothing are remembered by
+  ``(mtime, size)`` and content hash per pattern set, so re-scanning an
+  unchanged tree costs one ``stat`` per file
+
+Storage
+-------
+- **Location**: ``<project>/.uvmgr/index/scan.db`` (SQLite, WAL)
+- **Table**: ``clean(ruleset, path, mtime_ns, size, hash)``
+
+Examples
+--------
+    >>> from uvmgr.core.scanner import PatternSet, scan_files
+    >>>
+    >>> patterns = PatternSet({"eval_usage": r"\\beval\\s*\\("})
+    >>> for hit in scan_files(Path("."), files, patterns):
+    ...     print(hit.path, hit.line, hit.pattern)
+
+See Also
+--------
+- :mod:`uvmgr.ops.security` : Secret and code-security scans
+- :mod:`uvmgr.core.code_index` : Source of the Python file list
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .code_index import get_project_index
+from .telemetry import metric_counter, span
+
+__all__ = [
+    "MMAP_THRESHOLD",
+    "PARALLEL_THRESHOLD",
+    "PatternSet",
+    "ScanMatch",
+    "scan_files",
+]
+
+PARALLEL_THRESHOLD = 256
+"""File count above which scanning fans out to a process pool."""
+
+MMAP_THRESHOLD = 1 << 16
+"""File size in bytes from which files are memory-mapped rather than read."""
+
+_SNIFF_BYTES = 8192
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clean (
+    ruleset  TEXT NOT NULL,
+    path     TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    hash     TEXT NOT NULL,
+    PRIMARY KEY (ruleset, path)
+) WITHOUT ROWID;
+"""
+
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+_ABSOLUTE_ANCHOR = re.compile(r"(?<!\\)(?:\\\\)*\\[AZ]")
+
+
+@dataclass(frozen=True, slots=True)
+class ScanMatch:
+    """One pattern match on one line."""
+
+    path: Path
+    line: int
+    pattern: str
+    """Name of the pattern in the :class:`PatternSet`."""
+    text: str
+    """The matched text."""
+    line_text: str
+
+
+class PatternSet:
+    """
+    Named regular expressions scanned together.
+
+    Patterns are plain :mod:`re` syntax and may start with inline flags such
+    as ``(?i)``. With *all_matches* every match on a line is reported,
+    otherwise at most one per pattern and line.
+
+    Raises
+    ------
+    re.error
+        If a pattern is not a valid regular expression.
+    """
+
+    def __init__(self, patterns: dict[str, str], *, all_matches: bool = True):
+        self.patterns = dict(patterns)
+        self.all_matches = all_matches
+        self.compiled = {name: re.compile(p) for name, p in self.patterns.items()}
+        self.digest = hashlib.sha1(
+            repr((sorted(self.patterns.items()), all_matches)).encode()
+        ).hexdigest()
+        self.prefilter = self._build_prefilter()
+
+    def _build_prefilter(self) -> re.Pattern[bytes] | None:
+        """
+        One bytes alternation of every pattern; ``None`` if they cannot be combined.
+
+        The alternation runs over the whole file, so it is compiled with
+        ``re.MULTILINE`` to keep ``^`` and ``$`` anchored at line boundaries,
+        as they are when a pattern is matched against a single line.
+        """
+        branches = []
+        for pattern in self.patterns.values():
+            if _ABSOLUTE_ANCHOR.search(pattern):
+                return None  # \A and \Z mean start and end of a line here
+            # Global flags are only legal at the start, so scope them to the branch
+            m = _LEADING_FLAGS.match(pattern)
+            branches.append(f"(?{m.group(1)}:{pattern[m.end():]})" if m else f"(?:{pattern})")
+        try:
+            return re.compile("|".join(branches).encode(), re.MULTILINE)
+        except (re.error, UnicodeEncodeError):
+            return None  # e.g. str-only flags or duplicate group names
+
+    def _line_starts(self, data: bytes | mmap.mmap) -> list[int]:
+        """Offsets of the lines touched by a prefilter hit (all lines without one)."""
+        if self.prefilter is None:
+            return [0, *(m.end() for m in re.finditer(b"\n", data))]
+        marked: set[int] = set()
+        for hit in self.prefilter.finditer(data):
+            pos = data.rfind(b"\n", 0, hit.start()) + 1
+            while True:
+                # A hit spanning a newline marks every line it touches
+                marked.add(pos)
+                nl = data.find(b"\n", pos)
+                if nl == -1 or nl + 1 >= hit.end():
+                    break
+                pos = nl + 1
+        return sorted(marked)
+
+    def scan_bytes(self, path: Path, data: bytes | mmap.mmap) -> tuple[str, list[ScanMatch]] | None:
+        """``(content_hash, matches)`` for the content of *path*, ``None`` if it is binary."""
+        if b"\0" in data[:_SNIFF_BYTES]:
+            return None
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+        matches: list[ScanMatch] = []
+        line_no, counted = 1, 0
+        for start in self._line_starts(data):
+            line_no += data[counted:start].count(b"\n")
+            counted = start
+            end = data.find(b"\n", start)
+            line = data[start:end if end != -1 else len(data)].decode("utf-8", errors="ignore")
+            for name, regex in self.compiled.items():
+                if self.all_matches:
+                    matches.extend(ScanMatch(path, line_no, name, m.group(0), line) for m in regex.finditer(line))
+                elif (m := regex.search(line)) is not None:
+                    matches.append(ScanMatch(path, line_no, name, m.group(0), line))
+        return digest, matches
+
+
+def _scan_file(patterns: PatternSet, path: str, known: str | None) -> tuple[str, list[ScanMatch]] | None:
+    """Scan one file, short-circuiting when its hash equals the *known* clean hash."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            data: bytes | mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+    try:
+        if known is not None and hashlib.blake2b(data, digest_size=16).hexdigest() == known:
+            return known, []
+        return patterns.scan_bytes(Path(path), data)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def _scan_chunk(
+    patterns: PatternSet, jobs: list[tuple[str, str | None]]
+) -> list[tuple[str, str, list[ScanMatch]]]:
+    """
+    Scan ``(path, known_clean_hash)`` jobs (process-pool worker).
+
+    Returns ``(path, hash, matches)`` for every readable text file.
+    """
+    out = []
+    for path, known in jobs:
+        try:
+            result = _scan_file(patterns, path, known)
+        except OSError:
+            continue  # vanished or unreadable since the walk
+        if result is not None:
+            out.append((path, *result))
+    return out
+
+
+class _CleanCache:
+    """Clean-file verdicts per pattern set."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def load(self, ruleset: str) -> dict[str, tuple[int, int, str]]:
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT path, mtime_ns, size, hash FROM clean WHERE ruleset = ?", (ruleset,)
+            ).fetchall()
+        return {path: (mtime, size, digest) for path, mtime, size, digest in rows}
+
+    def update(self, ruleset: str, clean: list[tuple[str, int, int, str]], dirty: list[str]) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN")
+            db.executemany(
+                "INSERT OR REPLACE INTO clean VALUES (?, ?, ?, ?, ?)",
+                [(ruleset, *row) for row in clean],
+            )
+            db.executemany("DELETE FROM clean WHERE ruleset = ? AND path = ?", [(ruleset, p) for p in dirty])
+            db.execute("COMMIT")
+
+
+_CACHES: dict[Path, _CleanCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def _clean_cache(root: Path) -> _CleanCache:
+    db_path = get_project_index(root).index_dir / "scan.db"
+    with _CACHES_LOCK:
+        cache = _CACHES.get(db_path)
+        if cache is None:
+            cache = _CACHES[db_path] = _CleanCache(db_path)
+        return cache
+
+
+def scan_files(
+    root: Path,
+    files: Iterable[Path],
+    patterns: PatternSet,
+    *,
+    use_cache: bool = True,
+    workers: int | None = None,
+) -> list[ScanMatch]:
+    """
+    Scan *files* (below *root*) for *patterns*.
+
+    Matches are returned ordered by path and line. Binary and unreadable
+    files are skipped; files that match nothing are cached as clean under the
+    project of *root* unless *use_cache* is false.
+    """
+    with span("scanner.scan_files", ruleset=patterns.digest[:12]) as current_span:
+        cache = _clean_cache(root) if use_cache else None
+        known = cache.load(patterns.digest) if cache is not None else {}
+
+        jobs: list[tuple[str, str | None]] = []
+        stats: dict[str, tuple[int, int]] = {}
+        skipped = 0
+        for file_path in files:
+            path = str(file_path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+            record = known.get(path)
+            if record is not None and record[:2] == stats[path]:
+                skipped += 1
+                continue
+            jobs.append((path, record[2] if record is not None else None))
+
+        if len(jobs) > PARALLEL_THRESHOLD:
+            n_workers = workers or os.cpu_count() or 1
+            size = max(1, -(-len(jobs) // (n_workers * 4)))
+            chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                results = [r for chunk in pool.map(_scan_chunk, [patterns] * len(chunks), chunks) for r in chunk]
+        else:
+            results = _scan_chunk(patterns, jobs)
+
+        matches: list[ScanMatch] = []
+        clean: list[tuple[str, int, int, str]] = []
+        dirty: list[str] = []
+        for path, digest, found in results:
+            if found:
+                matches.extend(found)
+                dirty.append(path)
+            else:
+                clean.append((path, *stats[path], digest))
+        if cache is not None and (clean or dirty):
+            cache.update(patterns.digest, clean, dirty)
+
+        current_span.set_attribute("scanner.files_cached", skipped)
+        current_span.set_attribute("scanner.files_scanned", len(jobs))
+        current_span.set_attribute("scanner.matches", len(matches))
+        metric_counter("scanner.files_cached")(skipped)
+        matches.sort(key=lambda m: (str(m.path), m.line))
+        return matches
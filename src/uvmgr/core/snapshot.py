@@ -0,0 +1,121 @@
+"""
+uvmgr.core.snapshot - Stat-Validated Snapshot Cache
+===================================================
+
+Persist the result of an expensive load (parsing and merging config files)
+together with a *key* describing its inputs, and reuse it while the key still
+matches.
+
+A key is built with one ``stat`` per contributing file - ``(path, mtime_ns,
+size)`` - plus the values of the environment variables that feed into the
+result. Snapshots are pickled (key first, then value) under
+``CACHE_DIR/snapshots``, so a hit costs a handful of ``stat`` calls and one
+small unpickle instead of TOML/YAML parsing.
+
+Snapshots are a cache, never a source of truth: unreadable, outdated or
+mismatching files are ignored and the caller loads from the real files.
+
+Examples
+--------
+    >>> from uvmgr.core.snapshot import load_snapshot, save_snapshot, snapshot_key
+    >>>
+    >>> key = snapshot_key([config_path])
+    >>> config = load_snapshot("config-demo", key)
+    >>> if config is None:
+    ...     config = parse(config_path)
+    ...     save_snapshot("config-demo", key, config)
+
+See Also
+--------
+- :mod:`uvmgr.core.configuration` : Hierarchical configuration
+- :mod:`uvmgr.core.workspace` : Workspace configuration and state
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Iterable
+
+from .paths import CACHE_DIR
+from .telemetry import metric_counter
+
+__all__ = [
+    "SNAPSHOT_DIR",
+    "load_snapshot",
+    "save_snapshot",
+    "snapshot_key",
+    "snapshot_name",
+]
+
+SNAPSHOT_DIR: Path = CACHE_DIR / "snapshots"
+
+_FORMAT = 1
+"""Bumped when the on-disk layout changes."""
+
+
+def snapshot_key(paths: Iterable[Path | None], env_prefix: str | None = "UVMGR_") -> tuple:
+    """
+    Key of the current inputs: ``(path, mtime_ns, size)`` per file and the
+    sorted environment variables starting with *env_prefix*.
+
+    Missing files contribute ``(path, None, None)``, so creating one changes
+    the key as well.
+    """
+    files = []
+    for path in paths:
+        if path is None:
+            continue
+        try:
+            st = os.stat(path)
+            files.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            files.append((str(path), None, None))
+    env = ()
+    if env_prefix:
+        env = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith(env_prefix)))
+    return (_FORMAT, tuple(files), env)
+
+
+def snapshot_name(kind: str, root: Path) -> str:
+    """File-name-safe snapshot name for *kind* data belonging to *root*."""
+    digest = hashlib.sha1(str(Path(root).resolve()).encode()).hexdigest()[:16]
+    return f"{kind}-{digest}"
+
+
+def _path(name: str) -> Path:
+    return SNAPSHOT_DIR / f"{name}.pickle"
+
+
+def load_snapshot(name: str, key: tuple) -> Any | None:
+    """The value stored under *name* if it was saved with *key*, else ``None``."""
+    try:
+        with open(_path(name), "rb") as fh:
+            if pickle.load(fh) != key:
+                metric_counter("snapshot.stale")(1)
+                return None
+            value = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated file, or classes that changed shape since it was written
+        metric_counter("snapshot.unreadable")(1)
+        return None
+    metric_counter("snapshot.hits")(1)
+    return value
+
+
+def save_snapshot(name: str, key: tuple, value: Any) -> None:
+    """Store *value* under *name* with *key*; failures are ignored."""
+    path = _path(name)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as fh:
+            pickle.dump(key, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
@@ -0,0 +1,240 @@
+"""
+uvmgr.core.streaming_stats - Constant-Memory Running Statistics
+===============================================================
+
+Summaries of an unbounded stream of measurements (job durations, latencies)
+that cost O(1) memory and amortised O(1) time per observation, so a
+long-running process can keep statistics without keeping history.
+
+- :class:`TDigest` estimates quantiles (p50, p95, ...) from at most a few
+  hundred weighted centroids. It follows Dunning's merging t-digest with the
+  ``k1`` (arcsine) scale function, so centroids near the tails stay small and
+  tail quantiles stay accurate.
+- :class:`RollingStats` adds count, failures, the exact running mean, an
+  exponentially weighted moving average (EWMA) of recent values and min/max.
+
+Both serialise to plain dicts (:meth:`RollingStats.to_dict`) for storage as
+JSON.
+
+Examples
+--------
+    >>> from uvmgr.core.streaming_stats import RollingStats
+    >>>
+    >>> stats = RollingStats()
+    >>> for duration in (0.8, 1.1, 0.9, 4.0):
+    ...     stats.add(duration)
+    >>> round(stats.mean, 2), stats.quantile(0.5)
+
+See Also
+--------
+- :mod:`uvmgr.runtime.aps` : Per-job scheduler statistics
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = [
+    "RollingStats",
+    "TDigest",
+]
+
+
+def _k(q: float, compression: float) -> float:
+    """``k1`` scale function: maps a quantile to centroid-index space."""
+    return compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+
+def _q(k: float, compression: float) -> float:
+    """Inverse of :func:`_k`."""
+    return (math.sin(min(max(k * 2 * math.pi / compression, -math.pi / 2), math.pi / 2)) + 1) / 2
+
+
+class TDigest:
+    """
+    Merging t-digest for streaming quantile estimates.
+
+    Values are buffered and merged into the centroid list once the buffer
+    holds ``5 * compression`` values, so :meth:`add` is amortised O(1) and
+    memory stays below roughly ``6 * compression`` floats.
+    """
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = compression
+        self._means: list[float] = []
+        self._weights: list[float] = []
+        self._buffer: list[float] = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self._buffer.append(value)
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= 5 * self.compression:
+            self._merge()
+
+    def _merge(self) -> None:
+        if not self._buffer:
+            return
+        points = sorted(
+            [*zip(self._means, self._weights), *((v, 1.0) for v in self._buffer)]
+        )
+        self._buffer.clear()
+        total = sum(w for _, w in points)
+
+        means: list[float] = []
+        weights: list[float] = []
+        mean, weight = points[0]
+        before = 0.0  # weight of all emitted centroids
+        limit = total * _q(_k(0.0, self.compression) + 1, self.compression)
+        for m, w in points[1:]:
+            if before + weight + w <= limit:
+                weight += w
+                mean += (m - mean) * w / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                before += weight
+                limit = total * _q(_k(before / total, self.compression) + 1, self.compression)
+                mean, weight = m, w
+        means.append(mean)
+        weights.append(weight)
+        self._means, self._weights = means, weights
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated *q*-quantile (``0 <= q <= 1``), or ``None`` when empty."""
+        self._merge()
+        if not self._means:
+            return None
+        if len(self._means) == 1 or q <= 0:
+            return self.min if q <= 0 else self._means[0]
+        if q >= 1:
+            return self.max
+
+        target = q * self.count
+        # Centroid i covers [cum, cum + w); its mean sits at cum + w / 2
+        cum = 0.0
+        prev_center, prev_mean = 0.0, self.min
+        for mean, weight in zip(self._means, self._weights):
+            center = cum + weight / 2
+            if target < center:
+                span = center - prev_center
+                frac = (target - prev_center) / span if span else 0.0
+                return prev_mean + (mean - prev_mean) * frac
+            prev_center, prev_mean = center, mean
+            cum += weight
+        span = self.count - prev_center
+        frac = (target - prev_center) / span if span else 0.0
+        return prev_mean + (self.max - prev_mean) * frac
+
+    def to_dict(self) -> dict[str, Any]:
+        self._merge()
+        return {
+            "compression": self.compression,
+            "centroids": [[m, w] for m, w in zip(self._means, self._weights)],
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TDigest:
+        digest = cls(data.get("compression", 100.0))
+        for mean, weight in data.get("centroids", []):
+            digest._means.append(mean)
+            digest._weights.append(weight)
+        digest.count = data.get("count", int(sum(digest._weights)))
+        if digest.count:
+            digest.min = data["min"]
+            digest.max = data["max"]
+        return digest
+
+
+@dataclass
+class RollingStats:
+    """Running summary of one measurement stream."""
+
+    alpha: float = 0.2
+    """EWMA smoothing factor; higher values weigh recent observations more."""
+    count: int = 0
+    failures: int = 0
+    coalesced: int = 0
+    """Runs skipped because the previous run was still in flight."""
+    mean: float = 0.0
+    ewma: float | None = None
+    last: float | None = None
+    last_at: float | None = None
+    digest: TDigest = field(default_factory=TDigest)
+
+    def add(self, value: float, *, ok: bool = True, at: float | None = None) -> None:
+        """Record one observation (and whether it succeeded)."""
+        self.count += 1
+        if not ok:
+            self.failures += 1
+        self.mean += (value - self.mean) / self.count
+        self.ewma = value if self.ewma is None else self.ewma + self.alpha * (value - self.ewma)
+        self.last = value
+        self.last_at = at
+        self.digest.add(value)
+
+    def quantile(self, q: float) -> float | None:
+        return self.digest.quantile(q)
+
+    @property
+    def p50(self) -> float | None:
+        return self.quantile(0.5)
+
+    @property
+    def p95(self) -> float | None:
+        return self.quantile(0.95)
+
+    @property
+    def success_rate(self) -> float:
+        return (self.count - self.failures) / self.count if self.count else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Display-ready figures (no digest)."""
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "coalesced": self.coalesced,
+            "mean": self.mean,
+            "ewma": self.ewma,
+            "p50": self.p50,
+            "p95": self.p95,
+            "min": self.digest.min if self.count else None,
+            "max": self.digest.max if self.count else None,
+            "last": self.last,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "alpha": self.alpha,
+            "count": self.count,
+            "failures": self.failures,
+            "coalesced": self.coalesced,
+            "mean": self.mean,
+            "ewma": self.ewma,
+            "last": self.last,
+            "last_at": self.last_at,
+            "digest": self.digest.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RollingStats:
+        return cls(
+            alpha=data.get("alpha", 0.2),
+            count=data.get("count", 0),
+            failures=data.get("failures", 0),
+            coalesced=data.get("coalesced", 0),
+            mean=data.get("mean", 0.0),
+            ewma=data.get("ewma"),
+            last=data.get("last"),
+            last_at=data.get("last_at"),
+            digest=TDigest.from_dict(data.get("digest", {})),
+        )
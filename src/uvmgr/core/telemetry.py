@@ -9,11 +9,15 @@ This module provides comprehensive telemetry capabilities for the uvmgr applicat
 • **Span Management**: Context-manager ``span(name, **attrs)`` for distributed tracing
 • **Metrics Collection**: Functions for counters, histograms, and gauges
 • **Exception Recording**: Utilities for recording exceptions with semantic conventions
+• **Instrument Registry**: Instruments are created once per (name, unit, kind) and reused
 • **Graceful Degradation**: No-op implementations when OpenTelemetry is not available
 
 The module automatically initializes OpenTelemetry when the environment variable
 `OTEL_EXPORTER_OTLP_ENDPOINT` is set and the `opentelemetry-sdk` package is installed.
-Otherwise, it provides no-op implementations that allow the application to run normally.
+Otherwise, it provides no-op implementations that allow the application to run normally:
+``span()`` returns one shared context manager, every metric factory returns one shared
+no-op callable, and the SDK/exporter modules are never imported. Hot paths can check
+``OTEL_ENABLED`` to skip building attribute dicts altogether.
 
 Example
 -------
@@ -25,6 +29,14 @@ Example
     counter = metric_counter("my.operation.calls")
     counter(1, {"operation": "add"})
 
+    # Bound attribute set (memoized together with the instrument)
+    adds = metric_counter("my.operation.calls", attributes={"operation": "add"})
+    adds(1)
+
+    # Skip attribute construction entirely when telemetry is off
+    if OTEL_ENABLED:
+        metric_histogram("my.operation.size", unit="By")(size, {"path": str(path)})
+
     # Exception recording
     try:
         risky_operation()
@@ -46,11 +58,12 @@ See Also
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import platform
-from collections.abc import Callable
-from contextlib import contextmanager
+import threading
+from collections.abc import Callable, Mapping
 from typing import Any
 
 
@@ -99,7 +112,41 @@ def setup_logging(level: str = "INFO") -> None:
 # --------------------------------------------------------------------------- #
 # Optional OpenTelemetry                                                      #
 # --------------------------------------------------------------------------- #
+# Instruments memoized by (kind, name, unit, bound attributes) – see _instrument()
+_INSTRUMENTS: dict[tuple, Callable[..., None]] = {}
+_INSTRUMENTS_LOCK = threading.Lock()
+
+
+def _noop(*_: Any, **__: Any) -> None:
+    """Shared no-op used for every metric when telemetry is disabled."""
+
+
+def _attributes_key(attributes: Mapping[str, Any] | None) -> frozenset | None:
+    """Hashable form of *attributes*; sequence values (legal in OTEL) become tuples."""
+    if not attributes:
+        return None
+    return frozenset(
+        (k, tuple(v) if isinstance(v, (list, tuple)) else v) for k, v in attributes.items()
+    )
+
+
+def _bind(record: Callable[..., None], attributes: Mapping[str, Any]) -> Callable[..., None]:
+    """Return *record* with *attributes* pre-applied (call-site attributes win)."""
+    bound = dict(attributes)
+
+    def _record(amount: float = 1, attributes: Mapping[str, Any] | None = None, **__: Any) -> None:
+        record(amount, {**bound, **attributes} if attributes else bound)
+
+    return _record
+
+
 try:
+    # Only initialize if OTEL endpoint is configured – checked before importing
+    # the SDK and exporters so the disabled path pays nothing for them.
+    _OTEL_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if not _OTEL_ENDPOINT:
+        raise ImportError("OTEL_EXPORTER_OTLP_ENDPOINT not set")
+
     from opentelemetry import metrics, trace
     from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
@@ -109,11 +156,6 @@ try:
     from opentelemetry.sdk.trace import TracerProvider
     from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-    # Only initialize if OTEL endpoint is configured
-    _OTEL_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
-    if not _OTEL_ENDPOINT:
-        raise ImportError("OTEL_EXPORTER_OTLP_ENDPOINT not set")
-
     _RESOURCE = Resource.create(
         {
             "service.name": os.getenv("OTEL_SERVICE_NAME", "uvmgr"),
@@ -139,23 +181,71 @@ try:
     metrics.set_meter_provider(_METRIC_PROVIDER)
     _METER = metrics.get_meter("uvmgr")
 
-    @contextmanager
+    OTEL_ENABLED = True
+
+    _FACTORIES: dict[str, Callable[[str, str], Callable[..., None]]] = {
+        "counter": lambda name, unit: _METER.create_counter(name, unit=unit).add,
+        "histogram": lambda name, unit: _METER.create_histogram(name, unit=unit).record,
+        "gauge": lambda name, unit: _METER.create_up_down_counter(name, unit=unit).add,
+    }
+
+    def _instrument(
+        kind: str, name: str, unit: str, attributes: Mapping[str, Any] | None
+    ) -> Callable[..., None]:
+        """
+        Return the recording callable for an instrument, creating it only once.
+
+        Instruments are keyed by ``(kind, name, unit)``; bound attribute sets get
+        their own entry so repeated lookups return the same callable.
+        """
+        key = (kind, name, unit, _attributes_key(attributes))
+        record = _INSTRUMENTS.get(key)
+        if record is None:
+            with _INSTRUMENTS_LOCK:
+                record = _INSTRUMENTS.get(key)
+                if record is None:
+                    record = _INSTRUMENTS.get((kind, name, unit, None))
+                    if record is None:
+                        record = _FACTORIES[kind](name, unit)
+                        _INSTRUMENTS[(kind, name, unit, None)] = record
+                    if attributes:
+                        record = _bind(record, attributes)
+                        _INSTRUMENTS[key] = record
+        return record
+
     def span(name: str, span_kind=None, **attrs: Any):
-        kwargs = {"attributes": attrs}
+        """Context manager starting *name* as the current span with *attrs*."""
         if span_kind is not None:
-            kwargs["kind"] = span_kind
-        with _TRACER.start_as_current_span(name, **kwargs) as current_span:
-            yield current_span
+            return _TRACER.start_as_current_span(name, kind=span_kind, attributes=attrs)
+        return _TRACER.start_as_current_span(name, attributes=attrs)
 
-    def metric_counter(name: str) -> Callable[[int], None]:
-        return _METER.create_counter(name).add
+    def metric_counter(
+        name: str, unit: str = "1", attributes: Mapping[str, Any] | None = None
+    ) -> Callable[[int], None]:
+        """
+        Return the ``add`` callable of the (memoized) counter *name*.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter metric.
+        unit : str, optional
+            The unit of the counted quantity. Default is "1".
+        attributes : Mapping[str, Any], optional
+            Attribute set bound to every recording; merged under any attributes
+            passed at call time.
+        """
+        return _instrument("counter", name, unit, attributes)
 
-    def metric_histogram(name: str, unit: str = "s") -> Callable[[float], None]:
+    def metric_histogram(
+        name: str, unit: str = "s", attributes: Mapping[str, Any] | None = None
+    ) -> Callable[[float], None]:
         """
         Create a histogram metric for recording distributions.
 
         Histograms are used to track the distribution of values, such as
         operation durations, request sizes, or other measurable quantities.
+        The underlying instrument is created once and reused on later calls.
 
         Parameters
         ----------
@@ -166,6 +256,8 @@ try:
             The unit of measurement for the histogram values. Common units
             include "s" (seconds), "ms" (milliseconds), "bytes", "count".
             Default is "s".
+        attributes : Mapping[str, Any], optional
+            Attribute set bound to every recording.
 
         Returns
         -------
@@ -178,9 +270,11 @@ try:
         >>> duration_histogram = metric_histogram("api.request.duration", unit="ms")
         >>> duration_histogram(150.5, {"endpoint": "/users", "method": "GET"})
         """
-        return _METER.create_histogram(name, unit=unit).record
+        return _instrument("histogram", name, unit, attributes)
 
-    def metric_gauge(name: str) -> Callable[[float], None]:
+    def metric_gauge(
+        name: str, unit: str = "1", attributes: Mapping[str, Any] | None = None
+    ) -> Callable[[float], None]:
         """
         Create a gauge metric for recording current values.
 
@@ -194,6 +288,10 @@ try:
         name : str
             The name of the gauge metric. Should follow OpenTelemetry
             naming conventions (e.g., "system.memory.usage").
+        unit : str, optional
+            The unit of the gauge value. Default is "1".
+        attributes : Mapping[str, Any], optional
+            Attribute set bound to every recording.
 
         Returns
         -------
@@ -214,7 +312,7 @@ try:
         >>> memory_gauge(-100.0, {"type": "heap"})  # Decrease by 100
         """
         # Note: OTEL uses UpDownCounter for gauge-like behavior
-        return _METER.create_up_down_counter(name).add
+        return _instrument("gauge", name, unit, attributes)
 
     def record_exception(
         e: Exception, escaped: bool = True, attributes: dict[str, Any] | None = None
@@ -332,41 +430,60 @@ try:
             else:
                 current_span.set_status(Status(StatusCode.UNSET))
 
-except ImportError:  # SDK not installed – degrade gracefully
+except ImportError:  # SDK not installed or endpoint unset – degrade gracefully
+    OTEL_ENABLED = False
 
-    @contextmanager
-    def span(name: str, span_kind=None, **attrs: Any):  # type: ignore[arg-type]
-        class _NoopSpan:
-            def is_recording(self):
-                return False
+    class _NoopSpan:
+        __slots__ = ()
 
-            def set_status(self, *args, **kwargs):
-                pass
+        def is_recording(self):
+            return False
 
-            def set_attribute(self, *args, **kwargs):
-                pass
+        def set_status(self, *args, **kwargs):
+            pass
 
-            def set_attributes(self, *args, **kwargs):
-                pass
+        def set_attribute(self, *args, **kwargs):
+            pass
 
-            def add_event(self, *args, **kwargs):
-                pass
+        def set_attributes(self, *args, **kwargs):
+            pass
 
-        yield _NoopSpan()
+        def add_event(self, *args, **kwargs):
+            pass
 
-    def metric_counter(name: str):  # type: ignore[return-value]
-        def _noop(_=1, **__): ...
+        def record_exception(self, *args, **kwargs):
+            pass
 
-        return _noop
+    class _NoopSpanContext:
+        __slots__ = ()
+
+        def __enter__(self):
+            return _NOOP_SPAN
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def __call__(self, func):  # ``@span("name")`` decorator usage
+            # Wrap like contextlib.ContextDecorator so ``__wrapped__`` survives
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+    _NOOP_SPAN = _NoopSpan()
+    _NOOP_SPAN_CONTEXT = _NoopSpanContext()
 
-    def metric_histogram(name: str, unit: str = "s"):  # type: ignore[return-value]
-        def _noop(_: float, **__): ...
+    def span(name: str, span_kind=None, **attrs: Any):  # type: ignore[arg-type]
+        return _NOOP_SPAN_CONTEXT
 
+    def metric_counter(name: str, unit: str = "1", attributes=None):  # type: ignore[return-value]
         return _noop
 
-    def metric_gauge(name: str):  # type: ignore[return-value]
-        def _noop(_: float, **__): ...
+    def metric_histogram(name: str, unit: str = "s", attributes=None):  # type: ignore[return-value]
+        return _noop
 
+    def metric_gauge(name: str, unit: str = "1", attributes=None):  # type: ignore[return-value]
         return _noop
 
     def record_exception(
@@ -375,20 +492,7 @@ except ImportError:  # SDK not installed – degrade gracefully
         pass
 
     def get_current_span():  # type: ignore[return-value]
-        class _NoopSpan:
-            def is_recording(self):
-                return False
-
-            def set_status(self, *args, **kwargs):
-                pass
-
-            def set_attributes(self, *args, **kwargs):
-                pass
-
-            def add_event(self, *args, **kwargs):
-                pass
-
-        return _NoopSpan()
+        return _NOOP_SPAN
 
     def get_tracer():  # type: ignore[return-value]
         return None
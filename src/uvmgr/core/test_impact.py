@@ -0,0 +1,391 @@
+"""
+uvmgr.core.test_impact - Test-Impact Selection
+==============================================
+
+Maps every test file to the project modules it (transitively) imports and
+remembers the outcome of every test node, so a test run can be narrowed to
+the tests whose dependencies changed plus the ones that failed last time.
+
+The import graph is built from the ``import`` / ``import_from`` records of the
+persistent symbol index (:mod:`uvmgr.core.code_index`), so no test or source
+module is imported or executed to compute it. A test file's *dependency hash*
+covers its own content, everything it imports inside the project, the
+``conftest.py`` files above it and the project's test configuration
+(``pyproject.toml``, ``pytest.ini``, lockfiles, ...).
+
+Selection Rules
+---------------
+A test file is **affected** when its dependency hash differs from the one
+recorded at its last run (or it was never run); affected files run in full so
+new tests are picked up. From unaffected files only the nodes that did not
+pass last time run. Files and nodes are ordered slowest-first using the
+recorded durations, so the long tail starts early on parallel workers.
+
+Dynamic imports (``importlib.import_module``, plugin entry points) and data
+files read at test time are invisible to the import graph; run the full suite
+(``impact=False``) in CI.
+
+Storage
+-------
+- **Location**: ``<project>/.uvmgr/index/tests.db`` (SQLite, WAL)
+- **Tables**: ``results(nodeid, file, dep_hash, outcome, duration, updated)``
+  and ``timings(nodeid, duration, runs)`` - an exponentially smoothed
+  duration per node, fed by every run and used for sharding
+  (:mod:`uvmgr.core.test_sharding`)
+
+Examples
+--------
+    >>> from uvmgr.core.test_impact import get_impact_store
+    >>>
+    >>> store = get_impact_store(Path.cwd())
+    >>> selection = store.select(Path("tests"))
+    >>> selection.args            # pass to pytest
+    >>> store.record(report["tests"], selection.dep_hashes)
+
+See Also
+--------
+- :mod:`uvmgr.core.code_index` : Persistent symbol index
+- :mod:`uvmgr.runtime.tests` : pytest execution
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .code_index import ProjectIndex, find_project_root, get_project_index
+from .telemetry import metric_counter, span
+
+__all__ = [
+    "CONFIG_FILES",
+    "ImpactSelection",
+    "TIMING_WEIGHT",
+    "TestImpactStore",
+    "get_impact_store",
+    "node_duration",
+]
+
+CONFIG_FILES = (
+    "pyproject.toml", "setup.cfg", "setup.py", "pytest.ini", "tox.ini",
+    "uv.lock", "poetry.lock", "requirements.txt", "requirements-dev.txt",
+)
+"""Project files whose change invalidates every test file."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    nodeid   TEXT PRIMARY KEY,
+    file     TEXT NOT NULL,
+    dep_hash TEXT NOT NULL,
+    outcome  TEXT NOT NULL,
+    duration REAL NOT NULL,
+    updated  REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_file ON results(file);
+CREATE TABLE IF NOT EXISTS timings (
+    nodeid   TEXT PRIMARY KEY,
+    duration REAL NOT NULL,
+    runs     INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+TIMING_WEIGHT = 0.5
+"""Weight of the newest run in the smoothed per-node duration."""
+
+_TEST_PATTERNS = ("test_*.py", "*_test.py")
+
+
+@dataclass(frozen=True, slots=True)
+class ImpactSelection:
+    """Tests chosen by :meth:`TestImpactStore.select`."""
+
+    args: list[str]
+    """pytest positional arguments (files and node IDs), slowest first."""
+    affected: list[str] = field(default_factory=list)
+    """Test files whose dependency hash changed; run in full."""
+    rerun: list[str] = field(default_factory=list)
+    """Node IDs from unaffected files that did not pass last time."""
+    skipped: int = 0
+    """Test files left out entirely."""
+    dep_hashes: dict[str, str] = field(default_factory=dict)
+    """Dependency hash of every considered test file, for :meth:`TestImpactStore.record`."""
+
+
+def node_duration(test: dict[str, Any]) -> float:
+    """Setup + call + teardown seconds of one ``pytest-json-report`` test entry."""
+    return sum((test.get(phase) or {}).get("duration", 0.0) for phase in ("setup", "call", "teardown"))
+
+
+def _module_names(rel: str) -> list[str]:
+    """Importable dotted names of a root-relative ``.py`` path."""
+    parts = rel[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    if not parts:
+        return []
+    names = [".".join(parts)]
+    if parts[0] in ("src", "lib") and len(parts) > 1:
+        names.append(".".join(parts[1:]))
+    return names
+
+
+class TestImpactStore:
+    """
+    Import graph, dependency hashes and last results for one project's tests.
+
+    Instances are safe to share between threads; use :func:`get_impact_store`
+    to get the process-wide instance for a project.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, root: Path, *, index: ProjectIndex | None = None):
+        self.root = root.resolve()
+        self.index = index or get_project_index(self.root)
+        self.db_path = self.index.index_dir / "tests.db"
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    # -- storage ----------------------------------------------------------- #
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def clear(self) -> None:
+        """Forget every recorded result; the next selection runs everything."""
+        with self._lock:
+            self._db().execute("DELETE FROM results")
+
+    # -- import graph ------------------------------------------------------ #
+
+    def _graph(self) -> tuple[dict[str, str], dict[str, set[str]]]:
+        """``(hash by file, direct project imports by file)`` for the whole index."""
+        hashes = {f.path.relative_to(self.root).as_posix(): f.hash for f in self.index.files()}
+        modules: dict[str, str] = {}
+        for rel in hashes:
+            for name in _module_names(rel):
+                modules.setdefault(name, rel)
+
+        def resolve(name: str) -> list[str]:
+            # Importing a.b.c also runs a/__init__.py and a/b/__init__.py
+            parts = name.split(".")
+            return [
+                modules[prefix] for i in range(1, len(parts) + 1)
+                if (prefix := ".".join(parts[:i])) in modules
+            ]
+
+        edges: dict[str, set[str]] = {rel: set() for rel in hashes}
+        for sym in self.index.symbols(kind=("import", "import_from")):
+            rel = sym.path.relative_to(self.root).as_posix()
+            targets = edges.setdefault(rel, set())
+            if sym.kind == "import":
+                targets.update(resolve(sym.name))
+                continue
+            base = sym.name
+            if level := sym.detail.get("level", 0):
+                names = _module_names(rel)
+                package = names[-1].split(".") if names else []
+                if not rel.endswith("__init__.py"):
+                    package = package[:-1]
+                package = package[: len(package) - level + 1]
+                base = ".".join(filter(None, [*package, sym.name]))
+            targets.update(resolve(base))
+            for imported in sym.detail.get("names", ()):
+                # ``from pkg import mod`` imports a submodule when one exists
+                if f"{base}.{imported}" in modules:
+                    targets.add(modules[f"{base}.{imported}"])
+        return hashes, edges
+
+    def _conftests(self, rel: str, hashes: dict[str, str]) -> list[str]:
+        parts = rel.split("/")[:-1]
+        return [
+            conftest for i in range(len(parts) + 1)
+            if (conftest := "/".join([*parts[:i], "conftest.py"])) in hashes
+        ]
+
+    def dependency_hashes(self, path: Path | None = None) -> dict[str, str]:
+        """
+        Dependency hash of every test file under *path* (default: the project).
+
+        The index is refreshed first, so hashes always reflect the tree on disk.
+        """
+        with span("test_impact.dependency_hashes"):
+            self.index.refresh()
+            hashes, edges = self._graph()
+
+            config = hashlib.sha1()
+            for name in CONFIG_FILES:
+                candidate = self.root / name
+                if candidate.is_file():
+                    config.update(name.encode() + b"\0" + candidate.read_bytes())
+            config_digest = config.hexdigest()
+
+            scope = [
+                f for pattern in _TEST_PATTERNS for f in self.index.files(path or self.root, pattern=pattern)
+            ]
+            result: dict[str, str] = {}
+            for record in scope:
+                rel = record.path.relative_to(self.root).as_posix()
+                seen: set[str] = set()
+                stack = [rel, *self._conftests(rel, hashes)]
+                while stack:
+                    current = stack.pop()
+                    if current in seen:
+                        continue
+                    seen.add(current)
+                    stack.extend(edges.get(current, ()))
+                digest = hashlib.sha1(config_digest.encode())
+                for dep in sorted(seen):
+                    digest.update(f"{dep}:{hashes.get(dep, '')}\n".encode())
+                result[rel] = digest.hexdigest()
+            return result
+
+    # -- selection --------------------------------------------------------- #
+
+    def select(self, path: Path | None = None) -> ImpactSelection:
+        """
+        Choose the tests to run under *path*.
+
+        Affected files run in full; from the rest only nodes whose last outcome
+        was not ``passed``/``skipped`` run. Both are ordered slowest-first.
+        """
+        with span("test_impact.select") as current_span:
+            dep_hashes = self.dependency_hashes(path)
+            with self._lock:
+                rows = self._db().execute(
+                    "SELECT nodeid, file, dep_hash, outcome, duration FROM results"
+                ).fetchall()
+
+            recorded: dict[str, set[str]] = {}
+            file_duration: dict[str, float] = {}
+            failing: list[tuple[float, str]] = []
+            for nodeid, rel, dep_hash, outcome, duration in rows:
+                recorded.setdefault(rel, set()).add(dep_hash)
+                file_duration[rel] = file_duration.get(rel, 0.0) + duration
+                if rel in dep_hashes and outcome not in ("passed", "skipped"):
+                    failing.append((duration, nodeid))
+
+            affected = [
+                rel for rel, dep_hash in dep_hashes.items() if recorded.get(rel) != {dep_hash}
+            ]
+            # Unknown files have no timing; run them first so they are measured early
+            affected.sort(key=lambda rel: -file_duration.get(rel, float("inf")))
+            affected_set = set(affected)
+            rerun = [
+                nodeid for _, nodeid in sorted(failing, reverse=True)
+                if nodeid.split("::", 1)[0] not in affected_set
+            ]
+
+            selection = ImpactSelection(
+                args=affected + rerun,
+                affected=affected,
+                rerun=rerun,
+                skipped=len(dep_hashes) - len(affected) - len({n.split("::", 1)[0] for n in rerun}),
+                dep_hashes=dep_hashes,
+            )
+            current_span.set_attribute("test_impact.affected_files", len(affected))
+            current_span.set_attribute("test_impact.rerun_nodes", len(rerun))
+            current_span.set_attribute("test_impact.skipped_files", selection.skipped)
+            metric_counter("test_impact.skipped_files")(selection.skipped)
+            return selection
+
+    def record(
+        self, tests: Iterable[dict[str, Any]], dep_hashes: dict[str, str], *, complete: bool = True
+    ) -> int:
+        """
+        Store the outcome of each test node from a pytest JSON report.
+
+        *tests* are the ``tests`` entries of a ``pytest-json-report`` document
+        (``nodeid``, ``outcome`` and ``setup``/``call``/``teardown`` durations).
+        Pass ``complete=False`` when the run may have stopped early (``-x``):
+        files with a failure are then left affected, so their unreached nodes
+        are not mistaken for passing ones. Returns the number of nodes stored.
+        """
+        now = time.time()
+        rows = []
+        for test in tests:
+            nodeid = test.get("nodeid", "")
+            rel = nodeid.split("::", 1)[0]
+            if rel not in dep_hashes:
+                continue
+            rows.append([nodeid, rel, dep_hashes[rel], test.get("outcome", "failed"), node_duration(test), now])
+        if not complete:
+            broken = {row[1] for row in rows if row[3] not in ("passed", "skipped")}
+            for row in rows:
+                if row[1] in broken:
+                    row[2] = ""
+
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN")
+            # Nodes of a fully re-run file that were not reported again were
+            # deleted or renamed; they are the rows still carrying an old hash
+            db.executemany(
+                "DELETE FROM results WHERE file = ? AND dep_hash != ?",
+                {(row[1], row[2]) for row in rows},
+            )
+            db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._update_timings(db, [(row[0], row[4]) for row in rows if row[3] != "skipped"])
+            db.execute("COMMIT")
+        return len(rows)
+
+    # -- timings ----------------------------------------------------------- #
+
+    @staticmethod
+    def _update_timings(db: sqlite3.Connection, samples: list[tuple[str, float]]) -> None:
+        db.executemany(
+            "INSERT INTO timings VALUES (?, ?, 1) ON CONFLICT(nodeid) DO UPDATE SET "
+            "duration = duration * ? + excluded.duration * ?, runs = runs + 1",
+            [(nodeid, duration, 1 - TIMING_WEIGHT, TIMING_WEIGHT) for nodeid, duration in samples],
+        )
+
+    def record_timings(self, samples: Iterable[tuple[str, float]]) -> int:
+        """
+        Fold ``(nodeid, seconds)`` samples into the timing history without
+        touching impact results. Returns the number of samples stored.
+        """
+        samples = list(samples)
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN")
+            self._update_timings(db, samples)
+            db.execute("COMMIT")
+        return len(samples)
+
+    def durations(self) -> dict[str, float]:
+        """Smoothed duration in seconds of every node with timing history."""
+        with self._lock:
+            return dict(self._db().execute("SELECT nodeid, duration FROM timings").fetchall())
+
+
+_STORES: dict[Path, TestImpactStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_impact_store(path: Path | None = None) -> TestImpactStore:
+    """Process-wide :class:`TestImpactStore` for the project containing *path*."""
+    root = find_project_root(path or Path.cwd())
+    with _STORES_LOCK:
+        store = _STORES.get(root)
+        if store is None:
+            store = _STORES[root] = TestImpactStore(root)
+        return store
@@ -0,0 +1,212 @@
+"""
+uvmgr.core.test_sharding - Duration-Aware Test Scheduling
+=========================================================
+
+Splits a test suite into shards of equal expected wall time and orders tests
+slowest-first for xdist, using the per-node timing history kept by
+:class:`uvmgr.core.test_impact.TestImpactStore`.
+
+Partitioning uses the longest-processing-time (LPT) rule: nodes are sorted by
+expected duration, longest first, and each goes to the currently lightest
+shard. The result is within 4/3 of the optimal makespan and, unlike splitting
+by file count, one slow file can no longer hold a whole CI matrix hostage.
+Nodes without history are assumed to take the median known duration.
+
+Every shard must compute the same partition, so all inputs are deterministic:
+the node list comes from ``pytest --collect-only`` and ties are broken by node
+ID. On CI the local timing history usually differs between machines; pass the
+same durations file (``{nodeid: seconds}``, the format ``pytest-split`` uses)
+to every shard instead.
+
+Examples
+--------
+    >>> from uvmgr.core.test_sharding import partition
+    >>>
+    >>> partition({"a": 5.0, "b": 3.0, "c": 2.0, "d": 1.0}, 2)
+    [['a', 'd'], ['b', 'c']]
+
+See Also
+--------
+- :mod:`uvmgr.core.test_impact` : Timing history and test-impact selection
+- :class:`uvmgr.core.testing.TestExecutor` : Consumer of these plans
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import statistics
+import subprocess
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = [
+    "DEFAULT_DURATION",
+    "ShardPlan",
+    "collect_node_ids",
+    "compress_node_ids",
+    "estimate_durations",
+    "load_durations",
+    "order_by_duration",
+    "partition",
+    "plan_shard",
+    "save_durations",
+]
+
+DEFAULT_DURATION = 1.0
+"""Seconds assumed for every node when there is no timing history at all."""
+
+
+@dataclass(frozen=True, slots=True)
+class ShardPlan:
+    """The tests one shard runs."""
+
+    index: int
+    shards: int
+    node_ids: list[str]
+    """Node IDs of this shard, slowest first."""
+    args: list[str]
+    """pytest positional arguments covering exactly :attr:`node_ids`."""
+    expected_duration: float
+    """Sum of the expected node durations, in seconds."""
+    loads: list[float]
+    """Expected duration of every shard, for spotting imbalance."""
+
+
+def estimate_durations(node_ids: Iterable[str], history: dict[str, float]) -> dict[str, float]:
+    """Expected seconds per node: its history, else the median known duration."""
+    known = [history[n] for n in node_ids if n in history] if history else []
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {n: history.get(n, fallback) for n in node_ids}
+
+
+def partition(durations: dict[str, float], shards: int) -> list[list[str]]:
+    """
+    Split nodes into *shards* lists of roughly equal total duration (LPT).
+
+    Each list is ordered slowest-first. The assignment depends only on
+    *durations*, with ties broken by node ID.
+    """
+    if shards < 1:
+        raise ValueError(f"shards must be at least 1, got {shards}")
+    bins: list[list[str]] = [[] for _ in range(shards)]
+    heap = [(0.0, i) for i in range(shards)]
+    for node in sorted(durations, key=lambda n: (-durations[n], n)):
+        load, i = heapq.heappop(heap)
+        bins[i].append(node)
+        heapq.heappush(heap, (load + durations[node], i))
+    return bins
+
+
+def order_by_duration(node_ids: Sequence[str], durations: dict[str, float]) -> list[str]:
+    """
+    Test files in *node_ids*, slowest file first.
+
+    Ordering at file granularity keeps the command line short while still
+    handing the longest files to xdist workers first.
+    """
+    totals: dict[str, float] = {}
+    for node in node_ids:
+        path = node.split("::", 1)[0]
+        totals[path] = totals.get(path, 0.0) + durations.get(node, 0.0)
+    return sorted(totals, key=lambda path: (-totals[path], path))
+
+
+def compress_node_ids(selected: Sequence[str], collected: Sequence[str]) -> list[str]:
+    """
+    pytest arguments selecting exactly *selected* out of *collected*.
+
+    A file whose every collected node is selected is passed as the file path
+    instead of node by node. Order follows the first appearance in *selected*.
+    """
+    per_file: dict[str, int] = {}
+    for node in collected:
+        path = node.split("::", 1)[0]
+        per_file[path] = per_file.get(path, 0) + 1
+    chosen: dict[str, list[str]] = {}
+    for node in selected:
+        chosen.setdefault(node.split("::", 1)[0], []).append(node)
+
+    args: list[str] = []
+    for path, nodes in chosen.items():
+        args.extend([path] if len(nodes) == per_file.get(path) else nodes)
+    return args
+
+
+def collect_node_ids(
+    paths: Sequence[str],
+    *,
+    markers: Sequence[str] = (),
+    cwd: Path | None = None,
+    python: str = "python",
+) -> list[str]:
+    """
+    Node IDs pytest collects for *paths*, in collection order.
+
+    The project's ``addopts`` are cleared so options such as ``--verbosity``
+    (which turns the node list into a tree) cannot change the output format.
+
+    Raises
+    ------
+    RuntimeError
+        If collection fails (import or syntax errors in test files, unknown
+        options), or collects nothing although *paths* were given.
+    """
+    cmd = [python, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", *paths]
+    for marker in markers:
+        cmd.extend(["-m", marker])
+    proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"pytest collection failed (exit code {proc.returncode}):\n"
+            f"{proc.stdout[-2000:]}{proc.stderr[-2000:]}"
+        )
+    node_ids = [line.strip() for line in proc.stdout.splitlines() if "::" in line]
+    if paths and not node_ids:
+        raise RuntimeError(f"pytest collected no node IDs for {' '.join(paths)}:\n{proc.stdout[-2000:]}")
+    return node_ids
+
+
+def plan_shard(
+    node_ids: Sequence[str],
+    history: dict[str, float],
+    shards: int,
+    index: int,
+) -> ShardPlan:
+    """
+    The slice of *node_ids* that shard *index* (0-based) of *shards* runs.
+
+    Raises
+    ------
+    ValueError
+        If *index* is not in ``range(shards)``.
+    """
+    if not 0 <= index < shards:
+        raise ValueError(f"shard index must be in [0, {shards}), got {index}")
+    durations = estimate_durations(node_ids, history)
+    bins = partition(durations, shards)
+    mine = bins[index]
+    return ShardPlan(
+        index=index,
+        shards=shards,
+        node_ids=mine,
+        args=compress_node_ids(mine, node_ids),
+        expected_duration=sum(durations[n] for n in mine),
+        loads=[sum(durations[n] for n in b) for b in bins],
+    )
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    """Read a ``{nodeid: seconds}`` durations file (empty if missing)."""
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    return {str(node): float(seconds) for node, seconds in data.items()}
+
+
+def save_durations(path: Path, durations: dict[str, float]) -> None:
+    """Write a ``{nodeid: seconds}`` durations file, sorted for stable diffs."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({n: round(d, 4) for n, d in sorted(durations.items())}, indent=1) + "\n")
@@ -33,6 +33,16 @@ import re
 
 from uvmgr.core.semconv import TestAttributes, TestCoverageAttributes, CliAttributes
 from uvmgr.core.agi_reasoning import observe_with_agi_reasoning
+from uvmgr.core.test_impact import get_impact_store, node_duration
+from uvmgr.core.test_sharding import (
+    ShardPlan,
+    collect_node_ids,
+    estimate_durations,
+    load_durations,
+    order_by_duration,
+    plan_shard,
+    save_durations,
+)
 from uvmgr.core.workspace import get_workspace_config
 
 logger = logging.getLogger(__name__)
@@ -278,6 +288,7 @@ class TestExecutor:
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.discovery = TestDiscovery(project_root)
+        self.shard_plan: Optional[ShardPlan] = None
     
     async def run_tests(
         self,
@@ -286,15 +297,52 @@ class TestExecutor:
         coverage: bool = True,
         fail_fast: bool = False,
         verbose: bool = False,
-        markers: List[str] = None
+        markers: List[str] = None,
+        shards: int = 1,
+        shard_index: int = 0,
+        dist: str = "load",
+        durations_file: Optional[Path] = None
     ) -> TestSuite:
-        """Run tests with advanced execution options."""
+        """
+        Run tests with advanced execution options.
+        
+        With ``shards > 1`` only the tests of shard ``shard_index`` run, chosen
+        so every shard takes about the same time; ``dist="timing"`` hands the
+        slowest test files to xdist workers first. Both use the recorded
+        per-test durations, or *durations_file* when given (use the same file
+        on every CI node so all shards agree on the partition).
+        """
         
         start_time = time.time()
         test_types = test_types or [TestType.UNIT, TestType.INTEGRATION]
-        
-        # Discover tests
-        discovered = self.discovery.discover_tests()
+        store = get_impact_store(self.project_root)
+        history = load_durations(durations_file) if durations_file else store.durations()
+        
+        # Replace the test paths with an explicit, duration-aware selection
+        targets = None
+        self.shard_plan = None
+        if shards > 1 or dist == "timing":
+            node_ids = await asyncio.to_thread(
+                collect_node_ids,
+                self._test_paths(test_types),
+                markers=markers or (),
+                cwd=self.project_root,
+            )
+            if shards > 1:
+                self.shard_plan = plan_shard(node_ids, history, shards, shard_index)
+                targets = self.shard_plan.args
+                if not targets:
+                    # More shards than tests: running no paths would run everything
+                    end_time = time.time()
+                    return TestSuite(
+                        name=f"shard_{shard_index}_of_{shards}",
+                        test_type=TestType.UNIT,
+                        total_tests=0, passed=0, failed=0, skipped=0, errors=0,
+                        start_time=start_time, end_time=end_time,
+                        total_duration=end_time - start_time,
+                    )
+            else:
+                targets = order_by_duration(node_ids, estimate_durations(node_ids, history))
         
         # Build pytest command
         cmd = self._build_pytest_command(
@@ -303,7 +351,8 @@ class TestExecutor:
             coverage=coverage,
             fail_fast=fail_fast,
             verbose=verbose,
-            markers=markers
+            markers=markers,
+            targets=targets
         )
         
         # Execute tests
@@ -317,6 +366,15 @@ class TestExecutor:
             coverage=coverage
         )
         
+        # Feed durations back into scheduling
+        samples = [
+            (test.name, test.duration) for test in test_suite.test_results
+            if test.status is not TestStatus.SKIPPED
+        ]
+        store.record_timings(samples)
+        if durations_file:
+            save_durations(durations_file, {**history, **dict(samples)})
+        
         # Observe execution
         observe_with_agi_reasoning(
             attributes={
@@ -345,20 +403,15 @@ class TestExecutor:
         coverage: bool,
         fail_fast: bool,
         verbose: bool,
-        markers: List[str] = None
+        markers: List[str] = None,
+        targets: Optional[List[str]] = None
     ) -> List[str]:
-        """Build optimized pytest command."""
+        """Build optimized pytest command; *targets* replace the per-type test paths."""
         
         cmd = ["python", "-m", "pytest"]
         
         # Add test paths
-        for test_type in test_types:
-            if test_type == TestType.UNIT:
-                cmd.extend(["tests/", "src/"])
-            elif test_type == TestType.INTEGRATION:
-                cmd.append("tests/integration/")
-            elif test_type == TestType.E2E:
-                cmd.append("tests/e2e/")
+        cmd.extend(self._test_paths(test_types) if targets is None else targets)
         
         # Coverage options
         if coverage:
@@ -376,6 +429,9 @@ class TestExecutor:
             cpu_count = os.cpu_count() or 2
             workers = min(cpu_count, 4)  # Limit to 4 workers
             cmd.extend(["-n", str(workers)])
+            if targets is not None:
+                # Hand out tests in the given (slowest-first) order
+                cmd.append("--dist=load")
         
         # Other options
         if fail_fast:
@@ -400,6 +456,18 @@ class TestExecutor:
         
         return cmd
     
+    def _test_paths(self, test_types: List[TestType]) -> List[str]:
+        """pytest path arguments for *test_types*."""
+        paths: List[str] = []
+        for test_type in test_types:
+            if test_type == TestType.UNIT:
+                paths.extend(["tests/", "src/"])
+            elif test_type == TestType.INTEGRATION:
+                paths.append("tests/integration/")
+            elif test_type == TestType.E2E:
+                paths.append("tests/e2e/")
+        return paths
+    
     async def _execute_pytest(self, cmd: List[str]) -> subprocess.CompletedProcess:
         """Execute pytest command asynchronously."""
         
@@ -471,7 +539,7 @@ class TestExecutor:
                     name=test_data.get("nodeid", "unknown"),
                     test_type=TestType.UNIT,  # Default, could be enhanced
                     status=status_map.get(test_data.get("outcome"), TestStatus.ERROR),
-                    duration=test_data.get("duration", 0.0),
+                    duration=node_duration(test_data),
                     file_path=test_data.get("file"),
                     line_number=test_data.get("line"),
                     error_message=test_data.get("message"),
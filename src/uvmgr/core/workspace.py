@@ -11,6 +11,10 @@ This module addresses the critical gap in uvmgr's configuration management by pr
 5. **State persistence**: Workspace state tracking and management
 
 The 80/20 approach: 20% of configuration features that solve 80% of workflow problems.
+
+Config and state are re-read only when their file's ``(mtime, size)``
+changes; the parsed YAML config is additionally kept as a snapshot (see
+:mod:`uvmgr.core.snapshot`) so new processes skip the YAML parse.
 """
 
 from __future__ import annotations
@@ -25,6 +29,12 @@ from datetime import datetime
 
 from uvmgr.core.semconv import ProjectAttributes, CliAttributes
 from uvmgr.core.agi_reasoning import observe_with_agi_reasoning
+from uvmgr.core.snapshot import load_snapshot, save_snapshot, snapshot_key, snapshot_name
+
+
+# libyaml-backed loaders when available (several times faster than pure Python)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 @dataclass
@@ -106,6 +116,9 @@ class WorkspaceManager:
         
         self._config: Optional[WorkspaceConfig] = None
         self._state: Optional[WorkspaceState] = None
+        self._config_key: Optional[tuple] = None  # File stat the loaded config/state match
+        self._state_key: Optional[tuple] = None
+        self._snapshot_name = snapshot_name("workspace", self.workspace_root)
         
     def initialize_workspace(self, project_name: str, project_type: str = "python") -> WorkspaceConfig:
         """Initialize a new uvmgr workspace with unified configuration."""
@@ -195,15 +208,25 @@ class WorkspaceManager:
         
         return config
     
+    def _config_snapshot_key(self) -> tuple:
+        """Key of the config snapshot; this module defines the pickled classes, so it is an input."""
+        return snapshot_key([Path(__file__), self.config_file], env_prefix=None)
+    
     def load_config(self) -> WorkspaceConfig:
         """Load workspace configuration with intelligent defaults."""
-        if self._config:
+        key = self._config_snapshot_key()
+        if self._config and key == self._config_key:
             return self._config
             
         if self.config_file.exists():
+            cached = load_snapshot(self._snapshot_name, key)
+            if cached is not None:
+                self._config, self._config_key = cached, key
+                return self._config
+            
             try:
                 with open(self.config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
+                    config_data = yaml.load(f, Loader=_SafeLoader)
                     
                 # Convert environments
                 environments = {}
@@ -212,6 +235,8 @@ class WorkspaceManager:
                     
                 config_data["environments"] = environments
                 self._config = WorkspaceConfig(**config_data)
+                self._config_key = key
+                save_snapshot(self._snapshot_name, key, self._config)
                 
             except Exception as e:
                 # Fallback to default config
@@ -233,13 +258,16 @@ class WorkspaceManager:
         config_dict["updated_at"] = datetime.now().isoformat()
         
         with open(self.config_file, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(config_dict, f, Dumper=_SafeDumper, default_flow_style=False, indent=2)
+        self._config_key = self._config_snapshot_key()
     
     def load_state(self) -> WorkspaceState:
         """Load workspace runtime state."""
-        if self._state:
+        key = snapshot_key([self.state_file], env_prefix=None)
+        if self._state and key == self._state_key:
             return self._state
             
+        self._state_key = key
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
@@ -259,6 +287,7 @@ class WorkspaceManager:
             
         with open(self.state_file, 'w') as f:
             json.dump(asdict(self._state), f, indent=2)
+        self._state_key = snapshot_key([self.state_file], env_prefix=None)
     
     def get_environment_config(self, env_name: Optional[str] = None) -> EnvironmentConfig:
         """Get configuration for specific environment."""
@@ -5,14 +5,19 @@ This module provides resource handlers for the MCP server that expose
 read-only project information and LLM interaction templates.
 """
 
+import asyncio
 import json
 
 from uvmgr.core import paths
+from uvmgr.core.file_listing import get_file_listing
 
 # Get the MCP instance from _mcp_instance
 from uvmgr.mcp._mcp_instance import mcp
 from uvmgr.ops import deps as deps_ops
 
+STRUCTURE_LIMIT = 100
+"""Entries returned by the ``project://structure`` resource."""
+
 # -----------------------------------------------------------------------------
 # Resources - Read-only project information
 # -----------------------------------------------------------------------------
@@ -51,23 +56,9 @@ async def get_project_info() -> str:
 async def get_project_structure() -> str:
     """Get project directory structure."""
     try:
-        root = paths.project_root()
-        structure = []
-
-        for path in sorted(root.rglob("*")):
-            if any(part.startswith(".") for part in path.parts):
-                continue  # Skip hidden files
-            if any(part in ["__pycache__", "node_modules", ".venv"] for part in path.parts):
-                continue  # Skip common ignored directories
-
-            rel_path = path.relative_to(root)
-            indent = "  " * (len(rel_path.parts) - 1)
-            name = path.name
-            if path.is_dir():
-                name += "/"
-            structure.append(f"{indent}{name}")
-
-        return "\n".join(structure[:100])  # Limit to first 100 entries
+        listing = get_file_listing(paths.project_root(), watch=True)
+        structure = await asyncio.to_thread(listing.tree, limit=STRUCTURE_LIMIT)
+        return "\n".join(structure)
     except Exception as e:
         return f"Error getting project structure: {e}"
 
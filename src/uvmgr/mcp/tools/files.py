@@ -3,14 +3,23 @@ File Operations Tools - Tools for searching and creating files.
 
 This module provides tools for searching through project files and creating
 new files in the project.
+
+File system scans run in a worker thread so a search never blocks other MCP
+requests, and read from a cached, watch-invalidated project file listing.
 """
 
+import asyncio
+
 from fastmcp import Context
 
 from uvmgr.core import paths
+from uvmgr.core.file_listing import get_file_listing, search_text
 from uvmgr.mcp._mcp_instance import mcp
 from uvmgr.mcp.server import OperationResult
 
+SEARCH_LIMIT = 20
+"""Matches returned by ``search_code``; the search stops once it has this many."""
+
 # -----------------------------------------------------------------------------
 # File Operations Tools
 # -----------------------------------------------------------------------------
@@ -34,27 +43,22 @@ async def search_code(
     try:
         await ctx.info(f"Searching for: {pattern}")
 
-        # Use ripgrep if available, otherwise fallback to Python
-        root = paths.project_root()
-        matches = []
-        # Simple Python-based search for now
-        for py_file in root.rglob(file_pattern or "*.py"):
-            if ".venv" in str(py_file):
-                continue
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                for i, line in enumerate(content.splitlines(), 1):
-                    if pattern.lower() in line.lower():
-                        matches.append(f"{py_file}:{i}: {line.strip()}")
-            except:
-                continue
+        listing = get_file_listing(paths.project_root(), watch=True)
+        matches, truncated = await asyncio.to_thread(
+            search_text,
+            listing,
+            pattern,
+            pattern=file_pattern or "*.py",
+            limit=SEARCH_LIMIT,
+        )
 
         return OperationResult(
             success=True,
-            message=f"Found {len(matches)} matches",
+            message=f"Found {len(matches)}{'+' if truncated else ''} matches",
             details={
                 "pattern": pattern,
-                "matches": matches[:20],  # Limit to first 20
+                "matches": [f"{m.path}:{m.line}: {m.text}" for m in matches],
+                "truncated": truncated,
             },
         ).to_string()
 
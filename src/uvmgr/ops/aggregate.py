@@ -6,19 +6,36 @@ Operations layer for command aggregation with 8020 implementation.
 
 This module provides the business logic for aggregating multiple uvmgr commands
 using SpiffWorkflow orchestration and Weaver semantic convention validation.
+
+DAG Executor
+------------
+:func:`execute_command_dag` runs aggregated commands on a bounded thread pool
+instead of stepping one BPMN task at a time: a command is dispatched as soon
+as every command it depends on has succeeded, so independent commands (lint,
+docs builds, OTEL validation, ...) overlap. Commands that are not
+``parallel_safe`` run alone. Dependents of a failed command are skipped. Each
+state change is passed to an ``on_status`` callback as a :class:`CommandStatus`,
+and the result reports the critical path of the run (the longest dependency
+chain by measured duration) against the actual wall time.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import os
+import subprocess
+import sys
 import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 
 from uvmgr.core.instrumentation import add_span_attributes, add_span_event
+from uvmgr.core.process import run_streaming
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram, record_exception
 from uvmgr.runtime.agent.spiff import run_bpmn, validate_bpmn_file
 from uvmgr.ops.weaver import check_registry, generate_code
@@ -51,21 +68,35 @@ class AggregationResult:
     errors: List[str] = field(default_factory=list)
 
 
+@dataclass
+class CommandStatus:
+    """State change of one command during :func:`execute_command_dag`."""
+    command: str
+    state: str  # "started", "succeeded", "failed" or "skipped"
+    duration: float = 0.0
+    exit_code: Optional[int] = None
+    detail: str = ""
+
+
 # 8020 Command Analysis - 20% of commands that provide 80% of value
+# "argv" is the uvmgr invocation the DAG executor runs for the command; it
+# must name a command group mounted in uvmgr.commands and must not make
+# irreversible changes (release only previews the bump)
 CRITICAL_COMMANDS = {
-    "deps": {"critical": True, "dependencies": [], "parallel_safe": True},
-    "test": {"critical": True, "dependencies": ["deps"], "parallel_safe": True},
-    "build": {"critical": True, "dependencies": ["deps", "test"], "parallel_safe": False},
-    "lint": {"critical": False, "dependencies": ["deps"], "parallel_safe": True},
-    "release": {"critical": False, "dependencies": ["build"], "parallel_safe": False},
-    "otel": {"critical": False, "dependencies": [], "parallel_safe": True},
-    "weaver": {"critical": False, "dependencies": [], "parallel_safe": True},
-    "forge": {"critical": False, "dependencies": ["weaver"], "parallel_safe": True},
+    "deps": {"critical": True, "dependencies": [], "parallel_safe": True, "argv": ["deps", "lock"]},
+    "test": {"critical": True, "dependencies": ["deps"], "parallel_safe": True, "argv": ["tests", "run"]},
+    "build": {"critical": True, "dependencies": ["deps", "test"], "parallel_safe": False, "argv": ["build", "dist"]},
+    "lint": {"critical": False, "dependencies": ["deps"], "parallel_safe": True, "argv": ["lint", "check"]},
+    "docs": {"critical": False, "dependencies": ["deps"], "parallel_safe": True, "argv": ["docs", "generate", "--no-ai"]},
+    "release": {"critical": False, "dependencies": ["build"], "parallel_safe": False, "argv": ["release", "bump", "--dry-run"]},
+    "otel": {"critical": False, "dependencies": [], "parallel_safe": True, "argv": ["otel", "validate"]},
+    "weaver": {"critical": False, "dependencies": [], "parallel_safe": True, "argv": ["weaver", "check"]},
+    "forge": {"critical": False, "dependencies": ["weaver"], "parallel_safe": True, "argv": ["forge", "validate"]},
 }
 
 # Mode-specific command sets
 MODE_COMMANDS = {
-    "development": ["deps", "lint", "test", "build"],
+    "development": ["deps", "lint", "docs", "test", "build"],
     "ci_cd": ["deps", "test", "build", "release"],
     "deployment": ["deps", "test", "build", "release"],
     "validation": ["otel", "weaver", "forge"],
@@ -119,7 +150,9 @@ def analyze_command_dependencies(commands: Optional[List[str]] = None) -> Dict[s
             "commands": target_commands,
             "dependencies": dependencies,
             "metrics": metrics,
-            "critical_path": _calculate_critical_path(dependencies),
+            "critical_path": _calculate_critical_path(
+                dependencies, {cmd: m["execution_time"] for cmd, m in metrics.items()}
+            ),
             "parallel_groups": _calculate_parallel_groups(dependencies),
         }
         
@@ -202,16 +235,22 @@ def execute_aggregation_workflow(
     workflow_path: Path,
     parallel: bool = True,
     validate_weaver: bool = True,
-    timeout: int = 300
+    timeout: int = 300,
+    on_status: Optional[Callable[[CommandStatus], None]] = None,
 ) -> AggregationResult:
     """
-    Execute command aggregation workflow using SpiffWorkflow.
+    Execute command aggregation workflow.
+    
+    With *parallel*, a workflow whose tasks are all known aggregation commands
+    runs through :func:`execute_command_dag`; otherwise it is stepped by
+    SpiffWorkflow.
     
     Args:
         workflow_path: Path to BPMN workflow file
         parallel: Enable parallel execution
         validate_weaver: Include Weaver validation
-        timeout: Execution timeout in seconds
+        timeout: Execution timeout in seconds (per command for the DAG executor)
+        on_status: Called with each command state change (DAG executor only)
         
     Returns:
         AggregationResult with execution details
@@ -234,6 +273,8 @@ def execute_aggregation_workflow(
         commands_failed = []
         errors = []
         metrics = {}
+        weaver_validation_passed = False
+        spiff_workflow_used = True
         
         try:
             # Validate workflow file
@@ -257,30 +298,40 @@ def execute_aggregation_workflow(
                     weaver_validation_passed = False
                     errors.append(f"Weaver validation error: {e}")
             
-            # Execute workflow
-            workflow_stats = run_bpmn(workflow_path)
-            
-            # Parse results
-            if workflow_stats["status"] == "completed":
-                # Extract executed commands from workflow data
-                workflow_data = workflow_stats.get("data", {})
-                commands_executed = workflow_data.get("commands_executed", [])
-                commands_successful = workflow_data.get("commands_successful", [])
-                commands_failed = workflow_data.get("commands_failed", [])
-                
-                # Calculate metrics
-                metrics = {
-                    "workflow_duration": workflow_stats.get("duration_seconds", 0),
-                    "steps_executed": workflow_stats.get("steps_executed", 0),
-                    "total_tasks": workflow_stats.get("total_tasks", 0),
-                    "completed_tasks": workflow_stats.get("completed_tasks", 0),
-                    "failed_tasks": workflow_stats.get("failed_tasks", 0),
-                    "parallel_execution": parallel,
-                    "weaver_validation": weaver_validation_passed,
-                }
+            commands = _workflow_commands(workflow_path) if parallel else []
+            if commands:
+                dag_result = execute_command_dag(commands, timeout=timeout, on_status=on_status)
+                commands_executed = dag_result.commands_executed
+                commands_successful = dag_result.commands_successful
+                commands_failed = dag_result.commands_failed
+                errors.extend(dag_result.errors)
+                metrics = {**dag_result.metrics, "weaver_validation": weaver_validation_passed}
+                spiff_workflow_used = False
             else:
-                commands_failed = ["workflow_execution"]
-                errors.append(f"Workflow execution failed: {workflow_stats.get('error', 'Unknown error')}")
+                # Execute workflow
+                workflow_stats = run_bpmn(workflow_path)
+                
+                # Parse results
+                if workflow_stats["status"] == "completed":
+                    # Extract executed commands from workflow data
+                    workflow_data = workflow_stats.get("data", {})
+                    commands_executed = workflow_data.get("commands_executed", [])
+                    commands_successful = workflow_data.get("commands_successful", [])
+                    commands_failed = workflow_data.get("commands_failed", [])
+                    
+                    # Calculate metrics
+                    metrics = {
+                        "workflow_duration": workflow_stats.get("duration_seconds", 0),
+                        "steps_executed": workflow_stats.get("steps_executed", 0),
+                        "total_tasks": workflow_stats.get("total_tasks", 0),
+                        "completed_tasks": workflow_stats.get("completed_tasks", 0),
+                        "failed_tasks": workflow_stats.get("failed_tasks", 0),
+                        "parallel_execution": parallel,
+                        "weaver_validation": weaver_validation_passed,
+                    }
+                else:
+                    commands_failed = ["workflow_execution"]
+                    errors.append(f"Workflow execution failed: {workflow_stats.get('error', 'Unknown error')}")
             
         except Exception as e:
             record_exception(e)
@@ -298,7 +349,7 @@ def execute_aggregation_workflow(
             total_duration=total_duration,
             parallel_execution=parallel,
             weaver_validation_passed=weaver_validation_passed,
-            spiff_workflow_used=True,
+            spiff_workflow_used=spiff_workflow_used,
             metrics=metrics,
             errors=errors,
         )
@@ -318,6 +369,135 @@ def execute_aggregation_workflow(
         return result
 
 
+def execute_command_dag(
+    commands: List[str],
+    *,
+    dependencies: Optional[Dict[str, List[str]]] = None,
+    parallel: bool = True,
+    max_workers: Optional[int] = None,
+    timeout: float = 300,
+    on_status: Optional[Callable[[CommandStatus], None]] = None,
+    runner: Optional[Callable[[str, float], CommandStatus]] = None,
+) -> AggregationResult:
+    """
+    Run *commands* as a dependency DAG on a bounded thread pool.
+    
+    A command is dispatched once all of its dependencies (restricted to
+    *commands*) succeeded; independent commands run concurrently, in the order
+    of :func:`_calculate_parallel_groups`. Commands that are not
+    ``parallel_safe`` run with nothing else in flight. Commands whose upstream
+    failed are skipped.
+    
+    Args:
+        commands: Commands to run
+        dependencies: Dependency edges (default: from :data:`CRITICAL_COMMANDS`)
+        parallel: Run independent commands concurrently
+        max_workers: Worker threads (default: CPU count)
+        timeout: Seconds allowed per command
+        on_status: Called with every :class:`CommandStatus` change, from the
+            calling thread
+        runner: Runs one command and returns its final status (default: the
+            command's ``uvmgr`` invocation in a subprocess)
+        
+    Returns:
+        AggregationResult whose metrics compare the critical path of the run
+        with the actual wall time
+        
+    Raises:
+        ValueError: If the dependencies are circular
+    """
+    if dependencies is None:
+        dependencies = analyze_command_dependencies(commands)["dependencies"]
+    edges = {cmd: [d for d in dependencies.get(cmd, []) if d in commands] for cmd in commands}
+    groups = _calculate_parallel_groups(edges)
+    order = [cmd for group in groups for cmd in group]
+    if len(order) < len(edges):
+        raise ValueError(f"Circular dependencies between: {', '.join(sorted(set(edges) - set(order)))}")
+    
+    exclusive = {cmd for cmd in order if not CRITICAL_COMMANDS.get(cmd, {}).get("parallel_safe", True)}
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(order))) if parallel else 1
+    run_one = runner or _run_uvmgr_command
+    statuses: Dict[str, CommandStatus] = {}
+    
+    def emit(status: CommandStatus) -> None:
+        statuses[status.command] = status
+        add_span_event("aggregate.command." + status.state, {"command": status.command, "duration": status.duration})
+        if on_status is not None:
+            on_status(status)
+    
+    with span("aggregate.execute_dag", commands=",".join(order), workers=workers):
+        pending = list(order)
+        running: Dict[Future, str] = {}
+        start = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aggregate")
+        try:
+            while pending or running:
+                for cmd in list(pending):
+                    upstream = [statuses.get(d) for d in edges[cmd]]
+                    blocked = [d for d, st in zip(edges[cmd], upstream) if st and st.state in ("failed", "skipped")]
+                    if blocked:
+                        pending.remove(cmd)
+                        emit(CommandStatus(cmd, "skipped", detail=f"Upstream failed: {', '.join(blocked)}"))
+                        continue
+                    if not all(st and st.state == "succeeded" for st in upstream):
+                        continue
+                    if len(running) >= workers or exclusive.intersection(running.values()):
+                        break
+                    if cmd in exclusive and running:
+                        break  # drain the pool, then run it alone
+                    pending.remove(cmd)
+                    emit(CommandStatus(cmd, "started"))
+                    running[pool.submit(run_one, cmd, timeout)] = cmd
+                    if cmd in exclusive:
+                        break
+                
+                if not running:
+                    continue  # only skips happened; re-scan for newly blocked commands
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    cmd = running.pop(future)
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        record_exception(e)
+                        status = CommandStatus(cmd, "failed", detail=str(e))
+                    emit(status)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        wall = time.perf_counter() - start
+        critical_path, critical_seconds = _longest_path(edges, {cmd: st.duration for cmd, st in statuses.items()})
+        serial = sum(st.duration for st in statuses.values())
+        ran = [cmd for cmd in order if statuses[cmd].state != "skipped"]
+        
+        add_span_attributes(**{
+            "aggregate.wall_seconds": wall,
+            "aggregate.critical_path_seconds": critical_seconds,
+        })
+        metric_histogram("aggregate.dag.duration")(wall)
+    
+    return AggregationResult(
+        workflow_name="command_dag",
+        commands_executed=ran,
+        commands_successful=[cmd for cmd in ran if statuses[cmd].state == "succeeded"],
+        commands_failed=[cmd for cmd in ran if statuses[cmd].state == "failed"],
+        total_duration=wall,
+        parallel_execution=workers > 1,
+        weaver_validation_passed=True,
+        spiff_workflow_used=False,
+        metrics={
+            "parallel_groups": " | ".join(", ".join(group) for group in groups),
+            "workers": workers,
+            "critical_path": " → ".join(critical_path),
+            "critical_path_seconds": critical_seconds,
+            "wall_seconds": wall,
+            "serial_seconds": serial,
+            "parallel_speedup": serial / wall if wall else 1.0,
+        },
+        errors=[f"{cmd}: {statuses[cmd].detail}" for cmd in order if statuses[cmd].detail],
+    )
+
+
 def validate_aggregation_workflow(
     workflow_path: Path,
     weaver_only: bool = False,
@@ -586,27 +766,12 @@ def get_aggregation_metrics(workflow_file: Optional[Path] = None) -> Dict[str, A
         return metrics
 
 
-def _calculate_critical_path(dependencies: Dict[str, List[str]]) -> List[str]:
+def _calculate_critical_path(
+    dependencies: Dict[str, List[str]],
+    durations: Optional[Dict[str, float]] = None,
+) -> List[str]:
     """Calculate critical path through command dependencies."""
-    # Simple topological sort for critical path
-    visited = set()
-    path = []
-    
-    def visit(cmd: str):
-        if cmd in visited:
-            return
-        visited.add(cmd)
-        
-        # Visit dependencies first
-        for dep in dependencies.get(cmd, []):
-            visit(dep)
-        
-        path.append(cmd)
-    
-    # Visit all commands
-    for cmd in dependencies.keys():
-        visit(cmd)
-    
+    path, _ = _longest_path(dependencies, durations or {})
     return path
 
 
@@ -619,7 +784,7 @@ def _calculate_parallel_groups(dependencies: Dict[str, List[str]]) -> List[List[
     while remaining:
         # Find commands with no dependencies on remaining commands
         current_group = []
-        for cmd in list(remaining):
+        for cmd in [c for c in dependencies if c in remaining]:  # keep input order
             cmd_deps = set(dependencies.get(cmd, []))
             if not cmd_deps.intersection(remaining):
                 current_group.append(cmd)
@@ -634,6 +799,82 @@ def _calculate_parallel_groups(dependencies: Dict[str, List[str]]) -> List[List[
     return groups
 
 
+def _workflow_commands(workflow_path: Path) -> List[str]:
+    """
+    Aggregation commands of a generated workflow (``Task_<command>`` tasks).
+    
+    Returns an empty list when the workflow contains any other task, so custom
+    workflows keep running through SpiffWorkflow.
+    """
+    commands = []
+    for element in ET.parse(workflow_path).iter():
+        if not element.tag.endswith(("}task", "}scriptTask", "}serviceTask")):
+            continue
+        task_id = element.get("id", "")
+        if task_id == "Task_weaver_validation":
+            continue  # covered by check_registry() before execution
+        cmd = task_id.removeprefix("Task_")
+        if cmd == task_id or cmd not in CRITICAL_COMMANDS:
+            return []
+        commands.append(cmd)
+    return commands
+
+
+def _run_uvmgr_command(cmd: str, timeout: float) -> CommandStatus:
+    """Run the ``uvmgr`` invocation of *cmd* in a subprocess."""
+    argv = [sys.executable, "-m", "uvmgr", *CRITICAL_COMMANDS.get(cmd, {}).get("argv", [cmd])]
+    start = time.perf_counter()
+    try:
+        result = run_streaming(argv, cwd=Path.cwd(), timeout=timeout, check=False, tail_lines=20)
+    except subprocess.TimeoutExpired:
+        return CommandStatus(cmd, "failed", time.perf_counter() - start, detail=f"Timed out after {timeout:g}s")
+    if result.exit_code == 0:
+        return CommandStatus(cmd, "succeeded", result.duration, 0)
+    return CommandStatus(cmd, "failed", result.duration, result.exit_code, _failure_detail(result.tail))
+
+
+def _failure_detail(tail: List[str]) -> str:
+    """
+    Last informative line of a failed command's output.
+    
+    Usage errors end in a rich error box, so box borders are skipped and the
+    message is taken from inside the box.
+    """
+    for line in reversed(tail):
+        text = line.strip("│╭╮╰╯─ ")
+        if text:
+            return text
+    return ""
+
+
+def _longest_path(
+    dependencies: Dict[str, List[str]],
+    durations: Dict[str, float],
+) -> Tuple[List[str], float]:
+    """
+    Longest dependency chain weighted by *durations* (1.0 when missing).
+    
+    This is the critical path: the best wall time unlimited workers could
+    reach. Commands on a dependency cycle are left out.
+    """
+    edges = {cmd: [d for d in deps if d in dependencies] for cmd, deps in dependencies.items()}
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for group in _calculate_parallel_groups(edges):  # topological
+        for cmd in group:
+            before = max(edges[cmd], key=lambda d: finish[d], default=None)
+            previous[cmd] = before
+            finish[cmd] = durations.get(cmd, 1.0) + (finish[before] if before else 0.0)
+    
+    path: List[str] = []
+    cmd = max(finish, key=lambda c: finish[c], default=None)
+    end = finish[cmd] if cmd else 0.0
+    while cmd is not None:
+        path.append(cmd)
+        cmd = previous[cmd]
+    return path[::-1], end
+
+
 def _generate_8020_bpmn_workflow(
     commands: List[str],
     dependencies: Dict[str, Any],
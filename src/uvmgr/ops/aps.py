@@ -22,7 +22,8 @@ def get_scheduler() -> BackgroundScheduler:
     """Get or create the global scheduler instance."""
     global _scheduler
     if _scheduler is None:
-        _scheduler = BackgroundScheduler()
+        # Collapse missed runs and never start a command while it is still running
+        _scheduler = BackgroundScheduler(job_defaults={"coalesce": True, "max_instances": 1})
     if not _scheduler.running:
         _scheduler.start()
     return _scheduler
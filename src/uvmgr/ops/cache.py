@@ -14,7 +14,7 @@ from uvmgr.runtime.uv import call as uv_call
 @timed
 def dir() -> str:
     with span("cache.dir"):
-        return uv_call("cache dir", capture=True) or ""
+        return uv_call("cache dir", capture=True, cache_ttl=3600) or ""
 
 
 @timed
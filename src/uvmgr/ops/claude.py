@@ -20,14 +20,14 @@ Key Features
 from __future__ import annotations
 
 import json
-import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from uvmgr.core.instrumentation import add_span_attributes, add_span_event, span
 from uvmgr.core.semconv import AIAttributes
 from uvmgr.runtime import ai as ai_runtime
+from uvmgr.runtime import conversation_index
 import re
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -542,15 +542,21 @@ def search_conversations(
     days_back: int = 30,
     project_filter: Optional[str] = None,
     limit: int = 50,
+    offset: int = 0,
 ) -> List[Dict[str, Any]]:
     """
     Search Claude conversations across multiple sources.
     
+    Sources are ingested incrementally into a full-text index (see
+    :mod:`uvmgr.runtime.conversation_index`); results are BM25-ranked, one
+    per session, with a highlighted ``snippet`` of the best match.
+    
     Args:
         query: Search query
         days_back: Number of days to search back
         project_filter: Optional project name filter
         limit: Maximum results
+        offset: Number of results to skip, for paging
         
     Returns:
         List of matching conversation results
@@ -562,31 +568,35 @@ def search_conversations(
             "search.days": days_back,
         })
         
-        results = []
+        indexed = conversation_index.refresh(_conversation_sources())
         cutoff_date = datetime.now() - timedelta(days=days_back)
         
-        # Search SQLite database
-        db_results = _search_sqlite_conversations(query, cutoff_date, project_filter)
-        results.extend(db_results)
-        
-        # Search JSON project histories
-        json_results = _search_json_histories(query, cutoff_date, project_filter)
-        results.extend(json_results)
-        
-        # Search session metadata
-        session_results = _search_session_metadata(query, cutoff_date)
-        results.extend(session_results)
-        
-        # Rank and deduplicate
-        results = _rank_search_results(results, query)
-        results = _deduplicate_results(results)
+        results = conversation_index.search(
+            query, since=cutoff_date, project=project_filter, offset=offset, limit=limit
+        )
         
         add_span_event("conversation_search_completed", {
             "results_found": len(results),
-            "sources_searched": 3,
+            "files_ingested": indexed["ingested"],
         })
         
-        return results[:limit]
+        return results
+
+
+def iter_conversations(
+    query: str,
+    days_back: int = 30,
+    project_filter: Optional[str] = None,
+    page_size: int = 50,
+) -> Iterator[Dict[str, Any]]:
+    """Stream every result of :func:`search_conversations`, one page at a time."""
+    conversation_index.refresh(_conversation_sources())
+    yield from conversation_index.iter_search(
+        query,
+        page_size=page_size,
+        since=datetime.now() - timedelta(days=days_back),
+        project=project_filter,
+    )
 
 
 def get_session(session_id: str) -> Optional[Dict[str, Any]]:
@@ -1039,136 +1049,6 @@ def _determine_experts(focus: Optional[str], num_experts: int) -> List[str]:
     return pool[:num_experts]
 
 
-def _search_sqlite_conversations(
-    query: str, 
-    cutoff_date: datetime,
-    project_filter: Optional[str],
-) -> List[Dict[str, Any]]:
-    """Search SQLite conversation database."""
-    results = []
-    
-    # Common Claude database locations
-    db_paths = [
-        Path.home() / ".claude" / "conversations.db",
-        Path.home() / "Library" / "Application Support" / "Claude" / "conversations.db",
-    ]
-    
-    for db_path in db_paths:
-        if db_path.exists():
-            try:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                
-                sql = """
-                SELECT session_id, timestamp, message, project
-                FROM conversations
-                WHERE message LIKE ? 
-                AND timestamp > ?
-                """
-                
-                params = [f"%{query}%", cutoff_date.isoformat()]
-                
-                if project_filter:
-                    sql += " AND project = ?"
-                    params.append(project_filter)
-                
-                cursor.execute(sql, params)
-                
-                for row in cursor.fetchall():
-                    results.append({
-                        "session_id": row[0],
-                        "date": row[1],
-                        "preview": row[2][:200],
-                        "project": row[3],
-                        "source": "sqlite",
-                    })
-                
-                conn.close()
-            except Exception as e:
-                add_span_event("sqlite_search_error", {"error": str(e)})
-    
-    return results
-
-
-def _search_json_histories(
-    query: str,
-    cutoff_date: datetime,
-    project_filter: Optional[str],
-) -> List[Dict[str, Any]]:
-    """Search JSON conversation histories."""
-    results = []
-    
-    # Search in current project
-    history_dir = Path.cwd() / ".claude" / "history"
-    if history_dir.exists():
-        for json_file in history_dir.glob("*.json"):
-            try:
-                with open(json_file, "r") as f:
-                    data = json.load(f)
-                
-                # Search in messages
-                for msg in data.get("messages", []):
-                    if query.lower() in msg.get("content", "").lower():
-                        timestamp = datetime.fromisoformat(msg.get("timestamp", ""))
-                        if timestamp > cutoff_date:
-                            results.append({
-                                "session_id": data.get("session_id", json_file.stem),
-                                "date": timestamp.strftime("%Y-%m-%d"),
-                                "preview": msg["content"][:200],
-                                "project": Path.cwd().name,
-                                "source": "json",
-                            })
-                            break
-            except Exception as e:
-                add_span_event("json_search_error", {"error": str(e)})
-    
-    return results
-
-
-def _rank_search_results(
-    results: List[Dict[str, Any]], 
-    query: str
-) -> List[Dict[str, Any]]:
-    """Rank search results by relevance."""
-    query_lower = query.lower()
-    
-    for result in results:
-        score = 0
-        preview = result.get("preview", "").lower()
-        
-        # Exact match
-        if query_lower in preview:
-            score += 10
-        
-        # Word matches
-        query_words = query_lower.split()
-        for word in query_words:
-            if word in preview:
-                score += 2
-        
-        # Recent results
-        try:
-            date = datetime.strptime(result["date"], "%Y-%m-%d")
-            days_old = (datetime.now() - date).days
-            if days_old < 7:
-                score += 5
-            elif days_old < 30:
-                score += 2
-        except:
-            pass
-        
-        result["_score"] = score
-    
-    # Sort by score
-    results.sort(key=lambda x: x.get("_score", 0), reverse=True)
-    
-    # Remove score from results
-    for result in results:
-        result.pop("_score", None)
-    
-    return results
-
-
 def _generate_command_content(
     name: str,
     description: str,
@@ -1382,6 +1262,18 @@ def _merge_descriptions(group: List[Dict[str, Any]]) -> str:
     return merged
 
 
+def _conversation_sources() -> List[conversation_index.Source]:
+    """Where Claude keeps conversations: databases, project histories, session metadata."""
+    return [
+        conversation_index.Source("sqlite", Path.home() / ".claude" / "conversations.db"),
+        conversation_index.Source(
+            "sqlite", Path.home() / "Library" / "Application Support" / "Claude" / "conversations.db"
+        ),
+        conversation_index.Source("json", Path.cwd() / ".claude" / "history", project=Path.cwd().name),
+        conversation_index.Source("metadata", Path.home() / ".claude" / "sessions"),
+    ]
+
+
 def _get_session_from_db(session_id: str) -> Optional[Dict[str, Any]]:
     """Get session from SQLite database."""
     # Implementation depends on actual Claude DB structure
@@ -1407,51 +1299,6 @@ def _get_session_from_json(session_id: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _search_session_metadata(
-    query: str, 
-    cutoff_date: datetime
-) -> List[Dict[str, Any]]:
-    """Search session metadata."""
-    results = []
-    
-    # Search in metadata files
-    metadata_dir = Path.home() / ".claude" / "sessions"
-    if metadata_dir.exists():
-        for meta_file in metadata_dir.glob("*.json"):
-            try:
-                with open(meta_file, "r") as f:
-                    metadata = json.load(f)
-                
-                # Check if matches query and date
-                if query.lower() in str(metadata).lower():
-                    date = datetime.fromisoformat(metadata.get("created", ""))
-                    if date > cutoff_date:
-                        results.append({
-                            "session_id": metadata.get("id", meta_file.stem),
-                            "date": date.strftime("%Y-%m-%d"),
-                            "preview": str(metadata)[:200],
-                            "source": "metadata",
-                        })
-            except Exception:
-                continue
-    
-    return results
-
-
-def _deduplicate_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Deduplicate search results by session ID."""
-    seen = set()
-    unique = []
-    
-    for result in results:
-        session_id = result.get("session_id")
-        if session_id not in seen:
-            seen.add(session_id)
-            unique.append(result)
-    
-    return unique
-
-
 def _get_system_commands() -> List[Dict[str, str]]:
     """Get built-in system commands."""
     return [
@@ -18,23 +18,35 @@ Key Features:
 - Real-time cost tracking and alerting
 - Integration with cloud providers and CI/CD systems
 - Comprehensive cost reporting and visualization
+
+Cost entries are stored in an append-only, month-partitioned Parquet ledger
+(:mod:`uvmgr.runtime.cost_ledger`). Period totals, category rollups, trends
+and budget spend are computed with vectorized Arrow scans over only the
+columns and months a query needs, so reports stay fast with millions of
+entries.
 """
 
 from __future__ import annotations
 
-import asyncio
 import json
+import os
 import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
 from uvmgr.core.agi_reasoning import observe_with_agi_reasoning
 from uvmgr.core.agi_memory import get_persistent_memory
 from uvmgr.core.semconv import CliAttributes
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram
+from uvmgr.runtime.cost_ledger import SCHEMA, CostLedger, total, totals_by
 
 
 class CostCategory(Enum):
@@ -131,6 +143,68 @@ class CostReport:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Simple conversion - in practice you'd have more sophisticated conversion rates
+CONVERSION_RATES = {
+    (CostUnit.CPU_HOURS, CostUnit.USD): 0.10,  # $0.10 per CPU hour
+    (CostUnit.GB_HOURS, CostUnit.USD): 0.01,   # $0.01 per GB hour
+    (CostUnit.REQUESTS, CostUnit.USD): 0.0001, # $0.0001 per request
+    (CostUnit.MINUTES, CostUnit.USD): 0.008,   # $0.008 per minute
+}
+
+
+REPORT_COLUMNS = ["category", "description", "amount", "timestamp", "source"]
+"""Ledger columns read for reports."""
+
+
+def _convert_amount(amount: float, from_unit: CostUnit, to_unit: CostUnit) -> float:
+    """Convert between cost units; amounts without a known rate are kept as is."""
+    if from_unit == to_unit:
+        return amount
+    rate = CONVERSION_RATES.get((from_unit, to_unit))
+    return amount * rate if rate else amount
+
+
+def _entry_row(entry: CostEntry) -> Dict[str, Any]:
+    """Ledger row for *entry*."""
+    return {
+        "id": entry.id,
+        "category": entry.category.value,
+        "description": entry.description,
+        "amount": entry.amount,
+        "unit": entry.unit.value,
+        "timestamp": entry.timestamp,
+        "metadata": json.dumps(entry.metadata),
+        "source": entry.source,
+        "project": entry.project,
+        "tags": entry.tags,
+    }
+
+
+def _table_entries(table: pa.Table) -> List[CostEntry]:
+    """Ledger rows back as :class:`CostEntry` objects."""
+    return [
+        CostEntry(
+            id=row["id"],
+            category=CostCategory(row["category"]),
+            description=row["description"],
+            amount=row["amount"],
+            unit=CostUnit(row["unit"]),
+            timestamp=row["timestamp"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            source=row["source"] or "manual",
+            project=row["project"],
+            tags=row["tags"] or [],
+        )
+        for row in table.to_pylist()
+    ]
+
+
+def _as_table(entries: pa.Table | List[CostEntry]) -> pa.Table:
+    if isinstance(entries, pa.Table):
+        return entries
+    return pa.Table.from_pylist([_entry_row(e) for e in entries], schema=SCHEMA)
+
+
 class IntelligentCostAnalyzer:
     """
     Intelligent cost analysis and optimization system.
@@ -141,11 +215,13 @@ class IntelligentCostAnalyzer:
     - Predictive cost modeling and forecasting
     - Budget management and alerting
     - Integration with development workflows
+
+    Entries live in a :class:`~uvmgr.runtime.cost_ledger.CostLedger` under
+    ``.uvmgr/costs``; budgets stay in ``.uvmgr/cost_data.json``.
     """
     
     def __init__(self, project_root: Optional[Path] = None):
         self.project_root = project_root or Path.cwd()
-        self.cost_entries: List[CostEntry] = []
         self.budgets: Dict[str, CostBudget] = {}
         self.optimization_history: List[OptimizationRecommendation] = []
         
@@ -154,6 +230,7 @@ class IntelligentCostAnalyzer:
         self.developer_hourly_rate = 75.0  # Default developer cost per hour
         self.enable_agi_optimization = True
         self.cost_storage_file = self.project_root / ".uvmgr" / "cost_data.json"
+        self.ledger = CostLedger(self.project_root / ".uvmgr" / "costs")
         
         # Cost calculation baselines
         self.cost_baselines = {
@@ -164,31 +241,20 @@ class IntelligentCostAnalyzer:
         }
         
         # Load existing data
-        asyncio.create_task(self._load_cost_data())
+        self._load_cost_data()
     
-    async def _load_cost_data(self):
-        """Load existing cost data from storage."""
+    @property
+    def cost_entries(self) -> List[CostEntry]:
+        """Every ledger entry as an object; analysis methods scan the ledger instead."""
+        return _table_entries(self.ledger.scan())
+    
+    def _load_cost_data(self):
+        """Load budgets, moving entries of the old all-JSON format into the ledger."""
         try:
             if self.cost_storage_file.exists():
                 with open(self.cost_storage_file) as f:
                     data = json.load(f)
                 
-                # Load cost entries
-                for entry_data in data.get("cost_entries", []):
-                    entry = CostEntry(
-                        id=entry_data["id"],
-                        category=CostCategory(entry_data["category"]),
-                        description=entry_data["description"],
-                        amount=entry_data["amount"],
-                        unit=CostUnit(entry_data["unit"]),
-                        timestamp=entry_data["timestamp"],
-                        metadata=entry_data.get("metadata", {}),
-                        source=entry_data.get("source", "manual"),
-                        project=entry_data.get("project"),
-                        tags=entry_data.get("tags", [])
-                    )
-                    self.cost_entries.append(entry)
-                
                 # Load budgets
                 for budget_data in data.get("budgets", []):
                     budget = CostBudget(
@@ -203,53 +269,47 @@ class IntelligentCostAnalyzer:
                         metadata=budget_data.get("metadata", {})
                     )
                     self.budgets[budget.id] = budget
+                
+                legacy_entries = data.get("cost_entries")
+                if legacy_entries:
+                    self.ledger.append(legacy_entries)
+                    self._write_cost_data()
                     
         except Exception as e:
             print(f"⚠️  Error loading cost data: {e}")
     
     async def _save_cost_data(self):
-        """Save cost data to storage."""
+        """Save budgets to storage."""
         try:
-            self.cost_storage_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            data = {
-                "cost_entries": [
-                    {
-                        "id": entry.id,
-                        "category": entry.category.value,
-                        "description": entry.description,
-                        "amount": entry.amount,
-                        "unit": entry.unit.value,
-                        "timestamp": entry.timestamp,
-                        "metadata": entry.metadata,
-                        "source": entry.source,
-                        "project": entry.project,
-                        "tags": entry.tags
-                    }
-                    for entry in self.cost_entries
-                ],
-                "budgets": [
-                    {
-                        "id": budget.id,
-                        "name": budget.name,
-                        "category": budget.category.value if budget.category else None,
-                        "period": budget.period,
-                        "limit": budget.limit,
-                        "unit": budget.unit.value,
-                        "current_spend": budget.current_spend,
-                        "alert_threshold": budget.alert_threshold,
-                        "metadata": budget.metadata
-                    }
-                    for budget in self.budgets.values()
-                ]
-            }
-            
-            with open(self.cost_storage_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+            self._write_cost_data()
         except Exception as e:
             print(f"⚠️  Error saving cost data: {e}")
     
+    def _write_cost_data(self):
+        self.cost_storage_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        data = {
+            "budgets": [
+                {
+                    "id": budget.id,
+                    "name": budget.name,
+                    "category": budget.category.value if budget.category else None,
+                    "period": budget.period,
+                    "limit": budget.limit,
+                    "unit": budget.unit.value,
+                    "current_spend": budget.current_spend,
+                    "alert_threshold": budget.alert_threshold,
+                    "metadata": budget.metadata
+                }
+                for budget in self.budgets.values()
+            ]
+        }
+        
+        tmp = self.cost_storage_file.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.cost_storage_file)
+    
     async def track_cost(self, 
                         category: CostCategory,
                         description: str,
@@ -263,7 +323,7 @@ class IntelligentCostAnalyzer:
         
         with span("cost.track_cost", category=category.value, amount=amount):
             
-            entry_id = f"cost_{int(time.time())}_{len(self.cost_entries)}"
+            entry_id = f"cost_{int(time.time())}_{uuid.uuid4().hex[:8]}"
             
             entry = CostEntry(
                 id=entry_id,
@@ -278,13 +338,12 @@ class IntelligentCostAnalyzer:
                 tags=tags or []
             )
             
-            self.cost_entries.append(entry)
+            self.ledger.append([_entry_row(entry)])
             
             # Update budgets
-            await self._update_budget_spend(entry)
-            
-            # Save data
-            await self._save_cost_data()
+            if self.budgets:
+                await self._update_budget_spend(entry)
+                await self._save_cost_data()
             
             # Observe cost tracking
             observe_with_agi_reasoning(
@@ -398,6 +457,7 @@ class IntelligentCostAnalyzer:
             alert_threshold=alert_threshold
         )
         
+        self._refresh_budget_spend(budget, time.time())
         self.budgets[budget_id] = budget
         await self._save_cost_data()
         
@@ -428,20 +488,35 @@ class IntelligentCostAnalyzer:
             
             # Check if entry is within budget period
             period_start = self._get_period_start(budget.period, current_time)
-            if cost_entry.timestamp < period_start:
+            if budget.metadata.get("period_start") != period_start:
+                # New period: recount from the ledger, which already holds the entry
+                self._refresh_budget_spend(budget, current_time)
+            elif cost_entry.timestamp < period_start:
                 continue
-            
-            # Convert cost to budget unit if needed
-            converted_amount = await self._convert_cost_units(
-                cost_entry.amount, cost_entry.unit, budget.unit
-            )
-            
-            budget.current_spend += converted_amount
+            else:
+                # Convert cost to budget unit if needed
+                converted_amount = await self._convert_cost_units(
+                    cost_entry.amount, cost_entry.unit, budget.unit
+                )
+                
+                budget.current_spend += converted_amount
             
             # Check for budget alerts
             if budget.current_spend >= budget.limit * budget.alert_threshold:
                 await self._send_budget_alert(budget, cost_entry)
     
+    def _refresh_budget_spend(self, budget: CostBudget, current_time: float):
+        """Recompute a budget's spend in its current period with one ledger scan."""
+        period_start = self._get_period_start(budget.period, current_time)
+        where = ds.field("category") == budget.category.value if budget.category else None
+        table = self.ledger.scan(start=period_start, columns=["unit", "amount"], where=where)
+        
+        budget.current_spend = sum(
+            _convert_amount(amount, CostUnit(unit), budget.unit)
+            for unit, amount in totals_by(table, "unit").items()
+        )
+        budget.metadata["period_start"] = period_start
+    
     async def _send_budget_alert(self, budget: CostBudget, triggering_entry: CostEntry):
         """Send budget alert."""
         
@@ -495,24 +570,7 @@ class IntelligentCostAnalyzer:
     
     async def _convert_cost_units(self, amount: float, from_unit: CostUnit, to_unit: CostUnit) -> float:
         """Convert between cost units."""
-        
-        if from_unit == to_unit:
-            return amount
-        
-        # Simple conversion - in practice you'd have more sophisticated conversion rates
-        conversion_rates = {
-            (CostUnit.CPU_HOURS, CostUnit.USD): 0.10,  # $0.10 per CPU hour
-            (CostUnit.GB_HOURS, CostUnit.USD): 0.01,   # $0.01 per GB hour
-            (CostUnit.REQUESTS, CostUnit.USD): 0.0001, # $0.0001 per request
-            (CostUnit.MINUTES, CostUnit.USD): 0.008,   # $0.008 per minute
-        }
-        
-        rate = conversion_rates.get((from_unit, to_unit))
-        if rate:
-            return amount * rate
-        
-        # If no conversion available, return original amount
-        return amount
+        return _convert_amount(amount, from_unit, to_unit)
     
     async def generate_cost_report(self, 
                                   period_days: int = 30,
@@ -524,22 +582,19 @@ class IntelligentCostAnalyzer:
             end_time = time.time()
             start_time = end_time - (period_days * 86400)
             
-            # Filter entries for period
-            period_entries = [
-                entry for entry in self.cost_entries
-                if start_time <= entry.timestamp <= end_time
-            ]
+            # One scan of the period, reading only the columns analysis needs
+            period_entries = self.ledger.scan(
+                start=start_time, end=end_time, columns=REPORT_COLUMNS
+            )
             
             # Calculate totals
-            total_cost = sum(entry.amount for entry in period_entries)
+            total_cost = total(period_entries)
             
             # Category breakdown
+            category_costs = totals_by(period_entries, "category")
             category_breakdown = {}
             for category in CostCategory:
-                category_cost = sum(
-                    entry.amount for entry in period_entries
-                    if entry.category == category
-                )
+                category_cost = category_costs.get(category.value, 0.0)
                 if category_cost > 0:
                     category_breakdown[category] = category_cost
             
@@ -549,6 +604,7 @@ class IntelligentCostAnalyzer:
             # Budget status
             budget_status = []
             for budget in self.budgets.values():
+                self._refresh_budget_spend(budget, end_time)
                 status = {
                     "budget_name": budget.name,
                     "current_spend": budget.current_spend,
@@ -578,7 +634,7 @@ class IntelligentCostAnalyzer:
                 insights=insights,
                 metadata={
                     "period_days": period_days,
-                    "entries_analyzed": len(period_entries),
+                    "entries_analyzed": period_entries.num_rows,
                     "generation_time": time.time()
                 }
             )
@@ -589,7 +645,7 @@ class IntelligentCostAnalyzer:
                     CliAttributes.COMMAND: "cost_generate_report",
                     "period_days": str(period_days),
                     "total_cost": str(total_cost),
-                    "entries_analyzed": str(len(period_entries))
+                    "entries_analyzed": str(period_entries.num_rows)
                 },
                 context={"cost_analysis": True, "reporting": True}
             )
@@ -599,22 +655,20 @@ class IntelligentCostAnalyzer:
             
             return report
     
-    async def _analyze_cost_trends(self, entries: List[CostEntry]) -> Dict[str, Any]:
+    async def _analyze_cost_trends(self, entries: pa.Table | List[CostEntry]) -> Dict[str, Any]:
         """Analyze cost trends."""
         
-        if len(entries) < 2:
+        entries = _as_table(entries)
+        if entries.num_rows < 2:
             return {"trend": "insufficient_data"}
         
-        # Sort by timestamp
-        sorted_entries = sorted(entries, key=lambda e: e.timestamp)
+        # Amounts in timestamp order
+        amounts = pc.take(entries["amount"], pc.sort_indices(entries["timestamp"]))
         
         # Split into first and second half for comparison
-        mid_point = len(sorted_entries) // 2
-        first_half = sorted_entries[:mid_point]
-        second_half = sorted_entries[mid_point:]
-        
-        first_half_cost = sum(e.amount for e in first_half)
-        second_half_cost = sum(e.amount for e in second_half)
+        mid_point = len(amounts) // 2
+        first_half_cost = pc.sum(amounts.slice(0, mid_point)).as_py() or 0.0
+        second_half_cost = pc.sum(amounts.slice(mid_point)).as_py() or 0.0
         
         if first_half_cost == 0:
             trend_percentage = 0
@@ -630,23 +684,19 @@ class IntelligentCostAnalyzer:
             "second_half_cost": second_half_cost
         }
     
-    async def _generate_optimization_recommendations(self, entries: List[CostEntry]) -> List[OptimizationRecommendation]:
+    async def _generate_optimization_recommendations(self, entries: pa.Table | List[CostEntry]) -> List[OptimizationRecommendation]:
         """Generate AGI-driven optimization recommendations."""
         
         recommendations = []
         
         # Analyze by category
-        category_costs = {}
-        for entry in entries:
-            category = entry.category
-            if category not in category_costs:
-                category_costs[category] = []
-            category_costs[category].append(entry)
+        entries = _as_table(entries)
+        category_costs = totals_by(entries, "category")
         
         # Check for high CI/CD costs
-        if CostCategory.CI_CD in category_costs:
-            ci_cd_cost = sum(e.amount for e in category_costs[CostCategory.CI_CD])
-            total_cost = sum(e.amount for e in entries)
+        if CostCategory.CI_CD.value in category_costs:
+            ci_cd_cost = category_costs[CostCategory.CI_CD.value]
+            total_cost = total(entries)
             
             if ci_cd_cost > total_cost * 0.3:  # More than 30% of total cost
                 recommendations.append(OptimizationRecommendation(
@@ -668,12 +718,14 @@ class IntelligentCostAnalyzer:
                 ))
         
         # Check for high developer time costs
-        if CostCategory.DEVELOPER_TIME in category_costs:
-            dev_entries = category_costs[CostCategory.DEVELOPER_TIME]
-            manual_tasks = [e for e in dev_entries if "manual" in e.description.lower()]
+        if CostCategory.DEVELOPER_TIME.value in category_costs:
+            dev_entries = entries.filter(pc.equal(entries["category"], CostCategory.DEVELOPER_TIME.value))
+            manual_tasks = dev_entries.filter(
+                pc.match_substring(dev_entries["description"], "manual", ignore_case=True)
+            )
             
-            if len(manual_tasks) > len(dev_entries) * 0.4:  # More than 40% manual tasks
-                manual_cost = sum(e.amount for e in manual_tasks)
+            if manual_tasks.num_rows > dev_entries.num_rows * 0.4:  # More than 40% manual tasks
+                manual_cost = total(manual_tasks)
                 
                 recommendations.append(OptimizationRecommendation(
                     id="automate_manual_tasks",
@@ -696,17 +748,18 @@ class IntelligentCostAnalyzer:
         return recommendations
     
     async def _generate_cost_insights(self, 
-                                    entries: List[CostEntry], 
+                                    entries: pa.Table | List[CostEntry], 
                                     category_breakdown: Dict[CostCategory, float]) -> List[str]:
         """Generate insights about costs."""
         
         insights = []
         
-        if not entries:
+        entries = _as_table(entries)
+        if not entries.num_rows:
             insights.append("No cost data available for analysis")
             return insights
         
-        total_cost = sum(entry.amount for entry in entries)
+        total_cost = total(entries)
         
         # Most expensive category
         if category_breakdown:
@@ -715,13 +768,12 @@ class IntelligentCostAnalyzer:
             insights.append(f"Highest cost category: {top_category[0].value} ({percentage:.1f}% of total)")
         
         # Cost frequency analysis
-        daily_avg = total_cost / max(1, len(set(int(e.timestamp / 86400) for e in entries)))
+        days = pc.count_distinct(pc.floor(pc.divide(entries["timestamp"], 86400))).as_py()
+        daily_avg = total_cost / max(1, days)
         insights.append(f"Average daily cost: ${daily_avg:.2f}")
         
         # Source analysis
-        sources = {}
-        for entry in entries:
-            sources[entry.source] = sources.get(entry.source, 0) + entry.amount
+        sources = totals_by(entries, "source")
         
         if "automated" in sources and "manual" in sources:
             auto_percentage = (sources["automated"] / total_cost) * 100
@@ -739,8 +791,9 @@ class IntelligentCostAnalyzer:
     def get_cost_stats(self) -> Dict[str, Any]:
         """Get comprehensive cost statistics."""
         
-        total_entries = len(self.cost_entries)
-        total_cost = sum(entry.amount for entry in self.cost_entries)
+        entries = self.ledger.scan(columns=["category", "amount", "timestamp"])
+        total_entries = entries.num_rows
+        total_cost = total(entries)
         
         if total_entries == 0:
             return {
@@ -752,15 +805,12 @@ class IntelligentCostAnalyzer:
             }
         
         # Category distribution
-        categories = {}
-        for entry in self.cost_entries:
-            category = entry.category.value
-            categories[category] = categories.get(category, 0) + entry.amount
+        categories = totals_by(entries, "category")
         
         # Recent activity (last 7 days)
         recent_cutoff = time.time() - (7 * 86400)
-        recent_entries = [e for e in self.cost_entries if e.timestamp > recent_cutoff]
-        recent_cost = sum(e.amount for e in recent_entries)
+        recent_entries = entries.filter(pc.greater(entries["timestamp"], recent_cutoff))
+        recent_cost = total(recent_entries)
         
         return {
             "total_entries": total_entries,
@@ -768,7 +818,7 @@ class IntelligentCostAnalyzer:
             "cost_currency": self.default_currency.value,
             "categories": categories,
             "budgets": len(self.budgets),
-            "recent_entries_7d": len(recent_entries),
+            "recent_entries_7d": recent_entries.num_rows,
             "recent_cost_7d": recent_cost,
             "agi_optimization_enabled": self.enable_agi_optimization,
             "developer_hourly_rate": self.developer_hourly_rate
@@ -18,15 +18,30 @@ Key Features:
 - Performance monitoring and adaptation
 - Integration with BPMN workflows and scheduling
 - Comprehensive telemetry and observability
+
+Incremental execution:
+- Tasks may declare ``inputs`` (globs) and ``outputs``. Before such a task
+  runs, its inputs are fingerprinted by content (sha256, cached by file size
+  and mtime); if the fingerprint equals the one from the task's last
+  successful run and its outputs exist, the task is skipped.
+- Fingerprints live in ``.uvmgr/devtasks/state.json`` in the project, so the
+  skip survives across processes.
+- Sequences run as a dependency graph: each task waits for its declared
+  ``dependencies`` and for earlier ``parallel_groups``; everything else runs
+  concurrently, at most ``max_parallel_tasks`` at a time.
 """
 
 from __future__ import annotations
 
 import asyncio
+import fnmatch
+import hashlib
 import json
 import os
 import subprocess
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -34,10 +49,22 @@ from typing import Any, Dict, List, Optional, Tuple, Callable
 
 from uvmgr.core.agi_reasoning import observe_with_agi_reasoning
 from uvmgr.core.agi_memory import get_persistent_memory
+from uvmgr.core.file_listing import FileListing
 from uvmgr.core.semconv import CliAttributes
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram
 from uvmgr.core.shell import run_cmd
 
+# Fingerprint state, relative to the project root
+STATE_FILE = Path(".uvmgr") / "devtasks" / "state.json"
+
+# Default inputs of auto-detected tasks. Patterns without a "/" match file
+# names anywhere in the tree, patterns with one match the project-relative path.
+PYTHON_INPUTS = ["*.py", "*.pyi", "pyproject.toml", "setup.cfg", "*.ini", "ruff.toml", ".ruff.toml", "uv.lock"]
+# Tests also load non-Python package data (templates, BPMN, ...) from src/
+PYTHON_TEST_INPUTS = [*PYTHON_INPUTS, "src/*", "tests/*"]
+PYTHON_BUILD_INPUTS = [*PYTHON_INPUTS, "README*", "LICENSE*", "src/*"]
+RUST_INPUTS = ["*.rs", "Cargo.toml", "Cargo.lock"]
+
 
 class TaskType(Enum):
     """Types of development tasks."""
@@ -91,6 +118,8 @@ class TaskDefinition:
     enabled: bool = True
     conditions: List[str] = field(default_factory=list)  # Conditions for execution
     metadata: Dict[str, Any] = field(default_factory=dict)
+    inputs: List[str] = field(default_factory=list)  # Globs whose content decides if the task must re-run
+    outputs: List[str] = field(default_factory=list)  # Paths (or globs) that must exist for a skip
 
 
 @dataclass
@@ -108,6 +137,8 @@ class TaskExecutionResult:
     error: Optional[str] = None
     performance_metrics: Dict[str, Any] = field(default_factory=dict)
     retry_count: int = 0
+    fingerprint: Optional[str] = None
+    cached: bool = False  # Skipped because inputs matched the last successful run
 
 
 @dataclass
@@ -138,19 +169,27 @@ class IntelligentDevTaskManager:
         self.project_root = project_root or Path.cwd()
         self.task_registry: Dict[str, TaskDefinition] = {}
         self.task_sequences: Dict[str, TaskSequence] = {}
-        self.execution_history: List[TaskExecutionResult] = []
         self.task_handlers: Dict[TaskType, Callable] = {}
         
-        # Performance tracking
-        self.performance_baselines: Dict[str, float] = {}
-        self.optimization_insights: List[str] = []
-        
         # Settings
         self.enable_agi_optimization = True
         self.auto_detect_tasks = True
         self.max_parallel_tasks = 4
         self.max_execution_history = 500
         
+        # Performance tracking
+        self.execution_history: deque[TaskExecutionResult] = deque(maxlen=self.max_execution_history)
+        self.performance_baselines: Dict[str, float] = {}
+        self.optimization_insights: List[str] = []
+        
+        # Incremental execution state
+        self._listing = FileListing(self.project_root)
+        self._state_path = self.project_root / STATE_FILE
+        self._state_lock = threading.Lock()
+        self._fingerprints: Dict[str, Dict[str, Any]] = {}  # task id -> last successful run
+        self._file_digests: Dict[str, List[Any]] = {}  # relative path -> [mtime_ns, size, sha256]
+        self._load_state()
+        
         # Initialize
         self._initialize_task_handlers()
         if self.auto_detect_tasks:
@@ -266,6 +305,7 @@ class IntelligentDevTaskManager:
                     help_text = f"Poetry task: {task_name}"
                 
                 task_type = self._infer_task_type(task_name, cmd)
+                inputs, outputs = self._python_task_io(task_type)
                 
                 tasks.append(TaskDefinition(
                     id=f"poe_{task_name}",
@@ -275,7 +315,9 @@ class IntelligentDevTaskManager:
                     command=f"poe {task_name}",
                     description=help_text,
                     working_dir=self.project_root,
-                    metadata={"source": "pyproject.toml", "tool": "poethepoet"}
+                    metadata={"source": "pyproject.toml", "tool": "poethepoet"},
+                    inputs=inputs,
+                    outputs=outputs
                 ))
             
             # Standard Python tools
@@ -288,6 +330,7 @@ class IntelligentDevTaskManager:
                     command="ruff check .",
                     description="Run Ruff linting",
                     working_dir=self.project_root,
+                    inputs=PYTHON_INPUTS,
                     metadata={"source": "auto_detect", "tool": "ruff"}
                 ))
                 
@@ -313,6 +356,7 @@ class IntelligentDevTaskManager:
                     description="Run Python tests with pytest",
                     working_dir=self.project_root,
                     timeout=600,  # 10 minutes for tests
+                    inputs=PYTHON_TEST_INPUTS,
                     metadata={"source": "auto_detect", "tool": "pytest"}
                 ))
             
@@ -326,6 +370,7 @@ class IntelligentDevTaskManager:
                     command="mypy .",
                     description="Run mypy type checking",
                     working_dir=self.project_root,
+                    inputs=PYTHON_INPUTS,
                     metadata={"source": "auto_detect", "tool": "mypy"}
                 ))
             
@@ -373,6 +418,8 @@ class IntelligentDevTaskManager:
                 command="cargo build",
                 description="Build Rust project",
                 working_dir=self.project_root,
+                inputs=RUST_INPUTS,
+                outputs=["target"],
                 metadata={"source": "auto_detect", "tool": "cargo"}
             ),
             TaskDefinition(
@@ -384,6 +431,7 @@ class IntelligentDevTaskManager:
                 description="Run Rust tests",
                 working_dir=self.project_root,
                 timeout=600,
+                inputs=RUST_INPUTS,
                 metadata={"source": "auto_detect", "tool": "cargo"}
             ),
             TaskDefinition(
@@ -394,6 +442,7 @@ class IntelligentDevTaskManager:
                 command="cargo clippy",
                 description="Run Clippy linting",
                 working_dir=self.project_root,
+                inputs=RUST_INPUTS,
                 metadata={"source": "auto_detect", "tool": "cargo"}
             ),
             TaskDefinition(
@@ -469,6 +518,16 @@ class IntelligentDevTaskManager:
         else:
             return TaskType.CUSTOM
     
+    def _python_task_io(self, task_type: TaskType) -> Tuple[List[str], List[str]]:
+        """Default inputs and outputs of a Python task of *task_type*."""
+        if task_type in (TaskType.LINT, TaskType.TYPECHECK):
+            return PYTHON_INPUTS, []
+        if task_type == TaskType.TEST:
+            return PYTHON_TEST_INPUTS, []
+        if task_type == TaskType.BUILD:
+            return PYTHON_BUILD_INPUTS, ["dist"]
+        return [], []  # Unknown side effects (format, deploy, ...): always run
+    
     def _infer_task_priority(self, task_type: TaskType) -> TaskPriority:
         """Infer task priority from type."""
         priority_map = {
@@ -513,8 +572,13 @@ class IntelligentDevTaskManager:
                 print(f"❌ Failed to register task '{task_def.id}': {e}")
                 return False
     
-    async def execute_task(self, task_id: str) -> TaskExecutionResult:
-        """Execute a single task."""
+    async def execute_task(self, task_id: str, force: bool = False) -> TaskExecutionResult:
+        """
+        Execute a single task.
+        
+        A task with declared ``inputs`` is skipped (``cached=True``) when their
+        fingerprint matches the last successful run, unless *force* is set.
+        """
         
         if task_id not in self.task_registry:
             return TaskExecutionResult(
@@ -541,6 +605,25 @@ class IntelligentDevTaskManager:
                     end_time=time.time()
                 )
             
+            # Skip when the inputs are unchanged since the last successful run
+            fingerprint = None
+            if task_def.inputs:
+                fingerprint = await asyncio.to_thread(self._fingerprint, task_def)
+                if not force and self._is_up_to_date(task_def, fingerprint):
+                    result = TaskExecutionResult(
+                        task_id=task_id,
+                        task_name=task_def.name,
+                        status=TaskStatus.SKIPPED,
+                        start_time=start_time,
+                        end_time=time.time(),
+                        fingerprint=fingerprint,
+                        cached=True
+                    )
+                    self.execution_history.append(result)
+                    metric_counter("devtasks.cache_hits")(1)
+                    return result
+                metric_counter("devtasks.cache_misses")(1)
+            
             # Execute task using appropriate handler
             handler = self.task_handlers.get(task_def.task_type)
             if handler:
@@ -548,8 +631,17 @@ class IntelligentDevTaskManager:
             else:
                 result = await self._execute_command_task(task_def, task_def.task_type)
             
-            # Store execution result
+            # Store execution result; remember the inputs of successful runs
+            result.fingerprint = fingerprint
             self.execution_history.append(result)
+            if fingerprint and result.status == TaskStatus.COMPLETED:
+                with self._state_lock:
+                    self._fingerprints[task_id] = {
+                        "fingerprint": fingerprint,
+                        "completed_at": result.end_time,
+                        "duration": result.duration
+                    }
+                await asyncio.to_thread(self._save_state)
             
             # Observe execution
             observe_with_agi_reasoning(
@@ -631,6 +723,106 @@ class IntelligentDevTaskManager:
         
         return result
     
+    def _matching_files(self, patterns: List[str]) -> List[str]:
+        """Project-relative paths of the files matching any of *patterns*, in tree order."""
+        anchored = [p for p in patterns if "/" in p]
+        names = [p for p in patterns if "/" not in p]
+        state_dir = STATE_FILE.parent.as_posix() + "/"
+        matches = []
+        for rel, is_dir in self._listing.entries():
+            if is_dir or rel.startswith(state_dir):
+                continue
+            name = rel.rsplit("/", 1)[-1]
+            if any(fnmatch.fnmatchcase(name, p) for p in names) or any(fnmatch.fnmatchcase(rel, p) for p in anchored):
+                matches.append(rel)
+        return matches
+    
+    def _file_digest(self, rel: str) -> str:
+        """sha256 of a project file, re-read only when its size or mtime changed."""
+        path = self._listing.root / rel
+        try:
+            st = path.stat()
+        except OSError:
+            return ""
+        with self._state_lock:
+            cached = self._file_digests.get(rel)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        try:
+            with path.open("rb") as fh:
+                digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        except OSError:
+            return ""
+        with self._state_lock:
+            self._file_digests[rel] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+    
+    def _fingerprint(self, task_def: TaskDefinition) -> str:
+        """Hash of the task's command, environment and input file contents."""
+        with span("devtasks.fingerprint", task_id=task_def.id):
+            digest = hashlib.sha256()
+            parts = [
+                task_def.command,
+                str(task_def.working_dir or self.project_root),
+                *sorted(f"{k}={v}" for k, v in task_def.environment.items()),
+                *task_def.inputs
+            ]
+            for part in parts:
+                digest.update(part.encode() + b"\0")
+            files = self._matching_files(task_def.inputs)
+            for rel in files:
+                digest.update(f"{rel}:{self._file_digest(rel)}\n".encode())
+            metric_histogram("devtasks.fingerprint.files")(len(files))
+            return digest.hexdigest()
+    
+    def _is_up_to_date(self, task_def: TaskDefinition, fingerprint: str) -> bool:
+        """Whether the last successful run had *fingerprint* and left its outputs behind."""
+        with self._state_lock:
+            record = self._fingerprints.get(task_def.id)
+        if not record or record.get("fingerprint") != fingerprint:
+            return False
+        for output in task_def.outputs:
+            if any(ch in output for ch in "*?["):
+                if next(self.project_root.glob(output), None) is None:
+                    return False
+            elif not (self.project_root / output).exists():
+                return False
+        return True
+    
+    def _load_state(self):
+        """Load fingerprints of earlier runs."""
+        try:
+            state = json.loads(self._state_path.read_text())
+        except (OSError, ValueError):
+            return
+        self._fingerprints = state.get("tasks", {})
+        self._file_digests = state.get("files", {})
+    
+    def _save_state(self):
+        """Write fingerprints atomically; digests of vanished files are dropped."""
+        with self._state_lock:
+            present = {rel for rel, is_dir in self._listing.entries() if not is_dir}
+            state = {
+                "tasks": dict(self._fingerprints),
+                "files": {rel: d for rel, d in self._file_digests.items() if rel in present}
+            }
+            try:
+                self._state_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._state_path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(state))
+                os.replace(tmp, self._state_path)
+            except OSError as e:
+                print(f"⚠️  Could not save task fingerprints: {e}")
+    
+    def clear_fingerprints(self, task_id: Optional[str] = None):
+        """Forget recorded runs so the task (or every task) runs next time."""
+        with self._state_lock:
+            if task_id is None:
+                self._fingerprints.clear()
+            else:
+                self._fingerprints.pop(task_id, None)
+        self._save_state()
+    
     async def _check_task_conditions(self, task_def: TaskDefinition) -> bool:
         """Check if task conditions are met."""
         for condition in task_def.conditions:
@@ -767,30 +959,97 @@ class IntelligentDevTaskManager:
                 name="Build and Test",
                 description="Build project and run tests",
                 tasks=build_tasks + test_tasks,
+                parallel_groups=[build_tasks, test_tasks],  # Tests start once the build is done
                 metadata={"auto_generated": True}
             )
             self.task_sequences["build_test_sequence"] = build_test_sequence
     
-    async def execute_sequence(self, sequence_id: str) -> List[TaskExecutionResult]:
-        """Execute a task sequence."""
+    def _sequence_dependencies(self, sequence: TaskSequence, task_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Tasks each task of *sequence* waits for.
+        
+        Declared ``dependencies`` inside the sequence always apply. With
+        ``parallel_groups``, each group also waits for all earlier groups;
+        tasks in no group form single-task groups after them.
+        """
+        in_sequence = set(task_ids)
+        waits = {
+            task_id: [d for d in self.task_registry[task_id].dependencies if d in in_sequence and d != task_id]
+            for task_id in task_ids
+        }
+        if sequence.parallel_groups:
+            groups = [[t for t in group if t in in_sequence] for group in sequence.parallel_groups]
+            grouped = {t for group in groups for t in group}
+            groups.extend([t] for t in task_ids if t not in grouped)
+            earlier: List[str] = []
+            for group in groups:
+                for task_id in group:
+                    waits[task_id] = list(dict.fromkeys([*waits[task_id], *earlier]))
+                earlier.extend(group)
+        return waits
+    
+    async def execute_sequence(self, sequence_id: str, force: bool = False) -> List[TaskExecutionResult]:
+        """
+        Execute a task sequence.
+        
+        Independent tasks run concurrently (at most ``max_parallel_tasks``);
+        tasks downstream of a failure are skipped. Results are returned in
+        sequence order.
+        """
         
         if sequence_id not in self.task_sequences:
             return []
         
         sequence = self.task_sequences[sequence_id]
-        results = []
+        task_ids = list(dict.fromkeys(t for t in sequence.tasks if t in self.task_registry))
+        waits = self._sequence_dependencies(sequence, task_ids)
         
         with span("devtasks.execute_sequence", sequence_id=sequence_id):
             
-            # Execute tasks in order
-            for task_id in sequence.tasks:
-                if task_id in self.task_registry:
-                    result = await self.execute_task(task_id)
-                    results.append(result)
-                    
-                    # Stop on failure if not configured to continue
-                    if result.status == TaskStatus.FAILED:
-                        break
+            # Topological order, so every task's prerequisites are scheduled first
+            order: List[str] = []
+            remaining = {t: set(w) for t, w in waits.items()}
+            while ready := [t for t in task_ids if t in remaining and not remaining[t]]:
+                for task_id in ready:
+                    del remaining[task_id]
+                    order.append(task_id)
+                for pending in remaining.values():
+                    pending.difference_update(ready)
+            
+            limit = asyncio.Semaphore(max(1, self.max_parallel_tasks))
+            runs: Dict[str, asyncio.Task] = {}
+            
+            async def run(task_id: str, prerequisites: List[asyncio.Task]) -> TaskExecutionResult:
+                upstream = await asyncio.gather(*prerequisites)
+                blocked = [r.task_id for r in upstream if _blocks_dependents(r)]
+                if blocked:
+                    now = time.time()
+                    return TaskExecutionResult(
+                        task_id=task_id,
+                        task_name=self.task_registry[task_id].name,
+                        status=TaskStatus.SKIPPED,
+                        start_time=now,
+                        end_time=now,
+                        error=f"Skipped: dependency {', '.join(blocked)} did not complete"
+                    )
+                async with limit:
+                    return await self.execute_task(task_id, force=force)
+            
+            for task_id in order:
+                runs[task_id] = asyncio.create_task(run(task_id, [runs[d] for d in waits[task_id]]))
+            
+            finished = dict(zip(runs, await asyncio.gather(*runs.values())))
+            now = time.time()
+            for task_id in remaining:  # Part of a dependency cycle
+                finished[task_id] = TaskExecutionResult(
+                    task_id=task_id,
+                    task_name=self.task_registry[task_id].name,
+                    status=TaskStatus.FAILED,
+                    start_time=now,
+                    end_time=now,
+                    error="Dependency cycle"
+                )
+            results = [finished[task_id] for task_id in task_ids]
             
             # Observe sequence execution
             observe_with_agi_reasoning(
@@ -798,7 +1057,8 @@ class IntelligentDevTaskManager:
                     CliAttributes.COMMAND: "devtasks_execute_sequence",
                     "sequence_id": sequence_id,
                     "tasks_executed": str(len(results)),
-                    "successful": str(sum(1 for r in results if r.status == TaskStatus.COMPLETED))
+                    "successful": str(sum(1 for r in results if r.status == TaskStatus.COMPLETED)),
+                    "cached": str(sum(1 for r in results if r.cached))
                 },
                 context={"devtasks": True, "sequence_execution": True}
             )
@@ -821,6 +1081,7 @@ class IntelligentDevTaskManager:
         
         successful = sum(1 for r in self.execution_history if r.status == TaskStatus.COMPLETED)
         failed = sum(1 for r in self.execution_history if r.status == TaskStatus.FAILED)
+        cached = sum(1 for r in self.execution_history if r.cached)
         
         # Task type distribution
         task_types = {}
@@ -838,6 +1099,7 @@ class IntelligentDevTaskManager:
             "total_executions": total_executions,
             "successful_executions": successful,
             "failed_executions": failed,
+            "cached_executions": cached,
             "success_rate": (successful / total_executions) * 100,
             "average_duration": avg_duration,
             "task_types": task_types,
@@ -847,6 +1109,11 @@ class IntelligentDevTaskManager:
         }
 
 
+def _blocks_dependents(result: TaskExecutionResult) -> bool:
+    """Failed tasks, and tasks skipped because of a failure, hold back their dependents."""
+    return result.status == TaskStatus.FAILED or (result.status == TaskStatus.SKIPPED and bool(result.error))
+
+
 # Global task manager instance
 _dev_task_manager = None
 
@@ -857,15 +1124,15 @@ def get_dev_task_manager(project_root: Optional[Path] = None) -> IntelligentDevT
         _dev_task_manager = IntelligentDevTaskManager(project_root)
     return _dev_task_manager
 
-async def execute_dev_task(task_id: str) -> TaskExecutionResult:
+async def execute_dev_task(task_id: str, force: bool = False) -> TaskExecutionResult:
     """Execute a development task."""
     manager = get_dev_task_manager()
-    return await manager.execute_task(task_id)
+    return await manager.execute_task(task_id, force=force)
 
-async def execute_task_sequence(sequence_id: str) -> List[TaskExecutionResult]:
+async def execute_task_sequence(sequence_id: str, force: bool = False) -> List[TaskExecutionResult]:
     """Execute a task sequence."""
     manager = get_dev_task_manager()
-    return await manager.execute_sequence(sequence_id)
+    return await manager.execute_sequence(sequence_id, force=force)
 
 def get_devtask_status() -> Dict[str, Any]:
     """Get development task system status."""
@@ -198,8 +198,7 @@ def execute_complete_automation(
             criteria=criteria,
             environment=environment,
             auto_fix=auto_fix,
-            parallel=parallel,
-            ai_assist=ai_assist
+            parallel=parallel
         )
         
         # Calculate weighted success rate using 80/20 principles
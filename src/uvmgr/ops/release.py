@@ -5,9 +5,9 @@ from uvmgr.runtime import release as _rt
 
 
 @timed
-def bump() -> dict:
-    _rt.bump()
-    return {"version": "bumped"}
+def bump(dry_run: bool = False) -> dict:
+    _rt.bump(dry_run=dry_run)
+    return {"version": "unchanged (dry run)" if dry_run else "bumped"}
 
 
 @timed
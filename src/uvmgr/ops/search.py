@@ -55,10 +55,10 @@ import sqlite3
 import subprocess
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
 
 # Import search-related libraries
 try:
@@ -73,8 +73,67 @@ try:
 except ImportError:
     EMBEDDINGS_AVAILABLE = False
 
+from uvmgr.core.code_index import (
+    PRUNE_DIRS,
+    ProjectIndex,
+    RefreshStats,
+    Symbol,
+    find_project_root,
+    get_project_index,
+)
 from uvmgr.core.instrumentation import add_span_attributes, add_span_event
 from uvmgr.core.process import run
+from uvmgr.core.telemetry import metric_counter
+
+_UNLOADED = object()  # sentinel: embedding model not loaded yet
+
+
+def _compile_pattern(config: Dict[str, Any]) -> re.Pattern:
+    """Compile the configured search pattern."""
+    flags = 0 if config.get("case_sensitive", False) else re.IGNORECASE
+    if config.get("exact_match", False):
+        return re.compile(re.escape(config["pattern"]), flags)
+    return re.compile(config["pattern"], flags)
+
+
+def _context_lines(lines: List[str], center_line: int, context: int) -> List[str]:
+    """Get context lines around a match."""
+    start = max(0, center_line - context)
+    end = min(len(lines), center_line + context + 1)
+    return lines[start:end]
+
+
+def _text_matches(file_path: Path, content: str, regex: re.Pattern, context: int) -> List[Dict[str, Any]]:
+    """Line-by-line regex matches in *content*."""
+    matches = []
+    lines = content.split('\n')
+    
+    for line_num, line in enumerate(lines, 1):
+        if regex.search(line):
+            matches.append({
+                "type": "text",
+                "line": line_num,
+                "file": str(file_path),
+                "content": line,
+                "context": _context_lines(lines, line_num - 1, context),
+            })
+    
+    return matches
+
+
+def _search_text_files(files: List[Path], options: Dict[str, Any]) -> List[Tuple[Path, List[Dict[str, Any]]]]:
+    """Process-pool worker: text-search a chunk of files."""
+    regex = _compile_pattern(options)
+    context = options.get("context_lines", 3)
+    results = []
+    for file_path in files:
+        try:
+            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            results.append((file_path, []))
+            continue
+        results.append((file_path, _text_matches(file_path, content, regex, context)))
+    return results
 
 
 class SearchCache:
@@ -84,12 +143,16 @@ class SearchCache:
         self.cache_dir = cache_dir or Path.home() / ".uvmgr" / "search_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.cache_dir / "search_cache.db"
+        # One connection per cache instance instead of one per get/set call
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
         self._init_db()
     
     def _init_db(self):
         """Initialize the cache database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        with self._lock:
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
                     key TEXT PRIMARY KEY,
                     value TEXT,
@@ -99,7 +162,7 @@ class SearchCache:
                 )
             """)
             
-            conn.execute("""
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS file_indexes (
                     file_path TEXT PRIMARY KEY,
                     file_hash TEXT,
@@ -111,43 +174,29 @@ class SearchCache:
     
     def get(self, key: str, file_path: Path = None) -> Optional[Any]:
         """Get cached value, checking file modification if provided."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        current_hash = self._file_hash(file_path) if file_path and file_path.exists() else None
+        
+        with self._lock:
+            result = self._conn.execute(
+                "SELECT value, file_hash FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
             
-            if file_path and file_path.exists():
-                # Check if file has been modified
-                current_hash = self._file_hash(file_path)
-                cursor.execute(
-                    "SELECT value, file_hash FROM cache_entries WHERE key = ?",
-                    (key,)
-                )
-                result = cursor.fetchone()
-                
-                if result and result[1] == current_hash:
-                    # Update access time
-                    cursor.execute(
-                        "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
-                        (datetime.now(), key)
-                    )
-                    return json.loads(result[0])
+            if result is None or (current_hash is not None and result[1] != current_hash):
                 return None
-            else:
-                cursor.execute("SELECT value FROM cache_entries WHERE key = ?", (key,))
-                result = cursor.fetchone()
-                if result:
-                    cursor.execute(
-                        "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
-                        (datetime.now(), key)
-                    )
-                    return json.loads(result[0])
-        return None
+            
+            # Update access time
+            self._conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                (datetime.now(), key)
+            )
+        return json.loads(result[0])
     
     def set(self, key: str, value: Any, file_path: Path = None):
         """Set cached value with optional file tracking."""
         file_hash = self._file_hash(file_path) if file_path and file_path.exists() else None
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        with self._lock:
+            self._conn.execute("""
                 INSERT OR REPLACE INTO cache_entries 
                 (key, value, created_at, accessed_at, file_hash)
                 VALUES (?, ?, ?, ?, ?)
@@ -164,51 +213,67 @@ class SearchCache:
     def cleanup(self, max_age_days: int = 30):
         """Clean up old cache entries."""
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 "DELETE FROM cache_entries WHERE accessed_at < ?",
                 (cutoff_date,)
             )
 
 
 class CodeSearchEngine:
-    """AST-based Python code search engine."""
+    """
+    AST-based Python code search engine backed by the project symbol index.
+    
+    Parsing is shared and pattern-independent: Python files are parsed once into
+    the :mod:`uvmgr.core.code_index` index (in a process pool on cold builds) and
+    every query afterwards is a symbol lookup. Non-Python files are text-searched
+    in chunks on a process pool. Results stream per file and scanning stops as
+    soon as ``max_results`` matches have been collected.
+    """
+    
+    # Index symbol kinds matched for each ``search_type``
+    SEARCH_KINDS = {
+        "all": ("function", "class", "variable", "import", "import_from"),
+        "function": ("function",),
+        "class": ("class",),
+        "variable": ("variable",),
+        "import": ("import", "import_from"),
+        "decorator": ("decorator",),
+    }
     
-    def __init__(self, cache: SearchCache = None):
+    # Below this many text files a process pool costs more than it saves
+    PROCESS_POOL_THRESHOLD = 32
+    CHUNK_SIZE = 64
+    
+    def __init__(self, cache: SearchCache = None, index: ProjectIndex = None):
         self.cache = cache or SearchCache()
+        self.index = index
         self.ast_patterns = {}
     
     def search(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute code search with AST parsing."""
+        """Execute code search against the incrementally refreshed symbol index."""
         add_span_event("code_search.started", {"pattern": config["pattern"]})
         
         start_time = time.time()
         matches = []
         files_scanned = 0
+        max_results = config.get("max_results", 100)
         
-        search_path = config["path"]
-        file_pattern = config["files"]
+        files_to_search, refresh = self._prepare(config)
         
-        # Find files to search
-        files_to_search = self._find_files(search_path, file_pattern, config.get("exclude_dirs", []))
-        
-        # Use parallel processing if enabled
-        if config.get("parallel", True):
-            matches = self._parallel_search(files_to_search, config)
-        else:
-            for file_path in files_to_search:
-                file_matches = self._search_file(file_path, config)
-                matches.extend(file_matches)
-                files_scanned += 1
+        for _, file_matches in self._scan(files_to_search, config):
+            files_scanned += 1
+            matches.extend(self._filter_matches(file_matches, config))
+            if len(matches) >= max_results:
+                break  # stop early; remaining files are never read
         
         execution_time = time.time() - start_time
-        
-        # Filter and limit results
-        matches = self._filter_matches(matches, config)
-        matches = matches[:config.get("max_results", 100)]
+        matches = matches[:max_results]
         
         add_span_attributes(**{
             "search.files_scanned": files_scanned,
+            "search.files_total": len(files_to_search),
+            "search.files_reparsed": refresh.parsed,
             "search.matches_found": len(matches),
             "search.execution_time": execution_time,
         })
@@ -220,16 +285,45 @@ class CodeSearchEngine:
             "search_config": config,
         }
     
+    def stream(self, config: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+        """Yield matches as files are scanned, stopping after ``max_results``."""
+        max_results = config.get("max_results", 100)
+        if max_results <= 0:
+            return
+        
+        files_to_search, _ = self._prepare(config)
+        emitted = 0
+        
+        for _, file_matches in self._scan(files_to_search, config):
+            for match in self._filter_matches(file_matches, config):
+                yield match
+                emitted += 1
+                if emitted >= max_results:
+                    return
+    
+    def _prepare(self, config: Dict[str, Any]) -> Tuple[List[Path], RefreshStats]:
+        """Refresh the symbol index (changed files only) and list files to search."""
+        search_path = config["path"]
+        refresh = self._index_for(search_path).refresh(search_path)
+        files = self._find_files(search_path, config["files"], config.get("exclude_dirs", []))
+        return files, refresh
+    
+    def _index_for(self, search_path: Path) -> ProjectIndex:
+        """Symbol index covering *search_path*."""
+        if self.index is None:
+            self.index = get_project_index(search_path)
+        return self.index
+    
     def _find_files(self, search_path: Path, pattern: str, exclude_dirs: List[str]) -> List[Path]:
         """Find files matching the pattern."""
         files = []
         exclude_set = set(exclude_dirs)
         
         if pattern == "*.py":
-            # Optimized Python file search
-            for path in search_path.rglob("*.py"):
-                if not any(part in exclude_set for part in path.parts):
-                    files.append(path)
+            # Python files come straight from the index
+            for record in self._index_for(search_path).files(search_path):
+                if not any(part in exclude_set for part in record.path.parts):
+                    files.append(record.path)
         else:
             # General pattern matching
             for path in search_path.rglob(pattern):
@@ -238,56 +332,82 @@ class CodeSearchEngine:
         
         return files
     
-    def _parallel_search(self, files: List[Path], config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Execute parallel search across files."""
-        matches = []
+    def _scan(self, files: List[Path], config: Dict[str, Any]) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+        """Yield ``(file, matches)`` for every scanned file, Python sources first."""
+        python_files = [f for f in files if f.suffix == '.py']
+        text_files = [f for f in files if f.suffix != '.py']
+        
+        if python_files:
+            yield from self._scan_python(python_files, config)
+        
+        if config.get("parallel", True) and len(text_files) >= self.PROCESS_POOL_THRESHOLD:
+            yield from self._parallel_search(text_files, config)
+        else:
+            for file_path in text_files:
+                yield file_path, self._search_file(file_path, config)
+    
+    def _scan_python(self, files: List[Path], config: Dict[str, Any]) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+        """Match all files with one index query; only files with hits are read."""
+        index = self._index_for(config["path"])
+        regex = _compile_pattern(config)
+        kinds = self.SEARCH_KINDS.get(config.get("search_type", "all"), self.SEARCH_KINDS["all"])
+        
+        hits: Dict[Path, List[Symbol]] = {}
+        for symbol in index.symbols(kind=kinds, name=regex, path=config["path"]):
+            hits.setdefault(symbol.path, []).append(symbol)
+        indexed = {record.path: record for record in index.files(config["path"])}
+        
+        for file_path in files:
+            resolved = file_path.resolve()
+            record = indexed.get(resolved)
+            if record is None or record.error:
+                # Unindexed (pruned directory) or unparsable: per-file path
+                yield file_path, self._search_file(file_path, config)
+            else:
+                yield file_path, self._symbol_matches(file_path, hits.get(resolved, []), config)
+    
+    def _parallel_search(self, files: List[Path], config: Dict[str, Any]) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+        """Text-search files in a process pool, yielding results as chunks complete."""
+        options = {
+            "pattern": config["pattern"],
+            "case_sensitive": config.get("case_sensitive", False),
+            "exact_match": config.get("exact_match", False),
+            "context_lines": config.get("context_lines", 3),
+        }
         max_workers = min(len(files), os.cpu_count() or 4)
+        chunk_size = max(1, min(self.CHUNK_SIZE, -(-len(files) // max_workers)))
+        chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_file = {
-                executor.submit(self._search_file, file_path, config): file_path
-                for file_path in files
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            future_to_chunk = {
+                executor.submit(_search_text_files, chunk, options): chunk
+                for chunk in chunks
             }
             
-            for future in as_completed(future_to_file):
+            for future in as_completed(future_to_chunk):
                 try:
-                    file_matches = future.result()
-                    matches.extend(file_matches)
+                    yield from future.result()
                 except Exception as e:
                     # Log error but continue searching
-                    file_path = future_to_file[future]
-                    add_span_event("code_search.file_error", {
-                        "file": str(file_path),
+                    add_span_event("code_search.chunk_error", {
+                        "files": len(future_to_chunk[future]),
                         "error": str(e)
                     })
-        
-        return matches
+        finally:
+            # Early stop: drop chunks that have not started yet
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def _search_file(self, file_path: Path, config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Search a single file using AST parsing."""
+        """Search a single file: indexed symbols for Python, text for the rest."""
         try:
-            # Check cache first
-            cache_key = f"ast:{file_path}:{config['pattern']}"
-            cached_result = self.cache.get(cache_key, file_path)
-            if cached_result:
-                return cached_result
+            if file_path.suffix == '.py':
+                return self._search_python_index(file_path, config)
             
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
             
-            matches = []
-            
-            if file_path.suffix == '.py':
-                # Use AST parsing for Python files
-                matches = self._search_python_ast(file_path, content, config)
-            else:
-                # Use text-based search for other files
-                matches = self._search_text(file_path, content, config)
-            
-            # Cache the results
-            self.cache.set(cache_key, matches, file_path)
-            
-            return matches
+            return self._search_text(file_path, content, config)
             
         except Exception as e:
             add_span_event("code_search.parse_error", {
@@ -296,178 +416,99 @@ class CodeSearchEngine:
             })
             return []
     
-    def _search_python_ast(self, file_path: Path, content: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Search Python file using AST parsing."""
-        try:
-            tree = ast.parse(content)
-            matches = []
-            lines = content.split('\n')
-            
-            pattern = config["pattern"]
-            search_type = config.get("search_type", "all")
-            include_docs = config.get("include_docs", False)
-            
-            # Compile regex pattern
-            flags = 0 if config.get("case_sensitive", False) else re.IGNORECASE
-            if config.get("exact_match", False):
-                regex = re.compile(re.escape(pattern), flags)
-            else:
-                regex = re.compile(pattern, flags)
-            
-            for node in ast.walk(tree):
-                match_info = self._check_ast_node(node, regex, search_type, include_docs, lines)
-                if match_info:
-                    match_info["file"] = str(file_path)
-                    matches.append(match_info)
-            
-            return matches
-            
-        except SyntaxError:
+    def _search_python_index(self, file_path: Path, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Search one Python file's indexed symbols."""
+        index = self._index_for(file_path)
+        record = index.file(file_path)
+        if record is None:  # outside the indexed tree (e.g. a pruned directory)
+            index.refresh(file_path)
+            record = index.file(file_path)
+        
+        if record is None or record.error:
             # Fall back to text search for files with syntax errors
+            content = file_path.read_text(encoding='utf-8', errors='ignore')
             return self._search_text(file_path, content, config)
-    
-    def _check_ast_node(self, node: ast.AST, regex: re.Pattern, search_type: str, 
-                       include_docs: bool, lines: List[str]) -> Optional[Dict[str, Any]]:
-        """Check if an AST node matches the search criteria."""
-        match_info = None
-        
-        # Function definitions
-        if (search_type in ["all", "function"] and 
-            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))):
-            if regex.search(node.name):
-                match_info = {
-                    "type": "function",
-                    "name": node.name,
-                    "line": node.lineno,
-                    "complexity": self._calculate_complexity(node),
-                    "is_async": isinstance(node, ast.AsyncFunctionDef),
-                }
-        
-        # Class definitions
-        elif (search_type in ["all", "class"] and isinstance(node, ast.ClassDef)):
-            if regex.search(node.name):
-                match_info = {
-                    "type": "class",
-                    "name": node.name,
-                    "line": node.lineno,
-                    "methods": len([n for n in node.body if isinstance(n, ast.FunctionDef)]),
-                    "bases": [self._get_name(base) for base in node.bases],
-                }
-        
-        # Variable assignments
-        elif (search_type in ["all", "variable"] and isinstance(node, ast.Assign)):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and regex.search(target.id):
-                    match_info = {
-                        "type": "variable",
-                        "name": target.id,
-                        "line": node.lineno,
-                        "value_type": type(node.value).__name__,
-                    }
-                    break
         
-        # Import statements
-        elif (search_type in ["all", "import"] and isinstance(node, (ast.Import, ast.ImportFrom))):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if regex.search(alias.name):
-                        match_info = {
-                            "type": "import",
-                            "name": alias.name,
-                            "line": node.lineno,
-                            "alias": alias.asname,
-                        }
-                        break
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                if regex.search(module):
-                    match_info = {
-                        "type": "import_from",
-                        "module": module,
-                        "line": node.lineno,
-                        "names": [alias.name for alias in node.names],
-                    }
+        kinds = self.SEARCH_KINDS.get(config.get("search_type", "all"), self.SEARCH_KINDS["all"])
+        symbols = list(index.symbols(kind=kinds, name=_compile_pattern(config), path=file_path))
+        return self._symbol_matches(file_path, symbols, config)
+    
+    def _symbol_matches(self, file_path: Path, symbols: List[Symbol], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Turn matching symbols into match records with context lines."""
+        if not symbols:
+            return []
         
-        # Decorators
-        elif (search_type in ["all", "decorator"] and 
-              hasattr(node, 'decorator_list') and node.decorator_list):
-            for decorator in node.decorator_list:
-                decorator_name = self._get_name(decorator)
-                if decorator_name and regex.search(decorator_name):
-                    match_info = {
-                        "type": "decorator",
-                        "name": decorator_name,
-                        "line": decorator.lineno,
-                        "target": getattr(node, 'name', 'unknown'),
-                    }
-                    break
+        lines = file_path.read_text(encoding='utf-8', errors='ignore').split('\n')
+        context = config.get("context_lines", 3)
+        matches = []
         
-        # Add context lines if match found
-        if match_info:
-            context_lines = self._get_context_lines(
-                lines, match_info["line"] - 1, 
-                config.get("context_lines", 3)
-            )
-            match_info["context"] = context_lines
+        for symbol in symbols:
+            match_info = self._symbol_record(symbol)
+            if match_info is None:
+                continue
+            match_info["file"] = str(file_path)
+            match_info["context"] = _context_lines(lines, match_info["line"] - 1, context)
             match_info["content"] = lines[match_info["line"] - 1] if match_info["line"] <= len(lines) else ""
+            matches.append(match_info)
         
-        return match_info
+        return matches
+    
+    def _symbol_record(self, symbol: Symbol) -> Optional[Dict[str, Any]]:
+        """Build the match record for an indexed symbol."""
+        detail = symbol.detail
+        if symbol.kind == "function":
+            return {
+                "type": "function",
+                "name": symbol.name,
+                "line": symbol.line,
+                "complexity": symbol.complexity,
+                "is_async": symbol.is_async,
+            }
+        if symbol.kind == "class":
+            return {
+                "type": "class",
+                "name": symbol.name,
+                "line": symbol.line,
+                "methods": detail.get("methods", 0),
+                "bases": detail.get("bases", []),
+            }
+        if symbol.kind == "variable":
+            return {
+                "type": "variable",
+                "name": symbol.name,
+                "line": symbol.line,
+                "value_type": detail.get("value_type"),
+            }
+        if symbol.kind == "import":
+            return {
+                "type": "import",
+                "name": symbol.name,
+                "line": symbol.line,
+                "alias": detail.get("alias"),
+            }
+        if symbol.kind == "import_from":
+            return {
+                "type": "import_from",
+                "module": symbol.name,
+                "line": symbol.line,
+                "names": detail.get("names", []),
+            }
+        if symbol.kind == "decorator":
+            return {
+                "type": "decorator",
+                "name": symbol.name,
+                "line": symbol.line,
+                "target": detail.get("target", "unknown"),
+            }
+        return None
     
     def _search_text(self, file_path: Path, content: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Search file using text-based pattern matching."""
-        pattern = config["pattern"]
-        flags = 0 if config.get("case_sensitive", False) else re.IGNORECASE
-        
-        if config.get("exact_match", False):
-            regex = re.compile(re.escape(pattern), flags)
-        else:
-            regex = re.compile(pattern, flags)
-        
-        matches = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            if regex.search(line):
-                context_lines = self._get_context_lines(lines, line_num - 1, config.get("context_lines", 3))
-                matches.append({
-                    "type": "text",
-                    "line": line_num,
-                    "file": str(file_path),
-                    "content": line,
-                    "context": context_lines,
-                })
-        
-        return matches
+        return _text_matches(file_path, content, _compile_pattern(config), config.get("context_lines", 3))
     
     def _get_context_lines(self, lines: List[str], center_line: int, context: int) -> List[str]:
         """Get context lines around a match."""
-        start = max(0, center_line - context)
-        end = min(len(lines), center_line + context + 1)
-        return lines[start:end]
-    
-    def _calculate_complexity(self, node: ast.AST) -> int:
-        """Calculate cyclomatic complexity of a function."""
-        complexity = 1  # Base complexity
-        
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        
-        return complexity
-    
-    def _get_name(self, node: ast.AST) -> Optional[str]:
-        """Extract name from an AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        elif isinstance(node, ast.Constant):
-            return str(node.value)
-        return None
+        return _context_lines(lines, center_line, context)
     
     def _filter_matches(self, matches: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Filter matches based on configuration criteria."""
@@ -575,27 +616,16 @@ class DependencyAnalyzer:
             return []
     
     def _search_import_usage(self, search_path: Path, pattern: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Search for import usage in Python files."""
-        matches = []
+        """Search for import usage in Python files via the project symbol index."""
         pattern_regex = re.compile(pattern, re.IGNORECASE)
         
-        for py_file in search_path.rglob("*.py"):
-            try:
-                with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                lines = content.split('\n')
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.Import, ast.ImportFrom)):
-                        import_matches = self._extract_import_matches(node, pattern_regex, py_file, lines)
-                        matches.extend(import_matches)
-                        
-            except Exception:
-                continue  # Skip files with syntax errors
+        index = get_project_index(search_path)
+        index.refresh(search_path)
         
-        return matches
+        return [
+            self._import_match(symbol)
+            for symbol in index.symbols(kind=("import", "import_from"), name=pattern_regex, path=search_path)
+        ]
     
     def _search_requirements(self, search_path: Path, pattern: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Search requirements files and pyproject.toml."""
@@ -613,36 +643,21 @@ class DependencyAnalyzer:
         
         return matches
     
-    def _extract_import_matches(self, node: ast.AST, pattern: re.Pattern, 
-                              file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
-        """Extract import matches from AST node."""
-        matches = []
-        
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                if pattern.search(alias.name):
-                    matches.append({
-                        "name": alias.name,
-                        "type": "import",
-                        "file": str(file_path),
-                        "line": node.lineno,
-                        "alias": alias.asname,
-                        "usage": [{"file": str(file_path), "line": node.lineno}],
-                    })
-        
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            if pattern.search(module):
-                matches.append({
-                    "name": module,
-                    "type": "import_from",
-                    "file": str(file_path),
-                    "line": node.lineno,
-                    "imports": [alias.name for alias in node.names],
-                    "usage": [{"file": str(file_path), "line": node.lineno}],
-                })
-        
-        return matches
+    def _import_match(self, symbol: Symbol) -> Dict[str, Any]:
+        """Build a dependency match from an indexed import symbol."""
+        file_path = str(symbol.path)
+        match = {
+            "name": symbol.name,
+            "type": symbol.kind,
+            "file": file_path,
+            "line": symbol.line,
+        }
+        if symbol.kind == "import":
+            match["alias"] = symbol.detail.get("alias")
+        else:
+            match["imports"] = symbol.detail.get("names", [])
+        match["usage"] = [{"file": file_path, "line": symbol.line}]
+        return match
     
     def _parse_requirements_file(self, req_file: Path, pattern: re.Pattern) -> List[Dict[str, Any]]:
         """Parse requirements.txt file."""
@@ -1464,22 +1479,255 @@ class LogSearchEngine:
         ]
 
 
+_EMBEDDING_MODELS: Dict[str, Any] = {}
+_EMBEDDING_MODELS_LOCK = threading.Lock()
+
+
+def _load_embedding_model(name: str) -> Optional[Any]:
+    """Load a sentence-transformers model once per process (``None`` if unavailable)."""
+    if not EMBEDDINGS_AVAILABLE:
+        return None
+    with _EMBEDDING_MODELS_LOCK:
+        if name not in _EMBEDDING_MODELS:
+            try:
+                _EMBEDDING_MODELS[name] = SentenceTransformer(name)
+            except Exception:
+                _EMBEDDING_MODELS[name] = None
+        return _EMBEDDING_MODELS[name]
+
+
+class EmbeddingStore:
+    """
+    Persistent chunk-embedding index.
+    
+    Vectors live in a float16 memory-mapped matrix (``vectors.f16``) and chunk
+    metadata in SQLite (``meta.db``), both under ``<project>/.uvmgr/index/
+    embeddings``. Files are tracked by ``(mtime, size)`` and content hash, so
+    only changed files are re-chunked and re-embedded. Rows of removed chunks
+    are recycled. Vectors are L2-normalised, so cosine similarity is a single
+    matrix-vector product.
+    """
+    
+    GROWTH = 1024  # minimum rows added when the matrix grows
+    
+    def __init__(self, directory: Path, model_name: str):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = directory / "vectors.f16"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(directory / "meta.db", timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS files (
+                path     TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size     INTEGER NOT NULL,
+                hash     TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                row  INTEGER PRIMARY KEY,
+                path TEXT,
+                line INTEGER,
+                type TEXT,
+                name TEXT,
+                text TEXT
+            );
+            CREATE INDEX IF NOT EXISTS chunks_path ON chunks(path);
+        """)
+        if self._meta("model") != model_name:
+            self.clear()
+            self._set_meta("model", model_name)
+        self._vectors = None
+    
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def _set_meta(self, key: str, value: Any):
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(value)))
+    
+    @property
+    def dim(self) -> Optional[int]:
+        value = self._meta("dim")
+        return int(value) if value else None
+    
+    def clear(self):
+        """Drop every stored file, chunk and vector."""
+        with self._lock:
+            self._conn.executescript("DELETE FROM files; DELETE FROM chunks; DELETE FROM meta WHERE key = 'dim';")
+            self._vectors = None
+            self.vectors_path.unlink(missing_ok=True)
+    
+    # Paths equal to, or below, a root-relative prefix ("" matches everything)
+    _UNDER = "path IS NOT NULL AND (? = '' OR path = ? OR substr(path, 1, ?) = ?)"
+    
+    @staticmethod
+    def _under(prefix: str) -> Tuple[str, str, int, str]:
+        return (prefix, prefix, len(prefix) + 1, prefix + "/")
+    
+    def known_files(self, prefix: str) -> Dict[str, Tuple[int, int, str]]:
+        """``path -> (mtime_ns, size, hash)`` for files under *prefix*."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, mtime_ns, size, hash FROM files WHERE " + self._UNDER, self._under(prefix)
+            ).fetchall()
+        return {path: (mtime, size, digest) for path, mtime, size, digest in rows}
+    
+    def _matrix(self, rows: int):
+        """Memory-mapped vector matrix with room for at least *rows* rows."""
+        import numpy as np
+        
+        dim = self.dim
+        capacity = self.vectors_path.stat().st_size // (2 * dim) if self.vectors_path.exists() else 0
+        if rows > capacity:
+            capacity = max(rows, capacity * 2, self.GROWTH)
+            with open(self.vectors_path, "ab") as f:
+                f.truncate(capacity * dim * 2)
+            self._vectors = None
+        if self._vectors is None and capacity:
+            self._vectors = np.memmap(self.vectors_path, dtype=np.float16, mode="r+", shape=(capacity, dim))
+        return self._vectors
+    
+    def update_file(self, path: str, stat: Tuple[int, int], digest: str,
+                    chunks: List[Dict[str, Any]], vectors) -> None:
+        """Replace the chunks of *path*; *vectors* are normalised rows aligned with *chunks*."""
+        with self._lock:
+            if self.dim is None and len(chunks):
+                self._set_meta("dim", vectors.shape[1])
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Free this file's rows, then reuse free rows before growing
+                conn.execute("UPDATE chunks SET path = NULL, text = NULL WHERE path = ?", (path,))
+                free = [row for (row,) in conn.execute(
+                    "SELECT row FROM chunks WHERE path IS NULL ORDER BY row LIMIT ?", (len(chunks),)
+                )]
+                next_row = conn.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM chunks").fetchone()[0]
+                rows = free + list(range(next_row, next_row + len(chunks) - len(free)))
+                
+                if chunks:
+                    matrix = self._matrix(max(rows) + 1)
+                    matrix[rows] = vectors
+                    matrix.flush()
+                
+                conn.executemany(
+                    "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (row, path, chunk.get("line"), chunk["type"], chunk.get("name"), chunk["text"])
+                        for row, chunk in zip(rows, chunks)
+                    ],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (path, stat[0], stat[1], digest)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+    
+    def touch_file(self, path: str, stat: Tuple[int, int]) -> None:
+        """Record a new ``(mtime, size)`` for a file whose content is unchanged."""
+        with self._lock:
+            self._conn.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?", (stat[0], stat[1], path))
+    
+    def remove_file(self, path: str) -> None:
+        """Forget *path*; its rows become free for reuse."""
+        with self._lock:
+            self._conn.execute("UPDATE chunks SET path = NULL, text = NULL WHERE path = ?", (path,))
+            self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+    
+    def candidates(self, prefix: str, types: Optional[Set[str]] = None,
+                   name_patterns: Optional[List[str]] = None) -> List[Tuple[int, str]]:
+        """``(row, path)`` of live chunks under *prefix*, filtered by chunk type and file name."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT row, path, type FROM chunks WHERE " + self._UNDER, self._under(prefix)
+            ).fetchall()
+        out = []
+        for row, path, chunk_type in rows:
+            if types is not None and chunk_type not in types:
+                continue
+            if name_patterns is not None:
+                file_name = path.rsplit("/", 1)[-1]
+                if not any(Path(file_name).match(pattern) for pattern in name_patterns):
+                    continue
+            out.append((row, path))
+        return out
+    
+    def query(self, query_vector, rows: List[int], k: int,
+              threshold: float) -> Tuple[List[Tuple[int, float]], int, float]:
+        """
+        Score *rows* against a normalised query vector.
+        
+        Returns the best *k* ``(row, similarity)`` pairs at or above *threshold*
+        (best first), plus the count and mean similarity of all such rows.
+        """
+        import numpy as np
+        
+        if not rows or self.dim is None:
+            return [], 0, 0.0
+        with self._lock:
+            matrix = self._matrix(0)
+            index = np.asarray(rows, dtype=np.int64)
+            scores = matrix[index].astype(np.float32) @ np.asarray(query_vector, dtype=np.float32)
+        
+        keep = np.flatnonzero(scores >= threshold)
+        count, mean = int(keep.size), float(scores[keep].mean()) if keep.size else 0.0
+        if keep.size > k:
+            # O(n) selection instead of sorting every score
+            keep = keep[np.argpartition(scores[keep], -k)[-k:]] if k > 0 else keep[:0]
+        keep = keep[np.argsort(scores[keep])[::-1]]
+        return [(int(index[i]), float(scores[i])) for i in keep], count, mean
+    
+    def chunk(self, row: int) -> Dict[str, Any]:
+        """Metadata of a stored chunk."""
+        with self._lock:
+            path, line, chunk_type, name, text = self._conn.execute(
+                "SELECT path, line, type, name, text FROM chunks WHERE row = ?", (row,)
+            ).fetchone()
+        return {"path": path, "line": line, "type": chunk_type, "name": name, "text": text}
+
+
 class SemanticSearchEngine:
-    """AI-powered semantic search using embeddings."""
+    """
+    AI-powered semantic search using embeddings.
+    
+    Chunk embeddings persist in an :class:`EmbeddingStore` per project and are
+    refreshed incrementally, so a query on a warm index encodes only the query
+    itself. The sentence-transformers model is loaded on first use and shared
+    by every engine in the process.
+    """
+    
+    MODEL_NAME = 'all-MiniLM-L6-v2'
+    ENCODE_BATCH_FILES = 256
+    
+    # Indexed file suffixes, and per-scope (file name patterns, chunk types)
+    INDEXED_SUFFIXES = {".py", ".md", ".rst", ".txt"}
+    SCOPES = {
+        "all": (None, None),
+        "code": (["*.py"], {"function", "class", "content"}),
+        "docs": (["*.md", "*.rst", "*.txt"], None),
+        "comments": (["*.py"], None),
+        "tests": (["test_*.py", "*_test.py"], {"function", "class", "content"}),
+    }
     
     def __init__(self, cache: SearchCache = None):
         self.cache = cache or SearchCache()
-        self.model = None
-        self._init_model()
+        self._model = _UNLOADED
+        self._stores: Dict[Path, EmbeddingStore] = {}
+    
+    @property
+    def model(self):
+        """Process-wide embedding model, loaded on first access."""
+        if self._model is _UNLOADED:
+            self._model = _load_embedding_model(self.MODEL_NAME)
+        return self._model
+    
+    @model.setter
+    def model(self, value):
+        self._model = value
     
-    def _init_model(self):
-        """Initialize the sentence transformer model."""
-        if EMBEDDINGS_AVAILABLE:
-            try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
-            except Exception:
-                self.model = None
-        
     def search(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Execute semantic search using AI embeddings."""
         if not self.model:
@@ -1497,75 +1745,135 @@ class SemanticSearchEngine:
         similarity_threshold = config.get("similarity_threshold", 0.7)
         max_results = config.get("max_results", 20)
         
-        # Extract text from files
-        text_chunks = self._extract_text_chunks(search_path, search_scope)
+        # Embed only chunks of files changed since the last query
+        store, prefix, embedded = self.refresh_index(search_path)
+        
+        name_patterns, chunk_types = self.SCOPES.get(search_scope, self.SCOPES["all"])
+        candidates = store.candidates(prefix, chunk_types, name_patterns)
         
-        if not text_chunks:
+        if not candidates:
             return {
                 "matches": [],
                 "search_config": config,
             }
         
-        # Generate embeddings
-        query_embedding = self.model.encode([query])
-        chunk_embeddings = self.model.encode([chunk["text"] for chunk in text_chunks])
-        
-        # Calculate similarities
-        from sklearn.metrics.pairwise import cosine_similarity
-        similarities = cosine_similarity(query_embedding, chunk_embeddings)[0]
+        query_embedding = self._encode([query])[0]
+        top, _, avg_similarity = store.query(
+            query_embedding, [row for row, _ in candidates], max_results, similarity_threshold
+        )
         
         # Create matches with similarity scores
         matches = []
-        for i, similarity in enumerate(similarities):
-            if similarity >= similarity_threshold:
-                chunk = text_chunks[i]
-                match = {
-                    "file": chunk["file"],
-                    "line": chunk.get("line"),
-                    "type": chunk["type"],
-                    "similarity": float(similarity),
-                    "preview": chunk["text"][:200] + "..." if len(chunk["text"]) > 200 else chunk["text"],
-                    "full_text": chunk["text"],
-                }
-                
-                if config.get("explain_results", False):
-                    match["explanation"] = self._explain_similarity(query, chunk["text"], similarity)
-                
-                matches.append(match)
-        
-        # Sort by similarity
-        matches.sort(key=lambda x: x["similarity"], reverse=True)
+        for row, similarity in top:
+            chunk = store.chunk(row)
+            text = chunk["text"]
+            match = {
+                "file": str(self._root(search_path) / chunk["path"]),
+                "line": chunk["line"],
+                "type": chunk["type"],
+                "similarity": similarity,
+                "preview": text[:200] + "..." if len(text) > 200 else text,
+                "full_text": text,
+            }
+            
+            if config.get("explain_results", False):
+                match["explanation"] = self._explain_similarity(query, text, similarity)
+            
+            matches.append(match)
         
-        avg_similarity = sum(m["similarity"] for m in matches) / len(matches) if matches else 0
+        add_span_attributes(**{
+            "semantic_search.chunks_candidates": len(candidates),
+            "semantic_search.chunks_embedded": embedded,
+            "semantic_search.matches": len(matches),
+        })
         
         return {
-            "matches": matches[:max_results],
+            "matches": matches,
             "avg_similarity": avg_similarity,
-            "total_chunks_processed": len(text_chunks),
+            "total_chunks_processed": len(candidates),
+            "chunks_embedded": embedded,
             "search_config": config,
         }
     
-    def _extract_text_chunks(self, search_path: Path, search_scope: str) -> List[Dict[str, Any]]:
-        """Extract text chunks from files for semantic search."""
-        chunks = []
-        
-        scope_patterns = {
-            "all": ["*.py", "*.md", "*.rst", "*.txt"],
-            "code": ["*.py"],
-            "docs": ["*.md", "*.rst", "*.txt"],
-            "comments": ["*.py"],  # Will extract only comments
-            "tests": ["test_*.py", "*_test.py"],
-        }
-        
-        patterns = scope_patterns.get(search_scope, scope_patterns["all"])
-        
-        for pattern in patterns:
-            for file_path in search_path.rglob(pattern):
-                if file_path.is_file():
-                    file_chunks = self._extract_file_chunks(file_path, search_scope)
-                    chunks.extend(file_chunks)
-        
-        return chunks
+    def _root(self, search_path: Path) -> Path:
+        return find_project_root(search_path)
+    
+    def _store(self, root: Path) -> EmbeddingStore:
+        store = self._stores.get(root)
+        if store is None:
+            store = self._stores[root] = EmbeddingStore(root / ".uvmgr" / "index" / "embeddings", self.MODEL_NAME)
+        return store
+    
+    def _encode(self, texts: List[str]):
+        """Encode *texts* into L2-normalised float32 vectors."""
+        import numpy as np
+        
+        vectors = np.asarray(
+            self.model.encode(texts, batch_size=64, convert_to_numpy=True, show_progress_bar=False),
+            dtype=np.float32,
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+    
+    def refresh_index(self, search_path: Path) -> Tuple[EmbeddingStore, str, int]:
+        """
+        Bring the embedding index for *search_path* up to date.
+        
+        Returns the store, the root-relative prefix of *search_path* and the
+        number of chunks that had to be (re-)embedded.
+        """
+        root = self._root(search_path)
+        store = self._store(root)
+        base = search_path.resolve()
+        prefix = base.relative_to(root).as_posix()
+        prefix = "" if prefix == "." else prefix
+        
+        on_disk = {}
+        paths = [base] if base.is_file() else self._walk(base)
+        for path in paths:
+            if path.suffix in self.INDEXED_SUFFIXES:
+                st = path.stat()
+                on_disk[path.relative_to(root).as_posix()] = (st.st_mtime_ns, st.st_size)
+        
+        known = store.known_files(prefix)
+        for rel in known.keys() - on_disk.keys():
+            store.remove_file(rel)
+        
+        pending = []
+        for rel, stat in on_disk.items():
+            previous = known.get(rel)
+            if previous is not None and previous[:2] == stat:
+                continue
+            try:
+                digest = hashlib.blake2b((root / rel).read_bytes(), digest_size=16).hexdigest()
+            except OSError:
+                continue
+            if previous is not None and previous[2] == digest:
+                store.touch_file(rel, stat)
+                continue
+            pending.append((rel, stat, digest, self._extract_file_chunks(root / rel, "all")))
+        
+        embedded = 0
+        for start in range(0, len(pending), self.ENCODE_BATCH_FILES):
+            batch = pending[start:start + self.ENCODE_BATCH_FILES]
+            texts = [chunk["text"] for *_, chunks in batch for chunk in chunks]
+            vectors = self._encode(texts) if texts else None
+            offset = 0
+            for rel, stat, digest, chunks in batch:
+                file_vectors = vectors[offset:offset + len(chunks)] if chunks else None
+                store.update_file(rel, stat, digest, chunks, file_vectors)
+                offset += len(chunks)
+            embedded += len(texts)
+        
+        metric_counter("semantic_search.chunks_embedded")(embedded)
+        return store, prefix, embedded
+    
+    def _walk(self, base: Path) -> Iterator[Path]:
+        """Files below *base*, skipping virtualenvs, VCS and cache directories."""
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = [d for d in dirnames if d not in PRUNE_DIRS]
+            for filename in filenames:
+                yield Path(dirpath, filename)
     
     def _extract_file_chunks(self, file_path: Path, search_scope: str) -> List[Dict[str, Any]]:
         """Extract text chunks from a single file."""
@@ -1752,6 +2060,12 @@ def search_code(config: Dict[str, Any]) -> Dict[str, Any]:
     return engine.search(config)
 
 
+def stream_code(config: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+    """Stream code search matches as they are found (up to ``max_results``)."""
+    engine = CodeSearchEngine()
+    yield from engine.stream(config)
+
+
 def search_dependencies(config: Dict[str, Any]) -> Dict[str, Any]:
     """Execute dependency search operation."""
     analyzer = DependencyAnalyzer()
@@ -6,15 +6,44 @@ Implements 80/20 security analysis: focuses on the 20% of checks that catch
 """
 
 import json
+import os
 import re
 import subprocess
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+from uvmgr.core.code_index import get_project_index
 from uvmgr.core.instrumentation import span, metric_counter
+from uvmgr.core.scanner import PatternSet, scan_files
 from uvmgr.core.semconv import SecurityAttributes, SecurityOperations
 
+# Common secret patterns (80/20 approach - most common secrets)
+SECRET_PATTERNS = {
+    "api_key": r"(?i)(api[_-]?key|apikey)[:=\s]['\"]?([a-zA-Z0-9]{20,})",
+    "password": r"(?i)(password|passwd|pwd)[:=\s]['\"]?([^\s'\"]{8,})",
+    "token": r"(?i)(token|auth[_-]?token)[:=\s]['\"]?([a-zA-Z0-9]{20,})",
+    "secret": r"(?i)(secret|secret[_-]?key)[:=\s]['\"]?([a-zA-Z0-9]{20,})",
+    "aws_access_key": r"AKIA[0-9A-Z]{16}",
+    "github_token": r"ghp_[a-zA-Z0-9]{36}",
+    "jwt_token": r"eyJ[a-zA-Z0-9_-]*\.eyJ[a-zA-Z0-9_-]*\.[a-zA-Z0-9_-]*",
+    "private_key": r"-----BEGIN [A-Z ]+ PRIVATE KEY-----",
+}
+
+# Common security anti-patterns
+CODE_SECURITY_PATTERNS = {
+    "sql_injection": r"(?i)(execute|cursor\.execute).*%.*%",
+    "hardcoded_password": r"(?i)password\s*=\s*['\"][^'\"]{8,}['\"]",
+    "eval_usage": r"\beval\s*\(",
+    "exec_usage": r"\bexec\s*\(",
+    "shell_injection": r"(?i)(os\.system|subprocess\.(call|run|Popen)).*\+",
+    "pickle_usage": r"\bpickle\.(loads?|dumps?)\s*\(",
+    "yaml_unsafe": r"yaml\.load\s*\([^,)]*\)",
+    "request_verify_false": r"requests\.[a-z]+\([^)]*verify\s*=\s*False",
+}
+
+_SCANNABLE_SUFFIXES = frozenset({".py", ".txt", ".yml", ".yaml", ".json", ".toml"})
+
 
 @span("security.comprehensive_scan")
 def run_comprehensive_scan(
@@ -254,23 +283,16 @@ def scan_secrets_impl(
     patterns_file: Optional[Path] = None,
     exclude_patterns: List[str] = None
 ) -> List[Dict[str, Any]]:
-    """Implementation of secret scanning."""
-    secrets = []
+    """
+    Implementation of secret scanning.
+    
+    All patterns are matched in one pass per file; files found clean are
+    cached by content, so re-scanning an unchanged tree only stats files.
+    """
     exclude_patterns = exclude_patterns or [
         "*.pyc", "__pycache__", ".git", ".venv", "venv", "node_modules"
     ]
-    
-    # Common secret patterns (80/20 approach - most common secrets)
-    secret_patterns = {
-        "api_key": r"(?i)(api[_-]?key|apikey)[:=\s]['\"]?([a-zA-Z0-9]{20,})",
-        "password": r"(?i)(password|passwd|pwd)[:=\s]['\"]?([^\\s'\"]{8,})",
-        "token": r"(?i)(token|auth[_-]?token)[:=\s]['\"]?([a-zA-Z0-9]{20,})",
-        "secret": r"(?i)(secret|secret[_-]?key)[:=\s]['\"]?([a-zA-Z0-9]{20,})",
-        "aws_access_key": r"AKIA[0-9A-Z]{16}",
-        "github_token": r"ghp_[a-zA-Z0-9]{36}",
-        "jwt_token": r"eyJ[a-zA-Z0-9_-]*\\.eyJ[a-zA-Z0-9_-]*\\.[a-zA-Z0-9_-]*",
-        "private_key": r"-----BEGIN [A-Z ]+ PRIVATE KEY-----",
-    }
+    secret_patterns = dict(SECRET_PATTERNS)
     
     # Load custom patterns if provided
     if patterns_file and patterns_file.exists():
@@ -282,27 +304,31 @@ def scan_secrets_impl(
         except Exception:
             pass
     
-    # Scan files
-    for file_path in _get_scannable_files(project_path, exclude_patterns):
+    # Invalid custom patterns are ignored rather than failing the scan
+    valid_patterns = {}
+    for secret_type, pattern in secret_patterns.items():
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.split("\\n")
-            
-            for line_num, line in enumerate(lines, 1):
-                for secret_type, pattern in secret_patterns.items():
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        secrets.append({
-                            "file": str(file_path.relative_to(project_path)),
-                            "line": line_num,
-                            "type": secret_type,
-                            "context": line.strip()[:100],
-                            "match": match.group(0)[:20] + "..." if len(match.group(0)) > 20 else match.group(0)
-                        })
-        except Exception:
+            re.compile(pattern)
+            valid_patterns[secret_type] = pattern
+        except (re.error, TypeError):
             continue
     
-    return secrets
+    project_path = project_path.resolve()
+    matches = scan_files(
+        project_path,
+        _get_scannable_files(project_path, exclude_patterns),
+        PatternSet(valid_patterns),
+    )
+    return [
+        {
+            "file": str(match.path.relative_to(project_path)),
+            "line": match.line,
+            "type": match.pattern,
+            "context": match.line_text.strip()[:100],
+            "match": match.text[:20] + "..." if len(match.text) > 20 else match.text
+        }
+        for match in matches
+    ]
 
 
 def scan_code_security(project_path: Path) -> List[Dict[str, Any]]:
@@ -311,45 +337,31 @@ def scan_code_security(project_path: Path) -> List[Dict[str, Any]]:
     
     80/20 approach: Focus on the most common code security patterns.
     """
-    issues = []
-    
-    # Common security anti-patterns
-    security_patterns = {
-        "sql_injection": r"(?i)(execute|cursor\\.execute).*%.*%",
-        "hardcoded_password": r"(?i)password\\s*=\\s*['\"][^'\"]{8,}['\"]",
-        "eval_usage": r"\\beval\\s*\\(",
-        "exec_usage": r"\\bexec\\s*\\(",
-        "shell_injection": r"(?i)(os\\.system|subprocess\\.(call|run|Popen)).*\\+",
-        "pickle_usage": r"\\bpickle\\.(loads?|dumps?)\\s*\\(",
-        "yaml_unsafe": r"yaml\\.load\\s*\\([^,)]*\\)",
-        "request_verify_false": r"requests\\.[a-z]+\\([^)]*verify\\s*=\\s*False",
-    }
-    
-    python_files = list(project_path.rglob("*.py"))
-    
-    for file_path in python_files:
-        if _should_skip_file(file_path):
-            continue
-            
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.split("\\n")
-            
-            for line_num, line in enumerate(lines, 1):
-                for issue_type, pattern in security_patterns.items():
-                    if re.search(pattern, line):
-                        issues.append({
-                            "type": issue_type,
-                            "severity": _get_severity_for_issue(issue_type),
-                            "file": str(file_path.relative_to(project_path)),
-                            "line": line_num,
-                            "description": _get_description_for_issue(issue_type),
-                            "context": line.strip()
-                        })
-        except Exception:
-            continue
+    # Python sources come from the incrementally maintained project index
+    index = get_project_index(project_path)
+    index.refresh(project_path)
+    project_path = project_path.resolve()
+    python_files = [
+        record.path for record in index.files(project_path)
+        if not _should_skip_file(record.path)
+    ]
     
-    return issues
+    matches = scan_files(
+        project_path,
+        python_files,
+        PatternSet(CODE_SECURITY_PATTERNS, all_matches=False),
+    )
+    return [
+        {
+            "type": match.pattern,
+            "severity": _get_severity_for_issue(match.pattern),
+            "file": str(match.path.relative_to(project_path)),
+            "line": match.line,
+            "description": _get_description_for_issue(match.pattern),
+            "context": match.line_text.strip()
+        }
+        for match in matches
+    ]
 
 
 @span("security.check_config")
@@ -470,20 +482,21 @@ def _check_ci_security(workflows_dir: Path) -> List[Dict[str, Any]]:
 def _get_scannable_files(project_path: Path, exclude_patterns: List[str]) -> List[Path]:
     """Get list of files to scan, excluding patterns."""
     files = []
-    
-    for file_path in project_path.rglob("*"):
-        if file_path.is_file():
-            # Check if file should be excluded
-            relative_path = str(file_path.relative_to(project_path))
-            should_exclude = False
-            
-            for pattern in exclude_patterns:
-                if pattern in relative_path:
-                    should_exclude = True
-                    break
-            
-            if not should_exclude and file_path.suffix in [".py", ".txt", ".yml", ".yaml", ".json", ".toml"]:
-                files.append(file_path)
+    root_len = len(str(project_path)) + 1
+    
+    for dirpath, dirnames, filenames in os.walk(project_path):
+        # Excluded directories are pruned instead of walked and filtered
+        dirnames[:] = [
+            d for d in dirnames
+            if not any(pattern in os.path.join(dirpath, d)[root_len:] for pattern in exclude_patterns)
+        ]
+        for filename in filenames:
+            if os.path.splitext(filename)[1] not in _SCANNABLE_SUFFIXES:
+                continue
+            full_path = os.path.join(dirpath, filename)
+            relative_path = full_path[root_len:]
+            if not any(pattern in relative_path for pattern in exclude_patterns):
+                files.append(Path(full_path))
     
     return files
 
@@ -33,11 +33,12 @@ import subprocess
 import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
 from uvmgr.core.instrumentation import add_span_attributes, add_span_event
 from uvmgr.core.process import run as _run
+from uvmgr.core.process import run_streaming
 from uvmgr.core.semconv import CliAttributes
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram
 from uvmgr.weaver.forge import TerraformForge
@@ -52,11 +53,31 @@ class SubprocessResult:
         self.stderr = stderr
 
 
-def run(cmd: List[str], cwd: Path = None, capture: bool = True, **kwargs) -> SubprocessResult:
-    """Wrapper for uvmgr's run function to provide subprocess-like interface"""
+def run(
+    cmd: List[str],
+    cwd: Path = None,
+    capture: bool = True,
+    timeout: Optional[float] = None,
+    on_line: Optional[Callable[[str], None]] = None,
+    **kwargs,
+) -> SubprocessResult:
+    """
+    Wrapper for uvmgr's run function to provide subprocess-like interface.
+
+    With *on_line*, output is streamed line by line (e.g. for live ``apply``
+    progress); ``stdout`` then holds only the retained tail. Failures report
+    the real exit code with the output tail as ``stderr``.
+    """
     try:
-        output = _run(cmd, capture=capture, cwd=cwd)
+        if on_line is not None:
+            streamed = run_streaming(cmd, cwd=cwd, timeout=timeout, on_line=on_line, check=False)
+            if streamed.exit_code == 0:
+                return SubprocessResult(returncode=0, stdout=streamed.output, stderr="")
+            return SubprocessResult(returncode=streamed.exit_code, stdout="", stderr=streamed.output)
+        output = _run(cmd, capture=capture, cwd=cwd, timeout=timeout)
         return SubprocessResult(returncode=0, stdout=output or "", stderr="")
+    except subprocess.CalledProcessError as e:
+        return SubprocessResult(returncode=e.returncode, stdout="", stderr=e.output or str(e))
     except Exception as e:
         # In case of error, return non-zero exit code with error message
         return SubprocessResult(returncode=1, stdout="", stderr=str(e))
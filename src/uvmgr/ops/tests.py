@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from uvmgr.core.instrumentation import add_span_attributes, span
 from uvmgr.core.semconv import TestAttributes, TestCoverageAttributes, CIAttributes, CIOperations
@@ -24,7 +24,10 @@ def run_test_suite(
     fail_fast: bool = False,
     test_types: Optional[List[str]] = None,
     markers: Optional[List[str]] = None,
-    generate_report: bool = True
+    generate_report: bool = True,
+    timeout: Optional[float] = 300,
+    on_line: Optional[Callable[[str], None]] = None,
+    impact: bool = False,
 ) -> Dict[str, Any]:
     """
     Run the complete test suite.
@@ -45,6 +48,13 @@ def run_test_suite(
         Test markers to run
     generate_report : bool
         Whether to generate comprehensive test report
+    timeout : Optional[float]
+        Seconds before pytest is killed (``None`` disables the limit)
+    on_line : Optional[Callable[[str], None]]
+        Called with each line of pytest output as it arrives (live progress)
+    impact : bool
+        Run only tests affected by changes since their last run and tests
+        that did not pass last time
         
     Returns
     -------
@@ -61,6 +71,7 @@ def run_test_suite(
             "test.parallel": parallel,
             "test.coverage": coverage,
             "test.fail_fast": fail_fast,
+            "test.impact": impact,
         })
         
         # Delegate to runtime
@@ -71,7 +82,10 @@ def run_test_suite(
             fail_fast=fail_fast,
             test_types=test_types or [],
             markers=markers or [],
-            generate_report=generate_report
+            generate_report=generate_report,
+            timeout=timeout,
+            on_line=on_line,
+            impact=impact,
         )
         
         # Add result attributes
@@ -19,4 +19,4 @@ def install(pkgs: list[str]) -> None:
 
 @timed
 def tool_dir() -> str:
-    return uv_call("tool dir", capture=True) or ""
+    return uv_call("tool dir", capture=True, cache_ttl=3600) or ""
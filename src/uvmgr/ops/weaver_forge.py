@@ -49,12 +49,13 @@ See Also
 
 from __future__ import annotations
 
-import asyncio
 import json
 import os
 import re
 import shutil
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
@@ -69,6 +70,11 @@ from uvmgr.core.telemetry import span, metric_counter, metric_histogram, record_
 
 console = Console()
 
+BULK_PARALLEL_THRESHOLD = 32
+"""Spec count from which ``parallel=True`` bulk generation fans out to a process pool."""
+
+_EJS_PLACEHOLDER = re.compile(r"<%= (.*?) %>", re.DOTALL)
+
 
 @dataclass
 class TemplateInfo:
@@ -1042,6 +1048,49 @@ def _get_template_files(template_path: Path) -> List[Path]:
     return template_files
 
 
+class CompiledTemplate:
+    """
+    An EJS-like template split once into literal text and placeholders.
+
+    Rendering is a single ``str.join`` over the parts instead of one
+    ``str.replace`` pass over the whole text per parameter. Placeholders
+    without a matching parameter are kept verbatim.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, content: str):
+        # Even indices are literal text, odd indices placeholder keys
+        self.parts: List[str] = _EJS_PLACEHOLDER.split(content)
+
+    def render(self, parameters: Dict[str, Any]) -> str:
+        parts = self.parts
+        out = parts[:]
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            out[i] = str(parameters[key]) if key in parameters else f"<%= {key} %>"
+        return "".join(out)
+
+
+_TEMPLATE_CACHE: Dict[Path, Tuple[int, int, CompiledTemplate]] = {}
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+def _compiled_template(template_file: Path) -> CompiledTemplate:
+    """Compiled form of *template_file*, re-read only when its mtime or size changes."""
+    st = template_file.stat()
+    cached = _TEMPLATE_CACHE.get(template_file)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        metric_counter("weaver_forge.template_cache.hits")(1)
+        return cached[2]
+
+    compiled = CompiledTemplate(template_file.read_text())
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE[template_file] = (st.st_mtime_ns, st.st_size, compiled)
+    metric_counter("weaver_forge.template_cache.misses")(1)
+    return compiled
+
+
 def _generate_file_from_template(
     template_file: Path,
     parameters: Dict[str, Any],
@@ -1049,12 +1098,8 @@ def _generate_file_from_template(
     dry_run: bool
 ) -> Optional[Dict[str, Any]]:
     """Generate file from template."""
-    # Read template content
-    with open(template_file, 'r') as f:
-        template_content = f.read()
-    
-    # Process template with EJS-like syntax
-    processed_content = _process_ejs_template(template_content, parameters)
+    # Render the cached, pre-parsed template
+    processed_content = _compiled_template(template_file).render(parameters)
     
     # Determine output file path
     relative_path = template_file.relative_to(template_file.parents[1])
@@ -1083,16 +1128,7 @@ def _generate_file_from_template(
 
 def _process_ejs_template(content: str, parameters: Dict[str, Any]) -> str:
     """Process EJS-like template."""
-    # Simple EJS-like template processing
-    # In a real implementation, you'd use a proper EJS engine
-    
-    processed_content = content
-    
-    for key, value in parameters.items():
-        placeholder = f"<%= {key} %>"
-        processed_content = processed_content.replace(placeholder, str(value))
-    
-    return processed_content
+    return CompiledTemplate(content).render(parameters)
 
 
 def _update_template_usage(template_name: str):
@@ -1504,20 +1540,30 @@ def _find_weaver_forge_path() -> Path:
     return Path.cwd() / ".weaver-forge"
 
 
+_AI_ENABLED_CACHE: Dict[Path, Tuple[int, bool]] = {}
+
+
 def _is_ai_enabled() -> bool:
-    """Check if AI is enabled."""
+    """Check if AI is enabled (config re-read only when it changes)."""
     weaver_forge_path = _find_weaver_forge_path()
     config_path = weaver_forge_path / "config.yaml"
     
-    if not config_path.exists():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
         return True  # Default to enabled
+    cached = _AI_ENABLED_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     
     try:
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
-            return config.get("ai_enabled", True)
+            enabled = config.get("ai_enabled", True)
     except Exception:
-        return True
+        enabled = True
+    _AI_ENABLED_CACHE[config_path] = (mtime, enabled)
+    return enabled
 
 
 def _get_detailed_template_stats() -> Dict[str, Any]:
@@ -1542,16 +1588,23 @@ def generate_bulk_from_templates(
     generation_specs: List[Dict[str, Any]],
     output_path: Optional[Path] = None,
     parallel: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Generate multiple items from templates in bulk.
     
+    With ``parallel=True`` and at least :data:`BULK_PARALLEL_THRESHOLD` specs,
+    templates are rendered in a process pool and the outputs written
+    afterwards, each distinct path once (the last spec wins, as in a
+    sequential run).
+    
     Args:
         generation_specs: List of generation specifications
         output_path: Base output path for all generations
         parallel: Whether to run generations in parallel
         dry_run: Show what would be generated without creating files
+        max_workers: Worker processes for parallel generation (default: CPU count)
         
     Returns:
         Bulk generation result with summary and individual results
@@ -1570,32 +1623,51 @@ def generate_bulk_from_templates(
         results = []
         errors = []
         total_files = 0
-        
-        if parallel:
-            # Parallel generation using asyncio
-            async def _generate_parallel():
-                tasks = []
-                for spec in generation_specs:
-                    task = asyncio.create_task(_generate_single_async(spec, output_path, dry_run))
-                    tasks.append(task)
-                
-                return await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Run parallel generation
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                parallel_results = loop.run_until_complete(_generate_parallel())
-                for result in parallel_results:
-                    if isinstance(result, Exception):
-                        errors.append(str(result))
-                    else:
-                        results.append(result)
-                        total_files += len(result.get("files", []))
-            finally:
-                loop.close()
+        writes_deduplicated = 0
+        
+        if parallel and len(generation_specs) >= BULK_PARALLEL_THRESHOLD:
+            # Render in worker processes, then write every output path once
+            workers = max_workers or os.cpu_count() or 1
+            chunk_size = max(1, -(-len(generation_specs) // (workers * 4)))
+            chunks = [
+                generation_specs[i:i + chunk_size]
+                for i in range(0, len(generation_specs), chunk_size)
+            ]
+            pending_writes: Dict[str, str] = {}
+            rendered: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+            rendered_files = 0
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for chunk, chunk_results in zip(chunks, pool.map(_render_specs, chunks, [output_path] * len(chunks))):
+                    for spec, result in zip(chunk, chunk_results):
+                        if isinstance(result, str):
+                            errors.append(result)
+                            continue
+                        if not dry_run:
+                            for file_info in result.get("files", []):
+                                pending_writes[file_info["path"]] = file_info.pop("content")
+                                file_info["type"] = "created"
+                                rendered_files += 1
+                        rendered.append((spec, result))
+            failed_writes: Dict[str, OSError] = {}
+            if pending_writes:
+                writes_deduplicated = rendered_files - len(pending_writes)
+                failed_writes = _write_files(pending_writes)
+            for spec, result in rendered:
+                # A spec fails like any other generation error if one of its files was not written
+                error = next(
+                    (failed_writes[f["path"]] for f in result.get("files", []) if f["path"] in failed_writes),
+                    None
+                )
+                if error is not None:
+                    errors.append(f"Error generating {spec.get('template', 'unknown')} {spec.get('name', 'unknown')}: {error}")
+                    record_exception(error)
+                    continue
+                results.append(result)
+                total_files += len(result.get("files", []))
+            current_span.set_attribute("weaver_forge.workers", workers)
         else:
-            # Sequential generation
+            # Sequential generation (also used for small parallel batches,
+            # where process start-up would dominate)
             for spec in generation_specs:
                 try:
                     result = generate_from_template(
@@ -1637,20 +1709,66 @@ def generate_bulk_from_templates(
             "results": results,
             "errors": errors,
             "parallel": parallel,
-            "dry_run": dry_run
+            "dry_run": dry_run,
+            "writes_deduplicated": writes_deduplicated
         }
 
 
-async def _generate_single_async(spec: Dict[str, Any], output_path: Path, dry_run: bool) -> Dict[str, Any]:
-    """Generate a single item asynchronously."""
-    return generate_from_template(
-        template_name=spec["template"],
-        name=spec["name"],
-        output_path=output_path / spec.get("subdir", ""),
-        parameters=spec.get("parameters", {}),
-        interactive=False,
-        dry_run=dry_run
-    )
+def _render_specs(specs: List[Dict[str, Any]], output_path: Path) -> List[Any]:
+    """
+    Render a chunk of generation specs without writing (process-pool worker).
+    
+    Returns one entry per spec: the dry-run generation result, whose files
+    carry their ``content``, or an error message.
+    """
+    rendered: List[Any] = []
+    for spec in specs:
+        try:
+            rendered.append(generate_from_template(
+                template_name=spec["template"],
+                name=spec["name"],
+                output_path=output_path / spec.get("subdir", ""),
+                parameters=spec.get("parameters", {}),
+                interactive=False,
+                dry_run=True
+            ))
+        except Exception as e:
+            rendered.append(
+                f"Error generating {spec.get('template', 'unknown')} {spec.get('name', 'unknown')}: {e}"
+            )
+    return rendered
+
+
+def _write_files(contents: Dict[str, str]) -> Dict[str, OSError]:
+    """
+    Write each ``path -> content`` once, skipping files that already match.
+    
+    Returns the paths that could not be written, with their error.
+    """
+    for directory in {Path(path).parent for path in contents}:
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # reported per file below
+    
+    failures: Dict[str, OSError] = {}
+    
+    def write(item: Tuple[str, str]) -> None:
+        path, content = item
+        target = Path(path)
+        try:
+            if target.read_text() == content:
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
+        try:
+            target.write_text(content)
+        except OSError as e:
+            failures[path] = e
+    
+    with ThreadPoolExecutor(max_workers=min(32, len(contents))) as pool:
+        list(pool.map(write, contents.items()))
+    return failures
 
 
 def generate_bulk_scaffolds(
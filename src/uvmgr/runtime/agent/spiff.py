@@ -3,41 +3,79 @@ Execute BPMN workflows with SpiffWorkflow.
 
 Provides comprehensive OTEL instrumentation for workflow execution,
 including task-level tracing, performance metrics, and semantic conventions.
+
+Parsed process specs are cached by file content hash, so re-running or
+validating an unchanged workflow skips the BPMN parser. :func:`run_bpmn`
+steps in batches by default: each iteration runs every ready task under one
+``workflow.step_batch`` span instead of opening a span per task.
 """
 
 from __future__ import annotations
 
+import hashlib
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from SpiffWorkflow.bpmn.parser import BpmnParser
 from SpiffWorkflow.bpmn.workflow import BpmnWorkflow
-from SpiffWorkflow.task import Task
+from SpiffWorkflow.task import Task, TaskState
 
 from uvmgr.core.instrumentation import add_span_attributes, add_span_event
 from uvmgr.core.semconv import WorkflowAttributes, WorkflowOperations
 from uvmgr.core.shell import colour
 from uvmgr.core.telemetry import metric_counter, metric_histogram, span
 
+SPEC_CACHE_SIZE = 64
+"""Parsed process specs kept in memory (oldest evicted first)."""
+
+_SPECS: dict[tuple[str, str], Any] = {}
+_SPECS_LOCK = threading.Lock()
+
+
+def _parse_spec(path: Path) -> tuple[Any, bool]:
+    """
+    Parsed spec of the first process in *path* and whether it was cached.
+
+    Specs are keyed by resolved path and SHA-256 of the file contents, so an
+    edited file is parsed again. Parse errors propagate and are not cached.
+    """
+    data = path.read_bytes()
+    key = (str(path.resolve()), hashlib.sha256(data).hexdigest())
+    with _SPECS_LOCK:
+        spec = _SPECS.get(key)
+    if spec is not None:
+        metric_counter("workflow.spec_cache.hits")(1)
+        return spec, True
+
+    parser = BpmnParser()
+    parser.add_bpmn_file(str(path))
+
+    # Get the workflow specification name from the file
+    # Try to get the first available process spec
+    process_parsers = parser.process_parsers
+    if process_parsers:
+        process_id = list(process_parsers.keys())[0]
+        spec = parser.get_spec(process_id)
+    else:
+        # Fallback to empty string for legacy compatibility
+        spec = parser.get_spec("")
+
+    with _SPECS_LOCK:
+        while len(_SPECS) >= SPEC_CACHE_SIZE:
+            _SPECS.pop(next(iter(_SPECS)))
+        _SPECS[key] = spec
+    metric_counter("workflow.spec_cache.misses")(1)
+    return spec, False
+
 
 def _load(path: Path) -> BpmnWorkflow:
     """Load BPMN workflow from file with instrumentation."""
     with span("workflow.load", definition_path=str(path)):
         add_span_event("workflow.parsing.started", {"file_path": str(path)})
 
-        parser = BpmnParser()
-        parser.add_bpmn_file(str(path))
-
-        # Get the workflow specification name from the file
-        # Try to get the first available process spec
-        process_parsers = parser.process_parsers
-        if process_parsers:
-            process_id = list(process_parsers.keys())[0]
-            wf_spec = parser.get_spec(process_id)
-        else:
-            # Fallback to empty string for legacy compatibility
-            wf_spec = parser.get_spec("")
+        wf_spec, cached = _parse_spec(path)
         workflow = BpmnWorkflow(wf_spec)
 
         # Add workflow metadata to current span
@@ -45,11 +83,13 @@ def _load(path: Path) -> BpmnWorkflow:
             workflow_engine="SpiffWorkflow",
             workflow_definition_name=wf_spec.name or path.stem,
             workflow_instance_id=str(id(workflow)),
+            workflow_spec_cached=cached,
         )
 
         add_span_event("workflow.parsing.completed", {
             "workflow_name": wf_spec.name or path.stem,
-            "task_count": len(list(wf_spec.task_specs)),
+            "task_count": len(wf_spec.task_specs),
+            "cached": cached,
         })
 
         metric_counter("workflow.instances.created")(1)
@@ -57,6 +97,18 @@ def _load(path: Path) -> BpmnWorkflow:
         return workflow
 
 
+def _task_type(task: Task) -> str:
+    return "script" if hasattr(task.task_spec, "script") else "service"
+
+
+def _run_task(task: Task) -> None:
+    """Run an engine task; auto-complete manual (user) tasks."""
+    if task.task_spec.manual:
+        task.complete()
+    else:
+        task.run()
+
+
 def _step(wf: BpmnWorkflow) -> None:
     """Execute one step of workflow with detailed instrumentation."""
     with span("workflow.step"):
@@ -64,9 +116,9 @@ def _step(wf: BpmnWorkflow) -> None:
         tasks_processed = 0
 
         # Get next ready task and execute it
-        next_task = wf.get_next_task()
+        next_task = wf.get_next_task(state=TaskState.READY)
         if next_task:
-            task_type = "script" if hasattr(next_task.task_spec, "script") else "service"
+            task_type = _task_type(next_task)
             _process_task(wf, next_task, task_type)
             tasks_processed = 1
 
@@ -90,6 +142,51 @@ def _step(wf: BpmnWorkflow) -> None:
         metric_counter("workflow.tasks.processed")(tasks_processed)
 
 
+def _step_batch(wf: BpmnWorkflow) -> int:
+    """
+    Run every currently ready task under one span.
+
+    Tasks made ready by this batch wait for the next one. Returns the number
+    of tasks processed (0 when nothing was ready).
+    """
+    with span("workflow.step_batch"):
+        step_start = time.time()
+        counts = {"script": 0, "service": 0}
+
+        for task in wf.get_tasks(state=TaskState.READY):
+            if task.state != TaskState.READY:
+                continue  # settled by an earlier task of this batch
+            task_type = _task_type(task)
+            try:
+                _run_task(task)
+            except Exception as e:
+                add_span_event("task.failed", {
+                    "task_name": getattr(task.task_spec, "name", str(task)),
+                    "error": str(e),
+                })
+                metric_counter(f"workflow.task.{task_type}.failed")(1)
+                raise
+            counts[task_type] += 1
+
+        tasks_processed = sum(counts.values())
+        step_duration = time.time() - step_start
+
+        add_span_attributes(
+            tasks_processed=tasks_processed,
+            script_tasks=counts["script"],
+            service_tasks=counts["service"],
+            step_duration_ms=int(step_duration * 1000),
+        )
+
+        metric_histogram("workflow.step.duration")(step_duration)
+        metric_counter("workflow.tasks.processed")(tasks_processed)
+        for task_type, count in counts.items():
+            if count:
+                metric_counter(f"workflow.task.{task_type}.completed")(count)
+
+        return tasks_processed
+
+
 def _process_task(wf: BpmnWorkflow, task: Task, task_type: str) -> None:
     """Process a single workflow task with instrumentation."""
     task_name = getattr(task.task_spec, "name", str(task))
@@ -112,12 +209,9 @@ def _process_task(wf: BpmnWorkflow, task: Task, task_type: str) -> None:
             # Execute the task based on its type
             if task_type == "script":
                 colour(f"🔄 executing script task: {task_name}", "cyan")
-                # For script tasks, just complete them (SpiffWorkflow handles execution)
-                task.complete()
             else:
                 colour(f"↻ auto-completing service task: {task_name}", "cyan")
-                # For other tasks, complete directly
-                task.complete()
+            _run_task(task)
 
             task_duration = time.time() - task_start
 
@@ -139,11 +233,14 @@ def _process_task(wf: BpmnWorkflow, task: Task, task_type: str) -> None:
             raise
 
 
-def run_bpmn(path: Path) -> dict[str, Any]:
+def run_bpmn(path: Path, *, batch: bool = True, max_iterations: int = 10_000) -> dict[str, Any]:
     """Execute a BPMN workflow with comprehensive instrumentation.
     
     Args:
         path: Path to the BPMN file
+        batch: Run all ready tasks per iteration under one span; with
+            ``False`` each task gets its own step and spans
+        max_iterations: Iteration limit guarding against looping workflows
         
     Returns
     -------
@@ -159,6 +256,7 @@ def run_bpmn(path: Path) -> dict[str, Any]:
             WorkflowAttributes.DEFINITION_PATH: str(path),
             WorkflowAttributes.DEFINITION_NAME: path.stem,
             WorkflowAttributes.ENGINE: "SpiffWorkflow",
+            "workflow.batch": batch,
         }
     ):
         add_span_event("workflow.execution.started", {"file_path": str(path)})
@@ -167,19 +265,27 @@ def run_bpmn(path: Path) -> dict[str, Any]:
         wf = _load(path)
 
         steps = 0
-        total_tasks = 0
+        tasks_executed = 0
 
         try:
             # Execute workflow steps with safety mechanisms
-            max_iterations = 100  # Prevent infinite loops
             last_task_id = None
             iterations = 0
 
             while not wf.is_completed() and iterations < max_iterations:
                 iterations += 1
 
+                if batch:
+                    processed = _step_batch(wf)
+                    if not processed:
+                        add_span_event("workflow.no_ready_tasks", {"iteration": iterations})
+                        break
+                    steps += 1
+                    tasks_executed += processed
+                    continue
+
                 # Get next task for safety checking
-                next_task = wf.get_next_task()
+                next_task = wf.get_next_task(state=TaskState.READY)
                 if not next_task:
                     add_span_event("workflow.no_ready_tasks", {"iteration": iterations})
                     break
@@ -195,24 +301,12 @@ def run_bpmn(path: Path) -> dict[str, Any]:
                     break
 
                 last_task_id = current_task_id
-                all_tasks_before = len(list(wf.get_tasks()))
 
                 # Execute step
                 _step(wf)
 
-                all_tasks_after = len(list(wf.get_tasks()))
                 steps += 1
-                total_tasks += all_tasks_after
-
-                # Add progress update
-                add_span_event("workflow.step.completed", {
-                    "step_number": steps,
-                    "iteration": iterations,
-                    "total_tasks": all_tasks_after,
-                })
-
-                # Safety: Add small delay to prevent CPU spinning
-                time.sleep(0.001)
+                tasks_executed += 1
 
             if iterations >= max_iterations:
                 add_span_event("workflow.max_iterations_reached", {
@@ -225,7 +319,6 @@ def run_bpmn(path: Path) -> dict[str, Any]:
             # Final workflow state
             final_tasks = list(wf.get_tasks())
             # Count tasks by state using SpiffWorkflow states
-            from SpiffWorkflow.task import TaskState
             completed_tasks = [t for t in final_tasks if t.state == TaskState.COMPLETED]
             failed_tasks = [t for t in final_tasks if t.state == TaskState.CANCELLED]
 
@@ -233,6 +326,7 @@ def run_bpmn(path: Path) -> dict[str, Any]:
                 "status": "completed",
                 "duration_seconds": execution_duration,
                 "steps_executed": steps,
+                "tasks_executed": tasks_executed,
                 "total_tasks": len(final_tasks),
                 "completed_tasks": len(completed_tasks),
                 "failed_tasks": len(failed_tasks),
@@ -251,7 +345,7 @@ def run_bpmn(path: Path) -> dict[str, Any]:
             metric_counter("workflow.executions.completed")(1)
 
             colour("✔ BPMN workflow completed", "green")
-            colour(f"  Duration: {execution_duration:.2f}s, Steps: {steps}, Tasks: {len(completed_tasks)}", "blue")
+            colour(f"  Duration: {execution_duration:.2f}s, Steps: {steps}, Tasks: {tasks_executed}", "blue")
 
             return stats
 
@@ -281,9 +375,6 @@ def get_workflow_stats(wf: BpmnWorkflow) -> dict[str, Any]:
         start_time = time.time()
         all_tasks = list(wf.get_tasks())
 
-        # Import TaskState for proper state checking
-        from SpiffWorkflow.task import TaskState
-
         # Calculate stats with detailed breakdown
         completed_tasks = [t for t in all_tasks if t.state == TaskState.COMPLETED]
         ready_tasks = [t for t in all_tasks if t.state == TaskState.READY]
@@ -326,17 +417,7 @@ def validate_bpmn_file(path: Path) -> bool:
     """Validate a BPMN file can be loaded successfully."""
     with span("workflow.validate", definition_path=str(path)):
         try:
-            parser = BpmnParser()
-            parser.add_bpmn_file(str(path))
-
-            # Try to get the first available process spec
-            process_parsers = parser.process_parsers
-            if process_parsers:
-                process_id = list(process_parsers.keys())[0]
-                spec = parser.get_spec(process_id)
-            else:
-                # Fallback to empty string for legacy compatibility
-                spec = parser.get_spec("")
+            spec, _ = _parse_spec(path)
 
             add_span_event("workflow.validation.success", {
                 "workflow_name": spec.name or path.stem,
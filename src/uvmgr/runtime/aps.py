@@ -18,13 +18,27 @@ Key Features:
 - Automatic job failure recovery
 - Dynamic scheduling adaptation
 - Comprehensive observability
+
+Execution and statistics:
+- Jobs run on the scheduler's event loop (``AsyncIOExecutor``); coroutine
+  job functions are awaited directly, plain functions go to a worker thread.
+- A job never overlaps itself: APScheduler coalesces missed runs and skips a
+  run while the previous one is in flight; such skips are counted per job.
+- Every job keeps a :class:`~uvmgr.core.streaming_stats.RollingStats`
+  (count, EWMA, p50/p95 via t-digest) instead of a duration list. The stats
+  are written to a ``uvmgr_job_stats`` table in the jobstore database and
+  reloaded on start, so optimization passes cost O(jobs) and memory stays
+  bounded however long the scheduler runs.
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
+import json
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -34,9 +48,15 @@ from typing import Any, Dict, List, Optional, Callable, Union
 try:
     from apscheduler.schedulers.asyncio import AsyncIOScheduler
     from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-    from apscheduler.executors.pool import ThreadPoolExecutor
-    from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
+    from apscheduler.executors.asyncio import AsyncIOExecutor
+    from apscheduler.events import (
+        EVENT_JOB_ERROR,
+        EVENT_JOB_EXECUTED,
+        EVENT_JOB_MAX_INSTANCES,
+        EVENT_JOB_MISSED,
+    )
     from apscheduler.job import Job
+    from sqlalchemy import Column, Float, MetaData, Table, Text, Unicode, create_engine, delete, insert, select
     APS_AVAILABLE = True
 except ImportError:
     APS_AVAILABLE = False
@@ -44,9 +64,16 @@ except ImportError:
 from uvmgr.core.agi_reasoning import observe_with_agi_reasoning
 from uvmgr.core.agi_memory import get_persistent_memory
 from uvmgr.core.semconv import CliAttributes
+from uvmgr.core.streaming_stats import RollingStats
 from uvmgr.core.telemetry import span, metric_counter, metric_histogram
 from uvmgr.core.paths import CONFIG_DIR
 
+STATS_TABLE = "uvmgr_job_stats"
+"""Table holding per-job rolling statistics, in the jobstore database."""
+
+STATS_FLUSH_INTERVAL = 30.0
+"""Seconds between writes of changed job statistics."""
+
 
 class JobStatus(Enum):
     """Job execution status."""
@@ -114,20 +141,26 @@ class IntelligentScheduler:
     def __init__(self, jobstore_url: Optional[str] = None):
         self.scheduler: Optional[Any] = None
         self.job_registry: Dict[str, ScheduledJob] = {}
-        self.execution_history: List[JobExecutionResult] = []
         self.job_functions: Dict[str, Callable] = {}
         
-        # Performance tracking
-        self.performance_metrics: Dict[str, List[float]] = {}
-        self.adaptive_schedules: Dict[str, Dict[str, Any]] = {}
-        
         # Settings
         self.enable_agi_optimization = True
         self.optimization_interval = 3600  # 1 hour
         self.max_execution_history = 1000
         
+        # Performance tracking: recent results only, O(1) statistics per job
+        self.execution_history: deque[JobExecutionResult] = deque(maxlen=self.max_execution_history)
+        self.job_stats: Dict[str, RollingStats] = {}
+        self.adaptive_schedules: Dict[str, Dict[str, Any]] = {}
+        self._in_flight: set[str] = set()
+        self._dirty_stats: set[str] = set()
+        self._last_flush = time.monotonic()
+        self._engine: Optional[Any] = None
+        self._stats_table: Optional[Any] = None
+        
         # Initialize jobstore
         self.jobstore_url = jobstore_url or f"sqlite:///{CONFIG_DIR}/scheduler.db"
+        _schedulers[self.jobstore_url] = self
         
         # Initialize if APScheduler is available
         if APS_AVAILABLE:
@@ -138,20 +171,31 @@ class IntelligentScheduler:
     def _initialize_scheduler(self):
         """Initialize the APScheduler."""
         try:
-            # Configure job stores
+            # Configure job stores; job statistics live in the same database
+            self._engine = create_engine(self.jobstore_url)
             jobstores = {
-                'default': SQLAlchemyJobStore(url=self.jobstore_url)
+                'default': SQLAlchemyJobStore(engine=self._engine)
             }
+            self._stats_table = Table(
+                STATS_TABLE,
+                MetaData(),
+                Column("job_id", Unicode(191), primary_key=True),
+                Column("stats", Text, nullable=False),
+                Column("updated_at", Float, nullable=False),
+            )
+            self._stats_table.create(self._engine, checkfirst=True)
+            self._load_stats()
             
-            # Configure executors
+            # Configure executors: jobs run on the event loop, sync job
+            # functions are moved to a worker thread by the wrapper
             executors = {
-                'default': ThreadPoolExecutor(max_workers=20),
+                'default': AsyncIOExecutor(),
             }
             
-            # Job defaults
+            # Job defaults: collapse missed runs and never overlap a job with itself
             job_defaults = {
                 'coalesce': True,
-                'max_instances': 3,
+                'max_instances': 1,
                 'misfire_grace_time': 300
             }
             
@@ -166,6 +210,7 @@ class IntelligentScheduler:
             self.scheduler.add_listener(self._job_executed_listener, EVENT_JOB_EXECUTED)
             self.scheduler.add_listener(self._job_error_listener, EVENT_JOB_ERROR)
             self.scheduler.add_listener(self._job_missed_listener, EVENT_JOB_MISSED)
+            self.scheduler.add_listener(self._job_overlap_listener, EVENT_JOB_MAX_INSTANCES)
             
             # Initialize built-in job functions
             self._initialize_job_functions()
@@ -228,21 +273,15 @@ class IntelligentScheduler:
                 return optimization_results
         
         async def cleanup_job():
-            """Clean up old execution history."""
+            """Drop statistics of removed jobs and flush the rest."""
             with span("scheduler.cleanup"):
                 start_time = time.time()
                 
-                # Keep only recent history
-                if len(self.execution_history) > self.max_execution_history:
-                    self.execution_history = self.execution_history[-self.max_execution_history:]
-                
-                # Clean up old performance metrics
-                cutoff_time = time.time() - 86400 * 7  # 7 days
-                for job_id in self.performance_metrics:
-                    self.performance_metrics[job_id] = [
-                        metric for metric in self.performance_metrics[job_id]
-                        if metric > cutoff_time
-                    ]
+                # History is a bounded deque; only stats of removed jobs remain to prune
+                for job_id in set(self.job_stats) - set(self.job_registry):
+                    del self.job_stats[job_id]
+                    self._dirty_stats.add(job_id)
+                await asyncio.to_thread(self._flush_stats)
                 
                 duration = time.time() - start_time
                 metric_histogram("scheduler.cleanup.duration")(duration)
@@ -299,6 +338,7 @@ class IntelligentScheduler:
         with span("scheduler.stop"):
             try:
                 self.scheduler.shutdown(wait=True)
+                self._flush_stats()
                 
                 observe_with_agi_reasoning(
                     attributes={
@@ -382,29 +422,32 @@ class IntelligentScheduler:
                 # Add to APScheduler based on schedule type
                 if schedule_type == ScheduleType.INTERVAL:
                     self.scheduler.add_job(
-                        func=self._execute_job_wrapper,
+                        func=_run_scheduled_job,
                         trigger='interval',
-                        args=[job_id],
+                        args=[self.jobstore_url, job_id],
                         id=job_id,
                         name=name,
+                        replace_existing=True,
                         **schedule_config
                     )
                 elif schedule_type == ScheduleType.CRON:
                     self.scheduler.add_job(
-                        func=self._execute_job_wrapper,
+                        func=_run_scheduled_job,
                         trigger='cron',
-                        args=[job_id],
+                        args=[self.jobstore_url, job_id],
                         id=job_id,
                         name=name,
+                        replace_existing=True,
                         **schedule_config
                     )
                 elif schedule_type == ScheduleType.DATE:
                     self.scheduler.add_job(
-                        func=self._execute_job_wrapper,
+                        func=_run_scheduled_job,
                         trigger='date',
-                        args=[job_id],
+                        args=[self.jobstore_url, job_id],
                         id=job_id,
                         name=name,
+                        replace_existing=True,
                         **schedule_config
                     )
                 
@@ -439,8 +482,14 @@ class IntelligentScheduler:
             print(f"⚠️  Job {job_id} not found in registry")
             return
         
+        # A run that starts while the previous one is still going is dropped
+        if job_id in self._in_flight:
+            self._record_coalesced(job_id)
+            return
+        
         scheduled_job = self.job_registry[job_id]
         start_time = time.time()
+        self._in_flight.add(job_id)
         
         with span("scheduler.execute_job", job_id=job_id, job_name=scheduled_job.name):
             
@@ -457,8 +506,13 @@ class IntelligentScheduler:
                 if not job_function:
                     raise ValueError(f"Job function '{scheduled_job.function}' not found")
                 
-                # Execute the job
-                execution_result = await job_function(*scheduled_job.args, **scheduled_job.kwargs)
+                # Coroutines run on the loop; blocking functions go to a worker thread
+                if inspect.iscoroutinefunction(job_function):
+                    execution_result = await job_function(*scheduled_job.args, **scheduled_job.kwargs)
+                else:
+                    execution_result = await asyncio.to_thread(
+                        job_function, *scheduled_job.args, **scheduled_job.kwargs
+                    )
                 
                 # Job completed successfully
                 end_time = time.time()
@@ -469,9 +523,6 @@ class IntelligentScheduler:
                 result.duration = duration
                 result.result = execution_result
                 
-                # Track performance
-                self._track_job_performance(job_id, duration)
-                
                 metric_counter("scheduler.jobs_completed")(1)
                 metric_histogram("scheduler.job_duration")(duration)
                 
@@ -487,9 +538,14 @@ class IntelligentScheduler:
                 metric_counter("scheduler.jobs_failed")(1)
                 
                 print(f"❌ Job '{scheduled_job.name}' failed: {e}")
+            finally:
+                self._in_flight.discard(job_id)
             
-            # Store execution result
+            # Track performance and store execution result
+            self._track_job_performance(job_id, result.duration, ok=result.status == JobStatus.COMPLETED)
             self.execution_history.append(result)
+            if time.monotonic() - self._last_flush >= STATS_FLUSH_INTERVAL:
+                await asyncio.to_thread(self._flush_stats)
             
             # Observe job execution
             observe_with_agi_reasoning(
@@ -502,16 +558,54 @@ class IntelligentScheduler:
                 context={"scheduler": True, "job_execution": True, "autonomous": True}
             )
     
-    def _track_job_performance(self, job_id: str, duration: float):
-        """Track job performance metrics."""
-        if job_id not in self.performance_metrics:
-            self.performance_metrics[job_id] = []
-        
-        self.performance_metrics[job_id].append(duration)
+    def _track_job_performance(self, job_id: str, duration: float, ok: bool = True):
+        """Fold one execution into the job's rolling statistics."""
+        stats = self.job_stats.get(job_id)
+        if stats is None:
+            stats = self.job_stats[job_id] = RollingStats()
+        stats.add(duration, ok=ok, at=time.time())
+        self._dirty_stats.add(job_id)
+    
+    def _record_coalesced(self, job_id: str):
+        """Count a run skipped because the job was still running."""
+        stats = self.job_stats.get(job_id)
+        if stats is None:
+            stats = self.job_stats[job_id] = RollingStats()
+        stats.coalesced += 1
+        self._dirty_stats.add(job_id)
+        metric_counter("scheduler.jobs_coalesced")(1)
+    
+    def _load_stats(self):
+        """Load persisted job statistics from the jobstore database."""
+        with self._engine.connect() as conn:
+            rows = conn.execute(select(self._stats_table.c.job_id, self._stats_table.c.stats))
+            for job_id, payload in rows:
+                try:
+                    self.job_stats[job_id] = RollingStats.from_dict(json.loads(payload))
+                except (ValueError, KeyError, TypeError):
+                    continue  # Unreadable row; start this job's stats afresh
+    
+    def _flush_stats(self):
+        """Write statistics of jobs that changed since the last flush."""
+        self._last_flush = time.monotonic()
+        if not self._dirty_stats or self._engine is None:
+            return
         
-        # Keep only recent metrics (last 100 executions)
-        if len(self.performance_metrics[job_id]) > 100:
-            self.performance_metrics[job_id] = self.performance_metrics[job_id][-100:]
+        dirty, self._dirty_stats = self._dirty_stats, set()
+        table = self._stats_table
+        now = time.time()
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(delete(table).where(table.c.job_id.in_(dirty)))
+                rows = [
+                    {"job_id": job_id, "stats": json.dumps(self.job_stats[job_id].to_dict()), "updated_at": now}
+                    for job_id in dirty if job_id in self.job_stats
+                ]
+                if rows:
+                    conn.execute(insert(table), rows)
+        except Exception as e:
+            self._dirty_stats |= dirty
+            print(f"⚠️  Failed to persist job statistics: {e}")
     
     async def _optimize_schedules_with_agi(self) -> Dict[str, Any]:
         """Use AGI to optimize job schedules based on performance."""
@@ -522,18 +616,14 @@ class IntelligentScheduler:
             "performance_improvements": []
         }
         
-        # Analyze each job's performance
+        # Analyze each job's performance: O(1) per job from the rolling stats
         for job_id, scheduled_job in self.job_registry.items():
-            if job_id not in self.performance_metrics:
-                continue
-            
-            durations = self.performance_metrics[job_id]
-            if len(durations) < 5:  # Need sufficient data
+            stats = self.job_stats.get(job_id)
+            if stats is None or stats.count < 5:  # Need sufficient data
                 continue
             
-            # Calculate performance statistics
-            avg_duration = sum(durations) / len(durations)
-            recent_duration = sum(durations[-5:]) / 5  # Last 5 executions
+            avg_duration = stats.mean
+            recent_duration = stats.ewma
             
             # Check if performance is degrading
             if recent_duration > avg_duration * 1.5:  # 50% increase
@@ -594,18 +684,8 @@ class IntelligentScheduler:
         # Update the schedule if it changed
         if current_config != scheduled_job.schedule_config:
             try:
-                # Remove old job
-                self.scheduler.remove_job(scheduled_job.id)
-                
-                # Add job with new schedule
-                self.scheduler.add_job(
-                    func=self._execute_job_wrapper,
-                    trigger='interval',
-                    args=[scheduled_job.id],
-                    id=scheduled_job.id,
-                    name=scheduled_job.name,
-                    **current_config
-                )
+                # Swap the trigger in place; the job keeps its id and store row
+                self.scheduler.reschedule_job(scheduled_job.id, trigger='interval', **current_config)
                 
                 # Update registry
                 scheduled_job.schedule_config = current_config
@@ -645,13 +725,17 @@ class IntelligentScheduler:
         job_id = event.job_id
         metric_counter(f"scheduler.job_missed.{job_id}")(1)
     
+    def _job_overlap_listener(self, event):
+        """Handle runs skipped because the job was still running."""
+        self._record_coalesced(event.job_id)
+    
     def register_job_function(self, name: str, function: Callable):
         """Register a job function."""
         self.job_functions[name] = function
     
     def get_scheduler_stats(self) -> Dict[str, Any]:
         """Get comprehensive scheduler statistics."""
-        if not self.execution_history:
+        if not self.job_stats:
             return {
                 "status": "running" if (self.scheduler and self.scheduler.running) else "stopped",
                 "total_jobs": len(self.job_registry),
@@ -660,13 +744,14 @@ class IntelligentScheduler:
                 "aps_available": APS_AVAILABLE
             }
         
-        total_executions = len(self.execution_history)
-        successful = len([e for e in self.execution_history if e.status == JobStatus.COMPLETED])
-        failed = len([e for e in self.execution_history if e.status == JobStatus.FAILED])
-        
-        # Calculate average durations
-        durations = [e.duration for e in self.execution_history if e.duration]
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
+        # Lifetime totals from the rolling stats, not just the recent history
+        total_executions = sum(s.count for s in self.job_stats.values())
+        failed = sum(s.failures for s in self.job_stats.values())
+        successful = total_executions - failed
+        avg_duration = (
+            sum(s.mean * s.count for s in self.job_stats.values()) / total_executions
+            if total_executions else 0.0
+        )
         
         return {
             "status": "running" if (self.scheduler and self.scheduler.running) else "stopped",
@@ -675,8 +760,10 @@ class IntelligentScheduler:
             "total_executions": total_executions,
             "successful_executions": successful,
             "failed_executions": failed,
+            "coalesced_runs": sum(s.coalesced for s in self.job_stats.values()),
             "success_rate": (successful / total_executions) * 100 if total_executions > 0 else 0.0,
             "average_duration": avg_duration,
+            "jobs": {job_id: stats.summary() for job_id, stats in self.job_stats.items()},
             "agi_optimization_enabled": self.enable_agi_optimization,
             "jobstore_url": self.jobstore_url,
             "aps_available": APS_AVAILABLE
@@ -686,6 +773,16 @@ class IntelligentScheduler:
 # Global scheduler instance
 _intelligent_scheduler = None
 
+# Live schedulers by jobstore URL, so persisted jobs can find their owner
+_schedulers: Dict[str, IntelligentScheduler] = {}
+
+
+async def _run_scheduled_job(jobstore_url: str, job_id: str):
+    """Job entry point stored in the jobstore (bound methods cannot be pickled)."""
+    scheduler = _schedulers.get(jobstore_url) or get_intelligent_scheduler()
+    await scheduler._execute_job_wrapper(job_id)
+
+
 def get_intelligent_scheduler() -> IntelligentScheduler:
     """Get the global intelligent scheduler."""
     global _intelligent_scheduler
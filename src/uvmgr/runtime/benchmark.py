@@ -0,0 +1,290 @@
+"""
+Benchmark suite runtime.
+
+Runs uvmgr's latency-critical operations repeatedly and summarises the
+distribution instead of a single timing: every benchmark gets warmup runs,
+*N* measured repetitions (timed by
+:func:`uvmgr.runtime.performance.measure_operation`), and reports the median,
+interquartile range (IQR), p95, CPU seconds and peak RSS.
+
+Results are stored per host under ``.uvmgr/bench/<host>.json`` in the
+project, so a later run on the same machine can be compared against them and
+CI can fail when a benchmark regresses. A benchmark counts as regressed when
+its median is more than the allowed percentage above the baseline median
+*and* above the baseline's upper quartile, so run-to-run noise inside the
+baseline's own spread does not fail a build.
+
+Child processes are reaped with ``os.wait4`` so CPU time and peak RSS are
+those of the benchmarked command itself, not of this process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import psutil
+
+from uvmgr.core.telemetry import metric_histogram, span
+from uvmgr.runtime.performance import measure_operation
+
+BASELINE_DIR = Path(".uvmgr") / "bench"
+"""Baseline directory, relative to the project root."""
+
+DEFAULT_BENCHMARKS = ["cold-start", "deps", "search", "test-discovery", "lint"]
+"""Benchmarks run when none are named; the commands CI gates on."""
+
+ALIASES = {"startup": "cold-start", "tests": "test-discovery"}
+"""Older benchmark names accepted by ``uvmgr performance benchmark``."""
+
+
+@dataclass
+class BenchmarkSpec:
+    """One benchmark: a command line to spawn or an in-process callable."""
+    name: str
+    description: str
+    argv: Optional[List[str]] = None
+    func: Optional[Callable[[], Any]] = None
+    timeout: float = 120.0
+
+
+@dataclass
+class BenchmarkResult:
+    """Distribution of one benchmark's measured runs (seconds, bytes)."""
+    name: str
+    samples: List[float]
+    runs: int
+    failures: int = 0
+    median: Optional[float] = None
+    q1: Optional[float] = None
+    q3: Optional[float] = None
+    iqr: Optional[float] = None
+    p95: Optional[float] = None
+    mean: Optional[float] = None
+    stdev: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    cpu_seconds: Optional[float] = None  # median per run
+    max_rss: Optional[int] = None        # largest peak RSS of any run
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.samples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> BenchmarkResult:
+        known = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+@dataclass
+class Comparison:
+    """A benchmark result measured against its stored baseline."""
+    name: str
+    baseline_median: float
+    current_median: float
+    change_pct: float
+    regression: bool
+
+
+def default_suite(project_path: Path) -> Dict[str, BenchmarkSpec]:
+    """The standard benchmarks for *project_path*; none of them modify it."""
+    from uvmgr.core.file_listing import FileListing, search_text
+
+    uvmgr = [sys.executable, "-m", "uvmgr"]
+
+    def search():
+        # A fresh listing each run: walk plus full scan, as a cold search pays
+        search_text(FileListing(project_path), "TODO", pattern="*.py")
+
+    return {
+        "cold-start": BenchmarkSpec("cold-start", "Interpreter start and CLI import", argv=[*uvmgr, "--version"]),
+        "deps": BenchmarkSpec("deps", "uvmgr deps list", argv=[*uvmgr, "deps", "list"]),
+        "search": BenchmarkSpec("search", "Project-wide text search", func=search),
+        "test-discovery": BenchmarkSpec("test-discovery", "uvmgr tests discover", argv=[*uvmgr, "tests", "discover", "--json"]),
+        # Read-only and exit 0 on findings: `uvmgr lint check` applies fixes
+        # under `[tool.ruff] fix = true` and fails every run of a dirty tree
+        "lint": BenchmarkSpec(
+            "lint", "ruff check (no fixes, no cache)",
+            argv=[sys.executable, "-m", "ruff", "check", "--no-fix", "--exit-zero", "--no-cache", "."],
+        ),
+    }
+
+
+def summarize(samples: Iterable[float]) -> Dict[str, Optional[float]]:
+    """Median, quartiles, IQR, p95, mean, stdev and range of *samples*."""
+    values = sorted(samples)
+    if not values:
+        return {k: None for k in ("median", "q1", "q3", "iqr", "p95", "mean", "stdev", "min", "max")}
+    q1, median, q3 = (_percentile(values, q) for q in (0.25, 0.5, 0.75))
+    return {
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "p95": _percentile(values, 0.95),
+        "mean": statistics.fmean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min": values[0],
+        "max": values[-1],
+    }
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Linearly interpolated *q*-quantile of sorted *values*."""
+    pos = (len(values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def _run_child(argv: List[str], cwd: Path, timeout: float) -> tuple[float | None, int | None]:
+    """Run *argv* to completion; return its CPU seconds and peak RSS in bytes."""
+    proc = subprocess.Popen(argv, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not hasattr(os, "wait4"):
+        proc.wait(timeout=timeout)
+        if proc.returncode:
+            raise RuntimeError(f"{argv[0]} exited with {proc.returncode}")
+        return None, None
+
+    # Reap the child ourselves so its rusage is not lost to Popen.wait
+    killer = threading.Timer(timeout, proc.kill)
+    killer.start()
+    try:
+        _, status, usage = os.wait4(proc.pid, 0)
+    finally:
+        killer.cancel()
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise RuntimeError(f"{argv[0]} exited with {proc.returncode}")
+    rss_unit = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is KiB on Linux
+    return usage.ru_utime + usage.ru_stime, usage.ru_maxrss * rss_unit
+
+
+def run_benchmark(spec: BenchmarkSpec,
+                  project_path: Path,
+                  warmup: int = 1,
+                  repetitions: int = 10) -> BenchmarkResult:
+    """Measure *spec* with *warmup* discarded runs and *repetitions* timed ones."""
+    resources: List[tuple[float | None, int | None]] = []
+    process = psutil.Process()
+
+    def operation():
+        if spec.argv:
+            resources.append(_run_child(spec.argv, project_path, spec.timeout))
+        else:
+            cpu_start = time.process_time()
+            spec.func()
+            resources.append((time.process_time() - cpu_start, process.memory_info().rss))
+
+    with span("performance.benchmark", benchmark=spec.name, repetitions=repetitions):
+        try:
+            metrics = measure_operation(spec.name, operation, warmup_runs=warmup, measurement_runs=repetitions)
+            samples = metrics.durations
+        except RuntimeError:
+            samples = []
+
+        # Failed runs raise before recording, so the tail lines up with samples
+        measured = resources[len(resources) - len(samples):] if samples else []
+        cpu = [c for c, _ in measured if c is not None]
+        rss = [r for _, r in measured if r is not None]
+
+        result = BenchmarkResult(
+            name=spec.name,
+            samples=samples,
+            runs=repetitions,
+            failures=repetitions - len(samples),
+            cpu_seconds=statistics.median(cpu) if cpu else None,
+            max_rss=max(rss) if rss else None,
+            **summarize(samples),
+        )
+        if result.ok:
+            metric_histogram("performance.benchmark.duration")(result.median, {"benchmark": spec.name})
+        return result
+
+
+def run_suite(names: Iterable[str],
+              project_path: Path,
+              warmup: int = 1,
+              repetitions: int = 10,
+              on_result: Optional[Callable[[BenchmarkResult], None]] = None) -> Dict[str, BenchmarkResult]:
+    """Run the named benchmarks of :func:`default_suite` in order."""
+    suite = default_suite(project_path)
+    specs = []
+    for name in names:
+        name = ALIASES.get(name, name)
+        if name not in suite:
+            raise ValueError(f"Unknown benchmark '{name}' (available: {', '.join(suite)})")
+        specs.append(suite[name])
+
+    results = {}
+    for spec in specs:
+        results[spec.name] = run_benchmark(spec, project_path, warmup=warmup, repetitions=repetitions)
+        if on_result:
+            on_result(results[spec.name])
+    return results
+
+
+def host_key() -> str:
+    """File-name-safe identifier of this machine and interpreter."""
+    raw = f"{platform.node() or 'host'}-{sys.platform}-{platform.machine()}-py{sys.version_info[0]}{sys.version_info[1]}"
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", raw)
+
+
+def baseline_path(project_path: Path, host: Optional[str] = None) -> Path:
+    return project_path / BASELINE_DIR / f"{host or host_key()}.json"
+
+
+def save_baseline(results: Dict[str, BenchmarkResult], project_path: Path) -> Path:
+    """Store successful *results* as this host's baseline, keeping other entries."""
+    path = baseline_path(project_path)
+    stored = {name: r.to_dict() for name, r in (load_baseline(project_path) or {}).items()}
+    stored.update({name: r.to_dict() for name, r in results.items() if r.ok})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "host": host_key(),
+        "python": platform.python_version(),
+        "updated": time.time(),
+        "benchmarks": stored,
+    }, indent=2))
+    return path
+
+
+def load_baseline(project_path: Path) -> Optional[Dict[str, BenchmarkResult]]:
+    """This host's stored baseline, or ``None`` when there is none."""
+    path = baseline_path(project_path)
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return {name: BenchmarkResult.from_dict(entry) for name, entry in data.get("benchmarks", {}).items()}
+
+
+def compare_results(current: Dict[str, BenchmarkResult],
+                    baseline: Dict[str, BenchmarkResult],
+                    threshold_pct: float) -> List[Comparison]:
+    """Compare medians; flag regressions beyond *threshold_pct* and the baseline IQR."""
+    comparisons = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if not result.ok or base is None or not base.median:
+            continue
+        change = (result.median - base.median) / base.median * 100
+        regression = change > threshold_pct and result.median > (base.q3 if base.q3 is not None else base.median)
+        comparisons.append(Comparison(name, base.median, result.median, change, regression))
+    return comparisons
@@ -0,0 +1,420 @@
+"""
+Conversation index runtime.
+
+Full-text index over Claude conversation histories, kept in a SQLite FTS5
+table so searches are BM25-ranked index lookups instead of scans of every
+history.
+
+Three kinds of :class:`Source` feed the index:
+
+- ``sqlite``: a Claude ``conversations.db`` with a ``conversations`` table;
+  rows past the last ingested ``rowid`` are read when the file changes.
+- ``json``: a directory of ``*.json`` session histories (``messages`` with
+  ``content`` and ``timestamp``); a changed file is re-ingested whole.
+- ``metadata``: a directory of ``*.json`` session metadata files, each
+  indexed as one document.
+
+:func:`refresh` stats every source file and only ingests files whose
+``(mtime_ns, size)`` differ from the recorded ones, and drops files that
+disappeared, so refreshing an unchanged year of sessions costs one ``stat``
+per file.
+
+Messages are indexed as one document per session (per ingested batch for
+databases), so BM25 ranks sessions directly and scores one document per
+session instead of one per message. :func:`search` returns one hit per
+session, best score first, with a highlighted snippet of the best-matching
+passage, and pages with ``offset``/``limit``.
+
+All functions share one WAL-mode connection per index database.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from uvmgr.core.instrumentation import add_span_event
+from uvmgr.core.telemetry import span
+
+PREVIEW_CHARS = 200
+
+SQLITE_BATCH = 1000
+"""Rows read from a conversations database per document batch."""
+
+_DOCUMENT_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class Source:
+    """A conversation database (``sqlite``) or directory of JSON files."""
+    kind: str  # "sqlite", "json" or "metadata"
+    path: Path
+    project: Optional[str] = None
+
+
+def _get_index_db_path() -> Path:
+    """Get path to the conversation index database."""
+    index_dir = Path.home() / ".uvmgr" / "claude"
+    index_dir.mkdir(parents=True, exist_ok=True)
+    return index_dir / "conversations-index.db"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    origin TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    mtime_ns INTEGER,
+    size INTEGER,
+    watermark INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    origin TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    session_id TEXT,
+    project TEXT,
+    ts REAL,
+    message_count INTEGER NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_origin ON documents(origin);
+CREATE INDEX IF NOT EXISTS idx_documents_session ON documents(session_id);
+CREATE INDEX IF NOT EXISTS idx_documents_ts ON documents(ts);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    content, content='documents', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+"""
+
+_INSERT_SQL = """
+    INSERT INTO documents (origin, kind, session_id, project, ts, message_count, content)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_lock = threading.RLock()
+_conns: Dict[Path, sqlite3.Connection] = {}
+
+
+def _db() -> sqlite3.Connection:
+    """Return the process-wide connection, opening it (and the schema) once per path."""
+    db_path = _get_index_db_path()
+    conn = _conns.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _conns[db_path] = conn
+    return conn
+
+
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """Serialize use of the shared connection across threads."""
+    with _lock:
+        yield _db()
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    """Shared connection inside one write transaction."""
+    with _connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Ingestion
+# ──────────────────────────────────────────────────────────────────────────────
+
+def refresh(sources: Iterable[Source]) -> Dict[str, int]:
+    """
+    Bring the index up to date with *sources*.
+
+    Returns counts of ``ingested`` and ``removed`` files and ``messages``
+    added.
+    """
+    with span("claude.conversation_index.refresh"):
+        with _connection() as conn:
+            known = {
+                row[0]: row[1:]
+                for row in conn.execute("SELECT origin, scope, mtime_ns, size, watermark FROM sources")
+            }
+
+        changed: List[Tuple[Source, Path, int, int]] = []
+        removed: List[str] = []
+        for source in sources:
+            scope = str(source.path)
+            present = set()
+            for origin, mtime_ns, size in _source_files(source):
+                present.add(origin)
+                state = known.get(origin)
+                if state is None or state[1:3] != (mtime_ns, size):
+                    changed.append((source, Path(origin), mtime_ns, size))
+            removed.extend(o for o, state in known.items() if state[0] == scope and o not in present)
+
+        stats = {"ingested": len(changed), "removed": len(removed), "messages": 0}
+        if not changed and not removed:
+            return stats
+
+        with _transaction() as conn:
+            for origin in removed:
+                conn.execute("DELETE FROM documents WHERE origin = ?", (origin,))
+                conn.execute("DELETE FROM sources WHERE origin = ?", (origin,))
+            for source, path, mtime_ns, size in changed:
+                watermark = known.get(str(path), (None, None, None, 0))[3]
+                # A failed file must not leave the batches it already inserted behind
+                conn.execute("SAVEPOINT ingest")
+                try:
+                    added, watermark = _ingest(conn, source, path, watermark)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO ingest")
+                    conn.execute("RELEASE ingest")
+                    add_span_event("conversation_index_ingest_error", {"path": str(path), "error": str(e)})
+                    if source.kind == "sqlite":
+                        continue  # Possibly locked: retry on the next refresh
+                    # Unreadable JSON stays unindexed until the file changes
+                    conn.execute("DELETE FROM documents WHERE origin = ?", (str(path),))
+                    added, watermark = 0, 0
+                else:
+                    conn.execute("RELEASE ingest")
+                stats["messages"] += added
+                conn.execute(
+                    "INSERT OR REPLACE INTO sources (origin, scope, mtime_ns, size, watermark) VALUES (?, ?, ?, ?, ?)",
+                    (str(path), str(source.path), mtime_ns, size, watermark),
+                )
+
+        add_span_event("conversation_index_refreshed", stats)
+        return stats
+
+
+def _source_files(source: Source) -> List[Tuple[str, int, int]]:
+    """``(path, mtime_ns, size)`` of every file of *source*."""
+    if source.kind == "sqlite":
+        try:
+            st = source.path.stat()
+        except OSError:
+            return []
+        mtime_ns, size = st.st_mtime_ns, st.st_size
+        # Writes land in the WAL until a checkpoint, leaving the main file untouched
+        try:
+            wal = source.path.with_name(source.path.name + "-wal").stat()
+            mtime_ns, size = max(mtime_ns, wal.st_mtime_ns), size + wal.st_size
+        except OSError:
+            pass
+        return [(str(source.path), mtime_ns, size)]
+
+    files = []
+    try:
+        with os.scandir(source.path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    st = entry.stat()
+                    files.append((entry.path, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return []
+    return files
+
+
+def _ingest(conn: sqlite3.Connection, source: Source, path: Path, watermark: int) -> Tuple[int, int]:
+    """Index *path*; return the messages added and the new watermark."""
+    origin = str(path)
+    if source.kind == "sqlite":
+        return _ingest_sqlite(conn, path, watermark)
+
+    conn.execute("DELETE FROM documents WHERE origin = ?", (origin,))
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    if source.kind == "metadata":
+        conn.execute(_INSERT_SQL, (
+            origin, "metadata", data.get("id", path.stem), source.project,
+            _timestamp(data.get("created")), 1, json.dumps(data),
+        ))
+        return 1, 0
+
+    messages = [
+        msg for msg in data.get("messages", [])
+        if isinstance(msg.get("content"), str) and msg["content"]
+    ]
+    if messages:
+        conn.execute(_INSERT_SQL, (
+            origin, "json", data.get("session_id", path.stem), source.project,
+            _latest(_timestamp(msg.get("timestamp")) for msg in messages),
+            len(messages), _DOCUMENT_SEPARATOR.join(msg["content"] for msg in messages),
+        ))
+    return len(messages), 0
+
+
+def _ingest_sqlite(conn: sqlite3.Connection, path: Path, watermark: int) -> Tuple[int, int]:
+    origin = str(path)
+    src = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        (last,) = src.execute("SELECT COALESCE(MAX(rowid), 0) FROM conversations").fetchone()
+        if last < watermark:
+            # Database was replaced or rows were deleted: start over
+            conn.execute("DELETE FROM documents WHERE origin = ?", (origin,))
+            watermark = 0
+        cursor = src.execute(
+            "SELECT rowid, session_id, timestamp, message, project FROM conversations "
+            "WHERE rowid > ? ORDER BY rowid",
+            (watermark,),
+        )
+        added = 0
+        while batch := cursor.fetchmany(SQLITE_BATCH):
+            # New rows become one document per session and batch
+            sessions: Dict[Tuple[Any, Any], List[Tuple[Optional[float], str]]] = {}
+            for _, session_id, ts, message, project in batch:
+                if message:
+                    sessions.setdefault((session_id, project), []).append((_timestamp(ts), message))
+            conn.executemany(_INSERT_SQL, [
+                (
+                    origin, "sqlite", session_id, project,
+                    _latest(ts for ts, _ in messages), len(messages),
+                    _DOCUMENT_SEPARATOR.join(message for _, message in messages),
+                )
+                for (session_id, project), messages in sessions.items()
+            ])
+            added += sum(len(messages) for messages in sessions.values())
+            watermark = batch[-1][0]
+        return added, watermark
+    finally:
+        src.close()
+
+
+def _latest(timestamps: Iterable[Optional[float]]) -> Optional[float]:
+    return max((ts for ts in timestamps if ts is not None), default=None)
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Search
+# ──────────────────────────────────────────────────────────────────────────────
+
+def match_expression(query: str) -> str:
+    """FTS5 query matching every word of *query*, with operators neutralised."""
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
+
+
+_MATCH_SQL = """
+    WITH hits AS (
+        SELECT d.id, d.session_id, d.ts, bm25(documents_fts) AS score
+        FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid
+        WHERE documents_fts MATCH :match {filters}
+    ),
+    ranked AS (
+        SELECT id, score, ROW_NUMBER() OVER (PARTITION BY session_id ORDER BY score, ts DESC) AS rn
+        FROM hits
+    )
+    SELECT d.id, d.session_id, d.ts, d.project, d.kind, substr(d.content, 1, {preview}), r.score,
+           (SELECT SUM(c.message_count) FROM documents c WHERE c.session_id = d.session_id)
+    FROM ranked r JOIN documents d ON d.id = r.id
+    WHERE r.rn = 1
+    ORDER BY r.score, d.ts DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+_RECENT_SQL = """
+    WITH ranked AS (
+        SELECT d.id, d.ts, ROW_NUMBER() OVER (PARTITION BY d.session_id ORDER BY d.ts DESC) AS rn
+        FROM documents d
+        WHERE 1 {filters}
+    )
+    SELECT d.id, d.session_id, d.ts, d.project, d.kind, substr(d.content, 1, {preview}), NULL,
+           (SELECT SUM(c.message_count) FROM documents c WHERE c.session_id = d.session_id)
+    FROM ranked r JOIN documents d ON d.id = r.id
+    WHERE r.rn = 1
+    ORDER BY d.ts DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+
+def search(
+    query: str,
+    since: Optional[datetime] = None,
+    project: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 50,
+    highlight: Tuple[str, str] = ("**", "**"),
+    snippet_tokens: int = 16,
+) -> List[Dict[str, Any]]:
+    """
+    One page of sessions matching *query*, best match first.
+
+    Each result carries the best-matching message as ``preview`` and a
+    ``snippet`` with the matched terms wrapped in *highlight*. A query
+    without words lists the most recent sessions instead.
+    """
+    match = match_expression(query)
+    params: Dict[str, Any] = {"match": match, "limit": limit, "offset": offset}
+    filters = ""
+    if since is not None:
+        filters += " AND d.ts > :since"
+        params["since"] = since.timestamp()
+    if project:
+        filters += " AND d.project = :project"
+        params["project"] = project
+
+    with span("claude.conversation_index.search", query=query, offset=offset, limit=limit):
+        with _connection() as conn:
+            sql = (_MATCH_SQL if match else _RECENT_SQL).format(filters=filters, preview=PREVIEW_CHARS)
+            rows = conn.execute(sql, params).fetchall()
+
+            results = []
+            for row_id, session_id, ts, row_project, kind, preview, score, message_count in rows:
+                snippet = preview
+                if match:
+                    (snippet,) = conn.execute(
+                        "SELECT snippet(documents_fts, 0, ?, ?, '…', ?) FROM documents_fts "
+                        "WHERE documents_fts MATCH ? AND rowid = ?",
+                        (highlight[0], highlight[1], snippet_tokens, match, row_id),
+                    ).fetchone()
+                results.append({
+                    "session_id": session_id,
+                    "date": datetime.fromtimestamp(ts).strftime("%Y-%m-%d") if ts is not None else "",
+                    "timestamp": ts,
+                    "preview": preview,
+                    "snippet": snippet,
+                    "project": row_project,
+                    "source": kind,
+                    "score": -score if score is not None else None,
+                    "message_count": message_count,
+                })
+        return results
+
+
+def iter_search(query: str, page_size: int = 50, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """Stream every result of :func:`search`, fetching one page at a time."""
+    offset = 0
+    while True:
+        page = search(query, offset=offset, limit=page_size, **kwargs)
+        yield from page
+        if len(page) < page_size:
+            return
+        offset += page_size
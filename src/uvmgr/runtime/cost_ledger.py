@@ -0,0 +1,229 @@
+"""
+Cost ledger runtime.
+
+Append-only columnar storage for cost entries. Entries are written as Parquet
+files under ``<root>/month=YYYY-MM/`` (UTC month of the entry timestamp), and
+queries are Arrow scans: only the months overlapping the requested time range
+are opened, only the requested columns are read, and the timestamp filter is
+pushed down to Parquet row-group statistics. Rollups over the scanned table
+(:func:`total`, :func:`totals_by`) use ``pyarrow.compute`` kernels, so reports
+over millions of entries never build a Python object per entry.
+
+Every append writes one immutable ``part-*.parquet`` file. Once a month holds
+more than ``compact_after`` files they are merged into one ``compact-*.parquet``
+file whose schema metadata lists the files it replaces; readers skip replaced
+files, so a scan that races a compaction never counts an entry twice.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from uvmgr.core.telemetry import metric_counter, span
+
+SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("category", pa.string()),
+    ("description", pa.string()),
+    ("amount", pa.float64()),
+    ("unit", pa.string()),
+    ("timestamp", pa.float64()),  # seconds since the epoch
+    ("source", pa.string()),
+    ("project", pa.string()),
+    ("tags", pa.list_(pa.string())),
+    ("metadata", pa.string()),  # JSON object
+])
+
+COMPACT_AFTER = 32
+"""Part files a month may accumulate before they are merged."""
+
+STALE_LOCK_SECONDS = 600
+"""Age after which a compaction lock is assumed to belong to a dead process."""
+
+_REPLACES_KEY = b"uvmgr.replaces"
+
+
+def _month(timestamp: float) -> str:
+    return time.strftime("%Y-%m", time.gmtime(timestamp))
+
+
+class CostLedger:
+    """Month-partitioned Parquet ledger rooted at *root*."""
+
+    def __init__(self, root: Path, compact_after: int = COMPACT_AFTER):
+        self.root = Path(root)
+        self.compact_after = compact_after
+        self._replaces: Dict[Path, tuple[int, frozenset]] = {}
+
+    # ------------------------------------------------------------------ write
+
+    def append(self, rows: Iterable[Mapping[str, Any]] | pa.Table) -> int:
+        """Append entries (dicts with :data:`SCHEMA` fields, or a table)."""
+        table = rows if isinstance(rows, pa.Table) else self._rows_table(rows)
+        if not table.num_rows:
+            return 0
+
+        with span("cost.ledger.append", rows=table.num_rows):
+            micros = pc.cast(pc.multiply(table["timestamp"], 1_000_000), pa.int64(), safe=False)
+            months = pc.strftime(micros.cast(pa.timestamp("us")), format="%Y-%m")
+            for month in pc.unique(months).to_pylist():
+                part = table.filter(pc.equal(months, month))
+                directory = self.root / f"month={month}"
+                self._write(directory, f"part-{time.time_ns()}-{os.getpid()}.parquet", part)
+                if len(list(directory.glob("*.parquet"))) > self.compact_after:
+                    self.compact(month)
+
+        metric_counter("cost.ledger.rows_appended")(table.num_rows)
+        return table.num_rows
+
+    @staticmethod
+    def _rows_table(rows: Iterable[Mapping[str, Any]]) -> pa.Table:
+        records = []
+        for row in rows:
+            record = dict(row)
+            if not isinstance(record.get("metadata"), (str, type(None))):
+                record["metadata"] = json.dumps(record["metadata"])
+            records.append(record)
+        return pa.Table.from_pylist(records, schema=SCHEMA)
+
+    @staticmethod
+    def _write(directory: Path, name: str, table: pa.Table) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / name
+        tmp = directory / f".{name}.tmp"
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, path)
+        return path
+
+    def compact(self, month: str) -> Optional[Path]:
+        """Merge the live files of *month* into one; ``None`` if another process is at it."""
+        directory = self.root / f"month={month}"
+        lock = directory / ".compact.lock"
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # Left behind by a crashed compaction: clear it for the next append
+            try:
+                if time.time() - lock.stat().st_mtime > STALE_LOCK_SECONDS:
+                    lock.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            return None
+        os.close(fd)
+        try:
+            files = self._live_files(directory)
+            if len(files) < 2:
+                return None
+            with span("cost.ledger.compact", month=month, files=len(files)):
+                table = ds.dataset(files, schema=SCHEMA, format="parquet").to_table()
+                table = table.replace_schema_metadata({
+                    _REPLACES_KEY: json.dumps(sorted(p.name for p in files)).encode()
+                })
+                path = self._write(directory, f"compact-{time.time_ns()}.parquet", table)
+                for old in files:
+                    old.unlink(missing_ok=True)
+                    self._replaces.pop(old, None)
+            metric_counter("cost.ledger.compactions")(1)
+            return path
+        finally:
+            lock.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------- read
+
+    def months(self) -> List[str]:
+        """Months with stored entries, oldest first."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p.name.split("=", 1)[1] for p in self.root.glob("month=*") if p.is_dir())
+
+    def _live_files(self, directory: Path) -> List[Path]:
+        files = sorted(directory.glob("*.parquet"))
+        replaced: set = set()
+        for path in files:
+            if path.name.startswith("compact-"):
+                replaced |= self._replaced_by(path)
+        return [p for p in files if p.name not in replaced]
+
+    def _replaced_by(self, path: Path) -> frozenset:
+        # Compacted files are immutable, so the footer is read once per process
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return frozenset()
+        cached = self._replaces.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        metadata = pq.read_schema(path).metadata or {}
+        names = frozenset(json.loads(metadata.get(_REPLACES_KEY, b"[]")))
+        self._replaces[path] = (mtime, names)
+        return names
+
+    def files(self, start: Optional[float] = None, end: Optional[float] = None) -> List[Path]:
+        """Live Parquet files of the months overlapping ``[start, end]``."""
+        first = _month(start) if start is not None else None
+        last = _month(end) if end is not None else None
+        files = []
+        for month in self.months():
+            if (first and month < first) or (last and month > last):
+                continue
+            files.extend(self._live_files(self.root / f"month={month}"))
+        return files
+
+    def scan(self,
+             start: Optional[float] = None,
+             end: Optional[float] = None,
+             columns: Optional[List[str]] = None,
+             where: Optional[ds.Expression] = None) -> pa.Table:
+        """Entries with ``start <= timestamp <= end`` matching *where*, as a table."""
+        expr = where
+        if start is not None:
+            expr = _and(expr, ds.field("timestamp") >= start)
+        if end is not None:
+            expr = _and(expr, ds.field("timestamp") <= end)
+
+        with span("cost.ledger.scan", start=start or 0, end=end or 0):
+            for attempt in range(3):
+                files = self.files(start, end)
+                if not files:
+                    empty = SCHEMA.empty_table()
+                    return empty.select(columns) if columns else empty
+                try:
+                    return ds.dataset(files, schema=SCHEMA, format="parquet").to_table(
+                        columns=columns, filter=expr
+                    )
+                except FileNotFoundError:
+                    # A compaction removed a file after we listed it; list again
+                    if attempt == 2:
+                        raise
+
+    def count(self) -> int:
+        """Number of stored entries, from Parquet footers only."""
+        return sum(pq.ParquetFile(path).metadata.num_rows for path in self.files())
+
+
+def _and(left: Optional[ds.Expression], right: ds.Expression) -> ds.Expression:
+    return right if left is None else left & right
+
+
+def total(table: pa.Table, column: str = "amount") -> float:
+    """Sum of *column*, ``0.0`` for an empty table."""
+    if not table.num_rows:
+        return 0.0
+    return pc.sum(table[column]).as_py() or 0.0
+
+
+def totals_by(table: pa.Table, key: str, column: str = "amount") -> Dict[Any, float]:
+    """Sum of *column* per distinct value of *key*."""
+    if not table.num_rows:
+        return {}
+    grouped = table.group_by(key).aggregate([(column, "sum")])
+    return dict(zip(grouped[key].to_pylist(), grouped[f"{column}_sum"].to_pylist()))
@@ -6,20 +6,497 @@ Infrastructure execution for complete project automation:
 - Subprocess execution for automation workflows  
 - External tool integration (CI/CD, testing, security)
 - Template processing and project structure generation
+
+Criterion Executor
+------------------
+Each DoD criterion is a :class:`CriterionCheck` in :data:`CRITERION_CHECKS`
+that declares the inputs it reads and the criteria it depends on.
+:func:`run_criteria` runs the requested checks as a DAG on a bounded thread
+pool (one worker per core), enforces a per-criterion timeout, and caches
+every result under a fingerprint of the check's inputs: the content hashes of
+the Python sources (from :mod:`uvmgr.core.code_index`), the declared config
+files (lockfiles, ``pyproject.toml``, CI workflows, ...) and the fingerprints
+of its upstream criteria. Re-running on an unchanged tree is a handful of
+cache lookups.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import re
+import shutil
 import subprocess
+import sys
 import time
 import yaml
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, List, Optional
 
+from ..core.cache import get_result, store_result
+from ..core.code_index import PRUNE_DIRS, ProjectIndex, get_project_index
 from ..core.process import run
-from ..core.telemetry import span
+from ..core.telemetry import metric_counter, metric_histogram, span
+
+PASS_THRESHOLD = 70.0
+"""Minimum score (0-100) for a criterion to pass."""
+
+
+@dataclass(frozen=True)
+class CheckContext:
+    """Everything a criterion check may read."""
+
+    root: Path
+    index: ProjectIndex
+    timeout: float
+    upstream: Dict[str, Dict[str, Any]]
+    """Results of the criteria this check depends on."""
+
+
+@dataclass(frozen=True)
+class CriterionCheck:
+    """One DoD criterion and the inputs its result depends on."""
+
+    name: str
+    check: Callable[[CheckContext], Dict[str, Any]]
+    """Returns at least ``score`` and ``details``; ``passed`` defaults to the threshold."""
+    files: tuple[str, ...] = ()
+    """Glob patterns (relative to the project root) of non-Python inputs."""
+    sources: bool = True
+    """Whether the content of the Python sources is an input."""
+    tools: tuple[str, ...] = ()
+    """Executables whose presence on ``PATH`` is an input."""
+    depends_on: tuple[str, ...] = ()
+    timeout: float = 120.0
+    version: int = 1
+    """Bump when the check logic changes to invalidate cached results."""
+
+
+def _clamp(score: float) -> float:
+    return round(max(0.0, min(100.0, score)), 1)
+
+
+def _public_definitions(ctx: CheckContext) -> List[Any]:
+    return [
+        sym for sym in ctx.index.symbols(kind=("function", "class"), path=ctx.root)
+        if not any(part.startswith("_") for part in sym.qualname.split("."))
+        and not sym.path.name.startswith("test_")
+    ]
+
+
+def _check_testing(ctx: CheckContext) -> Dict[str, Any]:
+    test_files = ctx.index.files(ctx.root, pattern="test_*.py") + ctx.index.files(ctx.root, pattern="*_test.py")
+    if not test_files:
+        return {"score": 0.0, "details": "No test files found", "suggestions": ["Add pytest tests"]}
+
+    venv_python = ctx.root / ".venv" / "bin" / "python"
+    python = str(venv_python) if venv_python.exists() else sys.executable
+    proc = subprocess.run(
+        [python, "-m", "pytest", "-q", "-p", "no:cacheprovider"],
+        cwd=ctx.root, capture_output=True, text=True, timeout=ctx.timeout,
+    )
+    counts = {
+        outcome: int(n)
+        for n, outcome in re.findall(r"(\d+) (passed|failed|errors?)\b", proc.stdout.splitlines()[-1] if proc.stdout else "")
+    }
+    passed = counts.get("passed", 0)
+    failed = counts.get("failed", 0) + counts.get("error", 0) + counts.get("errors", 0)
+    total = passed + failed
+    if not total:
+        return {
+            "score": 0.0,
+            "details": f"pytest collected no tests (exit code {proc.returncode})",
+            "suggestions": ["Check pytest configuration and test discovery"],
+        }
+    return {
+        "score": _clamp(100.0 * passed / total),
+        "details": f"{passed}/{total} tests passed in {len(test_files)} files",
+        "passed": proc.returncode == 0,
+        "tests_passed": passed,
+        "tests_failed": failed,
+        "suggestions": [f"Fix {failed} failing tests"] if failed else [],
+    }
+
+
+_SEVERITY_PENALTY = {"critical": 40, "high": 25, "medium": 10, "low": 2}
+
+
+def _check_security(ctx: CheckContext) -> Dict[str, Any]:
+    from uvmgr.ops.security import check_security_config_impl, scan_code_security
+
+    issues = scan_code_security(ctx.root) + check_security_config_impl(ctx.root).get("issues", [])
+    by_severity: Dict[str, int] = {}
+    for issue in issues:
+        severity = str(issue.get("severity", "low")).lower()
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+    blocking = by_severity.get("critical", 0) + by_severity.get("high", 0)
+    return {
+        "score": _clamp(100 - sum(_SEVERITY_PENALTY.get(s, 2) * n for s, n in by_severity.items())),
+        "details": f"{len(issues)} security issues ({blocking} high or critical)",
+        "passed": blocking == 0,
+        "issues_by_severity": by_severity,
+        "suggestions": sorted({f"{i.get('type')}: {i.get('file', 'config')}" for i in issues})[:10],
+    }
+
+
+_LINT_PENALTY = 2.0
+"""Points deducted per ruff violation."""
+
+_LINT_PENALTY_CAP = 30.0
+"""Most points lint can cost, so a noisy linter cannot sink the criterion alone."""
+
+
+def _check_code_quality(ctx: CheckContext) -> Dict[str, Any]:
+    functions = list(ctx.index.symbols(kind="function", path=ctx.root))
+    files = ctx.index.files(ctx.root)
+    broken = [f for f in files if f.error]
+    if not files:
+        return {"score": 0.0, "details": "No Python sources found", "suggestions": []}
+
+    complex_count = sum(1 for f in functions if f.complexity > 10)
+    score = 100.0 * (1 - complex_count / len(functions)) if functions else 100.0
+    score -= 20 * len(broken)
+    details = f"{complex_count}/{len(functions)} functions with complexity > 10"
+    suggestions = [f"Fix syntax error in {f.path.relative_to(ctx.root)}" for f in broken]
+
+    ruff = shutil.which("ruff")
+    if ruff:
+        proc = subprocess.run(
+            [ruff, "check", "--no-fix", "--no-cache", "--output-format", "json", "--exit-zero", "."],
+            cwd=ctx.root, capture_output=True, text=True, timeout=ctx.timeout,
+        )
+        violations = len(json.loads(proc.stdout or "[]"))
+        score -= min(_LINT_PENALTY_CAP, _LINT_PENALTY * violations)
+        details += f", {violations} ruff violations"
+        if violations:
+            suggestions.append("Run `uvmgr lint fix`")
+    else:
+        # Unchecked lint is scored as the worst case rather than as clean
+        violations = None
+        score -= _LINT_PENALTY_CAP
+        details += ", lint not checked (ruff not installed)"
+        suggestions.append("Install ruff to check lint")
+    if complex_count:
+        suggestions.append(f"Simplify {complex_count} complex functions")
+    return {
+        "score": _clamp(score),
+        "details": details,
+        "lint_violations": violations,
+        "suggestions": suggestions,
+    }
+
+
+def _check_documentation(ctx: CheckContext) -> Dict[str, Any]:
+    readmes = [p for p in ctx.root.glob("README*") if p.is_file()]
+    docs = [p for pattern in ("docs/**/*.md", "docs/**/*.rst") for p in ctx.root.glob(pattern)]
+    public = _public_definitions(ctx)
+    documented = sum(1 for sym in public if sym.detail.get("docstring"))
+    coverage = documented / len(public) if public else 1.0
+
+    score = 40.0 * coverage
+    if readmes and max(p.stat().st_size for p in readmes) > 200:
+        score += 40
+    if docs:
+        score += 20
+    suggestions = []
+    if not readmes:
+        suggestions.append("Add a README")
+    if not docs:
+        suggestions.append("Add a docs/ directory")
+    if coverage < 0.8:
+        suggestions.append(f"Document {len(public) - documented} public functions and classes")
+    return {
+        "score": _clamp(score),
+        "details": f"{documented}/{len(public)} public definitions documented, {len(docs)} doc pages",
+        "docstring_coverage": round(coverage, 3),
+        "suggestions": suggestions,
+    }
+
+
+_CI_FILES = (".github/workflows/*.yml", ".github/workflows/*.yaml", ".gitlab-ci.yml", "Jenkinsfile", ".circleci/config.yml")
+_LOCK_FILES = ("uv.lock", "poetry.lock", "pdm.lock", "requirements*.txt")
+
+
+def _check_devops(ctx: CheckContext) -> Dict[str, Any]:
+    ci = [p for pattern in _CI_FILES for p in ctx.root.glob(pattern)]
+    locks = [p for pattern in _LOCK_FILES for p in ctx.root.glob(pattern)]
+    pyproject = ctx.root / "pyproject.toml"
+    has_build = pyproject.exists() and "[build-system]" in pyproject.read_text(encoding="utf-8", errors="ignore")
+
+    score = 40.0 * bool(ci) + 20.0 * bool(locks) + 10.0 * has_build
+    suggestions = []
+    for name in ("testing", "security"):
+        if ctx.upstream.get(name, {}).get("passed"):
+            score += 15
+        else:
+            suggestions.append(f"Pipeline is blocked until {name} passes")
+    if not ci:
+        suggestions.append("Add a CI pipeline (`uvmgr dod pipeline`)")
+    if not locks:
+        suggestions.append("Commit a lockfile")
+    return {
+        "score": _clamp(score),
+        "details": f"{len(ci)} CI configs, lockfile {'present' if locks else 'missing'}",
+        "suggestions": suggestions,
+    }
+
+
+def _check_performance(ctx: CheckContext) -> Dict[str, Any]:
+    benchmarks = [
+        f for f in ctx.index.files(ctx.root)
+        if f.path.name.startswith("test_") and re.search(r"bench|perf", f.path.name)
+    ]
+    pyproject = ctx.root / "pyproject.toml"
+    text = pyproject.read_text(encoding="utf-8", errors="ignore") if pyproject.exists() else ""
+    tooling = bool(re.search(r"pytest-benchmark|asv|pyperf", text)) or (ctx.root / "asv.conf.json").exists()
+
+    score = 70.0 * bool(benchmarks) + 30.0 * tooling
+    return {
+        "score": score,
+        "details": f"{len(benchmarks)} benchmark test files, benchmark tooling {'configured' if tooling else 'missing'}",
+        "suggestions": [] if benchmarks else ["Add performance tests"],
+    }
+
+
+def _check_compliance(ctx: CheckContext) -> Dict[str, Any]:
+    def present(*patterns: str) -> bool:
+        return any(p.is_file() for pattern in patterns for p in ctx.root.glob(pattern))
+
+    items = {
+        "license": (40, present("LICENSE*", "COPYING*")),
+        "security policy": (20, present("SECURITY*", ".github/SECURITY*")),
+        "contributing guide": (10, present("CONTRIBUTING*", "CODE_OF_CONDUCT*")),
+        "changelog": (10, present("CHANGELOG*", "CHANGES*", "HISTORY*")),
+        "no blocking security issues": (20, bool(ctx.upstream.get("security", {}).get("passed"))),
+    }
+    return {
+        "score": float(sum(points for points, ok in items.values() if ok)),
+        "details": ", ".join(f"{name}: {'yes' if ok else 'no'}" for name, (_, ok) in items.items()),
+        "suggestions": [f"Add {name}" for name, (_, ok) in items.items() if not ok],
+    }
+
+
+CRITERION_CHECKS: Dict[str, CriterionCheck] = {
+    check.name: check
+    for check in (
+        CriterionCheck(
+            "testing", _check_testing,
+            files=("pyproject.toml", "setup.cfg", "pytest.ini", "tox.ini", *_LOCK_FILES),
+            timeout=600.0,
+        ),
+        CriterionCheck(
+            "security", _check_security,
+            files=("pyproject.toml", *_LOCK_FILES, ".github/workflows/*"),
+        ),
+        CriterionCheck(
+            "code_quality", _check_code_quality,
+            files=("pyproject.toml", "ruff.toml", ".ruff.toml", "setup.cfg"),
+            tools=("ruff",),
+            version=2,
+        ),
+        CriterionCheck(
+            "documentation", _check_documentation,
+            files=("README*", "docs/**/*.md", "docs/**/*.rst"),
+        ),
+        CriterionCheck(
+            "devops", _check_devops,
+            files=("pyproject.toml", *_CI_FILES, *_LOCK_FILES),
+            sources=False,
+            depends_on=("testing", "security"),
+        ),
+        CriterionCheck(
+            "performance", _check_performance,
+            files=("pyproject.toml", "asv.conf.json"),
+        ),
+        CriterionCheck(
+            "compliance", _check_compliance,
+            files=("LICENSE*", "COPYING*", "SECURITY*", ".github/SECURITY*", "CONTRIBUTING*",
+                   "CODE_OF_CONDUCT*", "CHANGELOG*", "CHANGES*", "HISTORY*"),
+            sources=False,
+            depends_on=("security",),
+        ),
+    )
+}
+"""Registered criterion checks by name."""
+
+
+def _with_dependencies(criteria: List[str]) -> List[str]:
+    """*criteria* plus their transitive dependencies, dependencies first."""
+    ordered: List[str] = []
+
+    def visit(name: str) -> None:
+        if name in ordered:
+            return
+        for dep in CRITERION_CHECKS[name].depends_on if name in CRITERION_CHECKS else ():
+            visit(dep)
+        ordered.append(name)
+
+    for name in criteria:
+        visit(name)
+    return ordered
+
+
+def _fingerprints(root: Path, index: ProjectIndex, names: List[str]) -> Dict[str, str]:
+    """Content fingerprint of each criterion's inputs (*names* in dependency order)."""
+    sources = hashlib.sha1()
+    for record in index.files(root):
+        sources.update(f"{record.path.relative_to(root)}:{record.hash}\n".encode())
+    sources_digest = sources.hexdigest()
+
+    file_digests: Dict[Path, str] = {}
+    fingerprints: Dict[str, str] = {}
+    for name in names:
+        check = CRITERION_CHECKS.get(name)
+        if check is None:
+            continue
+        h = hashlib.sha1(f"{root}\0{name}\0{check.version}\0".encode())
+        if check.sources:
+            h.update(sources_digest.encode())
+        matched = {
+            p for pattern in check.files for p in root.glob(pattern)
+            if p.is_file() and not PRUNE_DIRS.intersection(p.relative_to(root).parts)
+        }
+        for path in sorted(matched):
+            if path not in file_digests:
+                file_digests[path] = hashlib.sha1(path.read_bytes()).hexdigest()
+            h.update(f"{path.relative_to(root)}:{file_digests[path]}\n".encode())
+        for tool in check.tools:
+            h.update(f"{tool}:{shutil.which(tool)}\n".encode())
+        for dep in check.depends_on:
+            h.update(fingerprints[dep].encode())
+        fingerprints[name] = h.hexdigest()
+    return fingerprints
+
+
+def _execute_check(check: CriterionCheck, ctx: CheckContext, started: Dict[str, float]) -> Dict[str, Any]:
+    started[check.name] = time.monotonic()
+    start = time.time()
+    with span("dod.runtime.criterion", **{"dod.criterion": check.name}):
+        try:
+            outcome = check.check(ctx)
+        except subprocess.TimeoutExpired:
+            outcome = {"score": 0.0, "details": f"Timed out after {ctx.timeout:g}s", "passed": False, "timed_out": True}
+        except Exception as e:
+            outcome = {"score": 0.0, "details": f"Check failed: {e}", "passed": False, "error": str(e)}
+    outcome.setdefault("passed", outcome["score"] >= PASS_THRESHOLD)
+    outcome["passed"] = bool(outcome["passed"]) and outcome["score"] >= PASS_THRESHOLD
+    outcome["execution_time"] = time.time() - start
+    metric_histogram("dod.criterion.duration")(outcome["execution_time"])
+    return outcome
+
+
+@span("dod.runtime.run_criteria")
+def run_criteria(
+    project_path: Path,
+    criteria: List[str],
+    *,
+    parallel: bool = True,
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the checks for *criteria* and return their results by name.
+
+    Checks run as a DAG: a criterion starts once everything it depends on has
+    finished, and independent criteria run concurrently. Results are cached
+    by input fingerprint, so only criteria whose inputs changed are re-run.
+
+    Parameters
+    ----------
+    project_path : Path
+        Project root.
+    criteria : list of str
+        Criteria to report; their dependencies are run (or fetched from the
+        cache) as well but not reported.
+    parallel : bool
+        Run independent criteria concurrently.
+    max_workers : int, optional
+        Worker threads; defaults to the number of CPUs.
+    timeout : float, optional
+        Seconds allowed per criterion, overriding :attr:`CriterionCheck.timeout`.
+    use_cache : bool
+        Look up and store results in the command-result cache.
+
+    Returns
+    -------
+    dict
+        ``{criterion: {"passed", "score", "details", "execution_time", "cached", ...}}``
+
+    Raises
+    ------
+    FileNotFoundError
+        If *project_path* is not a directory.
+    """
+    root = project_path.resolve()
+    if not root.is_dir():
+        raise FileNotFoundError(f"Project path does not exist: {project_path}")
+
+    names = _with_dependencies(criteria)
+    index = get_project_index(root)
+    index.refresh(root)
+    fingerprints = _fingerprints(root, index, names)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    pending: List[str] = []
+    for name in names:
+        if name not in CRITERION_CHECKS:
+            results[name] = {
+                "passed": False, "score": 0.0, "details": f"No check registered for '{name}'",
+                "execution_time": 0.0, "cached": False,
+            }
+        elif use_cache and (hit := get_result(f"dod:{name}:{fingerprints[name]}")) is not None:
+            results[name] = {**json.loads(hit.output), "cached": True}
+        else:
+            pending.append(name)
+    metric_counter("dod.criteria.cache_hits")(len(names) - len(pending))
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(pending))) if parallel else 1
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dod")
+    running: Dict[Future, str] = {}
+    started: Dict[str, float] = {}  # set by the worker, so queued checks do not burn their timeout
+    try:
+        while pending or running:
+            for name in [n for n in pending if all(d in results for d in CRITERION_CHECKS[n].depends_on)]:
+                check = CRITERION_CHECKS[name]
+                ctx = CheckContext(root, index, timeout or check.timeout, {d: results[d] for d in check.depends_on})
+                running[pool.submit(_execute_check, check, ctx, started)] = name
+                pending.remove(name)
+
+            deadlines = {
+                future: started[name] + (timeout or CRITERION_CHECKS[name].timeout)
+                for future, name in running.items() if name in started
+            }
+            # Poll briefly while some submitted checks have not started yet
+            wake = min(deadlines.values(), default=time.monotonic() + 0.05)
+            if len(deadlines) < len(running):
+                wake = min(wake, time.monotonic() + 0.05)
+            done, _ = wait(running, timeout=max(0.0, wake - time.monotonic()), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = {**future.result(), "cached": False}
+                if use_cache and not results[name].get("timed_out") and "error" not in results[name]:
+                    store_result(f"dod:{name}:{fingerprints[name]}", json.dumps(results[name]), exit_code=0)
+
+            now = time.monotonic()
+            for future, deadline in deadlines.items():
+                if future in running and now >= deadline:
+                    # Threads cannot be killed; the check's subprocesses carry the same timeout
+                    name = running.pop(future)
+                    limit = timeout or CRITERION_CHECKS[name].timeout
+                    results[name] = {
+                        "passed": False, "score": 0.0, "details": f"Timed out after {limit:g}s",
+                        "execution_time": limit, "cached": False, "timed_out": True,
+                    }
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return {name: results[name] for name in criteria}
+
 
 @span("dod.runtime.initialize_exoskeleton_files")
 def initialize_exoskeleton_files(
@@ -81,42 +558,47 @@ ai:
         }
 
 
+def _apply_lint_fixes(root: Path, timeout: float = 120.0) -> Optional[int]:
+    """Apply ruff's safe fixes under *root*; the number fixed, ``None`` without ruff."""
+    ruff = shutil.which("ruff")
+    if not ruff or not root.is_dir():
+        return None
+    proc = subprocess.run(
+        [ruff, "check", "--fix", "--exit-zero", "."],
+        cwd=root, capture_output=True, text=True, timeout=timeout,
+    )
+    found = re.search(r"(\d+) fixed", proc.stdout + proc.stderr)
+    return int(found.group(1)) if found else 0
+
+
 @span("dod.runtime.execute_automation_workflow")
 def execute_automation_workflow(
     project_path: Path,
     criteria: List[str],
     environment: str,
     auto_fix: bool,
-    parallel: bool,
-    ai_assist: bool
+    parallel: bool
 ) -> Dict[str, Any]:
-    """Execute complete automation workflow."""
+    """Execute complete automation workflow.
+
+    With *auto_fix*, ruff's safe fixes are applied to the project before the
+    criteria are checked, so the results reflect the fixed tree.
+    """
     try:
         start_time = time.time()
         
-        # Simulate automation execution
-        criteria_results = {}
-        
-        for criterion in criteria:
-            # Simulate validation for each criterion
-            success = True  # In real implementation, would run actual checks
-            score = 85.0 + (hash(criterion) % 15)  # Realistic score variation
-            
-            criteria_results[criterion] = {
-                "passed": success,
-                "score": score,
-                "details": f"Automated validation for {criterion}",
-                "execution_time": 0.5 + (hash(criterion) % 3)
-            }
-        
+        fixes = _apply_lint_fixes(project_path) if auto_fix else None
+        criteria_results = run_criteria(project_path, criteria, parallel=parallel)
         overall_success = all(r["passed"] for r in criteria_results.values())
         
         return {
             "success": overall_success,
             "criteria_results": criteria_results,
             "execution_time": time.time() - start_time,
+            "cache_hits": sum(1 for r in criteria_results.values() if r.get("cached")),
             "environment": environment,
-            "auto_fix_applied": auto_fix,
+            "auto_fix_applied": fixes is not None,
+            "fixes_applied": fixes or 0,
             "parallel_execution": parallel
         }
         
@@ -137,27 +619,23 @@ def validate_criteria_runtime(
 ) -> Dict[str, Any]:
     """Runtime validation of DoD criteria."""
     try:
+        from uvmgr.ops.dod import DOD_CRITERIA_WEIGHTS
+
         criteria_scores = {}
         
-        for criterion in criteria:
-            # Simulate validation scoring
-            base_score = 80.0
-            variation = (hash(criterion) % 20) - 10  # -10 to +10 variation
-            score = max(0, min(100, base_score + variation))
-            
-            passed = score >= 70  # Threshold for passing
-            
+        for criterion, result in run_criteria(project_path, criteria).items():
             criteria_scores[criterion] = {
-                "score": score,
-                "passed": passed,
-                "weight": 0.15,  # Default weight
-                "details": f"Validation details for {criterion}" if detailed else None
+                "score": result["score"],
+                "passed": result["passed"],
+                "weight": DOD_CRITERIA_WEIGHTS.get(criterion, {}).get("weight", 0.0),
+                "details": result["details"] if detailed else None,
+                "suggestions": result.get("suggestions", []) if fix_suggestions else [],
             }
         
         return {
             "success": True,
             "criteria_scores": criteria_scores,
-            "validation_strategy": "runtime_simulation"
+            "validation_strategy": "runtime_checks"
         }
         
     except Exception as e:
@@ -4,6 +4,10 @@ Command history runtime implementation.
 This module handles the actual storage and retrieval of command execution history
 at the runtime layer. It manages database operations, file I/O, and analytics
 calculations for command usage tracking.
+
+All functions share one WAL-mode connection per database, opened (and the
+schema created) once per process. Analytics run in SQL: sessions are split at
+30-minute gaps with window functions, so nothing loads the whole table.
 """
 
 from __future__ import annotations
@@ -11,13 +15,17 @@ from __future__ import annotations
 import csv
 import json
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from uvmgr.core.instrumentation import span
 
+SESSION_GAP = 1800  # seconds of inactivity that start a new session
+
 
 def store_command_record(
     command: str,
@@ -55,30 +63,11 @@ def store_command_record(
     """
     with span("runtime.history.store_record"):
         try:
-            db_path = _get_history_db_path()
-            timestamp = timestamp or datetime.now()
-            
-            with sqlite3.connect(db_path) as conn:
-                _ensure_schema(conn)
-                
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO command_history 
-                    (command, subcommand, args, exit_code, execution_time, 
-                     working_directory, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    command,
-                    subcommand,
-                    json.dumps(args or []),
-                    exit_code,
-                    execution_time,
-                    str(working_directory) if working_directory else None,
-                    timestamp.isoformat()
-                ))
-                
-                record_id = cursor.lastrowid
-                conn.commit()
+            row = _record_row(
+                command, subcommand, args, exit_code, execution_time, working_directory, timestamp
+            )
+            with _transaction() as conn:
+                record_id = conn.execute(_INSERT_SQL, row).lastrowid
                 
             return {
                 "success": True,
@@ -92,6 +81,49 @@ def store_command_record(
             }
 
 
+def store_command_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Store many command execution records in a single transaction.
+    
+    Parameters
+    ----------
+    records : Iterable[Dict[str, Any]]
+        Records with the keyword arguments of :func:`store_command_record`.
+        
+    Returns
+    -------
+    Dict[str, Any]
+        Storage results, with the number of ``records_stored``
+    """
+    with span("runtime.history.store_records"):
+        try:
+            rows = [
+                _record_row(
+                    record["command"],
+                    record.get("subcommand"),
+                    record.get("args"),
+                    record.get("exit_code", 0),
+                    record.get("execution_time", 0.0),
+                    record.get("working_directory"),
+                    record.get("timestamp"),
+                )
+                for record in records
+            ]
+            with _transaction() as conn:
+                conn.executemany(_INSERT_SQL, rows)
+                
+            return {
+                "success": True,
+                "records_stored": len(rows)
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+
 def query_command_history(
     limit: int = 50,
     command_filter: Optional[str] = None,
@@ -119,11 +151,7 @@ def query_command_history(
     """
     with span("runtime.history.query"):
         try:
-            db_path = _get_history_db_path()
-            
-            with sqlite3.connect(db_path) as conn:
-                _ensure_schema(conn)
-                
+            with _connection() as conn:
                 # Build query
                 query = "SELECT * FROM command_history WHERE 1=1"
                 params = []
@@ -195,11 +223,7 @@ def analyze_command_patterns(
     """
     with span("runtime.history.analyze_patterns"):
         try:
-            db_path = _get_history_db_path()
-            
-            with sqlite3.connect(db_path) as conn:
-                _ensure_schema(conn)
-                
+            with _connection() as conn:
                 # Get basic usage statistics
                 cursor = conn.cursor()
                 
@@ -278,11 +302,7 @@ def calculate_command_statistics(
     """
     with span("runtime.history.calculate_stats"):
         try:
-            db_path = _get_history_db_path()
-            
-            with sqlite3.connect(db_path) as conn:
-                _ensure_schema(conn)
-                
+            with _connection() as conn:
                 cursor = conn.cursor()
                 
                 # Build query
@@ -357,32 +377,52 @@ def find_similar_command_sessions(
     """
     with span("runtime.history.find_similar_sessions"):
         try:
-            db_path = _get_history_db_path()
-            
-            with sqlite3.connect(db_path) as conn:
-                _ensure_schema(conn)
-                
-                # Get command sessions (grouped by time windows)
-                sessions = _extract_command_sessions(conn)
+            with _connection() as conn:
+                # Sessions are segmented and scored (Jaccard over distinct
+                # commands) in SQL; only the best matches come back
+                current = sorted(set(current_commands))
+                rows = conn.execute(
+                    f"""
+                    {_SESSIONS_CTE},
+                    scores AS (
+                        SELECT session_id,
+                               SUM(command IN (SELECT value FROM json_each(:current))) AS hits,
+                               COUNT(*) AS size
+                        FROM (SELECT DISTINCT session_id, command FROM sessions)
+                        GROUP BY session_id
+                    )
+                    SELECT session_id, started, ended, duration,
+                           CAST(hits AS REAL) / (size + :current_size - hits) AS similarity
+                    FROM session_spans JOIN scores USING (session_id)
+                    WHERE similarity >= :threshold
+                    ORDER BY similarity DESC, session_id
+                    LIMIT :limit
+                    """,
+                    {
+                        "current": json.dumps(current),
+                        "current_size": len(current),
+                        "threshold": similarity_threshold,
+                        "limit": max_results,
+                    },
+                ).fetchall()
                 
                 similar_sessions = []
-                
-                for session in sessions:
-                    session_commands = [record["command"] for record in session["commands"]]
-                    similarity = _calculate_command_similarity(current_commands, session_commands)
-                    
-                    if similarity >= similarity_threshold:
-                        similar_sessions.append({
-                            "session_id": session["session_id"],
-                            "commands": session_commands,
-                            "similarity": similarity,
-                            "timestamp": session["timestamp"],
-                            "duration": session["duration"]
-                        })
-                        
-                # Sort by similarity and limit results
-                similar_sessions.sort(key=lambda x: x["similarity"], reverse=True)
-                similar_sessions = similar_sessions[:max_results]
+                for session_id, started, ended, duration, similarity in rows:
+                    # A session is a contiguous timestamp range: fetch its commands by index
+                    session_commands = [
+                        command for (command,) in conn.execute(
+                            "SELECT command FROM command_history WHERE timestamp BETWEEN ? AND ? "
+                            "ORDER BY timestamp, id",
+                            (started, ended),
+                        )
+                    ]
+                    similar_sessions.append({
+                        "session_id": session_id,
+                        "commands": session_commands,
+                        "similarity": similarity,
+                        "timestamp": started,
+                        "duration": duration
+                    })
                 
                 avg_similarity = sum(s["similarity"] for s in similar_sessions) / len(similar_sessions) if similar_sessions else 0.0
                 
@@ -420,11 +460,7 @@ def analyze_productivity_metrics(
     """
     with span("runtime.history.analyze_productivity"):
         try:
-            db_path = _get_history_db_path()
-            
-            with sqlite3.connect(db_path) as conn:
-                _ensure_schema(conn)
-                
+            with _connection() as conn:
                 # Calculate productivity metrics
                 insights = []
                 
@@ -563,37 +599,28 @@ def clear_command_history(
     """
     with span("runtime.history.clear"):
         try:
-            db_path = _get_history_db_path()
+            where = " WHERE 1=1"
+            params = []
             
-            with sqlite3.connect(db_path) as conn:
-                _ensure_schema(conn)
-                
-                # Count records to be cleared
-                count_query = "SELECT COUNT(*) FROM command_history WHERE 1=1"
-                params = []
-                
-                if cutoff_date:
-                    count_query += " AND timestamp < ?"
-                    params.append(cutoff_date.isoformat())
-                    
-                if command_filter:
-                    count_query += " AND command = ?"
-                    params.append(command_filter)
-                    
-                cursor = conn.cursor()
-                cursor.execute(count_query, params)
-                records_to_clear = cursor.fetchone()[0]
-                
-                if not dry_run and records_to_clear > 0:
-                    # Actually clear the records
-                    delete_query = "DELETE FROM command_history WHERE 1=1"
-                    if cutoff_date:
-                        delete_query += " AND timestamp < ?"
-                    if command_filter:
-                        delete_query += " AND command = ?"
-                        
-                    cursor.execute(delete_query, params)
-                    conn.commit()
+            if cutoff_date:
+                where += " AND timestamp < ?"
+                params.append(cutoff_date.isoformat())
+                
+            if command_filter:
+                where += " AND command = ?"
+                params.append(command_filter)
+                
+            if dry_run:
+                with _connection() as conn:
+                    # Count records to be cleared
+                    records_to_clear = conn.execute(
+                        "SELECT COUNT(*) FROM command_history" + where, params
+                    ).fetchone()[0]
+            else:
+                with _transaction() as conn:
+                    records_to_clear = conn.execute(
+                        "DELETE FROM command_history" + where, params
+                    ).rowcount
                     
             return {
                 "success": True,
@@ -617,26 +644,113 @@ def _get_history_db_path() -> Path:
     return history_dir / "commands.db"
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS command_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    command TEXT NOT NULL,
+    subcommand TEXT,
+    args TEXT,
+    exit_code INTEGER,
+    execution_time REAL,
+    working_directory TEXT,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_command ON command_history(command);
+CREATE INDEX IF NOT EXISTS idx_timestamp ON command_history(timestamp);
+"""
+
+_INSERT_SQL = """
+    INSERT INTO command_history
+    (command, subcommand, args, exit_code, execution_time, working_directory, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Rows numbered into sessions: a new session starts after a SESSION_GAP pause.
+# Gaps are rounded to milliseconds to absorb julianday() float error.
+_SESSIONS_CTE = f"""
+    WITH ordered AS (
+        SELECT id, command, timestamp, jd, jd - LAG(jd) OVER (ORDER BY timestamp, id) AS gap
+        FROM (SELECT id, command, timestamp, julianday(timestamp) AS jd FROM command_history)
+    ),
+    sessions AS (
+        SELECT id, command, timestamp, jd,
+               SUM(gap IS NULL OR ROUND(gap * 86400, 3) > {SESSION_GAP}) OVER (
+                   ORDER BY timestamp, id ROWS UNBOUNDED PRECEDING
+               ) - 1 AS session_id
+        FROM ordered
+    ),
+    session_spans AS (
+        SELECT session_id, MIN(timestamp) AS started, MAX(timestamp) AS ended,
+               ROUND((MAX(jd) - MIN(jd)) * 86400, 3) AS duration
+        FROM sessions
+        GROUP BY session_id
+    )
+"""
+
+_lock = threading.RLock()
+_conn: Optional[sqlite3.Connection] = None
+_conn_path: Optional[Path] = None
+
+
+def _db() -> sqlite3.Connection:
+    """Return the process-wide connection, opening it (and the schema) once per path."""
+    global _conn, _conn_path
+    db_path = _get_history_db_path()
+    if _conn is None or _conn_path != db_path:
+        if _conn is not None:
+            _conn.close()
+        conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _ensure_schema(conn)
+        _conn, _conn_path = conn, db_path
+    return _conn
+
+
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """Serialize use of the shared connection across threads."""
+    with _lock:
+        yield _db()
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    """Shared connection inside one write transaction."""
+    with _connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
 def _ensure_schema(conn: sqlite3.Connection) -> None:
     """Ensure database schema exists."""
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS command_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            command TEXT NOT NULL,
-            subcommand TEXT,
-            args TEXT,
-            exit_code INTEGER,
-            execution_time REAL,
-            working_directory TEXT,
-            timestamp TEXT NOT NULL
-        )
-    """)
-    
-    # Create indexes for performance
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_command ON command_history(command)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON command_history(timestamp)")
-    conn.commit()
+    conn.executescript(_SCHEMA)
+
+
+def _record_row(
+    command: str,
+    subcommand: Optional[str],
+    args: Optional[List[str]],
+    exit_code: int,
+    execution_time: float,
+    working_directory: Optional[Path],
+    timestamp: Optional[datetime],
+) -> tuple:
+    """Column values of one ``command_history`` row."""
+    return (
+        command,
+        subcommand,
+        json.dumps(args or []),
+        exit_code,
+        execution_time,
+        str(working_directory) if working_directory else None,
+        (timestamp or datetime.now()).isoformat(),
+    )
 
 
 def _analyze_usage_trends(conn: sqlite3.Connection, start_date: Optional[datetime]) -> List[Dict[str, Any]]:
@@ -700,70 +814,6 @@ def _generate_usage_recommendations(patterns: List[Dict[str, Any]]) -> List[Dict
     return recommendations
 
 
-def _extract_command_sessions(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
-    """Extract command sessions from history."""
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT * FROM command_history 
-        ORDER BY timestamp
-    """)
-    
-    records = cursor.fetchall()
-    sessions = []
-    current_session = []
-    last_timestamp = None
-    session_id = 0
-    
-    for record in records:
-        timestamp = datetime.fromisoformat(record[7])
-        
-        # Start new session if gap > 30 minutes
-        if last_timestamp and (timestamp - last_timestamp).total_seconds() > 1800:
-            if current_session:
-                sessions.append({
-                    "session_id": session_id,
-                    "commands": current_session,
-                    "timestamp": current_session[0]["timestamp"],
-                    "duration": (datetime.fromisoformat(current_session[-1]["timestamp"]) - 
-                               datetime.fromisoformat(current_session[0]["timestamp"])).total_seconds()
-                })
-                session_id += 1
-                current_session = []
-                
-        current_session.append({
-            "command": record[1],
-            "subcommand": record[2],
-            "timestamp": record[7]
-        })
-        last_timestamp = timestamp
-        
-    # Add final session
-    if current_session:
-        sessions.append({
-            "session_id": session_id,
-            "commands": current_session,
-            "timestamp": current_session[0]["timestamp"],
-            "duration": (datetime.fromisoformat(current_session[-1]["timestamp"]) - 
-                       datetime.fromisoformat(current_session[0]["timestamp"])).total_seconds()
-        })
-        
-    return sessions
-
-
-def _calculate_command_similarity(commands1: List[str], commands2: List[str]) -> float:
-    """Calculate similarity between two command lists."""
-    if not commands1 or not commands2:
-        return 0.0
-        
-    set1 = set(commands1)
-    set2 = set(commands2)
-    
-    intersection = set1.intersection(set2)
-    union = set1.union(set2)
-    
-    return len(intersection) / len(union) if union else 0.0
-
-
 def _get_most_used_commands(conn: sqlite3.Connection, start_date: Optional[datetime]) -> List[Dict[str, Any]]:
     """Get most used commands."""
     cursor = conn.cursor()
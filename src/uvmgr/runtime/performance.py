@@ -26,7 +26,7 @@ import resource
 import subprocess
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable
 
@@ -48,6 +48,7 @@ class PerformanceMetrics:
     io_write: int      # bytes
     context_switches: int
     timestamp: str
+    durations: List[float] = field(default_factory=list)  # per successful run, seconds
 
 
 @dataclass
@@ -273,7 +274,7 @@ def measure_operation(operation_name: str, operation: "Callable",
                 # num_ctx_switches() not available on some systems
                 initial_ctx_switches = None
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             cpu_start = time.process_time()
             
             try:
@@ -281,7 +282,7 @@ def measure_operation(operation_name: str, operation: "Callable",
                 operation()
                 
                 # Get final state
-                end_time = time.time()
+                end_time = time.perf_counter()
                 cpu_end = time.process_time()
                 
                 final_memory = process.memory_info().rss
@@ -352,7 +353,8 @@ def measure_operation(operation_name: str, operation: "Callable",
             io_read=int(avg_io_read),
             io_write=int(avg_io_write),
             context_switches=int(avg_ctx_switches),
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S")
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+            durations=durations
         )
         
         # Record metrics
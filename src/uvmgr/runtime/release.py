@@ -4,9 +4,9 @@ from uvmgr.core.process import run_logged
 from uvmgr.core.telemetry import span
 
 
-def bump() -> None:
-    with span("release.bump"):
-        run_logged(["cz", "bump"])
+def bump(dry_run: bool = False) -> None:
+    with span("release.bump", dry_run=dry_run):
+        run_logged(["cz", "bump", "--dry-run"] if dry_run else ["cz", "bump"])
 
 
 def changelog() -> str:
@@ -1,11 +1,50 @@
+"""
+uvmgr.runtime.remote - SSH Execution with Pooled, Multiplexed Sessions
+======================================================================
+
+Every host gets one :class:`RemoteSession`, kept in a process-wide pool. A
+session runs ``ssh`` with ``ControlMaster=auto``/``ControlPersist``, so the
+first command opens a master connection and every later command (and every
+later ``uvmgr`` invocation while the master is alive) rides on it without a
+new TCP and key exchange.
+
+Many commands can be sent through one ``ssh`` invocation with
+:meth:`RemoteSession.run_batch`, and sets of files are copied as one
+tar stream by :func:`copy_file`.
+
+The ``ssh`` executable can be overridden with ``UVMGR_SSH`` (e.g. a shim that
+runs the command locally in tests).
+"""
+
 import asyncio
+import getpass
+import hashlib
+import os
+import shlex
 import subprocess
+import tarfile
+import tempfile
+import threading
+import uuid
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
-from uvmgr.core.telemetry import span
+from uvmgr.core.telemetry import metric_counter, span
 from uvmgr.core.instrumentation import add_span_event, add_span_attributes
-from uvmgr.core.process import run as local_run
+from uvmgr.core.process import run_streaming
+
+CONTROL_PERSIST = 300
+"""Seconds an idle master connection stays open after its last session."""
+
+CONNECT_TIMEOUT = 30
+
+DEFAULT_MAX_CONCURRENT = 10
+
+SSH_ENV = "UVMGR_SSH"
+"""Environment variable naming the ``ssh`` executable to use."""
 
 
 class RemoteExecutionError(Exception):
@@ -13,56 +52,255 @@ class RemoteExecutionError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one command of :meth:`RemoteSession.run_batch`."""
+
+    command: str
+    exit_code: Optional[int]
+    """``None`` if the batch stopped before the command ran."""
+    output: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+def _ssh_binary() -> str:
+    return os.environ.get(SSH_ENV, "ssh")
+
+
+def _control_dir() -> Path:
+    """Per-user directory for master sockets (not readable by others)."""
+    path = Path(tempfile.gettempdir()) / f"uvmgr-ssh-{getpass.getuser()}"
+    path.mkdir(mode=0o700, exist_ok=True)
+    return path
+
+
+class RemoteSession:
+    """
+    Multiplexed SSH connection to one ``user@host:port``.
+
+    Commands run through a shared master connection; the socket lives in a
+    per-user temp directory and is named by a hash of the target, since
+    socket paths are limited to ~100 bytes.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        user: str = "root",
+        port: int = 22,
+        key_file: Optional[str] = None,
+        connect_timeout: int = CONNECT_TIMEOUT,
+    ):
+        self.host = host
+        self.user = user
+        self.port = port
+        self.key_file = key_file
+        self.connect_timeout = connect_timeout
+        digest = hashlib.sha1(f"{user}@{host}:{port}".encode()).hexdigest()[:16]
+        self.control_path = _control_dir() / digest
+
+    @property
+    def destination(self) -> str:
+        return f"{self.user}@{self.host}"
+
+    def options(self) -> List[str]:
+        """``-o`` options shared by ``ssh`` and ``scp``."""
+        return [
+            '-o', 'StrictHostKeyChecking=no',
+            '-o', 'UserKnownHostsFile=/dev/null',
+            '-o', 'LogLevel=ERROR',
+            '-o', f'ConnectTimeout={self.connect_timeout}',
+            '-o', 'ControlMaster=auto',
+            '-o', f'ControlPath={self.control_path}',
+            '-o', f'ControlPersist={CONTROL_PERSIST}',
+        ]
+
+    def ssh_command(self, remote_cmd: Optional[str] = None, *, stdin: bool = False) -> List[str]:
+        """``ssh`` argv for *remote_cmd*; stdin is closed unless *stdin* is set."""
+        argv = [_ssh_binary(), *self.options()]
+        if not stdin:
+            argv.append('-n')
+        if self.key_file:
+            argv.extend(['-i', str(self.key_file)])
+        if self.port != 22:
+            argv.extend(['-p', str(self.port)])
+        argv.append(self.destination)
+        if remote_cmd is not None:
+            argv.append(remote_cmd)
+        return argv
+
+    def run(
+        self,
+        cmd: str,
+        *,
+        timeout: Optional[float] = 300,
+        capture: bool = True,
+        text: bool = True,
+        check: bool = True,
+    ) -> subprocess.CompletedProcess:
+        """Run one command and return its buffered result."""
+        return subprocess.run(
+            self.ssh_command(cmd),
+            timeout=timeout,
+            capture_output=capture,
+            text=text,
+            check=check,
+        )
+
+    def stream(
+        self,
+        cmd: str,
+        on_line: Optional[Callable[[str], None]] = None,
+        *,
+        timeout: Optional[float] = None,
+        check: bool = True,
+    ):
+        """Run one command, passing each output line to *on_line* as it arrives."""
+        return run_streaming(self.ssh_command(cmd), on_line=on_line, timeout=timeout, check=check)
+
+    def run_batch(
+        self,
+        commands: Sequence[str],
+        *,
+        on_line: Optional[Callable[[int, str], None]] = None,
+        stop_on_error: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[BatchResult]:
+        """
+        Run *commands* one after another in a single remote shell.
+
+        Each command runs in its own subshell, so ``exit`` or ``cd`` do not
+        leak into the next one.
+        Output is streamed: *on_line* receives ``(command_index, line)`` as
+        lines arrive. Each command's exit code is reported separately; with
+        *stop_on_error* the commands after the first failure do not run and
+        get ``exit_code=None``.
+        """
+        if not commands:
+            return []
+        marker = f"__uvmgr_{uuid.uuid4().hex}__"
+        script = []
+        for i, command in enumerate(commands):
+            # Subshells keep ``exit``/``cd`` local to their command; the end
+            # marker may follow output without a trailing newline
+            script.append(f"( {command}\n) </dev/null 2>&1; __rc=$?; echo '{marker}' {i} $__rc")
+            if stop_on_error:
+                script.append("[ $__rc -eq 0 ] || exit $__rc")
+
+        outputs: List[List[str]] = [[] for _ in commands]
+        codes: List[Optional[int]] = [None] * len(commands)
+        current = 0
+
+        def _collect(line: str) -> None:
+            nonlocal current
+            pos = line.find(marker)
+            if pos == -1:
+                if current < len(commands):
+                    outputs[current].append(line)
+                    if on_line is not None:
+                        on_line(current, line)
+                return
+            if pos:
+                outputs[current].append(line[:pos])
+                if on_line is not None:
+                    on_line(current, line[:pos])
+            index, code = line[pos + len(marker):].split()
+            codes[int(index)] = int(code)
+            current = int(index) + 1
+
+        with span("remote.run_batch", host=self.host, commands=len(commands)):
+            try:
+                self.stream("\n".join(script), _collect, timeout=timeout, check=False)
+            except subprocess.TimeoutExpired as e:
+                raise RemoteExecutionError(f"Remote batch timed out on {self.host}") from e
+            metric_counter("remote.batched_commands")(len(commands))
+
+        if codes[0] is None:
+            # ssh itself failed before the first command finished
+            tail = outputs[0][-1] if outputs[0] else "no output"
+            raise RemoteExecutionError(f"Remote batch failed on {self.host}: {tail}")
+        return [
+            BatchResult(command, code, "\n".join(lines))
+            for command, code, lines in zip(commands, codes, outputs)
+        ]
+
+    def close(self) -> None:
+        """Stop the master connection, if one is running."""
+        if self.control_path.exists():
+            subprocess.run(
+                [_ssh_binary(), *self.options(), '-O', 'exit', self.destination],
+                capture_output=True,
+                timeout=CONNECT_TIMEOUT,
+            )
+
+
+_SESSIONS: Dict[tuple, RemoteSession] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_session(host: str, **kwargs) -> RemoteSession:
+    """Pooled :class:`RemoteSession` for *host* and the SSH options in *kwargs*."""
+    user = kwargs.get('user') or 'root'
+    port = kwargs.get('port') or 22
+    key_file = kwargs.get('key_file')
+    key = (host, user, port, key_file)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _SESSIONS[key] = RemoteSession(host, user, port, key_file)
+        return session
+
+
+def close_sessions() -> None:
+    """Stop every pooled master connection."""
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+
 def run(host: str, cmd: str, *args, **kwargs) -> subprocess.CompletedProcess:
     """Execute command on remote host via SSH.
-    
+
     Args:
         host: Remote hostname or IP address
         cmd: Command to execute remotely
         *args: Additional command arguments
-        **kwargs: Additional options (user, key_file, timeout, etc.)
-        
+        **kwargs: Additional options (user, key_file, port, timeout, capture, text)
+
     Returns:
         CompletedProcess result from remote execution
-        
+
     Raises:
         RemoteExecutionError: If remote execution fails
     """
-    with span("remote.run", host=host, cmd=cmd) as current_span:
+    with span("remote.run", host=host, cmd=cmd):
+        session = get_session(host, **kwargs)
+        full_cmd = f"{cmd} {' '.join(str(arg) for arg in args)}" if args else cmd
+
+        add_span_attributes(**{
+            'remote.host': host,
+            'remote.user': session.user,
+            'remote.port': session.port,
+            'remote.command': full_cmd,
+            'remote.multiplexed': session.control_path.exists(),
+        })
+        add_span_event('remote.execution.start')
+
         try:
-            # Extract SSH options
-            user = kwargs.get('user', 'root')
-            key_file = kwargs.get('key_file')
-            port = kwargs.get('port', 22)
-            timeout = kwargs.get('timeout', 300)
-            
-            # Build SSH command
-            ssh_cmd = _build_ssh_command(host, cmd, user, key_file, port, args)
-            
-            add_span_attributes({
-                'remote.host': host,
-                'remote.user': user,
-                'remote.port': port,
-                'remote.command': cmd
-            })
-            
-            add_span_event('remote.execution.start')
-            
-            # Execute via SSH
-            result = local_run(
-                ssh_cmd,
-                timeout=timeout,
+            result = session.run(
+                full_cmd,
+                timeout=kwargs.get('timeout', 300),
                 capture=kwargs.get('capture', True),
-                text=kwargs.get('text', True)
+                text=kwargs.get('text', True),
             )
-            
-            add_span_event('remote.execution.success', {
-                'exit_code': result.returncode,
-                'stdout_length': len(result.stdout) if result.stdout else 0
-            })
-            
-            return result
-            
         except subprocess.CalledProcessError as e:
             add_span_event('remote.execution.error', {
                 'error': str(e),
@@ -73,126 +311,178 @@ def run(host: str, cmd: str, *args, **kwargs) -> subprocess.CompletedProcess:
             add_span_event('remote.execution.exception', {'error': str(e)})
             raise RemoteExecutionError(f"Remote execution failed: {e}") from e
 
+        add_span_event('remote.execution.success', {
+            'exit_code': result.returncode,
+            'stdout_length': len(result.stdout) if result.stdout else 0
+        })
+        return result
+
+
+def run_batch(host: str, commands: Sequence[str], **kwargs) -> List[BatchResult]:
+    """Run *commands* on *host* in one SSH session (see :meth:`RemoteSession.run_batch`).
+
+    Args:
+        host: Remote hostname or IP address
+        commands: Commands to run in order
+        **kwargs: SSH options (user, key_file, port) plus on_line,
+            stop_on_error and timeout
+
+    Returns:
+        One BatchResult per command
+    """
+    session = get_session(host, **kwargs)
+    return session.run_batch(
+        commands,
+        on_line=kwargs.get('on_line'),
+        stop_on_error=kwargs.get('stop_on_error', False),
+        timeout=kwargs.get('timeout'),
+    )
+
 
 def _build_ssh_command(
-    host: str, 
-    cmd: str, 
-    user: str, 
-    key_file: Optional[str], 
+    host: str,
+    cmd: str,
+    user: str,
+    key_file: Optional[str],
     port: int,
     args: tuple
 ) -> List[str]:
     """Build SSH command with proper escaping and options."""
-    ssh_cmd = ['ssh']
-    
-    # SSH options for non-interactive execution
-    ssh_cmd.extend([
-        '-o', 'StrictHostKeyChecking=no',
-        '-o', 'UserKnownHostsFile=/dev/null',
-        '-o', 'LogLevel=ERROR',
-        '-o', 'ConnectTimeout=30'
-    ])
-    
-    # Add key file if specified
-    if key_file:
-        ssh_cmd.extend(['-i', str(key_file)])
-        
-    # Add port if not default
-    if port != 22:
-        ssh_cmd.extend(['-p', str(port)])
-        
-    # Add user@host
-    ssh_cmd.append(f"{user}@{host}")
-    
-    # Add command with arguments
     full_cmd = f"{cmd} {' '.join(str(arg) for arg in args)}" if args else cmd
-    ssh_cmd.append(full_cmd)
-    
-    return ssh_cmd
+    return get_session(host, user=user, key_file=key_file, port=port).ssh_command(full_cmd)
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    """Bounded pool for remote calls, separate from the event loop's default pool."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_CONCURRENT, thread_name_prefix="uvmgr-remote"
+            )
+        return _EXECUTOR
 
 
 async def run_async(host: str, cmd: str, *args, **kwargs) -> subprocess.CompletedProcess:
     """Async version of remote execution."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, run, host, cmd, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor(), lambda: run(host, cmd, *args, **kwargs))
 
 
 def run_parallel(
-    hosts: List[str], 
-    cmd: str, 
-    *args, 
-    max_concurrent: int = 10,
+    hosts: List[str],
+    cmd: str,
+    *args,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     **kwargs
 ) -> Dict[str, Union[subprocess.CompletedProcess, Exception]]:
     """Execute command on multiple hosts in parallel.
-    
+
     Args:
         hosts: List of hostnames/IPs to execute on
         cmd: Command to execute
         *args: Command arguments
         max_concurrent: Maximum concurrent executions
         **kwargs: SSH options
-        
+
     Returns:
         Dict mapping hostname to result or exception
     """
-    async def _run_all():
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def _run_one(host: str):
-            async with semaphore:
-                try:
-                    return await run_async(host, cmd, *args, **kwargs)
-                except Exception as e:
-                    return e
-                    
-        tasks = [_run_one(host) for host in hosts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        return dict(zip(hosts, results))
-        
-    return asyncio.run(_run_all())
-
-
-def copy_file(local_path: Union[str, Path], remote_path: str, host: str, **kwargs) -> bool:
-    """Copy file to remote host via SCP.
-    
+    hosts = list(dict.fromkeys(hosts))
+    if not hosts:
+        return {}
+
+    def _run_one(host: str):
+        try:
+            return run(host, cmd, *args, **kwargs)
+        except Exception as e:
+            return e
+
+    with span("remote.run_parallel", hosts=len(hosts), cmd=cmd):
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrent, len(hosts)), thread_name_prefix="uvmgr-remote"
+        ) as pool:
+            return dict(zip(hosts, pool.map(_run_one, hosts)))
+
+
+def _copy_tree(
+    paths: List[Path], remote_path: str, session: RemoteSession, base: Optional[Path]
+) -> bool:
+    """Stream *paths* (files or directories) as one tar archive into *remote_path*."""
+    if base is None:
+        base = Path(os.path.commonpath([p.parent for p in paths]))
+    remote_cmd = f"mkdir -p {shlex.quote(remote_path)} && tar -xf - -C {shlex.quote(remote_path)}"
+    proc = subprocess.Popen(
+        session.ssh_command(remote_cmd, stdin=True),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+            for path in paths:
+                tar.add(path, arcname=path.relative_to(base).as_posix())
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass  # the remote side exited; its status and stderr tell why
+    stderr = proc.stderr.read().decode(errors="replace")
+    if proc.wait() != 0:
+        raise RemoteExecutionError(f"File copy to {session.host} failed: {stderr.strip()}")
+    return True
+
+
+def copy_file(
+    local_path: Union[str, Path, Iterable[Union[str, Path]]],
+    remote_path: str,
+    host: str,
+    **kwargs,
+) -> bool:
+    """Copy one file, or a set of files and directories, to a remote host.
+
+    A single file goes through ``scp``. A collection is sent as one
+    tar-over-ssh stream and unpacked below the remote directory
+    *remote_path*, keeping paths relative to ``base`` (default: the closest
+    common parent directory).
+
     Args:
-        local_path: Local file path
-        remote_path: Remote destination path
+        local_path: Local file path, or an iterable of paths
+        remote_path: Remote destination path (a directory for collections)
         host: Remote hostname
-        **kwargs: SSH options (user, key_file, port)
-        
+        **kwargs: SSH options (user, key_file, port) and base
+
     Returns:
         True if copy succeeded
-        
+
     Raises:
         RemoteExecutionError: If copy fails
     """
+    session = get_session(host, **kwargs)
+    if not isinstance(local_path, (str, Path)):
+        paths = [Path(p).resolve() for p in local_path]
+        base = kwargs.get('base')
+        with span("remote.copy_files", files=len(paths), remote_path=remote_path, host=host):
+            if not paths:
+                return True
+            try:
+                return _copy_tree(paths, remote_path, session, Path(base).resolve() if base else None)
+            except (OSError, ValueError) as e:
+                raise RemoteExecutionError(f"File copy failed: {e}") from e
+
     with span("remote.copy_file", local_path=str(local_path), remote_path=remote_path, host=host):
+        # Same control socket as ssh, so scp rides on the master connection
+        scp_cmd = ['scp', *session.options()]
+        if session.key_file:
+            scp_cmd.extend(['-i', str(session.key_file)])
+        if session.port != 22:
+            scp_cmd.extend(['-P', str(session.port)])
+        scp_cmd.extend([str(local_path), f"{session.destination}:{remote_path}"])
+
         try:
-            user = kwargs.get('user', 'root')
-            key_file = kwargs.get('key_file')
-            port = kwargs.get('port', 22)
-            
-            scp_cmd = ['scp']
-            
-            # SCP options
-            scp_cmd.extend([
-                '-o', 'StrictHostKeyChecking=no',
-                '-o', 'UserKnownHostsFile=/dev/null',
-                '-o', 'LogLevel=ERROR'
-            ])
-            
-            if key_file:
-                scp_cmd.extend(['-i', str(key_file)])
-                
-            if port != 22:
-                scp_cmd.extend(['-P', str(port)])
-                
-            scp_cmd.extend([str(local_path), f"{user}@{host}:{remote_path}"])
-            
-            result = local_run(scp_cmd)
-            return result.returncode == 0
-            
-        except Exception as e:
+            result = subprocess.run(scp_cmd, capture_output=True, text=True)
+        except OSError as e:
             raise RemoteExecutionError(f"File copy failed: {e}") from e
+        return result.returncode == 0
@@ -8,14 +8,17 @@ for test execution and reporting.
 
 from __future__ import annotations
 
+import functools
 import json
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from uvmgr.core.instrumentation import span
-from uvmgr.core.process import run_logged
+from uvmgr.core.process import run_logged, run_streaming
+from uvmgr.core.test_impact import get_impact_store
 
 
 def execute_pytest(
@@ -25,10 +28,17 @@ def execute_pytest(
     fail_fast: bool = False,
     test_types: Optional[List[str]] = None,
     markers: Optional[List[str]] = None,
-    generate_report: bool = True
+    generate_report: bool = True,
+    timeout: Optional[float] = 300,
+    on_line: Optional[Callable[[str], None]] = None,
+    impact: bool = False,
 ) -> Dict[str, Any]:
     """
     Execute pytest with specified options.
+
+    Output is streamed rather than buffered: *on_line* sees every line as it
+    is produced and only the last lines are kept in the ``output`` entry of the
+    result, so memory stays flat on very large test logs.
     
     Parameters
     ----------
@@ -46,6 +56,13 @@ def execute_pytest(
         Test markers to run
     generate_report : bool
         Whether to generate comprehensive report
+    timeout : Optional[float]
+        Seconds before pytest is killed (``None`` disables the limit)
+    on_line : Optional[Callable[[str], None]]
+        Called with each line of pytest output as it arrives
+    impact : bool
+        Run only tests affected by changes since their last run plus those
+        that did not pass, slowest first (see :mod:`uvmgr.core.test_impact`)
         
     Returns
     -------
@@ -53,6 +70,25 @@ def execute_pytest(
         Test execution results
     """
     with span("runtime.pytest.execute"):
+        selection = None
+        if impact:
+            store = get_impact_store(Path.cwd())
+            selection = store.select()
+            if not selection.args:
+                return {
+                    "success": True,
+                    "exit_code": 0,
+                    "stdout": "No tests affected since the last run",
+                    "stderr": "",
+                    "total_tests": 0,
+                    "passed": 0,
+                    "failed": 0,
+                    "skipped": 0,
+                    "coverage": {},
+                    "test_results": {},
+                    "impact": _impact_summary(selection),
+                }
+
         cmd = ["python", "-m", "pytest"]
         
         if verbose:
@@ -60,19 +96,8 @@ def execute_pytest(
         else:
             cmd.append("-q")
             
-        if parallel:
-            # Try to use pytest-xdist if available
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["python", "-c", "import xdist"],
-                    capture_output=True,
-                    check=True
-                )
-                cmd.extend(["-n", "auto"])
-            except subprocess.CalledProcessError:
-                # xdist not available, continue without parallel execution
-                pass
+        if parallel and _has_xdist(shutil.which("python") or "python"):
+            cmd.extend(["-n", "auto"])
                 
         if fail_fast:
             cmd.append("-x")
@@ -89,18 +114,18 @@ def execute_pytest(
             json_report_path = f.name
             
         cmd.extend(["--json-report", f"--json-report-file={json_report_path}"])
+        if selection is not None:
+            cmd.extend(selection.args)
         
         try:
-            # Execute pytest
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            # Execute pytest, streaming output with a bounded tail buffer
+            result = run_streaming(cmd, on_line=on_line, timeout=timeout, check=False)
             
             # Parse JSON report if available
             test_results = _parse_pytest_json_report(json_report_path)
+            node_results = test_results.pop("tests", [])
+            if selection is not None:
+                store.record(node_results, selection.dep_hashes, complete=not fail_fast)
             
             # Parse coverage if collected
             coverage_results = {}
@@ -108,23 +133,26 @@ def execute_pytest(
                 coverage_results = _parse_coverage_report()
                 
             return {
-                "success": result.returncode == 0,
-                "exit_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "success": result.exit_code == 0,
+                "exit_code": result.exit_code,
+                "stdout": result.output,
+                "stderr": "",
+                "output_lines": result.line_count,
                 "total_tests": test_results.get("total", 0),
                 "passed": test_results.get("passed", 0),
                 "failed": test_results.get("failed", 0),
                 "skipped": test_results.get("skipped", 0),
                 "coverage": coverage_results,
-                "test_results": test_results
+                "test_results": test_results,
+                **({"impact": _impact_summary(selection)} if selection is not None else {}),
             }
             
-        except subprocess.TimeoutExpired:
+        except subprocess.TimeoutExpired as e:
             return {
                 "success": False,
                 "error": "Test execution timed out",
-                "timeout": True
+                "timeout": True,
+                "stdout": e.output or "",
             }
         except Exception as e:
             return {
@@ -361,6 +389,21 @@ def validate_test_environment() -> Dict[str, Any]:
 
 # Helper functions
 
+@functools.lru_cache(maxsize=None)
+def _has_xdist(python: str) -> bool:
+    """Whether pytest-xdist is importable by *python* (probed once per interpreter)."""
+    return subprocess.run([python, "-c", "import xdist"], capture_output=True).returncode == 0
+
+
+def _impact_summary(selection) -> Dict[str, Any]:
+    """Counts describing an impact selection."""
+    return {
+        "affected_files": len(selection.affected),
+        "rerun_tests": len(selection.rerun),
+        "skipped_files": selection.skipped,
+    }
+
+
 def _parse_pytest_json_report(json_path: str) -> Dict[str, Any]:
     """Parse pytest JSON report."""
     try:
@@ -373,7 +416,8 @@ def _parse_pytest_json_report(json_path: str) -> Dict[str, Any]:
             "passed": summary.get("passed", 0),
             "failed": summary.get("failed", 0),
             "skipped": summary.get("skipped", 0),
-            "errors": summary.get("error", 0)
+            "errors": summary.get("error", 0),
+            "tests": data.get("tests", []),
         }
     except (FileNotFoundError, json.JSONDecodeError, KeyError):
         return {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
@@ -21,6 +21,7 @@ import shlex
 import time
 from pathlib import Path
 
+from uvmgr.core.cache import get_result, store_result
 from uvmgr.core.config import env_or
 from uvmgr.core.instrumentation import add_span_attributes, add_span_event
 from uvmgr.core.metrics import OperationResult, package_metrics
@@ -47,10 +48,21 @@ def _extra_flags() -> list[str]:
     return flags
 
 
-def call(sub_cmd: str, *, capture: bool = False, cwd: Path | None = None) -> str | None:
+def call(
+    sub_cmd: str,
+    *,
+    capture: bool = False,
+    cwd: Path | None = None,
+    cache_ttl: float | None = None,
+) -> str | None:
     """
     Execute `uv <sub_cmd>` and return stdout if *capture* is True.
 
+    With *cache_ttl* (seconds) and *capture*, the output of a previous
+    successful run in the same directory is reused from the command result
+    cache instead of spawning uv again. Only pass it for read-only commands
+    whose output is stable (``uv cache dir``, ``uv tool dir``).
+
     Examples
     --------
     >>> call("add fastapi ruff")  # doctest: +ELLIPSIS
@@ -59,7 +71,18 @@ def call(sub_cmd: str, *, capture: bool = False, cwd: Path | None = None) -> str
     cmd = ["uv"] + shlex.split(sub_cmd) + _extra_flags()
     _log.debug("uv call: %s", cmd)
     with span("uv.call", cmd=" ".join(cmd)):
-        return run_logged(cmd, capture=capture, cwd=cwd)
+        if cache_ttl is None or not capture:
+            return run_logged(cmd, capture=capture, cwd=cwd)
+
+        key = f"{(cwd or Path.cwd()).resolve()}\0{shlex.join(cmd)}"
+        if (cached := get_result(key, ttl=cache_ttl)) is not None and cached.exit_code == 0:
+            add_span_attributes(**{"uv.cached": True})
+            return cached.output
+
+        output = run_logged(cmd, capture=capture, cwd=cwd)
+        if output:  # dry runs return "" – never cache those
+            store_result(key, output, exit_code=0)
+        return output
 
 
 # --------------------------------------------------------------------------- #
@@ -2,6 +2,8 @@
 import json
 import os
 import statistics
+import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Dict, List
@@ -257,6 +259,203 @@ class TestTelemetryIntegration:
         print(f"\nError tracking: {len(errors_tracked)} errors captured")
 
 
+_TELEMETRY_BENCH = """
+import json, timeit
+from uvmgr.core.telemetry import OTEL_ENABLED, metric_counter, span
+
+def call():
+    with span("bench.operation", component="bench"):
+        metric_counter(f"bench.{'calls'}")(1)
+
+call()  # warm the instrument registry
+n = 20000
+print(json.dumps({"enabled": OTEL_ENABLED, "ns_per_call": timeit.timeit(call, number=n) / n * 1e9}))
+"""
+
+
+def _telemetry_overhead(endpoint: str | None) -> dict:
+    """Measure span() + counter cost per call in a fresh interpreter."""
+    env = {k: v for k, v in os.environ.items() if k != "OTEL_EXPORTER_OTLP_ENDPOINT"}
+    if endpoint:
+        env["OTEL_EXPORTER_OTLP_ENDPOINT"] = endpoint
+    result = subprocess.run(
+        [sys.executable, "-c", _TELEMETRY_BENCH],
+        capture_output=True, text=True, env=env, timeout=120, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestTelemetryOverhead:
+    """Microbenchmark: per-call overhead of span() + metric_counter()."""
+
+    def test_overhead_exporter_off(self):
+        """With no endpoint the shared no-op path must stay cheap."""
+        stats = _telemetry_overhead(None)
+        print(f"\nspan+counter (exporter off): {stats['ns_per_call']:.0f} ns/call")
+
+        assert stats["enabled"] is False
+        assert stats["ns_per_call"] < 20_000, f"No-op telemetry too slow: {stats}"
+
+    def test_overhead_exporter_on(self):
+        """With an exporter configured, instruments are reused across calls."""
+        # Nothing listens on the discard port; export happens in background threads
+        stats = _telemetry_overhead("http://127.0.0.1:9")
+        print(f"\nspan+counter (exporter on): {stats['ns_per_call']:.0f} ns/call")
+
+        assert stats["enabled"] is True
+        assert stats["ns_per_call"] < 1_000_000, f"Telemetry too slow: {stats}"
+
+
+class TestAGIObservationCost:
+    """Benchmark: observe_with_agi_reasoning() cost must not grow with history."""
+
+    def test_constant_cost_at_100k_observations(self):
+        from uvmgr.core.agi_reasoning import ExponentialAGIReasoningEngine
+        from uvmgr.core.semconv import CliAttributes
+
+        engine = ExponentialAGIReasoningEngine()
+        commands = ["deps", "tests", "lint", "build", "otel", "weaver", "forge"]
+        chunk, total = 10_000, 100_000
+        us_per_observation = []
+
+        for start in range(0, total, chunk):
+            began = time.perf_counter()
+            for i in range(start, start + chunk):
+                engine.observe({CliAttributes.COMMAND: commands[i % 7], CliAttributes.EXIT_CODE: 0})
+            us_per_observation.append((time.perf_counter() - began) / chunk * 1e6)
+
+        first, last = us_per_observation[0], us_per_observation[-1]
+        print(f"\nAGI observe: first 10k {first:.1f} µs/obs, last 10k {last:.1f} µs/obs")
+
+        assert len(engine.observations) <= engine.observations.maxlen
+        assert last < first * 2, f"Per-observation cost grows with history: {us_per_observation}"
+        assert last < 1_000, f"Observation too slow: {last:.0f} µs"
+
+
+class TestHistoryAnalytics:
+    """Benchmark: history analytics over a year of commands stay in SQL."""
+
+    def test_year_of_history_under_a_second(self, tmp_path, monkeypatch):
+        import random
+        from datetime import datetime, timedelta
+
+        from uvmgr.runtime import history
+
+        monkeypatch.setattr(history, "_get_history_db_path", lambda: tmp_path / "commands.db")
+        rng = random.Random(0)
+        commands = ["deps", "tests", "lint", "build", "otel", "docs"]
+        now, records = datetime(2025, 1, 1, 9), []
+        while len(records) < 365 * 100:  # ~100 commands per day
+            now += timedelta(seconds=rng.choice([20, 60, 300, 900, 2 * 3600, 14 * 3600]))
+            records.append({"command": rng.choice(commands), "exit_code": rng.choice([0, 0, 1]), "timestamp": now})
+        assert history.store_command_records(records)["success"]
+
+        timings = {}
+        for name, call in {
+            "similar_sessions": lambda: history.find_similar_command_sessions(["deps", "tests", "lint"]),
+            "patterns": lambda: history.analyze_command_patterns(),
+            "productivity": lambda: history.analyze_productivity_metrics(),
+        }.items():
+            start = time.perf_counter()
+            assert call()["success"]
+            timings[name] = time.perf_counter() - start
+        print(f"\nHistory analytics over {len(records)} records: {timings}")
+
+        assert max(timings.values()) < 1.0, timings
+
+
+class TestMCPConcurrency:
+    """Benchmark: tree scans must not stall concurrent MCP requests."""
+
+    def test_p99_latency_of_mixed_calls(self, tmp_path, monkeypatch):
+        import asyncio
+
+        from uvmgr.core.file_listing import get_file_listing, search_text
+        from uvmgr.mcp import resources
+
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'bench'\nversion = '0.1.0'\n")
+        for d in range(40):
+            pkg = tmp_path / f"pkg{d}"
+            pkg.mkdir()
+            for f in range(50):
+                (pkg / f"mod{f}.py").write_text("def f():\n    return 1\n" * 200)
+        monkeypatch.chdir(tmp_path)
+        structure = getattr(resources.get_project_structure, "fn", resources.get_project_structure)
+        info = getattr(resources.get_project_info, "fn", resources.get_project_info)
+        read_file = getattr(resources.read_project_file, "fn", resources.read_project_file)
+
+        async def search():
+            # Same call search_code makes; a needle that never matches scans every file
+            listing = get_file_listing(tmp_path, watch=True)
+            return await asyncio.to_thread(search_text, listing, "no such text", pattern="*.py", limit=20)
+
+        async def timed(kind, call):
+            start = time.perf_counter()
+            await call()
+            return kind, time.perf_counter() - start
+
+        async def mixed():
+            calls = []
+            for i in range(200):
+                calls.append(timed("search", search) if i % 10 == 0 else
+                             timed("structure", structure) if i % 10 == 1 else
+                             timed("light", info if i % 2 else lambda: read_file("pyproject.toml")))
+            return await asyncio.gather(*calls)
+
+        latencies: Dict[str, List[float]] = {}
+        for kind, elapsed in asyncio.run(mixed()):
+            latencies.setdefault(kind, []).append(elapsed)
+        p99 = {kind: statistics.quantiles(v, n=100)[98] if len(v) > 1 else v[0] for kind, v in latencies.items()}
+        print(f"\nMCP mixed calls p99: " + ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in p99.items()))
+
+        assert p99["light"] < p99["search"], p99
+        assert p99["light"] < 0.5, f"Light MCP calls stalled behind scans: {p99}"
+
+
+def _wide_bpmn(branches: int, length: int) -> str:
+    """A parallel split into *branches* chains of *length* script tasks, then a join."""
+    tasks, flows = [], []
+    for b in range(branches):
+        previous = "split"
+        for i in range(length):
+            task_id = f"T{b}_{i}"
+            tasks.append(f'<bpmn:scriptTask id="{task_id}"><bpmn:script>x = {i}</bpmn:script></bpmn:scriptTask>')
+            flows.append(f'<bpmn:sequenceFlow id="F{b}_{i}" sourceRef="{previous}" targetRef="{task_id}"/>')
+            previous = task_id
+        flows.append(f'<bpmn:sequenceFlow id="J{b}" sourceRef="{previous}" targetRef="join"/>')
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<bpmn:definitions xmlns:bpmn="http://www.omg.org/spec/BPMN/20100524/MODEL" id="D" targetNamespace="bench">
+  <bpmn:process id="Bench" isExecutable="true">
+    <bpmn:startEvent id="start"/><bpmn:parallelGateway id="split"/>{"".join(tasks)}
+    <bpmn:parallelGateway id="join"/><bpmn:endEvent id="end"/>
+    <bpmn:sequenceFlow id="S" sourceRef="start" targetRef="split"/>
+    <bpmn:sequenceFlow id="E" sourceRef="join" targetRef="end"/>{"".join(flows)}
+  </bpmn:process>
+</bpmn:definitions>"""
+
+
+class TestSpiffRunnerOverhead:
+    """Benchmark: per-task cost of the SpiffWorkflow runner on a 500-task workflow."""
+
+    def test_500_task_workflow(self, tmp_path):
+        from uvmgr.runtime.agent.spiff import run_bpmn
+
+        path = tmp_path / "bench.bpmn"
+        path.write_text(_wide_bpmn(branches=25, length=20))
+
+        ms_per_task, stats = {}, {}
+        for mode, batch in (("cold", True), ("batch", True), ("step", False)):
+            start = time.perf_counter()
+            stats[mode] = run_bpmn(path, batch=batch)
+            ms_per_task[mode] = (time.perf_counter() - start) / stats[mode]["tasks_executed"] * 1000
+        print("\nSpiff runner, 500 script tasks: " + ", ".join(f"{k} {v:.2f} ms/task" for k, v in ms_per_task.items()))
+
+        assert all(s["tasks_executed"] >= 500 for s in stats.values()), stats
+        assert stats["batch"]["steps_executed"] < stats["step"]["steps_executed"] / 10
+        assert ms_per_task["batch"] < ms_per_task["step"], ms_per_task
+        assert ms_per_task["batch"] < 20, f"Runner overhead too high: {ms_per_task}"
+
+
 class TestScalabilityBenchmarks:
     """Test uvmgr performance at scale."""
 
@@ -63,3 +63,49 @@ def test_remote_command_available() -> None:
     result = runner.invoke(app, ["remote", "--help"])
     assert result.exit_code == 0
     assert "remote" in result.stdout.lower()
+
+
+def test_manifest_matches_sources() -> None:
+    """The prebuilt manifest must be regenerated when command modules change."""
+    from uvmgr.commands._manifest import COMMANDS, build_manifest
+
+    assert COMMANDS == build_manifest(), "run `python -m uvmgr.commands._manifest`"
+
+
+def test_help_imports_no_command_modules() -> None:
+    """Listing commands is served from the manifest without importing sub-apps."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from uvmgr.cli import app\n"
+        "assert CliRunner().invoke(app, ['--help']).exit_code == 0\n"
+        "print(sorted(m for m in sys.modules if m.startswith('uvmgr.commands.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "['uvmgr.commands._manifest']"
+
+
+def test_invoked_command_is_mounted_lazily() -> None:
+    """Invoking a verb imports and mounts its sub-app on first use."""
+    result = runner.invoke(app, ["cache", "--help"])
+    assert result.exit_code == 0
+    assert "Manage uv cache" in result.stdout
+
+
+def test_parse_importtime() -> None:
+    """`-X importtime` lines are parsed into per-module costs."""
+    from uvmgr.cli_utils import parse_importtime
+
+    costs = parse_importtime([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   typer.colors",
+        "import time:      3000 |       3120 | typer",
+        "Some other stderr line",
+    ])
+    assert [(c.module, c.self_us, c.cumulative_us, c.depth) for c in costs] == [
+        ("typer.colors", 120, 120, 1),
+        ("typer", 3000, 3120, 0),
+    ]
@@ -0,0 +1,24 @@
+from typer.testing import CliRunner
+
+from uvmgr.commands.performance import app
+
+runner = CliRunner()
+
+
+def test_fail_on_regression_without_baseline_fails(tmp_path):
+    result = runner.invoke(app, [
+        "benchmark", "--commands", "search", "--iterations", "1", "--warmup", "0",
+        "--fail-on-regression", "10", "--path", str(tmp_path),
+    ])
+
+    assert result.exit_code == 1
+    assert "needs a baseline" in result.output
+
+
+def test_fail_on_regression_gates_against_a_recorded_baseline(tmp_path):
+    args = ["benchmark", "--commands", "search", "--iterations", "2", "--warmup", "0", "--path", str(tmp_path)]
+
+    assert runner.invoke(app, [*args, "--baseline"]).exit_code == 0
+    result = runner.invoke(app, [*args, "--fail-on-regression", "100000"])
+    assert result.exit_code == 0, result.output
+    assert "needs a baseline" not in result.output
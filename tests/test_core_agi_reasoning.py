@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from uvmgr.core import agi_reasoning
+from uvmgr.core.agi_reasoning import AGIReasoningEngine, ExponentialAGIReasoningEngine
+from uvmgr.core.semconv import CliAttributes
+
+
+def _cmd(command):
+    return {CliAttributes.COMMAND: command, CliAttributes.EXIT_CODE: 0}
+
+
+def test_observations_are_bounded():
+    engine = AGIReasoningEngine(max_observations=50)
+    for i in range(200):
+        engine.observe(_cmd("deps" if i % 2 else "tests"))
+
+    assert len(engine.observations) == 50
+    assert len(engine.learning_history) == 50
+    assert len(engine._by_timestamp) <= 50
+    assert engine.get_reasoning_summary()["recent_observations"] == 50
+
+
+def test_causal_predecessors_and_patterns():
+    engine = AGIReasoningEngine()
+    deps = engine.observe(_cmd("deps"))
+    engine.observe(_cmd("otel"))
+    tests = engine.observe(_cmd("tests"))
+
+    # Most recent first; unrelated commands are ignored
+    assert [p.split("@")[0] for p in tests.causal_predecessors] == [
+        "observability_enhancement", "dependency_management",
+    ]
+    assert tests.causal_predecessors[-1] == f"dependency_management@{deps.timestamp}"
+    assert len(engine.causal_patterns) == 2
+
+    engine.observe(_cmd("deps"))
+    engine.observe(_cmd("tests"))
+    by_cause = {p.cause_pattern[CliAttributes.COMMAND]: p for p in engine.causal_patterns}
+    assert len(engine.causal_patterns) == 2
+    assert by_cause["deps"].frequency == 3  # both deps runs precede the second tests run
+    assert by_cause["otel"].frequency == 2
+
+
+def test_causal_window_and_predecessor_cap(monkeypatch):
+    engine = AGIReasoningEngine()
+    for _ in range(agi_reasoning.MAX_PREDECESSORS + 5):
+        engine.observe(_cmd("lint"))
+    assert len(engine.observe(_cmd("tests")).causal_predecessors) == agi_reasoning.MAX_PREDECESSORS
+
+    monkeypatch.setattr(agi_reasoning, "CAUSAL_WINDOW", 0.0)
+    time.sleep(0.01)
+    assert engine.observe(_cmd("tests")).causal_predecessors == []
+
+
+def test_cross_domain_instances_are_bounded():
+    engine = AGIReasoningEngine()
+    for i in range(agi_reasoning.MAX_PATTERN_INSTANCES + 10):
+        engine.observe(_cmd("lint"), {"domain": f"d{i % 3}"})
+
+    [pattern] = engine.cross_domain_patterns
+    assert len(pattern.concrete_instances) == agi_reasoning.MAX_PATTERN_INSTANCES
+    assert pattern.domains == {"d0", "d1", "d2"}
+
+
+def test_understanding_confidence_tracks_rescaled_observations():
+    engine = ExponentialAGIReasoningEngine()
+    for command in ("deps", "tests", "build", "tests"):
+        engine.observe(_cmd(command))
+
+    recent = list(engine._recent)
+    assert engine._recent_confidence == pytest.approx(sum(o.confidence for o in recent))
+
+
+def test_background_reasoning():
+    engine = ExponentialAGIReasoningEngine(background=True)
+    engine.observe(_cmd("deps"))
+    tests = engine.observe(_cmd("tests"))
+
+    summary = engine.get_reasoning_summary()  # waits for pending observations
+    assert summary["total_observations"] == 2
+    assert summary["causal_patterns_discovered"] == 1
+    assert len(tests.causal_predecessors) == 1
+    assert engine._worker.daemon
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from uvmgr.core import cache
+
+
+@pytest.fixture(autouse=True)
+def _tmp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_DB", tmp_path / "runs.db")
+
+
+def test_store_and_get_result():
+    assert cache.get_result("uv --version") is None
+    cache.store_result("uv --version", "uv 0.7.0\n", exit_code=0)
+
+    result = cache.get_result("uv --version")
+    assert result.output == "uv 0.7.0\n"
+    assert result.exit_code == 0
+    assert cache.cache_hit("uv --version")
+    assert not cache.cache_hit("uv --help")
+
+
+def test_store_replaces_previous_result():
+    cache.store_result("cmd", "old", exit_code=1)
+    cache.store_result("cmd", "new!", exit_code=0)
+
+    assert cache.get_result("cmd").output == "new!"
+    assert cache.cache_stats() == {"entries": 1, "bytes": 4}
+
+
+def test_ttl_expiry():
+    cache.store_result("cmd", "out")
+    assert cache.get_result("cmd", ttl=0) is None
+
+    time.sleep(0.01)
+    assert cache.purge(ttl=0) == 1
+    assert cache.cache_stats()["entries"] == 0
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    for i in range(5):
+        cache.store_result(f"cmd{i}", "x" * 10)
+    cache.get_result("cmd0")  # refresh cmd0 so cmd1 is least recently used
+
+    assert cache.purge(max_entries=4) == 1
+    assert cache.get_result("cmd1") is None
+    assert cache.get_result("cmd0") is not None
+
+    cache.purge(max_bytes=25)
+    assert cache.cache_stats() == {"entries": 2, "bytes": 20}
+
+
+def test_clear_cache():
+    cache.store_result("cmd", "out")
+    cache.clear_cache()
+    assert cache.cache_stats() == {"entries": 0, "bytes": 0}
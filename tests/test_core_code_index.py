@@ -0,0 +1,130 @@
+import os
+
+import pytest
+
+from uvmgr.core.code_index import ProjectIndex
+
+MODULE = '''\
+import os
+from typing import Optional as Opt
+
+LIMIT = 10
+
+
+@decorate
+class Widget(Base):
+    """A widget."""
+
+    def size(self, items):
+        for item in items:
+            if item and self.ok:
+                return item
+        return None
+
+    async def load(self):
+        with span("widget.load"):
+            return await fetch()
+'''
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "widget.py").write_text(MODULE)
+    (pkg / "util.py").write_text("def helper():\n    return 1\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "ignored.py").write_text("def hidden(): pass\n")
+    return tmp_path
+
+
+@pytest.fixture
+def index(project):
+    idx = ProjectIndex(project)
+    yield idx
+    idx.close()
+
+
+def test_symbols_are_extracted(index, project):
+    index.refresh()
+    widget = project / "pkg" / "widget.py"
+
+    by_qualname = {s.qualname: s for s in index.symbols(path=widget)}
+    assert by_qualname["os"].kind == "import"
+    assert by_qualname["typing"].detail["names"] == ["Optional"]
+    assert by_qualname["LIMIT"].kind == "variable"
+
+    cls = by_qualname["Widget"]
+    assert cls.detail["bases"] == ["Base"]
+    assert cls.detail["decorators"] == ["decorate"]
+    assert cls.detail["docstring"] == "A widget."
+
+    size = by_qualname["Widget.size"]
+    assert size.parent == "Widget"
+    assert size.complexity == 4  # for + if + `and`
+    assert (size.line, size.end_line) == (11, 15)
+
+    load = by_qualname["Widget.load"]
+    assert load.is_async
+    assert load.detail["contexts"] == ["span"]
+
+    assert [s.name for s in index.symbols(kind="decorator")] == ["decorate"]
+    assert index.segments(widget, [size])[0].splitlines()[0] == "    def size(self, items):"
+
+
+def test_refresh_is_incremental(index, project):
+    first = index.refresh()
+    assert (first.scanned, first.parsed) == (2, 2)  # .venv is pruned
+
+    assert index.refresh().parsed == 0
+
+    util = project / "pkg" / "util.py"
+    util.write_text("def helper():\n    return 2\n\ndef other():\n    pass\n")
+    assert index.refresh().parsed == 1
+    assert [s.name for s in index.symbols(kind="function", name="^(helper|other)$")] == ["helper", "other"]
+
+    # Touched but identical content is re-hashed, not re-parsed
+    os.utime(util, ns=(0, 0))
+    assert index.refresh().parsed == 0
+
+    util.unlink()
+    stats = index.refresh()
+    assert stats.removed == 1
+    assert list(index.symbols(name="helper")) == []
+
+
+def test_subtree_refresh_and_queries(index, project):
+    other = project / "other"
+    other.mkdir()
+    (other / "mod.py").write_text("x = 1\n")
+
+    stats = index.refresh(project / "pkg")
+    assert stats.scanned == 2
+    assert [f.path.name for f in index.files()] == ["util.py", "widget.py"]
+    assert [f.path.name for f in index.files(project / "pkg", pattern="w*.py")] == ["widget.py"]
+
+    index.refresh()
+    assert [f.path.name for f in index.files(other)] == ["mod.py"]
+
+
+def test_syntax_errors_are_recorded(index, project):
+    broken = project / "pkg" / "broken.py"
+    broken.write_text("def broken(:\n")
+
+    stats = index.refresh()
+    assert stats.errors == 1
+    assert index.file(broken).error.startswith("SyntaxError")
+    assert list(index.symbols(path=broken)) == []
+
+
+def test_index_persists_across_instances(index, project):
+    index.refresh()
+    index.close()
+
+    reopened = ProjectIndex(project)
+    try:
+        assert reopened.refresh().parsed == 0
+        assert reopened.file(project / "pkg" / "util.py").lines == 2
+    finally:
+        reopened.close()
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from uvmgr.core.file_listing import FileListing, search_text
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "a.py").write_text("x = 1\n# TODO: first\n")
+    (pkg / "b.py").write_text("# todo: second\n# TODO: third\n")
+    (pkg / "blob.bin").write_bytes(b"TODO\0binary")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "c.py").write_text("# TODO: hidden\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "d.py").write_text("# TODO: pruned\n")
+    return tmp_path
+
+
+def test_tree_skips_pruned_and_hidden(project):
+    listing = FileListing(project)
+
+    assert listing.tree() == ["pkg/", "  a.py", "  b.py", "  blob.bin", "pyproject.toml"]
+    assert "  c.py" in listing.tree(hidden=True)
+    assert all("d.py" not in line for line in listing.tree(hidden=True))
+    assert listing.tree(limit=2) == ["pkg/", "  a.py"]
+
+
+def test_files_match_like_rglob(project):
+    listing = FileListing(project)
+
+    names = sorted(p.name for p in listing.files("*.py"))
+    assert names == ["a.py", "b.py", "c.py"]
+    assert [p.name for p in listing.files("pkg/*.bin")] == ["blob.bin"]
+
+
+def test_search_stops_at_limit(project):
+    listing = FileListing(project)
+
+    matches, truncated = search_text(listing, "todo", pattern="pkg/*")
+    assert [(m.path.name, m.line) for m in matches] == [("a.py", 2), ("b.py", 1), ("b.py", 2)]
+    assert truncated is False
+
+    matches, truncated = search_text(listing, "todo", pattern="pkg/*", limit=2)
+    assert len(matches) == 2
+    assert truncated is True
+
+
+def test_listing_is_reused_until_a_directory_changes(project):
+    listing = FileListing(project)
+    first = listing.entries()
+
+    assert listing.entries() is first
+
+    (project / "pkg" / "new.py").write_text("")
+    pkg = project / "pkg"
+    stat = pkg.stat()
+    os.utime(pkg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert ("pkg/new.py", False) in listing.entries()
+
+
+def test_invalidate_forces_rewalk(project):
+    listing = FileListing(project)
+    first = listing.entries()
+
+    listing.invalidate()
+
+    assert listing.entries() is not first
@@ -0,0 +1,84 @@
+import json
+import multiprocessing
+
+import pytest
+
+from uvmgr.core import history
+
+
+@pytest.fixture(autouse=True)
+def _tmp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "_DB", tmp_path / "history.db")
+
+
+def test_log_and_filter_commands():
+    history.log_command("deps", ["add", "rich"], exit_code=0, duration=1.5, metadata={"k": "v"})
+    history.log_command("tests", exit_code=1, error="boom")
+    history.log_command("deps", ["remove", "rich"], exit_code=0)
+
+    entries = history.get_command_history()
+    assert [e["command"] for e in entries] == ["deps", "tests", "deps"]
+    assert entries[0]["args"] == ["add", "rich"]
+    assert entries[0]["metadata"] == {"k": "v"}
+    assert entries[1]["error"] == "boom"
+
+    assert [e["args"] for e in history.get_command_history(command="deps", limit=1)] == [["remove", "rich"]]
+    assert len(history.get_command_history(successful_only=True)) == 2
+
+
+def test_stats_follow_trimmed_window(monkeypatch):
+    monkeypatch.setattr(history, "MAX_COMMANDS", 4)
+    for i in range(6):
+        history.log_command("lint" if i < 2 else "build", exit_code=i % 2, duration=float(i))
+
+    stats = history.get_command_stats()
+    assert stats["total_commands"] == 4
+    assert stats["most_used"] == [("build", 4)]  # both lint runs were trimmed
+    assert stats["unique_commands"] == 1
+    assert stats["success_rate"] == 50.0
+    assert stats["avg_duration"] == pytest.approx((2 + 3 + 4 + 5) / 4)
+    assert stats["recent_activity"]["last_24h"] == 4
+    assert len(history.get_command_history(limit=0)) == 4
+
+
+def test_file_history_and_clear(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "MAX_FILES", 3)
+    for i in range(5):
+        history.log_output(tmp_path / f"out{i}.txt")
+    assert history.last_files(2) == [tmp_path / "out3.txt", tmp_path / "out4.txt"]
+    assert len(history.last_files(10)) == 3
+
+    history.log_command("deps")
+    history.clear_history(command_history=True, file_history=True)
+    assert history.get_command_history() == []
+    assert history.last_files() == []
+    assert history.get_command_stats()["total_commands"] == 0
+
+
+def test_legacy_json_is_imported(tmp_path):
+    legacy = tmp_path / "command_history.json"
+    legacy.write_text(json.dumps([
+        {"ts": "2024-01-01T00:00:00", "command": "build", "args": [], "exit_code": 0, "duration": 2.0},
+    ]))
+
+    assert [e["command"] for e in history.get_command_history()] == ["build"]
+    assert not legacy.exists()
+    assert (tmp_path / "command_history.json.migrated").exists()
+    assert history.get_command_stats()["recent_activity"]["last_24h"] == 0
+
+
+def _log_many(db, n):
+    history._DB = db
+    for _ in range(n):
+        history.log_command("deps")
+
+
+def test_concurrent_processes_do_not_lose_writes(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_log_many, args=(tmp_path / "history.db", 25)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+
+    assert history.get_command_stats()["total_commands"] == 75
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+from uvmgr.core import process
+
+
+def _py(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_streaming_calls_on_line_and_keeps_tail():
+    seen = []
+    result = process.run_streaming(
+        _py("for i in range(1000): print(i)"), on_line=seen.append, tail_lines=3
+    )
+    assert result.exit_code == 0
+    assert result.line_count == 1000
+    assert len(seen) == 1000
+    assert result.tail == ["997", "998", "999"]
+
+
+def test_run_streaming_raises_with_tail_on_error():
+    with pytest.raises(subprocess.CalledProcessError) as exc:
+        process.run_streaming(_py("print('boom'); raise SystemExit(3)"))
+    assert exc.value.returncode == 3
+    assert exc.value.output == "boom"
+
+
+def test_run_streaming_no_check_returns_exit_code():
+    result = process.run_streaming(_py("raise SystemExit(2)"), check=False)
+    assert result.exit_code == 2
+
+
+def test_run_streaming_timeout_kills_process():
+    with pytest.raises(subprocess.TimeoutExpired) as exc:
+        process.run_streaming(
+            _py("import time; print('started', flush=True); time.sleep(30)"), timeout=0.5
+        )
+    assert exc.value.output == "started"
+
+
+def test_stream_yields_lines_and_stops_early():
+    proc = process.stream(_py("import sys\nfor i in range(10**6): print(i)"))
+    for line in proc:
+        if line == "5":
+            break
+    assert proc.line_count == 6
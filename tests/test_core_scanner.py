@@ -0,0 +1,86 @@
+import pytest
+
+from uvmgr.core import scanner
+from uvmgr.core.scanner import PatternSet, scan_files
+
+PATTERNS = PatternSet({
+    "eval": r"\beval\s*\(",
+    "password": r"(?i)password\s*=\s*['\"][^'\"]{8,}['\"]",
+})
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    (tmp_path / "clean.py").write_text("def f():\n    return 1\n")
+    (tmp_path / "bad.py").write_text(
+        "import os\n\nPASSWORD = 'hunter2hunter2'\nx = eval(y)  # eval (again)\n"
+    )
+    (tmp_path / "blob.bin").write_bytes(b"\0eval(1)")
+    return tmp_path
+
+
+def test_every_pattern_is_reported_on_the_right_line(tree):
+    matches = scan_files(tree, [tree / "bad.py", tree / "clean.py", tree / "blob.bin"], PATTERNS)
+
+    assert [(m.path.name, m.line, m.pattern, m.text) for m in matches] == [
+        ("bad.py", 3, "password", "PASSWORD = 'hunter2hunter2'"),
+        ("bad.py", 4, "eval", "eval("),
+        ("bad.py", 4, "eval", "eval ("),
+    ]
+
+
+def test_first_match_only_mode():
+    patterns = PatternSet({"eval": r"\beval\s*\("}, all_matches=False)
+
+    found = patterns.scan_bytes(None, b"a\neval(1) + eval(2)\n")[1]
+    assert [(m.line, m.text) for m in found] == [(2, "eval(")]
+
+
+def test_hits_spanning_lines_mark_each_line():
+    patterns = PatternSet({"kv": r"key[:=\s]+\w+", "line": r"^x$"})
+
+    found = patterns.scan_bytes(None, b"key\nvalue\n")[1]
+    assert found == []  # neither pattern matches a single line
+
+
+def test_anchored_patterns_match_on_any_line():
+    patterns = PatternSet({"token": r"^SECRET_TOKEN=\w+$", "edge": r"\Aend\Z"})
+
+    found = patterns.scan_bytes(None, b"# config\nSECRET_TOKEN=abc123\nX SECRET_TOKEN=no\nend\n")[1]
+    assert [(m.line, m.pattern, m.text) for m in found] == [
+        (2, "token", "SECRET_TOKEN=abc123"),
+        (4, "edge", "end"),
+    ]
+
+
+def test_clean_files_are_not_read_again(tree, monkeypatch):
+    files = [tree / "bad.py", tree / "clean.py"]
+    scan_files(tree, files, PATTERNS)
+
+    scanned = []
+    original = scanner._scan_file
+    monkeypatch.setattr(scanner, "_scan_file", lambda p, path, known: scanned.append(path) or original(p, path, known))
+
+    assert len(scan_files(tree, files, PATTERNS)) == 3
+    assert scanned == [str(tree / "bad.py")]
+
+    (tree / "clean.py").write_text("def f():\n    return eval('1')\n")
+    assert {m.path.name for m in scan_files(tree, files, PATTERNS)} == {"bad.py", "clean.py"}
+
+
+def test_large_files_are_memory_mapped(tree, monkeypatch):
+    monkeypatch.setattr(scanner, "MMAP_THRESHOLD", 16)
+
+    matches = scan_files(tree, [tree / "bad.py"], PATTERNS, use_cache=False)
+    assert len(matches) == 3
+
+
+def test_process_pool_matches_serial_scan(tree, monkeypatch):
+    for i in range(12):
+        (tree / f"m{i}.py").write_text("ok = 1\n" * i + "eval(x)\n")
+    files = sorted(tree.glob("*.py"))
+    serial = scan_files(tree, files, PATTERNS, use_cache=False)
+
+    monkeypatch.setattr(scanner, "PARALLEL_THRESHOLD", 2)
+    assert scan_files(tree, files, PATTERNS, use_cache=False, workers=2) == serial
@@ -0,0 +1,131 @@
+import pytest
+
+import uvmgr.core.configuration as configuration
+import uvmgr.core.snapshot as snapshot
+import uvmgr.core.workspace as workspace
+from uvmgr.core.configuration import ConfigurationManager, ConfigScope
+from uvmgr.core.snapshot import load_snapshot, save_snapshot, snapshot_key
+from uvmgr.core.workspace import WorkspaceManager
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setattr(configuration, "CONFIG_DIR", tmp_path / "config")
+    for name in list(__import__("os").environ):
+        if name.startswith("UVMGR_"):
+            monkeypatch.delenv(name)
+    project = tmp_path / "project"
+    project.mkdir()
+    return project
+
+
+def test_snapshot_round_trip_and_invalidation(tmp_path):
+    source = tmp_path / "source.toml"
+    source.write_text("a = 1\n")
+    key = snapshot_key([source])
+
+    save_snapshot("demo", key, {"a": 1})
+    assert load_snapshot("demo", key) == {"a": 1}
+
+    source.write_text("a = 22\n")
+    assert load_snapshot("demo", snapshot_key([source])) is None
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    (tmp_path / "snapshots").mkdir()
+    (tmp_path / "snapshots" / "broken.pickle").write_bytes(b"not a pickle")
+
+    assert load_snapshot("broken", snapshot_key([])) is None
+
+
+def test_environment_is_part_of_the_key(monkeypatch):
+    before = snapshot_key([])
+    monkeypatch.setenv("UVMGR_LOG_LEVEL", "DEBUG")
+    assert snapshot_key([]) != before
+
+
+def test_second_manager_uses_snapshot(isolated, monkeypatch):
+    ConfigurationManager(isolated)
+
+    def fail():
+        raise AssertionError("configuration was re-parsed")
+
+    monkeypatch.setattr(ConfigurationManager, "_load_configuration_hierarchy", lambda self: fail())
+    manager = ConfigurationManager(isolated)
+
+    assert manager.get_config_value("development.git_hooks_enabled") is True
+
+
+def test_changes_are_picked_up(isolated, monkeypatch):
+    monkeypatch.setattr(configuration, "SNAPSHOT_CHECK_INTERVAL", 0)
+    manager = ConfigurationManager(isolated)
+    assert manager.get_config_value("telemetry.log_level") == "INFO"
+
+    monkeypatch.setenv("UVMGR_LOG_LEVEL", "DEBUG")
+    assert manager.get_config_value("telemetry.log_level") == "DEBUG"
+    assert ConfigurationManager(isolated).get_config_value("telemetry.log_level") == "DEBUG"
+
+    monkeypatch.delenv("UVMGR_LOG_LEVEL")
+    other = ConfigurationManager(isolated)
+    other.set_config_value("runtime.max_concurrent_workflows", 7)
+    assert manager.get_config_value("runtime.max_concurrent_workflows") == 7
+
+
+def test_config_values_are_copies(isolated):
+    manager = ConfigurationManager(isolated)
+
+    section = manager.get_config_value("agi")
+    section["memory_enabled"] = "mutated"
+
+    assert isinstance(section, dict)
+    assert manager.get_config(ConfigScope.RUNTIME).agi.memory_enabled != "mutated"
+    assert manager.get_config_value("agi.missing", "fallback") == "fallback"
+
+
+def test_workspace_config_snapshot_and_reload(isolated, monkeypatch):
+    WorkspaceManager(isolated).load_config()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("workspace.yaml was re-parsed")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(workspace.yaml, "load", fail)
+        fresh = WorkspaceManager(isolated)
+        config = fresh.load_config()
+        assert fresh.load_config() is config
+
+    config_file = isolated / ".uvmgr" / "workspace.yaml"
+    config_file.write_text(config_file.read_text().replace("development", "dev", 1) + "\n")
+    assert fresh.load_config() is not config
+
+
+def test_workspace_snapshot_is_dropped_when_the_module_changes(isolated, tmp_path, monkeypatch):
+    module = tmp_path / "workspace.py"
+    module.write_text("# v1\n")
+    monkeypatch.setattr(workspace, "__file__", str(module))
+    WorkspaceManager(isolated).load_config()  # writes workspace.yaml
+    WorkspaceManager(isolated).load_config()  # parses it and saves the snapshot
+
+    parsed = []
+    real_load = workspace.yaml.load
+    monkeypatch.setattr(workspace.yaml, "load", lambda *a, **kw: parsed.append(1) or real_load(*a, **kw))
+    WorkspaceManager(isolated).load_config()
+    assert parsed == []
+
+    module.write_text("# v2, with new config fields\n")
+    WorkspaceManager(isolated).load_config()
+    assert parsed == [1]
+
+
+def test_workspace_state_reloads_after_external_write(isolated):
+    manager = WorkspaceManager(isolated)
+    manager.load_config()
+    state = manager.load_state()
+    assert manager.load_state() is state
+
+    other = WorkspaceManager(isolated)
+    other.load_config()
+    other.switch_environment("staging")
+
+    assert manager.load_state().current_environment == "staging"
@@ -0,0 +1,51 @@
+import random
+
+from uvmgr.core.streaming_stats import RollingStats, TDigest
+
+
+def test_digest_quantiles_track_exact_values():
+    rng = random.Random(7)
+    values = [rng.expovariate(1.0) for _ in range(20_000)]
+    digest = TDigest()
+    for value in values:
+        digest.add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * len(ordered))]
+        assert abs(digest.quantile(q) - exact) / exact < 0.02
+    assert len(digest.to_dict()["centroids"]) < 200
+    assert digest.quantile(0) == ordered[0]
+    assert digest.quantile(1) == ordered[-1]
+
+
+def test_empty_digest_has_no_quantiles():
+    assert TDigest().quantile(0.5) is None
+    assert RollingStats().summary()["p95"] is None
+
+
+def test_rolling_stats_mean_ewma_and_failures():
+    stats = RollingStats(alpha=0.5)
+    for value, ok in ((1.0, True), (3.0, False), (5.0, True)):
+        stats.add(value, ok=ok)
+
+    assert stats.count == 3
+    assert stats.failures == 1
+    assert stats.mean == 3.0
+    assert stats.ewma == 3.5
+    assert stats.last == 5.0
+    assert stats.p50 == 3.0
+    assert round(stats.success_rate, 3) == 0.667
+
+
+def test_round_trip_preserves_state():
+    stats = RollingStats()
+    for i in range(1_000):
+        stats.add(i / 10, ok=i % 10 != 0)
+    stats.coalesced = 4
+
+    restored = RollingStats.from_dict(stats.to_dict())
+
+    assert restored.summary() == stats.summary()
+    restored.add(1.0)
+    assert restored.count == 1_001
@@ -0,0 +1,121 @@
+import pytest
+
+from uvmgr.core.code_index import ProjectIndex
+from uvmgr.core.test_impact import TestImpactStore
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text("def add(a, b):\n    return a + b\n")
+    (pkg / "api.py").write_text("from .core import add\n\ndef total(xs):\n    return sum(xs)\n")
+    (pkg / "other.py").write_text("VALUE = 1\n")
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "conftest.py").write_text("")
+    (tests / "test_api.py").write_text("from pkg import api\n\ndef test_total():\n    pass\n")
+    (tests / "test_other.py").write_text("from pkg.other import VALUE\n\ndef test_value():\n    pass\n")
+    return tmp_path
+
+
+@pytest.fixture
+def store(project):
+    index = ProjectIndex(project)
+    store = TestImpactStore(project, index=index)
+    yield store
+    store.close()
+    index.close()
+
+
+def report(*outcomes):
+    return [
+        {"nodeid": nodeid, "outcome": outcome, "call": {"duration": duration}}
+        for nodeid, outcome, duration in outcomes
+    ]
+
+
+def run_all(store, outcome="passed"):
+    selection = store.select()
+    store.record(
+        report(
+            ("tests/test_api.py::test_total", outcome, 2.0),
+            ("tests/test_other.py::test_value", "passed", 0.1),
+        ),
+        selection.dep_hashes,
+    )
+    return selection
+
+
+def test_unseen_files_are_affected(store):
+    selection = store.select()
+
+    assert sorted(selection.affected) == ["tests/test_api.py", "tests/test_other.py"]
+    assert selection.rerun == []
+    assert selection.skipped == 0
+
+
+def test_nothing_runs_on_an_unchanged_tree(store):
+    run_all(store)
+
+    selection = store.select()
+    assert selection.args == []
+    assert selection.skipped == 2
+
+
+def test_transitive_source_change_selects_dependent_tests(store, project):
+    run_all(store)
+    (project / "src" / "pkg" / "core.py").write_text("def add(a, b):\n    return b + a\n")
+
+    assert store.select().affected == ["tests/test_api.py"]
+
+
+def test_conftest_and_config_changes_affect_everything(store, project):
+    run_all(store)
+    (project / "tests" / "conftest.py").write_text("import os\n")
+    assert len(store.select().affected) == 2
+
+    run_all(store)
+    (project / "pyproject.toml").write_text("[project]\nname = 'demo'\nversion = '1'\n")
+    assert len(store.select().affected) == 2
+
+
+def test_failures_rerun_until_they_pass(store):
+    run_all(store, outcome="failed")
+
+    selection = store.select()
+    assert selection.args == ["tests/test_api.py::test_total"]
+
+    store.record(report(("tests/test_api.py::test_total", "passed", 2.0)), selection.dep_hashes)
+    assert store.select().args == []
+
+
+def test_slowest_files_run_first(store, project):
+    run_all(store)
+    for name in ("test_api.py", "test_other.py"):
+        path = project / "tests" / name
+        path.write_text(path.read_text() + "\n")
+
+    assert store.select().affected == ["tests/test_api.py", "tests/test_other.py"]
+
+
+def test_incomplete_runs_keep_failing_files_affected(store):
+    selection = store.select()
+    store.record(
+        report(("tests/test_api.py::test_total", "failed", 1.0), ("tests/test_other.py::test_value", "passed", 0.1)),
+        selection.dep_hashes,
+        complete=False,
+    )
+
+    assert store.select().affected == ["tests/test_api.py"]
+
+
+def test_timings_are_smoothed_and_skips_ignored(store):
+    selection = store.select()
+    store.record(report(("tests/test_api.py::test_total", "passed", 4.0)), selection.dep_hashes)
+    store.record_timings([("tests/test_api.py::test_total", 2.0)])
+    store.record(report(("tests/test_other.py::test_value", "skipped", 0.0)), selection.dep_hashes)
+
+    assert store.durations() == {"tests/test_api.py::test_total": 3.0}
@@ -0,0 +1,94 @@
+import sys
+
+import pytest
+
+from uvmgr.core.test_sharding import (
+    collect_node_ids,
+    compress_node_ids,
+    estimate_durations,
+    load_durations,
+    order_by_duration,
+    partition,
+    plan_shard,
+    save_durations,
+)
+
+
+def test_partition_balances_by_duration():
+    durations = {"a": 5.0, "b": 3.0, "c": 2.0, "d": 1.0, "e": 1.0}
+
+    bins = partition(durations, 2)
+
+    loads = sorted(sum(durations[n] for n in b) for b in bins)
+    assert loads == [6.0, 6.0]
+    assert sorted(n for b in bins for n in b) == sorted(durations)
+
+
+def test_partition_is_deterministic_and_rejects_zero_shards():
+    durations = {f"t{i}": 1.0 for i in range(7)}
+
+    assert partition(durations, 3) == partition(dict(reversed(durations.items())), 3)
+    with pytest.raises(ValueError):
+        partition(durations, 0)
+
+
+def test_unknown_nodes_get_the_median_duration():
+    assert estimate_durations(["a", "b", "c", "new"], {"a": 1.0, "b": 2.0, "c": 9.0})["new"] == 2.0
+    assert estimate_durations(["new"], {})["new"] == 1.0
+
+
+def test_compress_uses_whole_files_when_possible():
+    collected = ["t/a.py::x", "t/a.py::y", "t/b.py::x", "t/b.py::y"]
+
+    assert compress_node_ids(["t/b.py::y", "t/a.py::x", "t/a.py::y"], collected) == ["t/b.py::y", "t/a.py"]
+
+
+def test_shards_cover_every_node_exactly_once():
+    nodes = [f"t/f{i % 3}.py::test_{i}" for i in range(20)]
+    history = {node: float(i % 5 + 1) for i, node in enumerate(nodes)}
+
+    plans = [plan_shard(nodes, history, 3, i) for i in range(3)]
+
+    assert sorted(n for p in plans for n in p.node_ids) == sorted(nodes)
+    assert max(plans[0].loads) - min(plans[0].loads) <= max(history.values())
+    with pytest.raises(ValueError):
+        plan_shard(nodes, history, 3, 3)
+
+
+def test_order_by_duration_puts_slow_files_first():
+    nodes = ["t/fast.py::a", "t/slow.py::a", "t/slow.py::b"]
+
+    assert order_by_duration(nodes, {"t/fast.py::a": 2.0, "t/slow.py::a": 1.5, "t/slow.py::b": 1.5}) == [
+        "t/slow.py",
+        "t/fast.py",
+    ]
+
+
+def test_durations_file_round_trip(tmp_path):
+    path = tmp_path / ".test_durations"
+
+    assert load_durations(path) == {}
+    save_durations(path, {"t/a.py::x": 1.23456})
+    assert load_durations(path) == {"t/a.py::x": 1.2346}
+
+
+def test_collect_ignores_project_addopts(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.pytest.ini_options]\naddopts = "--failed-first --verbosity=2"\n'
+    )
+    (tmp_path / "test_a.py").write_text("def test_one():\n    pass\n\n\ndef test_two():\n    pass\n")
+
+    assert collect_node_ids(["test_a.py"], cwd=tmp_path, python=sys.executable) == [
+        "test_a.py::test_one",
+        "test_a.py::test_two",
+    ]
+
+
+def test_collect_fails_loudly(tmp_path):
+    (tmp_path / "test_broken.py").write_text("import does_not_exist\n")
+    (tmp_path / "test_empty.py").write_text("x = 1\n")
+
+    with pytest.raises(RuntimeError, match="exit code 2"):
+        collect_node_ids(["test_broken.py"], cwd=tmp_path, python=sys.executable)
+    with pytest.raises(RuntimeError, match="exit code 5"):
+        collect_node_ids(["test_empty.py"], cwd=tmp_path, python=sys.executable)
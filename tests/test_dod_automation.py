@@ -30,6 +30,8 @@ from uvmgr.ops.dod import (
     _calculate_weighted_success_rate
 )
 
+from tests.test_runtime_dod import make_project
+from uvmgr.core import cache
 from uvmgr.runtime.dod import (
     initialize_exoskeleton_files,
     execute_automation_workflow,
@@ -41,6 +43,14 @@ from uvmgr.runtime.dod import (
 )
 
 
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A real project for the runtime checks, with an isolated result cache."""
+    monkeypatch.setattr(cache, "_DB", tmp_path / "runs.db")
+    (tmp_path / "project").mkdir()
+    return make_project(tmp_path / "project")
+
+
 class TestDoDCriteriaWeights:
     """Test DoD criteria weights and configuration."""
     
@@ -452,15 +462,14 @@ class TestRuntimeImplementations:
             assert result["success"] is False
             assert "already exists" in result["error"]
     
-    def test_execute_automation_workflow_generates_results(self):
+    def test_execute_automation_workflow_generates_results(self, project):
         """Test automation workflow execution generates realistic results."""
         result = execute_automation_workflow(
-            project_path=Path("/test/project"),
+            project_path=project,
             criteria=["testing", "security", "devops"],
             environment="development",
             auto_fix=True,
-            parallel=True,
-            ai_assist=True
+            parallel=True
         )
         
         assert result["success"] is True
@@ -474,10 +483,10 @@ class TestRuntimeImplementations:
             assert "score" in details
             assert 0 <= details["score"] <= 100
     
-    def test_validate_criteria_runtime_scoring(self):
+    def test_validate_criteria_runtime_scoring(self, project):
         """Test runtime criteria validation scoring."""
         result = validate_criteria_runtime(
-            project_path=Path("/test/project"),
+            project_path=project,
             criteria=["testing", "security"],
             detailed=True,
             fix_suggestions=True
@@ -633,7 +642,7 @@ class TestErrorHandlingAndEdgeCases:
         assert "success" in result
         assert "overall_score" in result
     
-    def test_concurrent_access_safety(self):
+    def test_concurrent_access_safety(self, project):
         """Test thread safety for concurrent DoD operations."""
         import threading
         import time
@@ -642,7 +651,7 @@ class TestErrorHandlingAndEdgeCases:
         
         def run_validation():
             result = validate_criteria_runtime(
-                project_path=Path("/test/project"),
+                project_path=project,
                 criteria=["testing"],
                 detailed=False,
                 fix_suggestions=False
@@ -0,0 +1,114 @@
+import threading
+import time
+
+import pytest
+
+from uvmgr.commands._manifest import COMMANDS
+from uvmgr.ops.aggregate import (
+    CRITICAL_COMMANDS,
+    CommandStatus,
+    create_8020_workflow,
+    execute_command_dag,
+    _failure_detail,
+    _workflow_commands,
+)
+
+
+def _sleeper(durations, failing=(), log=None):
+    lock = threading.Lock()
+    active = []
+
+    def run(cmd, timeout):
+        with lock:
+            active.append(cmd)
+            if log is not None:
+                log.append(tuple(active))
+        time.sleep(durations.get(cmd, 0.01))
+        with lock:
+            active.remove(cmd)
+        state = "failed" if cmd in failing else "succeeded"
+        return CommandStatus(cmd, state, durations.get(cmd, 0.01), 1 if cmd in failing else 0)
+
+    return run
+
+
+def test_independent_commands_overlap():
+    durations = {"deps": 0.05, "lint": 0.2, "test": 0.2, "docs": 0.2}
+    events = []
+
+    result = execute_command_dag(
+        ["deps", "lint", "test", "docs"],
+        max_workers=4,
+        runner=_sleeper(durations),
+        on_status=lambda st: events.append((st.command, st.state)),
+    )
+
+    assert result.commands_successful == ["deps", "lint", "test", "docs"]
+    assert result.total_duration < 0.5  # serial would be 0.65s
+    assert events.index(("deps", "succeeded")) < events.index(("lint", "started"))
+    assert result.metrics["critical_path_seconds"] == pytest.approx(0.25)
+    assert result.metrics["critical_path"].startswith("deps → ")
+
+
+def test_failed_command_skips_dependents():
+    events = []
+
+    result = execute_command_dag(
+        ["deps", "test", "build", "lint"],
+        runner=_sleeper({}, failing={"test"}),
+        on_status=lambda st: events.append((st.command, st.state)),
+    )
+
+    assert result.commands_failed == ["test"]
+    assert "build" not in result.commands_executed
+    assert ("build", "skipped") in events
+    assert "lint" in result.commands_successful
+
+
+def test_unsafe_commands_run_alone():
+    log = []
+
+    execute_command_dag(
+        ["deps", "test", "lint", "build", "otel"],
+        max_workers=4,
+        runner=_sleeper({"lint": 0.05, "otel": 0.05}, log=log),
+    )
+
+    assert all(len(active) == 1 for active in log if "build" in active)
+
+
+def test_circular_dependencies_rejected():
+    with pytest.raises(ValueError, match="Circular"):
+        execute_command_dag(["a", "b"], dependencies={"a": ["b"], "b": ["a"]}, runner=_sleeper({}))
+
+
+def test_generated_workflow_commands(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    path = create_8020_workflow("development", validate_weaver=True)
+
+    assert _workflow_commands(path) == ["deps", "lint", "docs", "test", "build"]
+
+
+def test_every_command_invokes_a_mounted_group():
+    mounted = {spec.name for spec in COMMANDS}
+
+    assert {info["argv"][0] for info in CRITICAL_COMMANDS.values()} <= mounted
+
+
+def test_failure_detail_reads_usage_errors_inside_the_box():
+    tail = [
+        "Usage: python -m uvmgr [OPTIONS] COMMAND [ARGS]...",
+        "Try 'python -m uvmgr --help' for help.",
+        "╭─ Error ──────────────────────────╮",
+        "│ No such command 'nope'.          │",
+        "╰──────────────────────────────────╯",
+    ]
+
+    assert _failure_detail(tail) == "No such command 'nope'."
+    assert _failure_detail(["building...", "error: no pyproject.toml"]) == "error: no pyproject.toml"
+    assert _failure_detail([]) == ""
+
+
+def test_release_step_only_previews_the_bump():
+    assert CRITICAL_COMMANDS["release"]["argv"] == ["release", "bump", "--dry-run"]
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from uvmgr.ops.cost import CostCategory, CostUnit, IntelligentCostAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def no_agi(monkeypatch):
+    import uvmgr.ops.cost as cost
+
+    monkeypatch.setattr(cost, "observe_with_agi_reasoning", lambda **kwargs: None)
+    monkeypatch.setattr(cost, "get_persistent_memory", lambda: _Memory())
+
+
+class _Memory:
+    def store_knowledge(self, **kwargs):
+        pass
+
+    def retrieve_similar(self, *args, **kwargs):
+        return []
+
+
+def test_analyzer_can_be_created_outside_an_event_loop(tmp_path):
+    analyzer = IntelligentCostAnalyzer(tmp_path)
+
+    assert analyzer.cost_entries == []
+    assert analyzer.get_cost_stats()["total_entries"] == 0
+
+
+def test_report_rolls_up_the_ledger(tmp_path):
+    analyzer = IntelligentCostAnalyzer(tmp_path)
+
+    async def scenario():
+        for i in range(4):
+            await analyzer.track_ci_cd_cost(f"pipeline-{i}", duration_minutes=100)
+        await analyzer.track_cost(CostCategory.DEVELOPER_TIME, "Manual release", 1.0)
+        return await analyzer.generate_cost_report(period_days=1)
+
+    report = asyncio.run(scenario())
+
+    assert report.total_cost == pytest.approx(4.2)
+    assert report.category_breakdown == {
+        CostCategory.CI_CD: pytest.approx(3.2),
+        CostCategory.DEVELOPER_TIME: 1.0,
+    }
+    assert report.metadata["entries_analyzed"] == 5
+    assert {r.id for r in report.optimization_opportunities} == {"optimize_ci_cd", "automate_manual_tasks"}
+
+    entries = IntelligentCostAnalyzer(tmp_path).cost_entries
+    assert len(entries) == 5
+    assert entries[0].metadata["pipeline_name"] == "pipeline-0"
+
+
+def test_legacy_json_entries_move_to_the_ledger(tmp_path):
+    storage = tmp_path / ".uvmgr" / "cost_data.json"
+    storage.parent.mkdir()
+    storage.write_text(json.dumps({
+        "cost_entries": [{
+            "id": "cost_1",
+            "category": "testing",
+            "description": "old entry",
+            "amount": 2.5,
+            "unit": "usd",
+            "timestamp": time.time(),
+            "metadata": {"suite": "unit"},
+        }],
+        "budgets": [],
+    }))
+
+    analyzer = IntelligentCostAnalyzer(tmp_path)
+
+    assert "cost_entries" not in json.loads(storage.read_text())
+    assert analyzer.get_cost_stats()["categories"] == {"testing": 2.5}
+    # Loading again must not import the entries twice
+    assert IntelligentCostAnalyzer(tmp_path).get_cost_stats()["total_entries"] == 1
+
+
+def test_budget_spend_is_counted_per_period(tmp_path):
+    analyzer = IntelligentCostAnalyzer(tmp_path)
+
+    async def scenario():
+        await analyzer.track_cost(CostCategory.TESTING, "before budget", 10.0)
+        budget_id = await analyzer.create_budget("Tests", CostCategory.TESTING, "daily", 100.0)
+        await analyzer.track_cost(CostCategory.TESTING, "runs", 5.0)
+        await analyzer.track_cost(CostCategory.CI_CD, "other category", 50.0)
+        await analyzer.track_cost(CostCategory.TESTING, "cpu", 10.0, unit=CostUnit.CPU_HOURS)
+        return analyzer.budgets[budget_id]
+
+    budget = asyncio.run(scenario())
+
+    assert budget.current_spend == pytest.approx(16.0)
+
+    # A new period recounts from the ledger instead of carrying the old total
+    budget.metadata["period_start"] = 0
+    budget.current_spend = 999.0
+    asyncio.run(analyzer.track_cost(CostCategory.TESTING, "next", 1.0))
+    assert budget.current_spend == pytest.approx(17.0)
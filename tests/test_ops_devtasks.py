@@ -0,0 +1,154 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from uvmgr.ops.devtasks import (
+    PYTHON_TEST_INPUTS,
+    IntelligentDevTaskManager,
+    TaskDefinition,
+    TaskPriority,
+    TaskSequence,
+    TaskStatus,
+    TaskType,
+)
+
+
+def _task(task_id, command, **kwargs):
+    return TaskDefinition(
+        id=task_id,
+        name=task_id,
+        task_type=TaskType.CUSTOM,
+        priority=TaskPriority.MEDIUM,
+        command=command,
+        description=task_id,
+        **kwargs,
+    )
+
+
+def _py(code):
+    return f'"{sys.executable}" -c "{code}"'
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "README.md").write_text("hello\n")
+    return tmp_path
+
+
+def _manager(root):
+    async def make():
+        manager = IntelligentDevTaskManager(root)
+        manager.enable_agi_optimization = False
+        await asyncio.sleep(0)  # let auto-detection finish
+        return manager
+    return asyncio.run(make())
+
+
+def _run(manager, coro_fn, *args, **kwargs):
+    return asyncio.run(getattr(manager, coro_fn)(*args, **kwargs))
+
+
+def test_unchanged_inputs_skip_the_task(project):
+    manager = _manager(project)
+    counter = project / "runs.txt"
+    asyncio.run(manager.register_task(_task(
+        "lint", _py("open('runs.txt', 'a').write('x')"), inputs=["*.py"], working_dir=project,
+    )))
+
+    first = _run(manager, "execute_task", "lint")
+    second = _run(manager, "execute_task", "lint")
+
+    assert first.status == TaskStatus.COMPLETED
+    assert second.status == TaskStatus.SKIPPED and second.cached
+    assert counter.read_text() == "x"
+
+    # A README edit is not an input; a source edit is
+    (project / "README.md").write_text("changed\n")
+    assert _run(manager, "execute_task", "lint").cached
+    (project / "pkg" / "mod.py").write_text("x = 2\n")
+    assert _run(manager, "execute_task", "lint").status == TaskStatus.COMPLETED
+    assert counter.read_text() == "xx"
+
+    assert _run(manager, "execute_task", "lint", force=True).status == TaskStatus.COMPLETED
+
+
+def test_fingerprints_persist_and_require_outputs(project):
+    manager = _manager(project)
+    build = _task("build", _py("import os; os.makedirs('dist', exist_ok=True)"),
+                  inputs=["*.py"], outputs=["dist"], working_dir=project)
+    asyncio.run(manager.register_task(build))
+    _run(manager, "execute_task", "build")
+
+    reloaded = _manager(project)
+    asyncio.run(reloaded.register_task(build))
+    assert _run(reloaded, "execute_task", "build").cached
+
+    (project / "dist").rmdir()
+    assert _run(reloaded, "execute_task", "build").status == TaskStatus.COMPLETED
+
+
+def test_test_fingerprint_covers_package_data(project):
+    data = project / "src" / "pkg" / "workflows" / "flow.bpmn"
+    data.parent.mkdir(parents=True)
+    data.write_text("<definitions/>\n")
+    manager = _manager(project)
+    task = _task("pytest", "pytest", inputs=PYTHON_TEST_INPUTS, working_dir=project)
+
+    before = manager._fingerprint(task)
+    data.write_text("<definitions id='changed'/>\n")
+
+    assert manager._fingerprint(task) != before
+
+
+def test_failed_runs_are_not_cached(project):
+    manager = _manager(project)
+    asyncio.run(manager.register_task(_task("bad", _py("raise SystemExit(1)"), inputs=["*.py"])))
+
+    assert _run(manager, "execute_task", "bad").status == TaskStatus.FAILED
+    assert _run(manager, "execute_task", "bad").status == TaskStatus.FAILED
+
+
+def test_sequence_runs_independent_tasks_concurrently(project):
+    manager = _manager(project)
+    sleep = _py("import time; time.sleep(0.5)")
+    for task_id in ("a", "b", "c"):
+        asyncio.run(manager.register_task(_task(task_id, sleep)))
+    manager.task_sequences["s"] = TaskSequence(id="s", name="s", description="", tasks=["a", "b", "c"])
+
+    start = time.perf_counter()
+    results = _run(manager, "execute_sequence", "s")
+    elapsed = time.perf_counter() - start
+
+    assert [r.task_id for r in results] == ["a", "b", "c"]
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    assert elapsed < 1.4
+
+
+def test_failure_skips_only_dependents(project):
+    manager = _manager(project)
+    asyncio.run(manager.register_task(_task("build", _py("raise SystemExit(1)"))))
+    asyncio.run(manager.register_task(_task("test", _py("pass"), dependencies=["build"])))
+    asyncio.run(manager.register_task(_task("lint", _py("pass"))))
+    asyncio.run(manager.register_task(_task("publish", _py("pass"))))
+    manager.task_sequences["s"] = TaskSequence(
+        id="s", name="s", description="",
+        tasks=["build", "test", "lint", "publish"],
+        parallel_groups=[["build", "test", "lint"]],
+    )
+
+    results = {r.task_id: r for r in _run(manager, "execute_sequence", "s")}
+
+    assert results["build"].status == TaskStatus.FAILED
+    assert results["test"].status == TaskStatus.SKIPPED and "build" in results["test"].error
+    assert results["lint"].status == TaskStatus.COMPLETED
+    # Ungrouped tasks wait for every earlier group
+    assert results["publish"].status == TaskStatus.SKIPPED
+
+
+def test_history_is_bounded(project):
+    manager = _manager(project)
+    assert manager.execution_history.maxlen == manager.max_execution_history
@@ -0,0 +1,47 @@
+import pytest
+
+from uvmgr.ops.weaver_forge import CompiledTemplate, generate_bulk_from_templates
+
+
+@pytest.fixture
+def forge(tmp_path, monkeypatch):
+    templates = tmp_path / ".weaver-forge" / "templates" / "model" / "_templates"
+    templates.mkdir(parents=True)
+    (templates.parent / "index.js").write_text("module.exports = {}\n")
+    (templates / "model.py.ejs.t").write_text("class <%= Name %>:\n    table = '<%= name_snake %>'\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_compiled_template_renders_in_one_pass():
+    template = CompiledTemplate("<%= a %>-<%= b %>-<%= missing %>")
+
+    assert template.render({"a": "<%= b %>", "b": 2}) == "<%= b %>-2-<%= missing %>"
+
+
+def test_parallel_bulk_generation_writes_each_path_once(forge):
+    specs = [{"template": "model", "name": f"item {i}", "subdir": f"m{i}"} for i in range(40)]
+    specs.append({"template": "model", "name": "item 0", "subdir": "m0"})
+    specs.append({"template": "missing", "name": "x"})
+
+    result = generate_bulk_from_templates(specs, output_path=forge / "out", parallel=True, max_workers=2)
+
+    assert result["successful"] == 41
+    assert len(result["errors"]) == 1
+    assert result["writes_deduplicated"] == 1
+    assert (forge / "out" / "m7" / "model.py").read_text() == "class Item 7:\n    table = 'item_7'\n"
+
+
+def test_parallel_bulk_generation_reports_write_errors_per_spec(forge):
+    out = forge / "out"
+    out.mkdir()
+    (out / "m3").write_text("a file where the m3 directory should be\n")
+    specs = [{"template": "model", "name": f"item {i}", "subdir": f"m{i}"} for i in range(40)]
+
+    result = generate_bulk_from_templates(specs, output_path=out, parallel=True, max_workers=2)
+
+    assert result["successful"] == 39
+    assert result["failed"] == 1
+    assert result["errors"][0].startswith("Error generating model item 3:")
+    assert result["total_files"] == 39
+    assert (out / "m4" / "model.py").exists()
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("apscheduler")
+
+from uvmgr.runtime.aps import IntelligentScheduler, ScheduledJob, ScheduleType
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    return IntelligentScheduler(jobstore_url=f"sqlite:///{tmp_path / 'scheduler.db'}")
+
+
+def _register(scheduler, job_id, function):
+    scheduler.register_job_function(job_id, function)
+    scheduler.job_registry[job_id] = ScheduledJob(
+        id=job_id,
+        name=job_id,
+        function=job_id,
+        schedule_type=ScheduleType.INTERVAL,
+        schedule_config={"seconds": 60},
+    )
+
+
+def test_sync_and_async_jobs_update_rolling_stats(scheduler):
+    calls = []
+
+    async def native():
+        calls.append("native")
+
+    def blocking():
+        calls.append("blocking")
+        raise RuntimeError("boom")
+
+    _register(scheduler, "native", native)
+    _register(scheduler, "blocking", blocking)
+
+    async def main():
+        for _ in range(3):
+            await scheduler._execute_job_wrapper("native")
+        await scheduler._execute_job_wrapper("blocking")
+
+    asyncio.run(main())
+
+    assert calls == ["native"] * 3 + ["blocking"]
+    assert scheduler.job_stats["native"].count == 3
+    assert scheduler.job_stats["blocking"].failures == 1
+    stats = scheduler.get_scheduler_stats()
+    assert stats["total_executions"] == 4
+    assert stats["failed_executions"] == 1
+    assert stats["jobs"]["native"]["p50"] is not None
+
+
+def test_overlapping_runs_are_coalesced(scheduler):
+    started = []
+
+    async def slow():
+        started.append(1)
+        await asyncio.sleep(0.05)
+
+    _register(scheduler, "slow", slow)
+
+    async def main():
+        await asyncio.gather(*(scheduler._execute_job_wrapper("slow") for _ in range(3)))
+
+    asyncio.run(main())
+
+    assert len(started) == 1
+    assert scheduler.job_stats["slow"].count == 1
+    assert scheduler.job_stats["slow"].coalesced == 2
+    assert scheduler.get_scheduler_stats()["coalesced_runs"] == 2
+
+
+def test_history_is_bounded(scheduler):
+    async def noop():
+        return None
+
+    _register(scheduler, "noop", noop)
+
+    async def main():
+        for _ in range(scheduler.max_execution_history + 10):
+            await scheduler._execute_job_wrapper("noop")
+
+    asyncio.run(main())
+
+    assert len(scheduler.execution_history) == scheduler.max_execution_history
+    assert scheduler.job_stats["noop"].count == scheduler.max_execution_history + 10
+
+
+def test_stats_persist_in_jobstore_database(scheduler):
+    pytest.importorskip("sqlalchemy")
+    for duration in (1.0, 2.0, 3.0):
+        scheduler._track_job_performance("nightly", duration)
+    scheduler._flush_stats()
+
+    reloaded = IntelligentScheduler(jobstore_url=scheduler.jobstore_url)
+
+    assert reloaded.job_stats["nightly"].count == 3
+    assert reloaded.job_stats["nightly"].mean == 2.0
+    assert json.dumps(reloaded.job_stats["nightly"].to_dict())
+
+
+def test_optimization_uses_ewma_against_mean(scheduler):
+    async def job():
+        return None
+
+    _register(scheduler, "degrading", job)
+    for duration in [1.0] * 20 + [10.0] * 5:
+        scheduler._track_job_performance("degrading", duration)
+
+    class FakeScheduler:
+        rescheduled = []
+
+        def reschedule_job(self, job_id, **kwargs):
+            self.rescheduled.append((job_id, kwargs))
+
+    scheduler.scheduler = FakeScheduler()
+    results = asyncio.run(scheduler._optimize_schedules_with_agi())
+
+    assert results["optimizations_made"] == 1
+    assert FakeScheduler.rescheduled == [("degrading", {"trigger": "interval", "seconds": 90.0})]
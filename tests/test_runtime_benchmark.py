@@ -0,0 +1,115 @@
+import sys
+
+import pytest
+
+from uvmgr.runtime.benchmark import (
+    BenchmarkResult,
+    BenchmarkSpec,
+    compare_results,
+    default_suite,
+    load_baseline,
+    run_benchmark,
+    run_suite,
+    save_baseline,
+    summarize,
+)
+
+
+def _result(name, samples):
+    return BenchmarkResult(name=name, samples=samples, runs=len(samples), **summarize(samples))
+
+
+def test_summarize_reports_robust_statistics():
+    stats = summarize([1.0, 2.0, 3.0, 4.0, 100.0])
+
+    assert stats["median"] == 3.0
+    assert stats["q1"] == 2.0
+    assert stats["q3"] == 4.0
+    assert stats["iqr"] == 2.0
+    assert stats["min"] == 1.0 and stats["max"] == 100.0
+    assert 4.0 < stats["p95"] < 100.0
+    assert summarize([])["median"] is None
+
+
+def test_run_benchmark_measures_child_process(tmp_path):
+    spec = BenchmarkSpec("noop", "python -c pass", argv=[sys.executable, "-c", "pass"])
+
+    result = run_benchmark(spec, tmp_path, warmup=1, repetitions=3)
+
+    assert result.ok
+    assert len(result.samples) == 3
+    assert result.failures == 0
+    assert result.median > 0
+    assert result.max_rss and result.max_rss > 1_000_000
+
+
+def test_failing_runs_are_counted(tmp_path):
+    spec = BenchmarkSpec("fail", "exit 3", argv=[sys.executable, "-c", "raise SystemExit(3)"])
+
+    result = run_benchmark(spec, tmp_path, warmup=0, repetitions=2)
+
+    assert not result.ok
+    assert result.failures == 2
+    assert result.median is None
+
+
+def test_in_process_benchmark(tmp_path):
+    calls = []
+    spec = BenchmarkSpec("func", "append", func=lambda: calls.append(1))
+
+    result = run_benchmark(spec, tmp_path, warmup=2, repetitions=4)
+
+    assert len(calls) == 6
+    assert len(result.samples) == 4
+    assert result.cpu_seconds is not None
+
+
+def test_unknown_benchmark_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="available"):
+        run_suite(["nope"], tmp_path)
+
+
+def test_baseline_round_trip_keeps_other_entries(tmp_path):
+    save_baseline({"deps": _result("deps", [1.0, 1.1, 1.2])}, tmp_path)
+    save_baseline({"lint": _result("lint", [2.0, 2.1, 2.2])}, tmp_path)
+
+    stored = load_baseline(tmp_path)
+
+    assert set(stored) == {"deps", "lint"}
+    assert stored["deps"].median == 1.1
+    assert list((tmp_path / ".uvmgr" / "bench").glob("*.json"))
+
+
+def test_regression_needs_threshold_and_baseline_spread():
+    baseline = {
+        "steady": _result("steady", [1.0, 1.0, 1.0, 1.0]),
+        "noisy": _result("noisy", [0.5, 1.0, 1.0, 2.0, 2.0]),
+    }
+    current = {
+        "steady": _result("steady", [1.3, 1.3, 1.3]),
+        "noisy": _result("noisy", [1.3, 1.3, 1.3]),
+        "new": _result("new", [1.0]),
+    }
+
+    by_name = {c.name: c for c in compare_results(current, baseline, threshold_pct=20)}
+
+    assert set(by_name) == {"steady", "noisy"}
+    assert by_name["steady"].regression is True
+    assert round(by_name["steady"].change_pct) == 30
+    # 30% slower but still inside the baseline's interquartile range
+    assert by_name["noisy"].regression is False
+
+
+def test_lint_benchmark_is_read_only(tmp_path):
+    argv = default_suite(tmp_path)["lint"].argv
+
+    assert argv[:4] == [sys.executable, "-m", "ruff", "check"]
+    assert {"--no-fix", "--exit-zero", "--no-cache"} <= set(argv)
+
+    source = tmp_path / "dirty.py"
+    source.write_text("import os\n")
+    result = run_benchmark(default_suite(tmp_path)["lint"], tmp_path, warmup=0, repetitions=1)
+
+    assert result.ok
+    assert source.read_text() == "import os\n"
+    assert not (tmp_path / ".ruff_cache").exists()
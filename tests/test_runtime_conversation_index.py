@@ -0,0 +1,156 @@
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from uvmgr.runtime import conversation_index
+from uvmgr.runtime.conversation_index import Source, iter_search, match_expression, refresh, search
+
+NOW = datetime.now()
+
+
+@pytest.fixture(autouse=True)
+def index_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversation_index, "_get_index_db_path", lambda: tmp_path / "index.db")
+
+
+def _history(directory, session_id, *messages, when=NOW):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{session_id}.json"
+    path.write_text(json.dumps({
+        "session_id": session_id,
+        "messages": [{"content": m, "timestamp": when.isoformat()} for m in messages],
+    }))
+    return path
+
+
+def _conversations_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS conversations (session_id, timestamp, message, project)")
+    conn.executemany("INSERT INTO conversations VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def test_match_expression_neutralises_operators():
+    assert match_expression('fix "NEAR(a b)" OR -x*') == '"fix" "NEAR" "a" "b" "OR" "x"'
+    assert match_expression("  ") == ""
+
+
+def test_bm25_ranking_one_hit_per_session(tmp_path):
+    history = tmp_path / "history"
+    _history(history, "s1", "the parser crashes on unicode", "parser parser parser regression")
+    _history(history, "s2", "unrelated chat about lunch")
+    _history(history, "s3", "a parser note")
+    sources = [Source("json", history, project="demo")]
+
+    assert refresh(sources) == {"ingested": 3, "removed": 0, "messages": 4}
+    results = search("parser", since=NOW - timedelta(days=1))
+
+    assert [r["session_id"] for r in results] == ["s1", "s3"]
+    assert results[0]["message_count"] == 2
+    assert "**parser**" in results[0]["snippet"]
+    assert results[0]["project"] == "demo"
+    assert search("parsers")[0]["session_id"] == "s1"  # porter stemming
+    assert search("parser", project="other") == []
+
+
+def test_refresh_only_ingests_changed_files(tmp_path):
+    history = tmp_path / "history"
+    _history(history, "s1", "first message")
+    changing = _history(history, "s2", "second message")
+    refresh([Source("json", history)])
+
+    assert refresh([Source("json", history)])["ingested"] == 0
+
+    _history(history, "s2", "second message", "now with an addendum")
+    stat = changing.stat()
+    os.utime(changing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert refresh([Source("json", history)]) == {"ingested": 1, "removed": 0, "messages": 2}
+    assert search("addendum")[0]["session_id"] == "s2"
+    assert search("second")[0]["message_count"] == 2
+
+    (history / "s1.json").unlink()
+    assert refresh([Source("json", history)])["removed"] == 1
+    assert search("first") == []
+
+
+def test_sqlite_sources_are_read_past_the_watermark(tmp_path):
+    db = tmp_path / "conversations.db"
+    _conversations_db(db, [("a", NOW.isoformat(), "deploy the service", "proj")])
+    sources = [Source("sqlite", db)]
+    refresh(sources)
+
+    _conversations_db(db, [("b", NOW.isoformat(), "deploy again tomorrow", "proj")])
+    assert refresh(sources)["messages"] == 1
+    assert {r["session_id"] for r in search("deploy", project="proj")} == {"a", "b"}
+
+
+def test_failed_sqlite_ingest_leaves_no_partial_batches(tmp_path, monkeypatch):
+    db = tmp_path / "conversations.db"
+    _conversations_db(db, [(f"s{i % 3}", NOW.isoformat(), f"message {i}", "proj") for i in range(25)])
+    sources = [Source("sqlite", db)]
+    monkeypatch.setattr(conversation_index, "SQLITE_BATCH", 10)
+    latest = conversation_index._latest
+    calls = []
+
+    def fails_in_second_batch(timestamps):
+        calls.append(1)
+        if len(calls) == 4:  # three sessions per batch
+            raise sqlite3.OperationalError("database is locked")
+        return latest(timestamps)
+
+    monkeypatch.setattr(conversation_index, "_latest", fails_in_second_batch)
+    assert refresh(sources) == {"ingested": 1, "removed": 0, "messages": 0}
+    assert search("message", project="proj") == []
+
+    monkeypatch.setattr(conversation_index, "_latest", latest)
+    assert refresh(sources)["messages"] == 25
+    assert sum(r["message_count"] for r in search("message", project="proj")) == 25
+
+
+def test_old_messages_are_filtered_and_empty_query_lists_recent(tmp_path):
+    history = tmp_path / "history"
+    _history(history, "old", "ancient topic", when=NOW - timedelta(days=90))
+    _history(history, "new", "fresh topic")
+    refresh([Source("json", history)])
+
+    assert [r["session_id"] for r in search("topic", since=NOW - timedelta(days=30))] == ["new"]
+    assert [r["session_id"] for r in search("", since=NOW - timedelta(days=365))] == ["new", "old"]
+
+
+def test_results_stream_in_pages(tmp_path):
+    history = tmp_path / "history"
+    for i in range(7):
+        _history(history, f"s{i}", f"pagination test {i}")
+    refresh([Source("json", history)])
+
+    assert len(search("pagination", limit=3, offset=6)) == 1
+    streamed = [r["session_id"] for r in iter_search("pagination", page_size=3)]
+    assert sorted(streamed) == [f"s{i}" for i in range(7)]
+
+
+def test_broken_json_is_skipped_until_it_changes(tmp_path):
+    history = tmp_path / "history"
+    history.mkdir()
+    (history / "bad.json").write_text("{not json")
+
+    assert refresh([Source("json", history)])["messages"] == 0
+    assert refresh([Source("json", history)])["ingested"] == 0
+
+
+def test_ops_search_uses_the_index(tmp_path, monkeypatch):
+    from uvmgr.ops import claude as claude_ops
+
+    history = tmp_path / "history"
+    for i in range(3):
+        _history(history, f"s{i}", f"websocket reconnect issue {i}")
+    monkeypatch.setattr(claude_ops, "_conversation_sources", lambda: [Source("json", history, project="demo")])
+
+    results = claude_ops.search_conversations("websocket", days_back=7, limit=2)
+    assert len(results) == 2
+    assert results[0]["project"] == "demo"
+    assert len(claude_ops.search_conversations("websocket", limit=2, offset=2)) == 1
+    assert len(list(claude_ops.iter_conversations("websocket", page_size=2))) == 3
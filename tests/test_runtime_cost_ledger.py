@@ -0,0 +1,94 @@
+import json
+import os
+import time
+
+import pyarrow.dataset as ds
+
+from uvmgr.runtime.cost_ledger import CostLedger, total, totals_by
+
+JAN = 1704067200.0  # 2024-01-01T00:00:00Z
+FEB = 1706745600.0  # 2024-02-01T00:00:00Z
+
+
+def _row(i, timestamp, category="ci_cd", amount=1.0):
+    return {
+        "id": f"cost_{i}",
+        "category": category,
+        "description": f"entry {i}",
+        "amount": amount,
+        "unit": "usd",
+        "timestamp": timestamp,
+        "source": "automated",
+        "metadata": {"i": i},
+        "tags": ["ci_cd"],
+    }
+
+
+def test_entries_are_partitioned_by_month(tmp_path):
+    ledger = CostLedger(tmp_path)
+
+    ledger.append([_row(1, JAN + 10), _row(2, FEB + 10), _row(3, FEB + 20)])
+
+    assert ledger.months() == ["2024-01", "2024-02"]
+    assert ledger.count() == 3
+    assert len(ledger.files(start=FEB)) == 1
+    assert ledger.scan(start=FEB, columns=["id"])["id"].to_pylist() == ["cost_2", "cost_3"]
+    assert json.loads(ledger.scan(end=JAN + 10)["metadata"][0].as_py()) == {"i": 1}
+
+
+def test_rollups(tmp_path):
+    ledger = CostLedger(tmp_path)
+    ledger.append([
+        _row(1, JAN + 1, "ci_cd", 2.0),
+        _row(2, JAN + 2, "testing", 3.0),
+        _row(3, JAN + 3, "ci_cd", 5.0),
+    ])
+
+    table = ledger.scan(columns=["category", "amount"])
+    assert total(table) == 10.0
+    assert totals_by(table, "category") == {"ci_cd": 7.0, "testing": 3.0}
+
+    testing = ledger.scan(where=ds.field("category") == "testing")
+    assert testing.num_rows == 1
+    assert total(ledger.scan(start=FEB)) == 0.0
+    assert totals_by(ledger.scan(start=FEB), "category") == {}
+
+
+def test_compaction_keeps_every_entry_once(tmp_path):
+    ledger = CostLedger(tmp_path, compact_after=3)
+
+    for i in range(10):
+        ledger.append([_row(i, JAN + i)])
+
+    directory = tmp_path / "month=2024-01"
+    assert len(list(directory.glob("*.parquet"))) <= 4
+    assert sorted(ledger.scan(columns=["id"])["id"].to_pylist()) == sorted(f"cost_{i}" for i in range(10))
+
+
+def test_replaced_parts_are_not_read_twice(tmp_path):
+    ledger = CostLedger(tmp_path)
+    ledger.append([_row(1, JAN + 1)])
+    ledger.append([_row(2, JAN + 2)])
+    parts = sorted((tmp_path / "month=2024-01").glob("part-*.parquet"))
+    saved = [p.read_bytes() for p in parts]
+
+    ledger.compact("2024-01")
+    # A reader that listed the directory before the old parts were unlinked
+    for path, data in zip(parts, saved):
+        path.write_bytes(data)
+
+    assert CostLedger(tmp_path).count() == 2
+
+
+def test_stale_compaction_lock_is_cleared(tmp_path):
+    ledger = CostLedger(tmp_path)
+    ledger.append([_row(1, JAN + 1)])
+    ledger.append([_row(2, JAN + 2)])
+    lock = tmp_path / "month=2024-01" / ".compact.lock"
+    lock.touch()
+
+    assert ledger.compact("2024-01") is None
+    old = time.time() - 3600
+    os.utime(lock, (old, old))
+    assert ledger.compact("2024-01") is None
+    assert ledger.compact("2024-01") is not None
@@ -9,22 +9,50 @@ from __future__ import annotations
 
 import json
 import pytest
+import shutil
 import tempfile
 import yaml
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, mock_open
 
+from uvmgr.core import cache
+from uvmgr.runtime import dod
 from uvmgr.runtime.dod import (
     initialize_exoskeleton_files,
     execute_automation_workflow,
     validate_criteria_runtime,
     generate_pipeline_files,
+    run_criteria,
     run_e2e_tests,
     analyze_project_health,
     create_automation_report
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_DB", tmp_path / "runs.db")
+
+
+def make_project(root: Path) -> Path:
+    """A small project that passes testing, security, code_quality and devops."""
+    (root / "pyproject.toml").write_text(
+        "[project]\nname = 'demo'\n\n[build-system]\nrequires = ['hatchling']\n\n"
+        "[tool.pytest.ini_options]\npythonpath = ['.']\n"
+    )
+    (root / "uv.lock").write_text("version = 1\n")
+    workflows = root / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yml").write_text("on: push\n")
+    (root / "pkg").mkdir()
+    (root / "pkg" / "__init__.py").write_text('def add(a, b):\n    """Add."""\n    return a + b\n')
+    (root / "tests").mkdir()
+    (root / "tests" / "test_add.py").write_text(
+        "from pkg import add\n\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+    )
+    return root
+
+
 class TestDoDRuntime:
     """Test suite for DoD runtime execution layer."""
     
@@ -120,24 +148,24 @@ class TestDoDRuntime:
         assert result["success"] is False
         assert "error" in result
         
-    def test_execute_automation_workflow_success(self):
+    def test_execute_automation_workflow_success(self, tmp_path):
         """Test successful automation workflow execution."""
         criteria = ["testing", "security", "code_quality"]
         
         result = execute_automation_workflow(
-            project_path=self.test_project_path,
+            project_path=make_project(tmp_path),
             criteria=criteria,
             environment="development",
             auto_fix=True,
-            parallel=True,
-            ai_assist=True
+            parallel=True
         )
         
         assert result["success"] is True
         assert "criteria_results" in result
         assert "execution_time" in result
         assert result["environment"] == "development"
-        assert result["auto_fix_applied"] is True
+        assert result["auto_fix_applied"] is (shutil.which("ruff") is not None)
+        assert result["fixes_applied"] == 0
         assert result["parallel_execution"] is True
         
         # Verify all criteria were processed
@@ -149,17 +177,17 @@ class TestDoDRuntime:
             assert "details" in criterion_result
             assert "execution_time" in criterion_result
             
-    def test_execute_automation_workflow_realistic_scores(self):
-        """Test that automation workflow generates realistic scores."""
+    def test_execute_automation_workflow_realistic_scores(self, tmp_path):
+        """Test that automation workflow scores come from the project."""
         criteria = ["testing", "security", "devops", "code_quality"]
+        project = make_project(tmp_path)
         
         result = execute_automation_workflow(
-            project_path=self.test_project_path,
+            project_path=project,
             criteria=criteria,
             environment="production",
             auto_fix=False,
-            parallel=False,
-            ai_assist=False
+            parallel=False
         )
         
         assert result["success"] is True
@@ -168,20 +196,23 @@ class TestDoDRuntime:
         for criterion, criterion_result in result["criteria_results"].items():
             score = criterion_result["score"]
             assert 0.0 <= score <= 100.0
+        assert result["criteria_results"]["testing"]["tests_passed"] == 1
             
-            # Scores should vary (not all the same)
-            # This tests the hash-based variation in the simulation
-            
-        # Verify different criteria have different scores
-        scores = [r["score"] for r in result["criteria_results"].values()]
-        assert len(set(scores)) > 1  # Should have variation
+        # Breaking a test fails testing, and devops which depends on it
+        (project / "tests" / "test_add.py").write_text("def test_add():\n    assert False\n")
+        result = execute_automation_workflow(project, criteria, "production", False, False)
+        
+        assert result["success"] is False
+        assert result["criteria_results"]["testing"]["passed"] is False
+        assert result["criteria_results"]["devops"]["score"] < 100.0
+        assert result["criteria_results"]["security"]["cached"] is False  # sources changed
         
-    def test_validate_criteria_runtime_success(self):
+    def test_validate_criteria_runtime_success(self, tmp_path):
         """Test successful runtime criteria validation."""
         criteria = ["testing", "security", "code_quality"]
         
         result = validate_criteria_runtime(
-            project_path=self.test_project_path,
+            project_path=make_project(tmp_path),
             criteria=criteria,
             detailed=True,
             fix_suggestions=True
@@ -189,7 +220,7 @@ class TestDoDRuntime:
         
         assert result["success"] is True
         assert "criteria_scores" in result
-        assert result["validation_strategy"] == "runtime_simulation"
+        assert result["validation_strategy"] == "runtime_checks"
         
         # Verify all criteria were validated
         for criterion in criteria:
@@ -200,12 +231,12 @@ class TestDoDRuntime:
             assert "weight" in criterion_score
             assert "details" in criterion_score
             
-    def test_validate_criteria_runtime_threshold_logic(self):
+    def test_validate_criteria_runtime_threshold_logic(self, tmp_path):
         """Test that validation properly applies passing thresholds."""
         criteria = ["testing"]
         
         result = validate_criteria_runtime(
-            project_path=self.test_project_path,
+            project_path=make_project(tmp_path),
             criteria=criteria,
             detailed=False,
             fix_suggestions=False
@@ -213,12 +244,12 @@ class TestDoDRuntime:
         
         assert result["success"] is True
         
-        # Verify passing threshold is applied (70% in simulation)
+        # Verify passing threshold is applied
         criterion_score = result["criteria_scores"]["testing"]
         score = criterion_score["score"]
         passed = criterion_score["passed"]
         
-        if score >= 70:
+        if score >= dod.PASS_THRESHOLD:
             assert passed is True
         else:
             assert passed is False
@@ -507,7 +538,6 @@ class TestDoDRuntime:
             ["testing"],
             "development",
             False,
-            False,
             False
         )
         assert "success" in result
@@ -616,6 +646,148 @@ class TestDoDRuntime:
                     pytest.fail("Generated report is not valid JSON")
 
 
+class TestCriterionExecutor:
+    """DAG scheduling, timeouts and caching of criterion checks."""
+
+    @staticmethod
+    def register(monkeypatch, **checks):
+        registry = dict(dod.CRITERION_CHECKS)
+        for name, (check, depends_on) in checks.items():
+            registry[name] = dod.CriterionCheck(name, check, sources=False, depends_on=depends_on, timeout=5)
+        monkeypatch.setattr(dod, "CRITERION_CHECKS", registry)
+
+    def test_dependencies_run_first_and_are_not_reported(self, tmp_path, monkeypatch):
+        order = []
+
+        def check(name):
+            def run(ctx):
+                order.append(name)
+                return {"score": 90.0 + len(ctx.upstream), "details": name}
+            return run
+
+        self.register(monkeypatch, base=(check("base"), ()), top=(check("top"), ("base",)))
+
+        results = run_criteria(tmp_path, ["top"])
+
+        assert order == ["base", "top"]
+        assert list(results) == ["top"]
+        assert results["top"]["score"] == 91.0
+
+    def test_independent_criteria_run_concurrently(self, tmp_path, monkeypatch):
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def check(ctx):
+            barrier.wait()  # deadlocks (and times out) unless both run at once
+            return {"score": 100.0, "details": "ok"}
+
+        self.register(monkeypatch, a=(check, ()), b=(check, ()))
+
+        results = run_criteria(tmp_path, ["a", "b"], max_workers=2)
+        assert all(r["passed"] for r in results.values())
+
+    def test_timeouts_and_errors_fail_the_criterion(self, tmp_path, monkeypatch):
+        import threading
+
+        release = threading.Event()
+
+        def hangs(ctx):
+            release.wait(5)
+            return {"score": 100.0, "details": "late"}
+
+        def raises(ctx):
+            raise RuntimeError("boom")
+
+        self.register(monkeypatch, slow=(hangs, ()), broken=(raises, ()))
+        try:
+            results = run_criteria(tmp_path, ["slow", "broken", "unknown"], timeout=0.2)
+        finally:
+            release.set()
+
+        assert results["slow"]["timed_out"] is True
+        assert results["broken"]["details"] == "Check failed: boom"
+        assert results["unknown"]["passed"] is False
+        assert not any(r["passed"] for r in results.values())
+
+    def test_results_are_cached_by_input_content(self, tmp_path, monkeypatch):
+        calls = []
+
+        def check(ctx):
+            calls.append(1)
+            return {"score": 100.0, "details": "ok"}
+
+        registry = dict(dod.CRITERION_CHECKS)
+        registry["config"] = dod.CriterionCheck("config", check, files=("*.toml",), sources=False)
+        monkeypatch.setattr(dod, "CRITERION_CHECKS", registry)
+        config = tmp_path / "pyproject.toml"
+        config.write_text("a = 1\n")
+
+        assert run_criteria(tmp_path, ["config"])["config"]["cached"] is False
+        assert run_criteria(tmp_path, ["config"])["config"]["cached"] is True
+        config.write_text("a = 2\n")
+        assert run_criteria(tmp_path, ["config"])["config"]["cached"] is False
+        assert len(calls) == 2
+
+    def test_missing_project_is_an_error(self):
+        with pytest.raises(FileNotFoundError):
+            run_criteria(Path("/test/project"), ["testing"])
+        assert execute_automation_workflow(Path("/test/project"), ["testing"], "dev", False, True)["success"] is False
+
+
+class TestCodeQualityCheck:
+    """Lint scoring and auto-fix of the code_quality criterion."""
+
+    @pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+    def test_lint_penalty_is_per_violation_and_bounded(self, tmp_path):
+        project = make_project(tmp_path)
+        assert run_criteria(project, ["code_quality"], use_cache=False)["code_quality"]["score"] == 100.0
+
+        (project / "pkg" / "noisy.py").write_text("".join(f"import mod{i}\n" for i in range(3)))
+        result = run_criteria(project, ["code_quality"], use_cache=False)["code_quality"]
+        assert result["lint_violations"] == 3
+        assert result["score"] == 100.0 - 3 * dod._LINT_PENALTY
+
+        (project / "pkg" / "noisy.py").write_text("".join(f"import mod{i}\n" for i in range(200)))
+        result = run_criteria(project, ["code_quality"], use_cache=False)["code_quality"]
+        assert result["score"] == 100.0 - dod._LINT_PENALTY_CAP
+
+    @pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+    def test_check_never_applies_fixes(self, tmp_path):
+        project = make_project(tmp_path)
+        with (project / "pyproject.toml").open("a") as f:
+            f.write("\n[tool.ruff]\nfix = true\n")
+        (project / "pkg" / "util.py").write_text("import os\n")
+
+        result = run_criteria(project, ["code_quality"], use_cache=False)["code_quality"]
+
+        assert result["lint_violations"] == 1
+        assert (project / "pkg" / "util.py").read_text() == "import os\n"
+        assert not (project / ".ruff_cache").exists()
+
+    def test_missing_ruff_does_not_raise_the_score(self, tmp_path, monkeypatch):
+        project = make_project(tmp_path)
+        monkeypatch.setattr(dod.shutil, "which", lambda name: None)
+
+        result = run_criteria(project, ["code_quality"], use_cache=False)["code_quality"]
+
+        assert result["lint_violations"] is None
+        assert result["score"] == 100.0 - dod._LINT_PENALTY_CAP
+        assert "lint not checked" in result["details"]
+
+    @pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+    def test_auto_fix_applies_ruff_fixes_before_checking(self, tmp_path):
+        project = make_project(tmp_path)
+        (project / "pkg" / "util.py").write_text("import os\n\n\ndef one():\n    return 1\n")
+
+        result = execute_automation_workflow(project, ["code_quality"], "dev", True, False)
+
+        assert result["auto_fix_applied"] is True
+        assert result["fixes_applied"] == 1
+        assert "import os" not in (project / "pkg" / "util.py").read_text()
+        assert result["criteria_results"]["code_quality"]["lint_violations"] == 0
+
+
 class TestDoDRuntimePerformance:
     """Performance tests for DoD runtime operations."""
     
@@ -638,26 +810,27 @@ class TestDoDRuntimePerformance:
             assert result["success"] is True
             assert (end_time - start_time) < 1.0  # Should complete in under 1 second
             
-    def test_automation_workflow_performance(self):
-        """Test automation workflow execution performance."""
+    def test_automation_workflow_performance(self, tmp_path):
+        """Test that an unchanged tree is served from the result cache."""
         import time
         
         criteria = ["testing", "security", "code_quality"]
+        project = make_project(tmp_path)
+        execute_automation_workflow(project, criteria, "test", False, True)
         
         start_time = time.time()
         result = execute_automation_workflow(
-            Path("/test"),
+            project,
             criteria,
             "test",
             False,
-            True,
-            False
+            True
         )
         end_time = time.time()
         
         assert result["success"] is True
-        assert (end_time - start_time) < 2.0  # Should complete in under 2 seconds
-
+        assert result["cache_hits"] == len(criteria)
+        assert (end_time - start_time) < 0.5
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from uvmgr.runtime import history
+
+
+@pytest.fixture(autouse=True)
+def _tmp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "_get_history_db_path", lambda: tmp_path / "commands.db")
+
+
+T0 = datetime(2025, 3, 1, 9, 0)
+
+
+def _store(*spec):
+    """Store ``(minutes after T0, command)`` pairs in one batch."""
+    result = history.store_command_records(
+        {"command": command, "timestamp": T0 + timedelta(minutes=minutes)} for minutes, command in spec
+    )
+    assert result == {"success": True, "records_stored": len(spec)}
+
+
+def test_single_and_batched_inserts_share_one_connection():
+    first = history.store_command_record("deps", args=["add", "rich"], exit_code=0, timestamp=T0)
+    assert first["success"]
+    conn = history._conn
+
+    _store((1, "tests"), (2, "lint"))
+    records = history.query_command_history(limit=10)["records"]
+    assert [r["command"] for r in records] == ["lint", "tests", "deps"]
+    assert records[-1]["args"] == ["add", "rich"]
+    assert history._conn is conn
+
+
+def test_sessions_split_on_thirty_minute_gaps():
+    _store(
+        (0, "deps"), (10, "tests"), (40, "lint"),   # 30 min gap exactly: same session
+        (71, "deps"), (75, "tests"),                # > 30 min: new session
+        (200, "docs"),
+    )
+
+    result = history.find_similar_command_sessions(["deps", "tests"], similarity_threshold=0.0, max_results=10)
+    sessions = {s["session_id"]: s for s in result["similar_sessions"]}
+
+    assert sessions[0]["commands"] == ["deps", "tests", "lint"]
+    assert sessions[0]["duration"] == 2400.0
+    assert sessions[0]["similarity"] == pytest.approx(2 / 3)
+    assert sessions[1]["commands"] == ["deps", "tests"]
+    assert sessions[1]["timestamp"] == (T0 + timedelta(minutes=71)).isoformat()
+    assert sessions[2]["similarity"] == 0.0
+    assert [s["session_id"] for s in result["similar_sessions"]] == [1, 0, 2]
+
+
+def test_similar_sessions_threshold_and_limit():
+    _store((0, "deps"), (1, "tests"), (100, "deps"), (101, "lint"), (200, "docs"))
+
+    result = history.find_similar_command_sessions(["deps", "tests"], similarity_threshold=0.3, max_results=1)
+    assert [s["commands"] for s in result["similar_sessions"]] == [["deps", "tests"]]
+    assert result["avg_similarity"] == 1.0
+
+
+def test_clear_counts_and_deletes():
+    _store((0, "deps"), (1, "tests"), (2, "deps"))
+
+    dry = history.clear_command_history(command_filter="deps", dry_run=True)
+    assert dry["records_cleared"] == 2
+    assert history.calculate_command_statistics()["total_executions"] == 3
+
+    assert history.clear_command_history(command_filter="deps")["records_cleared"] == 2
+    assert history.calculate_command_statistics()["total_executions"] == 1
@@ -0,0 +1,91 @@
+import stat
+
+import pytest
+
+from uvmgr.runtime import remote
+
+SHIM = """#!/bin/sh
+# Fake ssh: log the invocation on one line, drop options and destination, run locally
+echo "$*" | tr '\n' ' ' >> "$SSH_LOG"; echo >> "$SSH_LOG"
+while [ $# -gt 0 ]; do
+  case "$1" in
+    -o|-i|-p|-O) shift 2 ;;
+    -*) shift ;;
+    *) break ;;
+  esac
+done
+shift
+[ $# -eq 0 ] && exit 0
+exec sh -c "$*"
+"""
+
+
+@pytest.fixture
+def ssh_log(tmp_path, monkeypatch):
+    shim = tmp_path / "ssh"
+    shim.write_text(SHIM)
+    shim.chmod(shim.stat().st_mode | stat.S_IXUSR)
+    log = tmp_path / "ssh.log"
+    monkeypatch.setenv(remote.SSH_ENV, str(shim))
+    monkeypatch.setenv("SSH_LOG", str(log))
+    yield log
+    remote._SESSIONS.clear()
+
+
+def test_commands_are_multiplexed_through_one_pooled_session(ssh_log):
+    result = remote.run("box", "echo", "hello", user="deploy")
+    remote.run("box", "true", user="deploy")
+
+    assert result.stdout == "hello\n"
+    assert remote.get_session("box", user="deploy") is remote.get_session("box", user="deploy")
+    calls = ssh_log.read_text().splitlines()
+    assert len(calls) == 2
+    assert all("ControlMaster=auto" in call and "ControlPersist=" in call for call in calls)
+    assert len({call.split("ControlPath=")[1].split()[0] for call in calls}) == 1
+
+
+def test_failures_raise_remote_execution_error(ssh_log):
+    with pytest.raises(remote.RemoteExecutionError):
+        remote.run("box", "exit 3")
+
+
+def test_batch_runs_in_one_invocation_with_per_command_status(ssh_log):
+    streamed = []
+    results = remote.run_batch(
+        "box",
+        ["echo one; echo two", "printf partial; exit 4", "echo three"],
+        on_line=lambda i, line: streamed.append((i, line)),
+    )
+
+    assert [r.exit_code for r in results] == [0, 4, 0]
+    assert [r.output for r in results] == ["one\ntwo", "partial", "three"]
+    assert streamed == [(0, "one"), (0, "two"), (1, "partial"), (2, "three")]
+    assert len(ssh_log.read_text().splitlines()) == 1
+
+
+def test_batch_stops_on_error(ssh_log):
+    results = remote.run_batch("box", ["false", "echo never"], stop_on_error=True)
+
+    assert [r.exit_code for r in results] == [1, None]
+    assert results[1].output == ""
+
+
+def test_file_sets_are_copied_as_one_tar_stream(ssh_log, tmp_path):
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "a.txt").write_text("a")
+    (src / "pkg" / "b.txt").write_text("b")
+    dest = tmp_path / "dest"
+
+    assert remote.copy_file([src / "a.txt", src / "pkg"], str(dest), "box", base=src)
+
+    assert (dest / "a.txt").read_text() == "a"
+    assert (dest / "pkg" / "b.txt").read_text() == "b"
+    assert len(ssh_log.read_text().splitlines()) == 1
+
+
+def test_parallel_runs_every_host(ssh_log):
+    results = remote.run_parallel(["a", "b", "c"], "echo ok", max_concurrent=2)
+
+    assert sorted(results) == ["a", "b", "c"]
+    assert all(r.stdout == "ok\n" for r in results.values())
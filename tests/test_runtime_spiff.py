@@ -0,0 +1,66 @@
+import pytest
+
+from uvmgr.runtime.agent import spiff
+
+WORKFLOW = """<?xml version="1.0" encoding="UTF-8"?>
+<bpmn:definitions xmlns:bpmn="http://www.omg.org/spec/BPMN/20100524/MODEL" id="D" targetNamespace="x">
+  <bpmn:process id="Demo" isExecutable="true">
+    <bpmn:startEvent id="start"/>
+    <bpmn:parallelGateway id="split"/>
+    <bpmn:scriptTask id="a"><bpmn:script>a = 1</bpmn:script></bpmn:scriptTask>
+    <bpmn:scriptTask id="b"><bpmn:script>b = 2</bpmn:script></bpmn:scriptTask>
+    <bpmn:parallelGateway id="join"/>
+    <bpmn:scriptTask id="total"><bpmn:script>total = a + b</bpmn:script></bpmn:scriptTask>
+    <bpmn:endEvent id="end"/>
+    <bpmn:sequenceFlow id="f0" sourceRef="start" targetRef="split"/>
+    <bpmn:sequenceFlow id="f1" sourceRef="split" targetRef="a"/>
+    <bpmn:sequenceFlow id="f2" sourceRef="split" targetRef="b"/>
+    <bpmn:sequenceFlow id="f3" sourceRef="a" targetRef="join"/>
+    <bpmn:sequenceFlow id="f4" sourceRef="b" targetRef="join"/>
+    <bpmn:sequenceFlow id="f5" sourceRef="join" targetRef="total"/>
+    <bpmn:sequenceFlow id="f6" sourceRef="total" targetRef="end"/>
+  </bpmn:process>
+</bpmn:definitions>
+"""
+
+
+@pytest.fixture
+def workflow(tmp_path):
+    path = tmp_path / "demo.bpmn"
+    path.write_text(WORKFLOW)
+    return path
+
+
+def test_spec_is_parsed_once_per_content(workflow):
+    first, cached = spiff._parse_spec(workflow)
+    assert cached is False
+
+    again, cached = spiff._parse_spec(workflow)
+    assert cached is True
+    assert again is first
+
+    workflow.write_text(WORKFLOW.replace("a = 1", "a = 10"))
+    edited, cached = spiff._parse_spec(workflow)
+    assert cached is False
+    assert edited is not first
+
+
+@pytest.mark.parametrize("batch", [True, False])
+def test_run_executes_scripts(workflow, batch):
+    wf = spiff._load(workflow)
+    while not wf.is_completed():
+        if batch:
+            assert spiff._step_batch(wf) > 0
+        else:
+            spiff._step(wf)
+
+    assert wf.data["total"] == 3
+
+
+def test_batch_steps_run_all_ready_tasks(workflow):
+    batched = spiff.run_bpmn(workflow)
+    stepped = spiff.run_bpmn(workflow, batch=False)
+
+    assert batched["completed_tasks"] == stepped["completed_tasks"]
+    assert batched["tasks_executed"] == stepped["tasks_executed"] == stepped["steps_executed"]
+    assert batched["steps_executed"] < stepped["steps_executed"]
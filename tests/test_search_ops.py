@@ -408,6 +408,67 @@ requests = ">=2.0.0"
         assert match["type"] == "text"
         assert "requests" in match["content"]
 
+    
+    def _config(self, **overrides):
+        config = {
+            "pattern": "needle",
+            "path": self.temp_path,
+            "files": "*.py",
+            "search_type": "function",
+            "case_sensitive": False,
+            "exact_match": False,
+            "context_lines": 0,
+            "max_results": 100,
+            "exclude_dirs": [],
+            "complexity_range": (None, None),
+            "lines_range": (None, None),
+            "parallel": True,
+        }
+        config.update(overrides)
+        return config
+    
+    def test_parallel_search_counts_files_and_stops_early(self):
+        """Parallel search reports files_scanned and stops at max_results."""
+        for i in range(10):
+            (self.temp_path / f"mod_{i}.py").write_text(f"def needle_{i}():\n    pass\n")
+        
+        results = self.engine.search(self._config())
+        assert len(results["matches"]) == 10
+        assert results["files_scanned"] == 10
+        
+        results = self.engine.search(self._config(max_results=3))
+        assert len(results["matches"]) == 3
+        assert results["files_scanned"] == 3
+    
+    def test_new_pattern_reuses_index(self):
+        """A different query needs no re-parse of unchanged files."""
+        (self.temp_path / "mod.py").write_text("def alpha():\n    pass\n\ndef beta():\n    pass\n")
+        self.engine.search(self._config(pattern="alpha"))
+        
+        assert self.engine.index.refresh(self.temp_path).parsed == 0
+        results = self.engine.search(self._config(pattern="beta"))
+        assert [m["name"] for m in results["matches"]] == ["beta"]
+    
+    def test_stream_yields_incrementally(self):
+        """stream() yields matches lazily and honours max_results."""
+        for i in range(5):
+            (self.temp_path / f"mod_{i}.py").write_text(f"def needle_{i}():\n    pass\n")
+        
+        stream = self.engine.stream(self._config(max_results=2))
+        assert next(stream)["name"].startswith("needle_")
+        assert len(list(stream)) == 1
+    
+    def test_process_pool_text_search(self):
+        """Enough text files fan out to the process pool."""
+        count = CodeSearchEngine.PROCESS_POOL_THRESHOLD + 4
+        for i in range(count):
+            (self.temp_path / f"notes_{i}.txt").write_text(f"line\nneedle {i}\n")
+        
+        results = self.engine.search(self._config(files="*.txt", max_results=1000))
+        assert results["files_scanned"] == count
+        assert len(results["matches"]) == count
+        assert {m["line"] for m in results["matches"]} == {2}
+
 
 class TestDependencyAnalyzer:
     """Test suite for dependency analysis and search."""
@@ -916,6 +977,85 @@ def login_user(request):
         assert "error" in results
         assert "sentence-transformers" in results["error"]
         assert len(results["matches"]) == 0
+    
+    def _indexed_engine(self):
+        """Engine backed by a deterministic bag-of-words encoder."""
+        import numpy as np
+        
+        vocabulary = ["user", "login", "password", "invoice", "total", "tax", "render", "html"]
+        encoded = []
+        
+        class FakeModel:
+            def encode(self, texts, **kwargs):
+                encoded.extend(texts)
+                return np.array([
+                    [text.lower().count(word) + 0.01 for word in vocabulary] for text in texts
+                ])
+        
+        (self.temp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+        (self.temp_path / "auth.py").write_text(
+            "def login(user, password):\n    return check(user, password)\n\n"
+            "def logout(user):\n    return drop(user)\n"
+        )
+        (self.temp_path / "billing.py").write_text(
+            "def invoice_total(invoice):\n    return invoice.total + tax(invoice.total)\n"
+        )
+        self.engine.model = FakeModel()
+        return encoded
+    
+    def _semantic_config(self, query, **overrides):
+        return {
+            "query": query,
+            "path": self.temp_path,
+            "search_scope": "code",
+            "similarity_threshold": 0.5,
+            "max_results": 20,
+            **overrides,
+        }
+    
+    def test_semantic_index_is_incremental(self):
+        """Only new or changed files are re-embedded; warm queries encode the query alone."""
+        encoded = self._indexed_engine()
+        
+        first = self.engine.search(self._semantic_config("user login password"))
+        assert first["chunks_embedded"] == 3
+        assert [Path(m["file"]).name for m in first["matches"]][:1] == ["auth.py"]
+        assert first["matches"][0]["type"] == "function"
+        
+        encoded.clear()
+        warm = self.engine.search(self._semantic_config("invoice total"))
+        assert warm["chunks_embedded"] == 0
+        assert encoded == ["invoice total"]
+        assert Path(warm["matches"][0]["file"]).name == "billing.py"
+        
+        (self.temp_path / "billing.py").write_text("def render(html):\n    return html\n")
+        changed = self.engine.search(self._semantic_config("render html"))
+        assert changed["chunks_embedded"] == 1
+        assert changed["total_chunks_processed"] == 3
+        assert changed["matches"][0]["line"] == 1
+        
+        # A fresh engine reuses the persisted index
+        encoded.clear()
+        model = self.engine.model
+        reopened = SemanticSearchEngine()
+        reopened.model = model
+        assert reopened.search(self._semantic_config("render html"))["chunks_embedded"] == 0
+    
+    def test_semantic_index_reuses_rows_of_deleted_files(self):
+        """Deleting a file frees its rows for the next embedded chunks."""
+        self._indexed_engine()
+        self.engine.search(self._semantic_config("login"))
+        
+        (self.temp_path / "billing.py").unlink()
+        assert self.engine.search(self._semantic_config("invoice"))["total_chunks_processed"] == 2
+        
+        (self.temp_path / "report.py").write_text("def render(html):\n    return html\n")
+        results = self.engine.search(self._semantic_config("render html", max_results=1))
+        assert [Path(m["file"]).name for m in results["matches"]] == ["report.py"]
+        
+        store = self.engine._store(self.temp_path.resolve())
+        assert store.vectors_path.stat().st_size == store.GROWTH * store.dim * 2
+        assert sorted(row for row, _ in store.candidates("")) == [0, 1, 2]
 
 
 class TestSearchIntegration:
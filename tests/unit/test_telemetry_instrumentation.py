@@ -457,5 +457,49 @@ class TestTelemetryPerformance:
         assert avg_metric_time < 0.001, f"Metrics recording too slow: {avg_metric_time}s per metric"
 
 
+class TestInstrumentRegistry:
+    """Instrument memoization and the shared no-op path."""
+
+    def test_noop_path_is_shared(self):
+        """Disabled telemetry hands out one no-op callable and one span context."""
+        from uvmgr.core import telemetry
+
+        if telemetry.OTEL_ENABLED:
+            pytest.skip("OTEL exporter configured")
+
+        assert metric_counter("a.calls") is metric_counter("b.calls")
+        assert metric_histogram("a.duration") is metric_gauge("a.gauge")
+        assert span("a") is span("b", key="value")
+        metric_counter("a.calls", attributes={"k": "v"})(1, {"extra": 1})
+
+    def test_span_works_as_decorator(self):
+        """``@span(...)`` keeps working on both the no-op and the SDK path."""
+
+        @span("decorated.operation")
+        def decorated(value):
+            return value * 2
+
+        assert decorated(21) == 42
+        assert decorated.__wrapped__.__name__ == "decorated"
+
+    def test_instruments_are_memoized(self):
+        """Enabled telemetry creates each (name, unit, kind) once."""
+        import subprocess
+        import sys
+
+        code = (
+            "from uvmgr.core.telemetry import metric_counter, metric_histogram\n"
+            "assert metric_counter('x.calls') is metric_counter('x.calls')\n"
+            "assert metric_counter('x.calls') is not metric_histogram('x.calls')\n"
+            "bound = metric_counter('x.calls', attributes={'op': 'add'})\n"
+            "assert bound is metric_counter('x.calls', attributes={'op': 'add'})\n"
+            "tagged = metric_counter('x.calls', attributes={'tags': ['a', 'b']})\n"
+            "assert tagged is metric_counter('x.calls', attributes={'tags': ['a', 'b']})\n"
+            "bound(1, {'extra': True})\n"
+        )
+        env = {"OTEL_EXPORTER_OTLP_ENDPOINT": "http://127.0.0.1:9", "PATH": ""}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env, timeout=120)
+
+
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])